@@ -0,0 +1,102 @@
+"""
+이벤트 발행 벤치마크 스크립트 (EventPublisher vs BatchingEventPublisher vs AsyncBatchingEventPublisher)
+- 로컬 Redis 에 N 개 NodeStatusEvent(노드 M 개, 노드당 N/M 번 상태 전이)를 발행하고
+  처리량(events/s)과 구독자 기준 발행→수신 지연(p50/p99)을 측정
+- 사용 예: python scripts/benchmark_event_publisher.py redis://localhost:6379/15 20000 1000
+  (인자: redis_url, 이벤트 수, 노드 수)
+"""
+import asyncio
+import sys
+import threading
+import time
+
+import redis
+
+from qmtl.dag_manager.registry.services.event import (
+    AsyncBatchingEventPublisher,
+    BatchingEventPublisher,
+    EventPublisher,
+)
+from qmtl.models.generated.qmtl_events_pb2 import NodeStatusEvent
+
+
+def _events(total: int, nodes: int):
+    for i in range(total):
+        yield NodeStatusEvent(node_id=f"n{i % nodes}", status=str(i), timestamp=time.time_ns())
+
+
+class _LatencyCollector:
+    """event:node_status 구독 후 수신 시각 - 이벤트 timestamp 로 지연 측정"""
+
+    def __init__(self, redis_url: str):
+        self.pubsub = redis.from_url(redis_url).pubsub()
+        self.pubsub.subscribe("event:node_status")
+        self.pubsub.get_message(timeout=1)
+        self.latencies = []
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.is_set():
+            msg = self.pubsub.get_message(timeout=0.1)
+            if msg and msg["type"] == "message":
+                event = NodeStatusEvent.FromString(msg["data"])
+                self.latencies.append((time.time_ns() - event.timestamp) / 1e6)
+
+    def stop(self):
+        time.sleep(0.5)
+        self._stop.set()
+        self._thread.join()
+        self.latencies.sort()
+        return self.latencies
+
+
+def _report(name: str, total: int, elapsed: float, latencies):
+    p50 = latencies[len(latencies) // 2] if latencies else float("nan")
+    p99 = latencies[int(len(latencies) * 0.99)] if latencies else float("nan")
+    print(
+        f"[bench] {name:16s} {total / elapsed:10,.0f} events/s, "
+        f"received {len(latencies):,}, latency p50 {p50:7.2f} ms, p99 {p99:7.2f} ms"
+    )
+
+
+def run_sync(redis_url: str, total: int, nodes: int, publisher, name: str):
+    collector = _LatencyCollector(redis_url)
+    started = time.perf_counter()
+    for event in _events(total, nodes):
+        publisher.publish_node_status(event)
+    if hasattr(publisher, "close"):
+        publisher.close()
+    _report(name, total, time.perf_counter() - started, collector.stop())
+
+
+def run_async(redis_url: str, total: int, nodes: int):
+    collector = _LatencyCollector(redis_url)
+
+    async def publish():
+        async with AsyncBatchingEventPublisher(redis_url) as publisher:
+            for event in _events(total, nodes):
+                await publisher.publish_node_status(event)
+                # 실제 서비스처럼 이벤트 사이에 루프를 양보
+                await asyncio.sleep(0)
+
+    started = time.perf_counter()
+    asyncio.run(publish())
+    _report("async-batching", total, time.perf_counter() - started, collector.stop())
+
+
+def main():
+    redis_url = sys.argv[1] if len(sys.argv) > 1 else "redis://localhost:6379/15"
+    total = int(sys.argv[2]) if len(sys.argv) > 2 else 20000
+    nodes = int(sys.argv[3]) if len(sys.argv) > 3 else 1000
+    run_sync(redis_url, total, nodes, EventPublisher(redis_url), "sync")
+    run_sync(
+        redis_url, total, nodes, BatchingEventPublisher(redis_url, coalesce=False), "batching"
+    )
+    run_sync(redis_url, total, nodes, BatchingEventPublisher(redis_url), "batching+coalesce")
+    run_async(redis_url, total, nodes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Gateway 요청당 인가 비용 벤치마크 스크립트
+- ACL 경로 매칭: 규칙 선형 정규식 검색 vs 단일 정규식 + 경로 캐시
+- 정책 평가: 정책/규칙 순회(_evaluate) vs 결정 캐시(evaluate_access)
+- JWT 인증: 매 요청 HS256 서명 검증(jwt.decode) vs 검증된 토큰 캐시(_verify_token)
+- 사용 예: python scripts/benchmark_gateway_auth.py 100000
+  (인자: 반복 횟수)
+"""
+import sys
+import time
+
+from jose import jwt
+
+from qmtl.gateway.middlewares.acl import ACLConfig, ACLMiddleware, default_acl_rules
+from qmtl.gateway.middlewares.auth import JWTAuthMiddleware, JWTConfig, create_access_token
+from qmtl.gateway.services.policy import ActionType, PolicyService, ResourceType
+
+PATHS = [
+    "/v1/gateway/strategies",
+    "/v1/gateway/strategies/s1/status",
+    "/v1/gateway/nodes",
+    "/v1/gateway/events/stream",
+    "/v1/gateway/unknown",
+]
+
+
+def _measure(name: str, repeat: int, fn) -> None:
+    started = time.perf_counter()
+    for i in range(repeat):
+        fn(i)
+    per_call_us = (time.perf_counter() - started) / repeat * 1e6
+    print(f"[bench] {name:28s} {per_call_us:8.3f} us/request")
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    acl = ACLMiddleware(ACLConfig(rules=default_acl_rules))
+
+    def linear(i):
+        path = PATHS[i % len(PATHS)]
+        for pattern, rule in acl.compiled_rules:
+            if pattern.match(path):
+                return rule
+        return None
+
+    _measure("acl linear scan", repeat, linear)
+    _measure("acl combined regex", repeat, lambda i: acl._scan(PATHS[i % len(PATHS)]))
+    _measure(
+        "acl combined + cache", repeat, lambda i: acl._find_matching_rule(PATHS[i % len(PATHS)])
+    )
+
+    policy = PolicyService()
+    roles = ["user", "service"]
+    args = (ResourceType.STRATEGY, ActionType.READ, "s1")
+    _measure(
+        "policy evaluate (uncached)", repeat, lambda i: policy._evaluate(frozenset(roles), *args)
+    )
+    _measure("policy evaluate (cached)", repeat, lambda i: policy.evaluate_access(roles, *args))
+
+    auth = JWTAuthMiddleware(JWTConfig(secret_key="bench_secret"))
+    tokens = [
+        create_access_token({"sub": f"user{n}", "roles": roles}, "bench_secret", expires_delta=3600)
+        for n in range(16)
+    ]
+    _measure(
+        "jwt decode (uncached)",
+        repeat,
+        lambda i: jwt.decode(tokens[i % len(tokens)], "bench_secret", algorithms=["HS256"]),
+    )
+    _measure("jwt verify (cached)", repeat, lambda i: auth._verify_token(tokens[i % len(tokens)]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+DAG Manager 작업 큐 shard 벤치마크 스크립트
+- 로컬 Redis 에 대해 M 개의 worker 프로세스를 띄워 shard 수별 처리량(items/s)을 측정
+- 사용 예: python scripts/benchmark_queue_shards.py redis://localhost:6379/15 8 20000 1,2,4,8
+  (인자: redis_url, workers, items, shard 수 목록)
+"""
+import multiprocessing as mp
+import sys
+import time
+
+import redis
+
+from qmtl.dag_manager.core.sharded_queue import ShardedRedisQueueRepository
+
+KEY_PREFIX = "qmtl:bench"
+
+
+def _worker(redis_url: str, num_shards: int, home_shard: int, counter) -> None:
+    repo = ShardedRedisQueueRepository(
+        num_shards=num_shards, redis_url=redis_url, key_prefix=KEY_PREFIX
+    )
+    while True:
+        item = repo.pop(home_shard=home_shard, timeout=1)
+        if item is None:
+            return
+        repo.complete(item)
+        with counter.get_lock():
+            counter.value += 1
+
+
+def run(redis_url: str, workers: int, items: int, num_shards: int) -> float:
+    conn = redis.from_url(redis_url)
+    for key in conn.scan_iter(f"{KEY_PREFIX}:*"):
+        conn.delete(key)
+    repo = ShardedRedisQueueRepository(
+        num_shards=num_shards, redis_client=conn, key_prefix=KEY_PREFIX
+    )
+    for i in range(items):
+        repo.push(f"{i:032x}")
+
+    counter = mp.Value("i", 0)
+    procs = [
+        mp.Process(target=_worker, args=(redis_url, num_shards, w % num_shards, counter))
+        for w in range(workers)
+    ]
+    started = time.perf_counter()
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join()
+    # 마지막 1초 blocking timeout 은 측정에서 제외
+    elapsed = max(time.perf_counter() - started - 1.0, 1e-9)
+    return counter.value / elapsed
+
+
+def main():
+    redis_url = sys.argv[1] if len(sys.argv) > 1 else "redis://localhost:6379/15"
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    items = int(sys.argv[3]) if len(sys.argv) > 3 else 20000
+    shard_counts = [int(s) for s in (sys.argv[4] if len(sys.argv) > 4 else "1,2,4,8").split(",")]
+    for num_shards in shard_counts:
+        throughput = run(redis_url, workers, items, num_shards)
+        print(f"[bench] shards={num_shards} workers={workers} -> {throughput:,.0f} items/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Registry API 본문 인코딩 벤치마크 스크립트 (JSON vs application/x-protobuf)
+- N 개 DataNode 목록(NodeList)을 서버 인코딩 → 클라이언트 디코딩 하는 CPU 시간과 payload 크기를 비교
+- json: MessageToDict + json.dumps / json.loads + camelCase→snake_case 키 변환 + ParseDict (기존 경로)
+- protobuf: NodeList.SerializeToString / NodeList.FromString
+- 사용 예: python scripts/benchmark_registry_codec.py 1000 200
+  (인자: 노드 수, 반복 횟수)
+"""
+
+import json
+import sys
+import time
+
+from google.protobuf.json_format import MessageToDict, ParseDict
+
+from qmtl.dag_manager.registry.api import _camel_to_snake
+from qmtl.models.generated import qmtl_common_pb2, qmtl_datanode_pb2, qmtl_registry_api_pb2
+
+
+def _make_nodes(total):
+    nodes = []
+    for i in range(total):
+        node = qmtl_datanode_pb2.DataNode(
+            node_id=f"{i:032x}",
+            type="FEATURE",
+            data_format={"type": "ohlcv", "fields": "open,high,low,close,volume"},
+            params={"window": str(i % 50), "source": "binance"},
+            dependencies=[f"{j:032x}" for j in range(max(0, i - 2), i)],
+            tags=qmtl_common_pb2.NodeTags(predefined=["FEATURE"], custom=[f"c{i % 7}"]),
+        )
+        node.interval_settings.interval = qmtl_common_pb2.HOUR
+        node.interval_settings.period = 24
+        node.stream_settings.intervals["1h"].CopyFrom(node.interval_settings)
+        nodes.append(node)
+    return qmtl_registry_api_pb2.NodeList(nodes=nodes)
+
+
+def _json_encode(message):
+    return json.dumps(
+        {"nodes": [MessageToDict(n, preserving_proto_field_name=True) for n in message.nodes]}
+    ).encode()
+
+
+def _json_decode(payload):
+    nodes = []
+    for node in json.loads(payload)["nodes"]:
+        node = {_camel_to_snake(k): v for k, v in node.items()}
+        nodes.append(ParseDict(node, qmtl_datanode_pb2.DataNode()))
+    return nodes
+
+
+def _protobuf_encode(message):
+    return message.SerializeToString()
+
+
+def _protobuf_decode(payload):
+    return list(qmtl_registry_api_pb2.NodeList.FromString(payload).nodes)
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    message = _make_nodes(total)
+    for name, encode, decode in (
+        ("json", _json_encode, _json_decode),
+        ("protobuf", _protobuf_encode, _protobuf_decode),
+    ):
+        payload = encode(message)
+        assert len(decode(payload)) == total
+        started = time.perf_counter()
+        for _ in range(repeat):
+            encode(message)
+        encode_ms = (time.perf_counter() - started) / repeat * 1000
+        started = time.perf_counter()
+        for _ in range(repeat):
+            decode(payload)
+        decode_ms = (time.perf_counter() - started) / repeat * 1000
+        print(
+            f"[bench] {name:8s} {total:,} nodes: encode {encode_ms:8.2f} ms, "
+            f"decode {decode_ms:8.2f} ms, payload {len(payload):,} bytes"
+        )
+
+
+if __name__ == "__main__":
+    main()
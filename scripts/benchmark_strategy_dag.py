@@ -0,0 +1,134 @@
+"""
+전략 DAG 조회 벤치마크 스크립트 (N+1 vs 단일 쿼리)
+- N 개의 DataNode 를 체인 + 팬인 형태의 DEPENDS_ON 관계로 생성하고 하나의 StrategyVersion 에 CONTAINS 로 연결
+- 기존 방식(get_strategy_nodes + 노드별 get_node_dependencies)과
+  get_strategy_graph(노드 + DEPENDS_ON collect 투영 단일 쿼리)의 소요 시간/쿼리 수를 비교
+- 사용 예: python scripts/benchmark_strategy_dag.py bolt://localhost:7687 neo4j test 3000
+  (인자: uri, user, password, 노드 수)
+"""
+import json
+import sys
+import time
+
+from qmtl.common.db.neo4j_client import Neo4jClient
+from qmtl.dag_manager.core.ready_node_selector import ReadyNodeSelector
+from qmtl.dag_manager.registry.services.node.management import (
+    Neo4jNodeManagementService,
+    NodeManagementService,
+)
+from qmtl.dag_manager.registry.services.node.neo4j_schema import get_schema_cypher
+
+VERSION_ID = "bench-strategy-dag"
+BATCH = 5000
+
+LOAD_NODES_QUERY = """
+UNWIND $rows AS row
+CREATE (n:DataNode:BenchDagNode {
+    node_id: row.node_id, type: "RAW", data_format: "{}", dependencies: row.dependencies,
+    interval_settings: $interval_settings, stream_settings: "null"
+})
+"""
+LOAD_EDGES_QUERY = """
+UNWIND $rows AS row
+MATCH (n:BenchDagNode {node_id: row.node_id})
+UNWIND row.dependencies AS dep_id
+MATCH (dep:BenchDagNode {node_id: dep_id})
+CREATE (n)-[:DEPENDS_ON]->(dep)
+"""
+LOAD_CONTAINS_QUERY = """
+MATCH (s:StrategyVersion {version_id: $version_id})
+MATCH (n:BenchDagNode)
+CREATE (s)-[:CONTAINS]->(n)
+"""
+
+
+WIDTH = 100  # 계층당 노드 수 (GraphBuilder 의 재귀 위상정렬 깊이 = 노드 수 / WIDTH)
+
+
+def _dependencies(i: int) -> list:
+    # 이전 계층의 같은 위치 + 다음 위치 노드에 의존 (계층형 팬인)
+    if i < WIDTH:
+        return []
+    base = i - WIDTH
+    return [f"{base:032x}", f"{base - base % WIDTH + (base + 1) % WIDTH:032x}"]
+
+
+class _CountingClient:
+    """Neo4jClient 호출 수를 세는 래퍼"""
+
+    def __init__(self, client: Neo4jClient):
+        self._client = client
+        self.calls = 0
+
+    def __getattr__(self, name):
+        attr = getattr(self._client, name)
+        if not name.startswith(("execute", "stream")):
+            return attr
+
+        def counted(*args, **kwargs):
+            self.calls += 1
+            return attr(*args, **kwargs)
+
+        return counted
+
+
+def _run(name: str, fetch, client: _CountingClient, total: int) -> None:
+    client.calls = 0
+    started = time.perf_counter()
+    nodes = fetch()
+    ready = ReadyNodeSelector(nodes, {}).get_ready_nodes()
+    elapsed = time.perf_counter() - started
+    assert len(nodes) == total
+    print(
+        f"[bench] {name:12s} nodes={len(nodes):,} ready={len(ready)} "
+        f"queries={client.calls:,} elapsed={elapsed * 1000:.1f}ms"
+    )
+
+
+def main():
+    uri = sys.argv[1] if len(sys.argv) > 1 else "bolt://localhost:7687"
+    user = sys.argv[2] if len(sys.argv) > 2 else "neo4j"
+    password = sys.argv[3] if len(sys.argv) > 3 else "test"
+    total = int(sys.argv[4]) if len(sys.argv) > 4 else 3000
+
+    client = Neo4jClient(uri=uri, username=user, password=password)
+    for cypher in get_schema_cypher():
+        client.execute_query(cypher)
+    client.execute_query("MATCH (n:BenchDagNode) CALL { WITH n DETACH DELETE n } IN TRANSACTIONS")
+    client.execute_query(
+        "MATCH (s:StrategyVersion {version_id: $v}) DETACH DELETE s", {"v": VERSION_ID}
+    )
+    client.execute_query("CREATE (:StrategyVersion {version_id: $v})", {"v": VERSION_ID})
+    interval_settings = json.dumps({"interval": "1m", "period": 1})
+    for start in range(0, total, BATCH):
+        rows = [
+            {"node_id": f"{i:032x}", "dependencies": _dependencies(i)}
+            for i in range(start, min(start + BATCH, total))
+        ]
+        client.execute_query(
+            LOAD_NODES_QUERY, {"rows": rows, "interval_settings": interval_settings}
+        )
+    for start in range(0, total, BATCH):
+        rows = [
+            {"node_id": f"{i:032x}", "dependencies": _dependencies(i)}
+            for i in range(start, min(start + BATCH, total))
+        ]
+        client.execute_query(LOAD_EDGES_QUERY, {"rows": rows})
+    client.execute_query(LOAD_CONTAINS_QUERY, {"version_id": VERSION_ID})
+    print(f"[bench] loaded {total:,} DataNodes in strategy {VERSION_ID}")
+
+    counting = _CountingClient(client)
+    service = Neo4jNodeManagementService(counting)
+    # 기존 방식: NodeManagementService 기본 구현(노드마다 get_node_dependencies)
+    _run(
+        "n+1",
+        lambda: NodeManagementService.get_strategy_graph(service, VERSION_ID),
+        counting,
+        total,
+    )
+    _run("single-query", lambda: service.get_strategy_graph(VERSION_ID), counting, total)
+    client.close()
+
+
+if __name__ == "__main__":
+    main()
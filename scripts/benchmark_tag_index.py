@@ -0,0 +1,57 @@
+"""
+태그 역색인(TagIndex) 벤치마크 스크립트
+- N 개 노드에 대해 선형 스캔(list 기반 in 검사)과 비트맵 역색인 질의 시간을 비교
+- 사용 예: python scripts/benchmark_tag_index.py 100000 200
+  (인자: 노드 수, 질의 반복 횟수)
+"""
+import random
+import sys
+import time
+
+from qmtl.sdk.tag_index import TagIndex
+
+TAGS = [f"T{i}" for i in range(50)]
+INTERVALS = ["1m", "1h", "1d"]
+
+
+def _linear(nodes, tags, interval, match_mode):
+    result = []
+    for node_id, node_tags, node_interval in nodes:
+        if match_mode == "AND":
+            matched = all(t in node_tags for t in tags)
+        else:
+            matched = any(t in node_tags for t in tags)
+        if matched and (not interval or node_interval == interval):
+            result.append(node_id)
+    return result
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    rng = random.Random(42)
+    nodes = [
+        (f"{i:032x}", rng.sample(TAGS, 4), rng.choice(INTERVALS)) for i in range(total)
+    ]
+    started = time.perf_counter()
+    index = TagIndex()
+    for node_id, tags, interval in nodes:
+        index.add(node_id, tags, [interval])
+    print(f"[bench] index build: {total:,} nodes in {time.perf_counter() - started:.2f}s")
+
+    queries = [
+        (rng.sample(TAGS, 2), rng.choice(INTERVALS + [None]), rng.choice(["AND", "OR"]))
+        for _ in range(repeat)
+    ]
+    for name, fn in (
+        ("linear", lambda q: _linear(nodes, *q)),
+        ("bitmap", lambda q: index.query(q[0], q[1], None, q[2])),
+    ):
+        started = time.perf_counter()
+        hits = sum(len(fn(q)) for q in queries)
+        elapsed = (time.perf_counter() - started) / repeat
+        print(f"[bench] {name:6s} {elapsed * 1000:8.2f} ms/query (hits={hits:,})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+DataNode 태그 쿼리 PROFILE 벤치마크 스크립트
+- N 개의 DataNode 를 생성(JSON 문자열 태그 + Tag 노드/top-level interval 동시 저장)한 뒤
+  기존 방식(label scan + JSON 문자열 필터)과 인덱스 기반 쿼리의 db hits / 소요 시간을 비교
+- 사용 예: python scripts/benchmark_tag_query.py bolt://localhost:7687 neo4j test 1000000
+  (인자: uri, user, password, 노드 수)
+"""
+import json
+import sys
+import time
+
+from qmtl.common.db.neo4j_client import Neo4jClient
+from qmtl.dag_manager.registry.services.node.neo4j_schema import get_schema_cypher
+
+TAGS = ["RAW", "CANDLE", "FEATURE", "SIGNAL", "RISK", "TREND"]
+INTERVALS = ["1m", "1h", "1d"]
+BATCH = 10000
+
+LOAD_QUERY = """
+UNWIND $rows AS row
+CREATE (n:DataNode:BenchNode {
+    node_id: row.node_id, tags: row.tags, interval_settings: row.interval_settings,
+    interval: row.interval, period: row.period
+})
+WITH n, row
+FOREACH (tag IN row.tag_names | MERGE (t:Tag {name: tag}) MERGE (n)-[:HAS_TAG]->(t))
+"""
+
+# 기존 방식: JSON 문자열에 대한 label scan (중첩 경로 인덱스는 사용 불가)
+LEGACY_QUERY = """
+MATCH (n:DataNode)
+WHERE n.tags CONTAINS $tag0 AND n.tags CONTAINS $tag1 AND n.interval_settings CONTAINS $interval
+RETURN n.node_id
+"""
+
+INDEXED_QUERY = """
+MATCH (t:Tag) WHERE t.name IN $tags
+MATCH (n:DataNode)-[:HAS_TAG]->(t)
+WITH n, count(DISTINCT t) AS matched
+WHERE matched = size($tags)
+WITH n
+WHERE n.interval = $interval
+RETURN n.node_id
+"""
+
+
+def _row(i: int) -> dict:
+    tag_names = [TAGS[i % len(TAGS)], TAGS[(i // len(TAGS)) % len(TAGS)]]
+    interval = INTERVALS[i % len(INTERVALS)]
+    return {
+        "node_id": f"{i:032x}",
+        "tags": json.dumps({"predefined": tag_names, "custom": []}),
+        "interval_settings": json.dumps({"interval": interval, "period": 1}),
+        "tag_names": list(dict.fromkeys(tag_names)),
+        "interval": interval,
+        "period": 1,
+    }
+
+
+def _profile(driver, query: str, params: dict) -> tuple:
+    def total_hits(plan) -> int:
+        return plan.get("dbHits", 0) + sum(total_hits(c) for c in plan.get("children", []))
+
+    with driver.session() as session:
+        started = time.perf_counter()
+        result = session.run("PROFILE " + query, params)
+        rows = len(list(result))
+        summary = result.consume()
+        elapsed = time.perf_counter() - started
+    return rows, total_hits(summary.profile), elapsed
+
+
+def main():
+    uri = sys.argv[1] if len(sys.argv) > 1 else "bolt://localhost:7687"
+    user = sys.argv[2] if len(sys.argv) > 2 else "neo4j"
+    password = sys.argv[3] if len(sys.argv) > 3 else "test"
+    total = int(sys.argv[4]) if len(sys.argv) > 4 else 1_000_000
+
+    client = Neo4jClient(uri=uri, username=user, password=password)
+    for cypher in get_schema_cypher():
+        client.execute_query(cypher)
+    client.execute_query("MATCH (n:BenchNode) CALL { WITH n DETACH DELETE n } IN TRANSACTIONS")
+    for start in range(0, total, BATCH):
+        rows = [_row(i) for i in range(start, min(start + BATCH, total))]
+        client.execute_query(LOAD_QUERY, {"rows": rows})
+    print(f"[bench] loaded {total:,} DataNodes")
+
+    driver = client.get_driver()
+    legacy = _profile(
+        driver, LEGACY_QUERY, {"tag0": '"RAW"', "tag1": '"SIGNAL"', "interval": '"1h"'}
+    )
+    indexed = _profile(driver, INDEXED_QUERY, {"tags": ["RAW", "SIGNAL"], "interval": "1h"})
+    for name, (rows, hits, elapsed) in (("legacy", legacy), ("indexed", indexed)):
+        print(f"[bench] {name:8s} rows={rows:,} db_hits={hits:,} elapsed={elapsed * 1000:.1f}ms")
+    client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,11 @@ Neo4j 인덱스 및 제약조건 마이그레이션 스크립트 (DAG Manager)
 """
 import sys
 from qmtl.common.db.neo4j_client import Neo4jClient
-from qmtl.dag_manager.registry.services.node.neo4j_schema import get_schema_cypher
+from qmtl.dag_manager.registry.services.node.neo4j_schema import (
+    backfill_gc_properties,
+    get_schema_cypher,
+    migrate_tag_storage,
+)
 
 
 def main():
@@ -15,11 +19,18 @@ def main():
     password = sys.argv[3] if len(sys.argv) > 3 else "test"
     database = sys.argv[4] if len(sys.argv) > 4 else None
 
-    client = Neo4jClient(uri=uri, user=user, password=password, database=database)
+    client = Neo4jClient(uri=uri, username=user, password=password)
     for cypher in get_schema_cypher():
         print(f"[Neo4j] Executing: {cypher.strip().splitlines()[0]} ...", flush=True)
-        client.execute_query(cypher)
+        client.execute_query(cypher, database=database)
     print("[Neo4j] All schema/index migrations applied.")
+    migrated = migrate_tag_storage(client, database)
+    print(f"[Neo4j] Tag/interval storage migrated for {migrated} DataNodes.")
+    backfilled = backfill_gc_properties(client, database)
+    print(
+        "[Neo4j] GC properties (expires_at, dependent_count) "
+        f"backfilled for {backfilled} DataNodes."
+    )
 
 if __name__ == "__main__":
     main()
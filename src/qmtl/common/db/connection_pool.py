@@ -1,11 +1,15 @@
 """Neo4j 연결 풀 관리 모듈.
 
 이 모듈은 Neo4j 데이터베이스 연결을 효율적으로 관리하기 위한 연결 풀을 제공합니다.
+URI 별로 하나의 드라이버(내부 커넥션 풀 보유)를 공유하고, 세션 단위로 임대(lease)합니다.
 """
 
 import threading
+import time
 from contextlib import contextmanager
-from typing import List, Optional
+from typing import Dict, Iterator, Optional
+
+from neo4j import Driver, GraphDatabase, Session
 
 from qmtl.common.config.settings import get_settings
 from qmtl.common.db.neo4j_client import Neo4jClient
@@ -31,7 +35,13 @@ class Neo4jConnectionPool:
         uri: Optional[str] = None,
         username: Optional[str] = None,
         password: Optional[str] = None,
-        max_size: int = 10,
+        max_size: Optional[int] = None,
+        max_connection_pool_size: int = 100,
+        max_stream_sessions: Optional[int] = None,
+        liveness_check_timeout: Optional[float] = 30.0,
+        acquire_timeout: float = 10.0,
+        connection_timeout: float = 5.0,
+        max_transaction_retry_time: float = 10.0,
     ):
         """Neo4j 연결 풀 초기화.
 
@@ -39,52 +49,177 @@ class Neo4jConnectionPool:
             uri: Neo4j 데이터베이스 URI (예: bolt://localhost:7687)
             username: 인증 사용자명
             password: 인증 비밀번호
-            max_size: 풀의 최대 크기
+            max_size: 동시에 임대 가능한 최대 세션 수 (기본값: max_connection_pool_size)
+            max_connection_pool_size: 드라이버 내부 커넥션 풀 최대 크기
+            max_stream_sessions: 스트리밍(stream=True) 세션 동시 임대 한도. 응답 전체 동안 세션을
+                점유하므로 일반 쿼리용 세션을 남겨 두기 위해 별도로 제한 (기본값: max_size 의 절반)
+            liveness_check_timeout: 유휴 커넥션 재사용 전 liveness 체크 기준 시간(초), None 이면 비활성
+            acquire_timeout: 세션 임대 대기 최대 시간(초)
+            connection_timeout: 연결 타임아웃(초)
+            max_transaction_retry_time: 관리형 트랜잭션 재시도 최대 시간(초)
         """
         if self._initialized and uri is None and username is None and password is None:
             # 이미 초기화된 싱글톤 인스턴스의 경우 재초기화 방지
             return
+        if self._initialized:
+            # 설정을 바꿔 재초기화하는 경우 기존 드라이버(커넥션)를 먼저 정리
+            self.close_all()
 
+        if max_size is None:
+            max_size = max_connection_pool_size
+        if max_stream_sessions is None:
+            max_stream_sessions = max(1, max_size // 2)
         self._initialized = True
         self._uri = uri
         self._username = username
         self._password = password
         self._max_size = max_size
-        self._pool: List[Neo4jClient] = []
+        self._max_stream_sessions = max_stream_sessions
+        self._max_connection_pool_size = max_connection_pool_size
+        self._liveness_check_timeout = liveness_check_timeout
+        self._acquire_timeout = acquire_timeout
+        self._connection_timeout = connection_timeout
+        self._max_transaction_retry_time = max_transaction_retry_time
+        self._drivers: Dict[str, Driver] = {}
+        self._clients: Dict[str, Neo4jClient] = {}
         self._available = threading.Semaphore(max_size)
+        self._stream_available = threading.Semaphore(max_stream_sessions)
         self._lock = threading.RLock()
+        # 메트릭
+        self._active_sessions = 0
+        self._active_stream_sessions = 0
+        self._peak_active_sessions = 0
+        self._acquired_total = 0
+        self._acquire_timeouts = 0
+        self._acquire_wait_total = 0.0
+        self._acquire_wait_max = 0.0
+
+    def get_driver(self, uri: Optional[str] = None) -> Driver:
+        """URI 별 공유 드라이버 반환 (최초 1회만 생성).
 
-    def get_client(self) -> Neo4jClient:
-        """연결 풀에서 Neo4j 클라이언트 획득.
+        Raises:
+            DatabaseError: 드라이버 생성 실패 시
+        """
+        uri = uri or self._uri
+        with self._lock:
+            driver = self._drivers.get(uri)
+            if driver is not None:
+                return driver
+            config = {
+                "max_connection_pool_size": self._max_connection_pool_size,
+                "connection_acquisition_timeout": self._acquire_timeout,
+                "connection_timeout": self._connection_timeout,
+                "max_transaction_retry_time": self._max_transaction_retry_time,
+            }
+            if self._liveness_check_timeout is not None:
+                config["liveness_check_timeout"] = self._liveness_check_timeout
+            try:
+                driver = GraphDatabase.driver(uri, auth=(self._username, self._password), **config)
+            except Exception as e:
+                raise DatabaseError(f"Neo4j 드라이버 생성 실패: {str(e)}")
+            self._drivers[uri] = driver
+            return driver
+
+    @contextmanager
+    def session(
+        self,
+        database: Optional[str] = None,
+        uri: Optional[str] = None,
+        access_mode: Optional[str] = None,
+        fetch_size: Optional[int] = None,
+        stream: bool = False,
+    ) -> Iterator[Session]:
+        """공유 드라이버에서 세션을 임대하는 컨텍스트 관리자.
+
+        Args:
+            database: 사용할 데이터베이스 (기본값: None, 기본 데이터베이스 사용)
+            uri: 드라이버 URI (기본값: 풀 기본 URI)
+            access_mode: READ_ACCESS/WRITE_ACCESS (클러스터 라우팅용, 기본값: 드라이버 기본)
+            fetch_size: 레코드 fetch 단위 (기본값: 드라이버 기본)
+            stream: 응답 스트리밍용 장기 임대 여부 (max_stream_sessions 한도를 추가로 적용)
+
+        Yields:
+            Neo4j 세션 (블록 종료 시 닫히고 커넥션은 드라이버 풀로 반환)
+
+        Raises:
+            DatabaseError: acquire_timeout 내 세션을 임대하지 못한 경우
+        """
+        driver = self.get_driver(uri)
+        # 재초기화 중에도 임대한 세마포어에 반납하도록 참조를 고정
+        available = self._available
+        stream_available = self._stream_available if stream else None
+        started = time.perf_counter()
+        deadline = started + self._acquire_timeout
+        if stream_available is not None and not stream_available.acquire(
+            timeout=self._acquire_timeout
+        ):
+            self._raise_acquire_timeout()
+        if not available.acquire(timeout=max(0.0, deadline - time.perf_counter())):
+            if stream_available is not None:
+                stream_available.release()
+            self._raise_acquire_timeout()
+        waited = time.perf_counter() - started
+        with self._lock:
+            self._acquired_total += 1
+            self._acquire_wait_total += waited
+            self._acquire_wait_max = max(self._acquire_wait_max, waited)
+            self._active_sessions += 1
+            self._peak_active_sessions = max(self._peak_active_sessions, self._active_sessions)
+            if stream:
+                self._active_stream_sessions += 1
+        config = {"database": database}
+        if access_mode is not None:
+            config["default_access_mode"] = access_mode
+        if fetch_size is not None:
+            config["fetch_size"] = fetch_size
+        try:
+            with driver.session(**config) as session:
+                yield session
+        finally:
+            with self._lock:
+                self._active_sessions -= 1
+                if stream:
+                    self._active_stream_sessions -= 1
+            available.release()
+            if stream_available is not None:
+                stream_available.release()
+
+    def _raise_acquire_timeout(self) -> None:
+        """세션 획득 타임아웃 기록 후 DatabaseError 발생."""
+        with self._lock:
+            self._acquire_timeouts += 1
+        raise DatabaseError(f"Neo4j 세션 획득 타임아웃 ({self._acquire_timeout}s)")
+
+    def get_client(self, uri: Optional[str] = None) -> Neo4jClient:
+        """공유 드라이버 기반 Neo4j 클라이언트 획득 (드라이버를 새로 만들지 않음).
+
+        반환된 클라이언트의 쿼리는 매번 풀에서 세션을 임대/반납하므로 release_client 호출은 선택입니다.
 
         Returns:
             Neo4j 클라이언트 인스턴스
 
         Raises:
-            DatabaseError: 연결 생성 실패 시
+            DatabaseError: 드라이버 생성 실패 시
         """
-        self._available.acquire()
-
+        uri = uri or self._uri
         with self._lock:
-            if not self._pool:
-                try:
-                    client = Neo4jClient(self._uri, self._username, self._password)
-                    return client
-                except Exception as e:
-                    self._available.release()
-                    raise DatabaseError(f"Neo4j 클라이언트 생성 실패: {str(e)}")
-            else:
-                return self._pool.pop()
+            client = self._clients.get(uri)
+            if client is None:
+                client = Neo4jClient.from_driver(
+                    self.get_driver(uri),
+                    session_provider=lambda database, **config: self.session(
+                        database, uri, **config
+                    ),
+                )
+                self._clients[uri] = client
+            return client
 
     def release_client(self, client: Neo4jClient) -> None:
-        """사용 완료된 클라이언트를 풀에 반환.
+        """하위 호환용. 세션은 쿼리 단위로 반납되므로 별도 작업이 없다.
 
         Args:
             client: 반환할 Neo4j 클라이언트 인스턴스
         """
-        with self._lock:
-            self._pool.append(client)
-        self._available.release()
 
     @contextmanager
     def client(self) -> Neo4jClient:
@@ -99,16 +234,46 @@ class Neo4jConnectionPool:
         finally:
             self.release_client(client)
 
+    def verify_connectivity(self, uri: Optional[str] = None) -> bool:
+        """드라이버 연결 상태 확인 (헬스체크용)."""
+        try:
+            self.get_driver(uri).verify_connectivity()
+            return True
+        except Exception:
+            return False
+
+    def get_metrics(self) -> Dict[str, float]:
+        """세션 임대 메트릭 반환 (획득 대기 시간, 활성 세션 수 등)."""
+        with self._lock:
+            acquired = self._acquired_total
+            return {
+                "drivers": len(self._drivers),
+                "max_sessions": self._max_size,
+                "max_stream_sessions": self._max_stream_sessions,
+                "active_sessions": self._active_sessions,
+                "active_stream_sessions": self._active_stream_sessions,
+                "peak_active_sessions": self._peak_active_sessions,
+                "acquired_total": acquired,
+                "acquire_timeouts": self._acquire_timeouts,
+                "acquire_wait_seconds_total": self._acquire_wait_total,
+                "acquire_wait_seconds_avg": (
+                    self._acquire_wait_total / acquired if acquired else 0.0
+                ),
+                "acquire_wait_seconds_max": self._acquire_wait_max,
+            }
+
     def close_all(self) -> None:
-        """풀의 모든 연결 종료."""
+        """풀의 모든 드라이버 종료."""
         with self._lock:
-            for client in self._pool:
-                client.close()
-            self._pool.clear()
+            for driver in self._drivers.values():
+                driver.close()
+            self._drivers.clear()
+            self._clients.clear()
 
     def __del__(self):
         """소멸자에서 열린 연결 정리."""
-        self.close_all()
+        if getattr(self, "_initialized", False):
+            self.close_all()
 
 
 # 글로벌 Neo4j 연결 풀 인스턴스
@@ -4,9 +4,10 @@
 Pydantic v2 모델을 활용하여 타입 안전성을 보장합니다.
 """
 
-from typing import Any, Callable, Dict, List, Optional, TypeVar
+from contextlib import AbstractContextManager
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar
 
-from neo4j import Driver, GraphDatabase, Transaction
+from neo4j import READ_ACCESS, WRITE_ACCESS, Driver, GraphDatabase, Transaction
 from pydantic import BaseModel
 
 from qmtl.common.errors.exceptions import DatabaseError
@@ -36,6 +37,8 @@ class Neo4jClient:
             max_transaction_retry_time: 트랜잭션 재시도 최대 시간 (밀리초)
             connection_acquisition_timeout: 연결 획득 타임아웃 (초)
         """
+        self._owns_driver = True
+        self._session_provider = None
         try:
             self._driver = GraphDatabase.driver(
                 uri, 
@@ -47,9 +50,55 @@ class Neo4jClient:
         except Exception as e:
             raise DatabaseError(f"Neo4j 연결 실패: {str(e)}")
 
+    @classmethod
+    def from_driver(
+        cls,
+        driver: Driver,
+        session_provider: Optional[Callable[..., AbstractContextManager]] = None,
+    ) -> "Neo4jClient":
+        """공유 드라이버를 사용하는 클라이언트 생성 (드라이버 생성/종료 책임 없음).
+
+        Args:
+            driver: 공유 Neo4j 드라이버 (예: Neo4jConnectionPool 소유)
+            session_provider: (database, access_mode, fetch_size[, stream])를 받아 세션 컨텍스트 관리자를
+                반환하는 함수 (지정 시 세션 획득/반납을 위임, 예: Neo4jConnectionPool.session)
+
+        Returns:
+            Neo4j 클라이언트 인스턴스
+        """
+        client = cls.__new__(cls)
+        client._driver = driver
+        client._owns_driver = False
+        client._session_provider = session_provider
+        return client
+
+    def _session(
+        self,
+        database: Optional[str] = None,
+        access_mode: Optional[str] = None,
+        fetch_size: Optional[int] = None,
+        stream: bool = False,
+    ) -> AbstractContextManager:
+        """쿼리/트랜잭션 실행용 세션 컨텍스트 관리자 반환.
+
+        access_mode 가 READ_ACCESS 이면 클러스터(neo4j:// 라우팅 URI)에서 follower/read replica 로 라우팅된다.
+        stream=True 는 결과를 지연 소비하는 장기 임대 세션임을 provider 에 알린다.
+        """
+        if self._session_provider is not None:
+            config = {"access_mode": access_mode, "fetch_size": fetch_size}
+            if stream:
+                config["stream"] = True
+            return self._session_provider(database, **config)
+        config = {"database": database}
+        if access_mode is not None:
+            config["default_access_mode"] = access_mode
+        if fetch_size is not None:
+            config["fetch_size"] = fetch_size
+        return self._driver.session(**config)
+
     def close(self) -> None:
-        """Neo4j 드라이버 연결 종료."""
-        if hasattr(self, "_driver"):
+        """Neo4j 드라이버 연결 종료 (공유 드라이버는 소유자가 종료)."""
+        if hasattr(self, "_driver") and getattr(self, "_owns_driver", True):
             self._driver.close()
 
     def get_driver(self) -> Driver:
@@ -82,12 +131,109 @@ class Neo4jClient:
         parameters = parameters or {}
 
         try:
-            with self._driver.session(database=database) as session:
+            with self._session(database) as session:
                 result = session.run(query, parameters)
                 return [record.data() for record in result]
         except Exception as e:
             raise DatabaseError(f"쿼리 실행 실패: {str(e)}")
 
+    def execute_read(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        database: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """읽기 전용 Cypher 쿼리를 관리형 트랜잭션(재시도 포함)으로 실행.
+
+        클러스터 환경에서는 READ 라우팅으로 follower/read replica 에서 실행된다.
+
+        Args:
+            query: 실행할 Cypher 쿼리
+            parameters: 쿼리 매개변수 (기본값: None)
+            database: 사용할 데이터베이스 (기본값: None, 기본 데이터베이스 사용)
+
+        Returns:
+            쿼리 결과 목록
+
+        Raises:
+            DatabaseError: 쿼리 실행 중 오류 발생 시
+        """
+        parameters = parameters or {}
+
+        def work(tx: Transaction) -> List[Dict[str, Any]]:
+            return [record.data() for record in tx.run(query, parameters)]
+
+        try:
+            with self._session(database, access_mode=READ_ACCESS) as session:
+                return session.execute_read(work)
+        except Exception as e:
+            raise DatabaseError(f"읽기 쿼리 실행 실패: {str(e)}")
+
+    def execute_write(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        database: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """쓰기 Cypher 쿼리를 관리형 트랜잭션(재시도 포함)으로 leader 에서 실행.
+
+        Args:
+            query: 실행할 Cypher 쿼리
+            parameters: 쿼리 매개변수 (기본값: None)
+            database: 사용할 데이터베이스 (기본값: None, 기본 데이터베이스 사용)
+
+        Returns:
+            쿼리 결과 목록
+
+        Raises:
+            DatabaseError: 쿼리 실행 중 오류 발생 시
+        """
+        parameters = parameters or {}
+
+        def work(tx: Transaction) -> List[Dict[str, Any]]:
+            return [record.data() for record in tx.run(query, parameters)]
+
+        try:
+            with self._session(database, access_mode=WRITE_ACCESS) as session:
+                return session.execute_write(work)
+        except Exception as e:
+            raise DatabaseError(f"쓰기 쿼리 실행 실패: {str(e)}")
+
+    def stream_read(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        database: Optional[str] = None,
+        fetch_size: int = 1000,
+    ) -> Iterator[Dict[str, Any]]:
+        """읽기 전용 쿼리 결과를 fetch_size 단위로 지연 스트리밍.
+
+        관리형 트랜잭션은 재시도를 위해 함수 내에서 결과를 모두 소비해야 하므로, 스트리밍은
+        READ 라우팅 세션의 명시적 트랜잭션으로 실행한다(재시도 없음). 세션은 iterator 소진/close 시 반납된다.
+
+        Args:
+            query: 실행할 Cypher 쿼리
+            parameters: 쿼리 매개변수 (기본값: None)
+            database: 사용할 데이터베이스 (기본값: None, 기본 데이터베이스 사용)
+            fetch_size: 서버에서 한 번에 가져올 레코드 수
+
+        Yields:
+            레코드 dict
+
+        Raises:
+            DatabaseError: 쿼리 실행 중 오류 발생 시
+        """
+        parameters = parameters or {}
+        try:
+            with self._session(
+                database, access_mode=READ_ACCESS, fetch_size=fetch_size, stream=True
+            ) as session:
+                with session.begin_transaction() as tx:
+                    for record in tx.run(query, parameters):
+                        yield record.data()
+        except Exception as e:
+            raise DatabaseError(f"스트리밍 쿼리 실행 실패: {str(e)}")
+
     def execute_with_model(
         self,
         query: str,
@@ -134,7 +280,7 @@ class Neo4jClient:
             DatabaseError: 트랜잭션 실행 중 오류 발생 시
         """
         try:
-            with self._driver.session(database=database) as session:
+            with self._session(database) as session:
                 return session.execute_write(work_function)
         except Exception as e:
             raise DatabaseError(f"트랜잭션 실행 실패: {str(e)}")
@@ -0,0 +1,66 @@
+"""
+HTTP 본문 content negotiation (JSON / application/x-protobuf)
+
+- 요청: Content-Type 이 application/x-protobuf 이면 본문을 protobuf 메시지로 파싱, 아니면 JSON
+- 응답: Accept 에 application/x-protobuf 가 있으면 protobuf 바이너리, 아니면 JSON (기본값)
+- 조건부 요청: If-None-Match 는 쉼표로 구분된 entity-tag 목록(또는 `*`)으로 해석, 약한 비교(W/ 무시)
+- registry API, gateway 에서 공용 사용
+"""
+
+from typing import Dict, Optional, Type, TypeVar
+
+from fastapi import HTTPException, Request
+from fastapi.responses import Response
+from google.protobuf.message import DecodeError, Message
+
+PROTOBUF_MEDIA_TYPE = "application/x-protobuf"
+
+M = TypeVar("M", bound=Message)
+
+
+def wants_protobuf(request: Request) -> bool:
+    """Accept 헤더로 protobuf 응답을 요청했는지 여부"""
+    return PROTOBUF_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def if_none_match(request: Request, etag: str) -> bool:
+    """If-None-Match 헤더가 etag 와 일치하는지 여부 (`*` 또는 목록 중 하나가 약한 비교로 일치)"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for tag in header.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == opaque:
+            return True
+    return False
+
+
+def is_protobuf_body(request: Request) -> bool:
+    """요청 본문이 protobuf 인지 여부 (Content-Type 기준)"""
+    return request.headers.get("content-type", "").startswith(PROTOBUF_MEDIA_TYPE)
+
+
+async def read_protobuf(request: Request, message_class: Type[M]) -> M:
+    """요청 본문을 message_class 로 파싱. 디코딩 실패 시 400"""
+    message = message_class()
+    try:
+        message.ParseFromString(await request.body())
+    except DecodeError:
+        raise HTTPException(status_code=400, detail="protobuf 본문을 해석할 수 없습니다")
+    return message
+
+
+def protobuf_response(
+    message: Message, status_code: int = 200, headers: Optional[Dict[str, str]] = None
+) -> Response:
+    return Response(
+        content=message.SerializeToString(),
+        status_code=status_code,
+        media_type=PROTOBUF_MEDIA_TYPE,
+        headers=headers,
+    )
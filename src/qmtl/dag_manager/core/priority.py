@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+"""CriticalPathPriority
+=======================
+ready 노드 dispatch 우선순위 계산기.
+
+기준
+-----
+1. 노드 비용 = 과거 실행 시간(초, 없으면 default_exec_time)
+2. critical path 길이 = 자기 비용 + downstream 중 가장 긴 경로의 비용
+3. 최종 priority = critical path 길이 × strategy_weight
+   - 값이 클수록 먼저 dispatch 되어야 함 (RedisQueueRepository.push_priority 의 score)
+"""
+
+from typing import Dict, List, Mapping, Optional
+
+from google.protobuf.timestamp_pb2 import Timestamp
+
+from qmtl.models.datanode import DataNode
+from qmtl.models.generated.qmtl_status_pb2 import NodeStatus
+from .graph_builder import GraphBuilder
+
+
+def exec_times_from_statuses(statuses: Mapping[str, NodeStatus]) -> Dict[str, float]:
+    """NodeStatus(start_time/end_time, RFC3339 문자열)로부터 노드별 실행 시간(초)을 추출한다."""
+    exec_times: Dict[str, float] = {}
+    for node_id, status in statuses.items():
+        if not (status.start_time and status.end_time):
+            continue
+        start, end = Timestamp(), Timestamp()
+        try:
+            start.FromJsonString(status.start_time)
+            end.FromJsonString(status.end_time)
+        except ValueError:
+            continue
+        elapsed = end.ToNanoseconds() - start.ToNanoseconds()
+        if elapsed >= 0:
+            exec_times[node_id] = elapsed / 1e9
+    return exec_times
+
+
+class CriticalPathPriority:
+    """downstream critical path 길이 기반 노드 우선순위 계산"""
+
+    def __init__(
+        self,
+        nodes: List[DataNode],
+        exec_times: Optional[Mapping[str, float]] = None,
+        strategy_weight: float = 1.0,
+        default_exec_time: float = 1.0,
+    ):
+        self.nodes = nodes
+        self.exec_times = exec_times or {}
+        self.strategy_weight = strategy_weight
+        self.default_exec_time = default_exec_time
+        self._priorities: Optional[Dict[str, float]] = None
+
+    def compute(self) -> Dict[str, float]:
+        """노드 ID → priority 맵을 반환한다. (결과는 인스턴스에 캐시)"""
+        if self._priorities is not None:
+            return self._priorities
+        topo = GraphBuilder(self.nodes).get_topological_sort_result()
+        children: Dict[str, List[str]] = {n.node_id: [] for n in self.nodes}
+        for node in self.nodes:
+            for dep in node.dependencies:
+                if dep in children:
+                    children[dep].append(node.node_id)
+
+        # 위상정렬 역순(downstream → upstream)으로 최장 경로를 누적
+        path_cost: Dict[str, float] = {}
+        for node_id in reversed(topo.order):
+            own = self.exec_times.get(node_id, self.default_exec_time)
+            downstream = max((path_cost[c] for c in children[node_id]), default=0.0)
+            path_cost[node_id] = own + downstream
+
+        self._priorities = {nid: cost * self.strategy_weight for nid, cost in path_cost.items()}
+        return self._priorities
+
+    def priority_of(self, node_id: str) -> float:
+        """단일 노드의 priority (미등록 노드는 0.0)"""
+        return self.compute().get(node_id, 0.0)
@@ -10,6 +10,9 @@ DAG Manager 작업 큐 전용 레포지토리.
 2. pop 시 `queue_key → processing_key` 로 이동하여 in-flight 작업 추적
 3. complete 호출 시 processing 리스트에서 제거하고 결과 해시(`results_key`)에 저장
    - 기본 TTL 1시간(3600s) 설정
+4. 우선순위 dispatch: `priority_queue_key` ZSET 에 score(priority)와 함께 ZADD,
+   Lua 스크립트(ZPOPMAX + LPUSH)로 가장 높은 priority 항목을 processing 리스트로 원자적으로 이동
+   - 대기는 poll_interval 간격 재시도 (BZPOPMAX 후 LPUSH 는 그 사이 worker 가 죽으면 항목이 유실됨)
 
 ※ 실제 프로덕션 환경에서는 protobuf WorkItem을 SerializeToString() 해서 push 함.
    여기서는 bytes 또는 str(any serialised form)을 그대로 저장하게끔 단순화.
@@ -19,8 +22,18 @@ from datetime import datetime
 from typing import Any, Optional
 
 import json
+import time
 import redis
 
+# 최고 priority 항목 pop 과 processing 리스트 기록을 한 번에 처리
+# KEYS: priority_queue, processing
+_POP_PRIORITY_LUA = """
+local popped = redis.call('ZPOPMAX', KEYS[1])
+if #popped == 0 then return false end
+redis.call('LPUSH', KEYS[2], popped[1])
+return popped[1]
+"""
+
 
 def _now_iso() -> str:
     return datetime.utcnow().isoformat()
@@ -34,11 +47,16 @@ class RedisQueueRepository:
         queue_key: str = "qmtl:dag:work_queue",
         processing_key: str = "qmtl:dag:processing",
         results_key: str = "qmtl:dag:results",
+        priority_queue_key: str = "qmtl:dag:priority_queue",
+        poll_interval: float = 0.1,
     ) -> None:
         self.redis = redis_client or redis.from_url(redis_url)
         self.queue_key = queue_key
         self.processing_key = processing_key
         self.results_key = results_key
+        self.priority_queue_key = priority_queue_key
+        self.poll_interval = poll_interval
+        self._pop_priority_script = None
 
     # ------------------------------------------------------------------
     # Enqueue / Dequeue
@@ -51,6 +69,31 @@ class RedisQueueRepository:
         """blocking pop → processing list로 이동"""
         return self.redis.brpoplpush(self.queue_key, self.processing_key, timeout)
 
+    def push_priority(self, item: bytes | str, priority: float) -> None:
+        """우선순위 큐(ZSET)에 항목 추가. priority 가 클수록 먼저 pop 된다."""
+        self.redis.zadd(self.priority_queue_key, {item: priority})
+
+    def pop_priority(self, timeout: float = 0) -> Optional[bytes | str]:
+        """가장 높은 priority 항목을 pop → processing list로 이동 (timeout=0 이면 무기한 대기)"""
+        deadline = time.monotonic() + timeout if timeout else None
+        while True:
+            item = self.pop_priority_nowait()
+            if item is not None:
+                return item
+            wait = self.poll_interval
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                wait = min(wait, remaining)
+            time.sleep(wait)
+
+    def pop_priority_nowait(self) -> Optional[bytes | str]:
+        """대기 없이 최고 priority 항목을 processing list로 원자적으로 이동 (없으면 None)"""
+        if self._pop_priority_script is None:
+            self._pop_priority_script = self.redis.register_script(_POP_PRIORITY_LUA)
+        return self._pop_priority_script(keys=[self.priority_queue_key, self.processing_key])
+
     # ------------------------------------------------------------------
     # Completion & Result
     # ------------------------------------------------------------------
@@ -5,31 +5,46 @@ from __future__ import annotations
 ReadyNodeSelector 결과를 큐에 enqueue 하고,
 작업 완료 시 상태 및 큐 결과를 갱신하는 유틸리티.
 
+priority_fn 이 주어지면 ready 노드를 priority 내림차순으로 정렬한 뒤
+push_fn(node_id, priority) 형태로 호출한다. (RedisQueueRepository.push_priority 연동)
+
 (실제 환경에서는 분리된 consumer 가 노드 실행을 담당하겠지만
 여기서는 간단한 헬퍼 클래스로 구현한다.)
 """
 
-from typing import List, Any, Callable
+from typing import List, Any, Callable, Optional
 from qmtl.models.datanode import DataNode
 
 
 class QueueWorker:
     def __init__(
         self,
-        push_fn: Callable[[str], None],
+        # push_fn(node_id), priority_fn 지정 시 push_fn(node_id, priority)
+        push_fn: Callable[..., None],
         update_status_fn: Callable[[str, str], None],
         complete_fn: Callable[[str, Any], bool],
+        priority_fn: Optional[Callable[[str], float]] = None,
     ):
         self.push_fn = push_fn
         self.update_status_fn = update_status_fn
         self.complete_fn = complete_fn
+        self.priority_fn = priority_fn
 
     def enqueue_ready_nodes(self, ready_nodes: List[DataNode]) -> List[DataNode]:
-        """ready 상태 노드를 큐에 등록하고 리스트 반환"""
-        for node in ready_nodes:
-            self.push_fn(node.node_id)
+        """ready 상태 노드를 큐에 등록하고 리스트 반환 (priority_fn 지정 시 priority 순)"""
+        if self.priority_fn is None:
+            for node in ready_nodes:
+                self.push_fn(node.node_id)
+                self.update_status_fn(node.node_id, "READY")
+            return ready_nodes
+
+        scored = [(self.priority_fn(node.node_id), node) for node in ready_nodes]
+        # sorted 는 stable 하므로 동일 priority 는 위상정렬 순서를 유지
+        scored = sorted(scored, key=lambda pair: pair[0], reverse=True)
+        for priority, node in scored:
+            self.push_fn(node.node_id, priority)
             self.update_status_fn(node.node_id, "READY")
-        return ready_nodes
+        return [node for _, node in scored]
 
     def complete_node(self, node_id: str, result: Any = None) -> bool:
         """노드 실행 완료 처리 (상태, 큐 결과)"""
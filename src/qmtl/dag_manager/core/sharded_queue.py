@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+"""ShardedRedisQueueRepository
+==============================
+단일 `qmtl:dag:work_queue` hot key 를 N 개 shard 로 분할한 작업 큐.
+
+설계 목표
+---------
+1. shard 선택: node_id 또는 pipeline_id(shard_key)의 consistent hashing
+   - shard 수를 바꿔도 대부분의 key 가 기존 shard 를 유지 (virtual node ring)
+2. 키 네이밍: `qmtl:dag:{shard-<i>}:work_queue` 처럼 Redis Cluster hash tag 를 사용해
+   한 shard 의 queue/processing/results 키가 같은 slot 에 위치 → RPOPLPUSH 가 cluster 에서도 동작
+3. work stealing: worker 는 home shard 를 먼저 확인하고, 비어 있으면 다른 shard 에서 가져옴
+   - 가져온 항목은 원래 shard 의 processing 리스트로 이동 (cross-slot 이동 금지)
+   - 전부 비어 있으면 home shard 에서 최대 steal_interval 동안 대기한 뒤 전체 shard 를 다시 확인
+     (다른 shard 에 들어온 작업도 steal_interval 안에 가져감)
+4. 각 shard 는 RedisQueueRepository 그대로 사용 (FIFO / priority 모두 지원)
+"""
+
+import bisect
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+import redis
+
+from qmtl.common.utils.hash_utils import md5_hex
+from .queue_repository import RedisQueueRepository
+
+
+class ConsistentHashRing:
+    """virtual node 기반 consistent hash ring"""
+
+    def __init__(self, shard_ids: Sequence[int], replicas: int = 64):
+        self.replicas = replicas
+        self._ring: List[int] = []
+        self._owners: Dict[int, int] = {}
+        for shard_id in shard_ids:
+            for r in range(replicas):
+                point = self._hash(f"shard-{shard_id}#{r}")
+                self._owners[point] = shard_id
+                bisect.insort(self._ring, point)
+
+    @staticmethod
+    def _hash(key: str) -> int:
+        return int(md5_hex(key)[:16], 16)
+
+    def get_shard(self, key: str) -> int:
+        """key 를 담당하는 shard id 반환"""
+        if not self._ring:
+            raise ValueError("ConsistentHashRing has no shards")
+        idx = bisect.bisect(self._ring, self._hash(key)) % len(self._ring)
+        return self._owners[self._ring[idx]]
+
+
+class ShardedRedisQueueRepository:
+    def __init__(
+        self,
+        num_shards: int = 4,
+        redis_client: Optional[redis.Redis] = None,
+        redis_url: str = "redis://localhost:6379/0",
+        key_prefix: str = "qmtl:dag",
+        replicas: int = 64,
+        steal_interval: float = 1.0,
+        poll_interval: float = 0.1,
+    ) -> None:
+        if num_shards < 1:
+            raise ValueError("num_shards must be >= 1")
+        self.redis = redis_client or redis.from_url(redis_url)
+        self.num_shards = num_shards
+        self.steal_interval = steal_interval
+        self.ring = ConsistentHashRing(range(num_shards), replicas=replicas)
+        self.shards: List[RedisQueueRepository] = [
+            RedisQueueRepository(
+                redis_client=self.redis,
+                queue_key=f"{key_prefix}:{{shard-{i}}}:work_queue",
+                processing_key=f"{key_prefix}:{{shard-{i}}}:processing",
+                results_key=f"{key_prefix}:{{shard-{i}}}:results",
+                priority_queue_key=f"{key_prefix}:{{shard-{i}}}:priority_queue",
+                poll_interval=poll_interval,
+            )
+            for i in range(num_shards)
+        ]
+
+    # ------------------------------------------------------------------
+    # Shard 선택
+    # ------------------------------------------------------------------
+    def shard_for(self, key: bytes | str) -> RedisQueueRepository:
+        """key(node_id/pipeline_id)를 담당하는 shard 반환"""
+        if isinstance(key, bytes):
+            key = key.decode("utf-8")
+        return self.shards[self.ring.get_shard(key)]
+
+    def _steal_order(self, home_shard: int) -> List[RedisQueueRepository]:
+        """home shard 부터 시작해 나머지 shard 를 순회하는 순서"""
+        return [self.shards[(home_shard + i) % self.num_shards] for i in range(self.num_shards)]
+
+    # ------------------------------------------------------------------
+    # Enqueue / Dequeue
+    # ------------------------------------------------------------------
+    def push(self, item: bytes | str, shard_key: Optional[str] = None) -> None:
+        """shard_key(기본: item 자체)로 선택된 shard 큐에 항목 추가"""
+        self.shard_for(shard_key or item).push(item)
+
+    def push_priority(
+        self, item: bytes | str, priority: float, shard_key: Optional[str] = None
+    ) -> None:
+        """shard_key(기본: item 자체)로 선택된 shard 우선순위 큐에 항목 추가"""
+        self.shard_for(shard_key or item).push_priority(item, priority)
+
+    def pop(self, home_shard: int = 0, timeout: float = 0) -> Optional[bytes | str]:
+        """home shard → 다른 shard 순으로 pop (timeout=0 이면 무기한 대기)
+
+        전부 비어 있으면 home shard 에서 steal_interval 만큼 대기 후 다시 전체를 확인한다.
+        """
+        home = self.shards[home_shard % self.num_shards]
+        deadline = time.monotonic() + timeout if timeout else None
+        while True:
+            for shard in self._steal_order(home_shard):
+                item = shard.redis.rpoplpush(shard.queue_key, shard.processing_key)
+                if item is not None:
+                    return item
+            wait = self._next_wait(deadline)
+            if wait is None:
+                return None
+            item = home.pop(wait)
+            if item is not None:
+                return item
+
+    def pop_priority(self, home_shard: int = 0, timeout: float = 0) -> Optional[bytes | str]:
+        """home shard → 다른 shard 순으로 최고 priority 항목 pop (timeout=0 이면 무기한 대기)
+
+        shard 별 pop 은 pop_priority_nowait (ZPOPMAX + LPUSH Lua 스크립트) 로 원자적이다.
+        """
+        home = self.shards[home_shard % self.num_shards]
+        deadline = time.monotonic() + timeout if timeout else None
+        while True:
+            for shard in self._steal_order(home_shard):
+                item = shard.pop_priority_nowait()
+                if item is not None:
+                    return item
+            wait = self._next_wait(deadline, home.poll_interval)
+            if wait is None:
+                return None
+            time.sleep(wait)
+
+    def _next_wait(self, deadline: Optional[float], interval: Optional[float] = None):
+        """다음 sweep 전 대기 시간 (deadline 이 지났으면 None)"""
+        wait = self.steal_interval if interval is None else interval
+        if deadline is None:
+            return wait
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        return min(wait, remaining)
+
+    # ------------------------------------------------------------------
+    # Completion & Result
+    # ------------------------------------------------------------------
+    def complete(
+        self, work_id: str, result: Any = None, ttl: int = 3600, shard_key: Optional[str] = None
+    ) -> bool:
+        """작업 완료 처리. 담당 shard 에서 먼저 찾고, 없으면 전체 shard 를 확인한다."""
+        owner = self.shard_for(shard_key or work_id)
+        if owner.complete(work_id, result, ttl):
+            return True
+        return any(s.complete(work_id, result, ttl) for s in self.shards if s is not owner)
+
+    def get_result(self, work_id: str, shard_key: Optional[str] = None) -> Optional[dict]:
+        owner = self.shard_for(shard_key or work_id)
+        found = owner.get_result(work_id)
+        if found is not None:
+            return found
+        for shard in self.shards:
+            if shard is not owner:
+                found = shard.get_result(work_id)
+                if found is not None:
+                    return found
+        return None
@@ -3,47 +3,248 @@
 Orchestrator 실시간 상태 구독/알림 연동 클라이언트 (MULTI-7)
 - Registry의 Redis Pub/Sub 이벤트 구독
 - 대시보드/알림 시스템 연동 Hook 예시
+- 프로세스당 하나의 EventDispatcher 가 단일 연결/단일 스레드로 PSUBSCRIBE 하고
+  채널별 callback 라우팅 테이블로 분배 (구독 수와 무관하게 스레드 1개, firehose 채널은 SUBSCRIBE)
+- 메시지당 protobuf 디코딩은 한 번만 수행하고 같은 이벤트 객체를 모든 callback 에 전달
+  (callback 은 이벤트를 수정하지 않아야 함)
 """
+import asyncio
+import inspect
+import itertools
+import logging
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
 import redis
+import redis.asyncio as aioredis
 from qmtl.models.generated import qmtl_events_pb2
 
-class EventClient:
+logger = logging.getLogger(__name__)
+
+# 채널 prefix → (PSUBSCRIBE 패턴, 이벤트 타입)
+CHANNEL_PATTERNS = {
+    "event:node:": ("event:node:*", qmtl_events_pb2.NodeStatusEvent),
+    "event:pipeline:": ("event:pipeline:*", qmtl_events_pb2.PipelineStatusEvent),
+    "event:alert:": ("event:alert:*", qmtl_events_pb2.AlertEvent),
+}
+
+
+# 전체 이벤트(firehose) 채널 → 이벤트 타입 (패턴 없이 SUBSCRIBE)
+FIREHOSE_CHANNELS = {
+    "event:node_status": qmtl_events_pb2.NodeStatusEvent,
+    "event:pipeline_status": qmtl_events_pb2.PipelineStatusEvent,
+    "event:alert": qmtl_events_pb2.AlertEvent,
+}
+
+
+def _pattern_for(channel: str) -> Tuple[str, type]:
+    """channel 을 받기 위한 (구독 대상, 이벤트 타입). firehose 채널은 채널 자체를 구독"""
+    if channel in FIREHOSE_CHANNELS:
+        return channel, FIREHOSE_CHANNELS[channel]
+    for prefix, (pattern, event_type) in CHANNEL_PATTERNS.items():
+        if channel.startswith(prefix):
+            return pattern, event_type
+    raise ValueError(f"지원하지 않는 이벤트 채널: {channel}")
+
+
+def _is_pattern(target: str) -> bool:
+    return target.endswith("*")
+
+
+class _RoutingTable:
+    """channel → callback 목록. 패턴으로 받은 메시지 중 구독 중인 채널만 디코딩"""
+
+    def __init__(self):
+        self._routes: Dict[str, Dict[int, Callable]] = {}
+        self._handles: Dict[int, str] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def add(self, channel: str, callback: Callable) -> int:
+        handle = next(self._ids)
+        with self._lock:
+            self._routes.setdefault(channel, {})[handle] = callback
+            self._handles[handle] = channel
+        return handle
+
+    def remove(self, handle: int) -> bool:
+        with self._lock:
+            channel = self._handles.pop(handle, None)
+            if channel is None:
+                return False
+            callbacks = self._routes[channel]
+            callbacks.pop(handle, None)
+            if not callbacks:
+                del self._routes[channel]
+            return True
+
+    def __len__(self) -> int:
+        return len(self._handles)
+
+    def match(self, message) -> Tuple[Optional[object], List[Callable]]:
+        """(디코딩된 이벤트, callback 목록). 구독자가 없는 채널은 디코딩하지 않음"""
+        channel = message["channel"]
+        if isinstance(channel, bytes):
+            channel = channel.decode()
+        with self._lock:
+            callbacks = list(self._routes.get(channel, {}).values())
+        if not callbacks:
+            return None, []
+        _, event_type = _pattern_for(channel)
+        event = event_type()
+        event.ParseFromString(message["data"])
+        return event, callbacks
+
+
+class EventDispatcher:
+    """
+    단일 Redis 연결 + 단일 스레드 Pub/Sub 분배기 (redis_url 별 프로세스 싱글턴: EventDispatcher.get)
+    - 이벤트 종류별 패턴(event:node:* 등)을 처음 필요할 때 한 번만 PSUBSCRIBE
+    """
+
+    _instances: Dict[str, "EventDispatcher"] = {}
+    _instances_lock = threading.Lock()
+
     def __init__(self, redis_url: str = "redis://localhost:6379/0"):
         self.redis = redis.from_url(redis_url)
-        self.pubsub = self.redis.pubsub()
-
-    def subscribe_node_status(self, node_id: str, callback):
-        channel = f"event:node:{node_id}"
-        def protobuf_callback(msg):
-            if msg['type'] == 'message':
-                event = qmtl_events_pb2.NodeStatusEvent()
-                event.ParseFromString(msg['data'])
-                callback(event)
-        self.pubsub.subscribe(**{channel: protobuf_callback})
-        self.pubsub.run_in_thread(sleep_time=0.1)
-
-    def subscribe_pipeline_status(self, pipeline_id: str, callback):
-        channel = f"event:pipeline:{pipeline_id}"
-        def protobuf_callback(msg):
-            if msg['type'] == 'message':
-                event = qmtl_events_pb2.PipelineStatusEvent()
-                event.ParseFromString(msg['data'])
-                callback(event)
-        self.pubsub.subscribe(**{channel: protobuf_callback})
-        self.pubsub.run_in_thread(sleep_time=0.1)
-
-    def subscribe_alerts(self, target_id: str, callback):
-        channel = f"event:alert:{target_id}"
-        def protobuf_callback(msg):
-            if msg['type'] == 'message':
-                event = qmtl_events_pb2.AlertEvent()
-                event.ParseFromString(msg['data'])
+        self.pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+        self.routes = _RoutingTable()
+        self._patterns = set()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @classmethod
+    def get(cls, redis_url: str = "redis://localhost:6379/0") -> "EventDispatcher":
+        with cls._instances_lock:
+            dispatcher = cls._instances.get(redis_url)
+            if dispatcher is None:
+                dispatcher = cls._instances[redis_url] = cls(redis_url)
+            return dispatcher
+
+    def subscribe(self, channel: str, callback: Callable) -> int:
+        """channel 구독, 구독 해제용 handle 반환"""
+        pattern, _ = _pattern_for(channel)
+        handle = self.routes.add(channel, callback)
+        with self._lock:
+            if pattern not in self._patterns:
+                if _is_pattern(pattern):
+                    self.pubsub.psubscribe(**{pattern: self._dispatch})
+                else:
+                    self.pubsub.subscribe(**{pattern: self._dispatch})
+                self._patterns.add(pattern)
+            if self._thread is None:
+                self._thread = self.pubsub.run_in_thread(sleep_time=1.0, daemon=True)
+        return handle
+
+    def unsubscribe(self, handle: int) -> bool:
+        return self.routes.remove(handle)
+
+    def _dispatch(self, message) -> None:
+        try:
+            event, callbacks = self.routes.match(message)
+        except Exception:
+            logger.exception("이벤트 디코딩 실패")
+            return
+        for callback in callbacks:
+            try:
                 callback(event)
-        self.pubsub.subscribe(**{channel: protobuf_callback})
-        self.pubsub.run_in_thread(sleep_time=0.1)
+            except Exception:
+                logger.exception("이벤트 callback 실패")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                self._thread.stop()
+                self._thread.join(timeout=2)
+                self._thread = None
+            self.pubsub.close()
+            self._patterns.clear()
+
+
+class AsyncEventDispatcher:
+    """
+    EventDispatcher 의 asyncio 버전 (redis.asyncio, 단일 연결 + reader task 1개)
+    - callback 은 일반 함수 또는 코루틴 함수
+    """
+
+    def __init__(self, redis_url: str = "redis://localhost:6379/0"):
+        self.redis = aioredis.from_url(redis_url)
+        self.pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+        self.routes = _RoutingTable()
+        self._patterns = set()
+        self._task: Optional[asyncio.Task] = None
+
+    async def __aenter__(self) -> "AsyncEventDispatcher":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+
+    async def subscribe(self, channel: str, callback: Callable) -> int:
+        pattern, _ = _pattern_for(channel)
+        handle = self.routes.add(channel, callback)
+        if pattern not in self._patterns:
+            self._patterns.add(pattern)
+            if _is_pattern(pattern):
+                await self.pubsub.psubscribe(pattern)
+            else:
+                await self.pubsub.subscribe(pattern)
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        return handle
+
+    def unsubscribe(self, handle: int) -> bool:
+        return self.routes.remove(handle)
+
+    async def _run(self) -> None:
+        while True:
+            message = await self.pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+            if message is None:
+                continue
+            try:
+                event, callbacks = self.routes.match(message)
+            except Exception:
+                logger.exception("이벤트 디코딩 실패")
+                continue
+            for callback in callbacks:
+                try:
+                    result = callback(event)
+                    if inspect.isawaitable(result):
+                        await result
+                except Exception:
+                    logger.exception("이벤트 callback 실패")
+
+    async def aclose(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.pubsub.aclose()
+        await self.redis.aclose()
+
+
+class EventClient:
+    def __init__(self, redis_url: str = "redis://localhost:6379/0"):
+        self.dispatcher = EventDispatcher.get(redis_url)
+        self.redis = self.dispatcher.redis
+        self.pubsub = self.dispatcher.pubsub
+
+    def subscribe_node_status(self, node_id: str, callback) -> int:
+        return self.dispatcher.subscribe(f"event:node:{node_id}", callback)
+
+    def subscribe_pipeline_status(self, pipeline_id: str, callback) -> int:
+        return self.dispatcher.subscribe(f"event:pipeline:{pipeline_id}", callback)
+
+    def subscribe_alerts(self, target_id: str, callback) -> int:
+        return self.dispatcher.subscribe(f"event:alert:{target_id}", callback)
+
+    def unsubscribe(self, handle: int) -> bool:
+        return self.dispatcher.unsubscribe(handle)
 
 # 대시보드/알림 시스템 연동 예시:
-# def dashboard_callback(msg):
-#     event = json.loads(msg['data'])
-#     ... # 대시보드/알림 처리
+# def dashboard_callback(event):
+#     ... # 대시보드/알림 처리 (event 는 NodeStatusEvent protobuf)
 # EventClient().subscribe_node_status(node_id, dashboard_callback)
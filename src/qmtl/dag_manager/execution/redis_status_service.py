@@ -0,0 +1,465 @@
+"""RedisStatusService
+==================
+StatusService 와 동일한 API 를 제공하는 Redis 기반 상태 저장소.
+DAG Manager replica 들이 같은 Redis 를 바라보며 상태를 공유한다.
+
+키 구조 (pipeline_id 를 hash tag 로 사용 → Redis Cluster 에서 한 slot 에 위치)
+------------------------------------------------------------------------
+- `{prefix}:{<pid>}:pipeline` : PipelineStatus (SerializeToString)
+- `{prefix}:{<pid>}:nodes`    : HASH node_id → NodeStatus (SerializeToString)
+- `{prefix}:{<pid>}:state`    : HASH node_id → status 문자열 (카운터 정합성용)
+- `{prefix}:{<pid>}:counters` : HASH status → 노드 수 (+ total, last_update_ms, version,
+                                base_version), HINCRBY 로 갱신
+- `{prefix}:{<pid>}:changes`  : STREAM 상태 변경 이벤트 (XADD MAXLEN ~ N)
+- `{prefix}:{<pid>}:versions` : ZSET node_id → 마지막 상태 변경 version (delta 스냅샷용)
+- `{prefix}:{<pid>}:order`    : ZSET node_id → 노드 인덱스 (bulk 스냅샷 순서)
+
+모든 키는 갱신 시 TTL 이 연장되며, 오래된 파이프라인은 스캔 없이 TTL 만료로 정리된다.
+protobuf blob 갱신은 read → merge(Python) → compare-and-set(Lua) 으로 처리한다.
+읽은 뒤 다른 replica 가 같은 blob 을 바꿨으면 스크립트가 -3 을 반환하고, 최신 값을 다시 읽어 merge 한다.
+
+※ 값이 binary protobuf 이므로 decode_responses=False 인 redis 클라이언트를 사용해야 한다.
+"""
+
+import json
+import logging
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import redis
+from google.protobuf.timestamp_pb2 import Timestamp
+
+from qmtl.common.errors.exceptions import StatusServiceError
+from qmtl.models.datanode import DataNode
+from qmtl.models.generated.qmtl_status_pb2 import NodeStatus, PipelineStatus
+from qmtl.models.generated.qmtl_status_snapshot_pb2 import (
+    NODE_STATUS_UNKNOWN,
+    PipelineStatusSnapshot,
+)
+from qmtl.models.status import STATUS_TO_CODE
+
+logger = logging.getLogger(__name__)
+
+# 노드 상태 갱신 (상태 맵/카운터/노드 blob/변경 스트림/TTL 을 원자적으로 처리)
+# KEYS: state, counters, nodes, changes, pipeline, versions, order
+# ARGV: node_id, status, node_blob, ttl, maxlen, now_ms, result_json, expected_blob
+_UPDATE_NODE_LUA = """
+if redis.call('EXISTS', KEYS[2]) == 0 then return -2 end
+local old = redis.call('HGET', KEYS[1], ARGV[1])
+if not old then return -1 end
+if (redis.call('HGET', KEYS[3], ARGV[1]) or '') ~= ARGV[8] then return -3 end
+redis.call('HSET', KEYS[1], ARGV[1], ARGV[2])
+if old ~= ARGV[2] then
+  redis.call('HINCRBY', KEYS[2], old, -1)
+  redis.call('HINCRBY', KEYS[2], ARGV[2], 1)
+  local version = redis.call('HINCRBY', KEYS[2], 'version', 1)
+  redis.call('ZADD', KEYS[6], version, ARGV[1])
+end
+redis.call('HSET', KEYS[2], 'last_update_ms', ARGV[6])
+redis.call('HSET', KEYS[3], ARGV[1], ARGV[3])
+local id = redis.call('XADD', KEYS[4], 'MAXLEN', '~', ARGV[5], '*',
+  'type', 'node', 'node_id', ARGV[1], 'status', ARGV[2], 'result', ARGV[7])
+for i = 1, #KEYS do redis.call('EXPIRE', KEYS[i], ARGV[4]) end
+return id
+"""
+
+# 파이프라인 blob compare-and-set + 변경 스트림 기록
+# KEYS: pipeline, changes
+# ARGV: expected_blob, new_blob, ttl, maxlen, status
+_UPDATE_PIPELINE_LUA = """
+local current = redis.call('GET', KEYS[1])
+if not current then return -2 end
+if current ~= ARGV[1] then return -3 end
+redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+return redis.call('XADD', KEYS[2], 'MAXLEN', '~', ARGV[4], '*',
+  'type', 'pipeline', 'status', ARGV[5])
+"""
+
+# bulk 스냅샷 조회 (파이프라인/카운터/노드 상태를 한 시점 기준으로 읽음)
+# KEYS: pipeline, counters, state, order, versions
+# ARGV: since_version ('' 이면 full)
+# 반환: {pipeline_blob, counters(flat), delta(0/1), node_ids, statuses, indices}
+_SNAPSHOT_LUA = """
+local pipeline = redis.call('GET', KEYS[1])
+if not pipeline then return false end
+local base = tonumber(redis.call('HGET', KEYS[2], 'base_version') or '0')
+local version = tonumber(redis.call('HGET', KEYS[2], 'version') or '0')
+local since = tonumber(ARGV[1])
+local delta = since ~= nil and since >= base and since <= version
+local ids
+if delta then
+  ids = redis.call('ZRANGEBYSCORE', KEYS[5], '(' .. ARGV[1], '+inf')
+else
+  ids = redis.call('ZRANGE', KEYS[4], 0, -1)
+end
+local statuses = {}
+local indices = {}
+for i, id in ipairs(ids) do
+  statuses[i] = redis.call('HGET', KEYS[3], id) or ''
+  if delta then indices[i] = redis.call('ZSCORE', KEYS[4], id) end
+end
+return {pipeline, redis.call('HGETALL', KEYS[2]), delta and 1 or 0, ids, statuses, indices}
+"""
+
+_CONFLICT = -3
+
+_FINISHED_STATES = ("COMPLETED", "FAILED")
+
+
+def _now_json() -> str:
+    ts = Timestamp()
+    ts.GetCurrentTime()
+    return ts.ToJsonString()
+
+
+def _str_map(result: Dict[str, Any]) -> Dict[str, str]:
+    return {str(k): str(v) if v is not None else "" for k, v in result.items()}
+
+
+def _decode(value) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
+class RedisStatusService:
+    """Redis 기반 파이프라인 상태 관리 서비스 (replica 간 공유)"""
+
+    def __init__(
+        self,
+        redis_client: Optional[redis.Redis] = None,
+        redis_url: str = "redis://localhost:6379/0",
+        key_prefix: str = "qmtl:status",
+        ttl: int = 24 * 3600,
+        stream_maxlen: int = 10000,
+        max_retries: int = 32,
+    ):
+        self.redis = redis_client or redis.from_url(redis_url)
+        self.key_prefix = key_prefix
+        self.ttl = ttl
+        self.stream_maxlen = stream_maxlen
+        # 동시 갱신 충돌 시 재시도 횟수
+        self.max_retries = max_retries
+        self._update_node_script = self.redis.register_script(_UPDATE_NODE_LUA)
+        self._update_pipeline_script = self.redis.register_script(_UPDATE_PIPELINE_LUA)
+        self._snapshot_script = self.redis.register_script(_SNAPSHOT_LUA)
+
+    # ------------------------------------------------------------------
+    # Key helpers
+    # ------------------------------------------------------------------
+    def _key(self, pipeline_id: str, kind: str) -> str:
+        return f"{self.key_prefix}:{{{pipeline_id}}}:{kind}"
+
+    def _keys(self, pipeline_id: str) -> List[str]:
+        return [
+            self._key(pipeline_id, kind)
+            for kind in ("state", "counters", "nodes", "changes", "pipeline", "versions", "order")
+        ]
+
+    # ------------------------------------------------------------------
+    # Write path
+    # ------------------------------------------------------------------
+    def initialize_pipeline(
+        self,
+        pipeline_id: str,
+        nodes: List[DataNode],
+        params: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """파이프라인 상태 초기화 (기존 상태는 덮어씀)
+
+        Raises:
+            StatusServiceError: 상태 초기화 실패 시
+        """
+        try:
+            now = Timestamp()
+            now.GetCurrentTime()
+            ps = PipelineStatus(pipeline_id=pipeline_id, status="PENDING", progress=0.0)
+            ps.start_time.CopyFrom(now)
+            ps.last_update.CopyFrom(now)
+            ps.params.update(_str_map(params or {}))
+
+            # 중복 node_id 는 첫 위치만 사용 (StatusService 와 동일)
+            node_index: Dict[str, int] = {}
+            for node in nodes:
+                node_index.setdefault(node.node_id, len(node_index))
+            blobs = {
+                nid: NodeStatus(node_id=nid, status="PENDING").SerializeToString()
+                for nid in node_index
+            }
+            keys = self._keys(pipeline_id)
+            state_key, counters_key, nodes_key, changes_key, pipeline_key = keys[:5]
+            versions_key, order_key = keys[5:]
+            # 재초기화 이전 스냅샷의 version 은 항상 base_version 보다 작도록 단조 증가 유지
+            previous = self.redis.hget(counters_key, "version")
+            base_version = max(int(time.time() * 1_000_000), int(previous or 0) + 1)
+            pipe = self.redis.pipeline(transaction=True)
+            pipe.delete(*keys)
+            pipe.set(pipeline_key, ps.SerializeToString(), ex=self.ttl)
+            if blobs:
+                pipe.hset(nodes_key, mapping=blobs)
+                pipe.hset(state_key, mapping={nid: "PENDING" for nid in node_index})
+                pipe.zadd(order_key, node_index)
+            pipe.hset(
+                counters_key,
+                mapping={
+                    "total": len(blobs),
+                    "PENDING": len(blobs),
+                    "last_update_ms": int(time.time() * 1000),
+                    "version": base_version,
+                    "base_version": base_version,
+                },
+            )
+            pipe.xadd(
+                changes_key,
+                {"type": "pipeline", "status": "PENDING"},
+                maxlen=self.stream_maxlen,
+                approximate=True,
+            )
+            for key in (state_key, counters_key, nodes_key, changes_key, order_key):
+                pipe.expire(key, self.ttl)
+            pipe.execute()
+            logger.info(f"Pipeline {pipeline_id} status initialized with {len(blobs)} nodes")
+        except redis.RedisError as e:
+            logger.error(f"Failed to initialize pipeline status: {e}")
+            raise StatusServiceError(f"Failed to initialize pipeline status: {e}")
+
+    def update_pipeline_status(
+        self,
+        pipeline_id: str,
+        status: str,
+        result: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """파이프라인 상태 업데이트
+
+        Raises:
+            ValueError: 파이프라인 ID가 유효하지 않은 경우
+            StatusServiceError: 상태 업데이트 실패 시
+        """
+        pipeline_key = self._key(pipeline_id, "pipeline")
+        try:
+            for _ in range(self.max_retries):
+                raw = self.redis.get(pipeline_key)
+                if raw is None:
+                    raise ValueError(f"Pipeline {pipeline_id} not found")
+                pipeline = PipelineStatus.FromString(raw)
+                pipeline.status = status
+                pipeline.last_update.GetCurrentTime()
+                if status in _FINISHED_STATES:
+                    pipeline.end_time.CopyFrom(pipeline.last_update)
+                if result is not None:
+                    if isinstance(result, dict):
+                        pipeline.result.update(_str_map(result))
+                    else:
+                        pipeline.result["result"] = str(result)
+                outcome = self._update_pipeline_script(
+                    keys=[pipeline_key, self._key(pipeline_id, "changes")],
+                    args=[raw, pipeline.SerializeToString(), self.ttl, self.stream_maxlen, status],
+                )
+                if outcome == -2:
+                    raise ValueError(f"Pipeline {pipeline_id} not found")
+                if outcome != _CONFLICT:
+                    break
+            else:
+                raise StatusServiceError(
+                    f"Failed to update pipeline status: too many concurrent updates ({pipeline_id})"
+                )
+            logger.info(f"Pipeline {pipeline_id} status updated to {status}")
+        except ValueError as e:
+            logger.error(f"Pipeline not found: {e}")
+            raise
+        except redis.RedisError as e:
+            logger.error(f"Failed to update pipeline status: {e}")
+            raise StatusServiceError(f"Failed to update pipeline status: {e}")
+
+    def update_node_status(
+        self,
+        pipeline_id: str,
+        node_id: str,
+        status: str,
+        result: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """노드 상태 업데이트 (blob compare-and-set, 상태 카운터/변경 스트림은 Lua 스크립트로 원자적으로 갱신)
+
+        Raises:
+            ValueError: 파이프라인 ID나 노드 ID가 유효하지 않은 경우
+            StatusServiceError: 상태 업데이트 실패 시
+        """
+        try:
+            for _ in range(self.max_retries):
+                outcome = self._try_update_node(pipeline_id, node_id, status, result)
+                if outcome != _CONFLICT:
+                    break
+            else:
+                raise StatusServiceError(
+                    f"Failed to update node status: too many concurrent updates ({node_id})"
+                )
+            if outcome == -2:
+                raise ValueError(f"Pipeline {pipeline_id} not found")
+            if outcome == -1:
+                raise ValueError(f"Node {node_id} not found in pipeline {pipeline_id}")
+            logger.info(f"Node {node_id} in pipeline {pipeline_id} status updated to {status}")
+        except ValueError as e:
+            logger.error(f"Invalid pipeline or node: {e}")
+            raise
+        except redis.RedisError as e:
+            logger.error(f"Failed to update node status: {e}")
+            raise StatusServiceError(f"Failed to update node status: {e}")
+
+    def _try_update_node(
+        self,
+        pipeline_id: str,
+        node_id: str,
+        status: str,
+        result: Optional[Dict[str, Any]],
+    ):
+        """현재 NodeStatus blob 에 변경을 merge 해 compare-and-set (충돌 시 _CONFLICT 반환)"""
+        raw = self.redis.hget(self._key(pipeline_id, "nodes"), node_id) or b""
+        node = NodeStatus.FromString(raw) if raw else NodeStatus(node_id=node_id)
+        node.status = status
+        if status == "RUNNING" and not node.start_time:
+            node.start_time = _now_json()
+        if status in _FINISHED_STATES and not node.end_time:
+            node.end_time = _now_json()
+        result_json = ""
+        if result is not None:
+            if isinstance(result, dict):
+                node.result.update(_str_map(result))
+                result_json = json.dumps(result, default=str)
+            else:
+                node.result["result"] = str(result)
+                result_json = str(result)
+        return self._update_node_script(
+            keys=self._keys(pipeline_id),
+            args=[
+                node_id,
+                status,
+                node.SerializeToString(),
+                self.ttl,
+                self.stream_maxlen,
+                int(time.time() * 1000),
+                result_json,
+                raw,
+            ],
+        )
+
+    # ------------------------------------------------------------------
+    # Read path
+    # ------------------------------------------------------------------
+    def get_pipeline_status(self, pipeline_id: str) -> Optional[PipelineStatus]:
+        """파이프라인 상태 조회 (진행률/last_update 는 카운터 해시로부터 계산)"""
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.get(self._key(pipeline_id, "pipeline"))
+        pipe.hgetall(self._key(pipeline_id, "counters"))
+        raw, counters = pipe.execute()
+        if raw is None:
+            return None
+        return self._with_counters(PipelineStatus.FromString(raw), counters)
+
+    def _with_counters(self, pipeline: PipelineStatus, counters) -> PipelineStatus:
+        """카운터 해시로 진행률/last_update 를 채운다."""
+        counts = {_decode(k): int(v) for k, v in counters.items()}
+        total = counts.get("total", 0)
+        if pipeline.status == "COMPLETED":
+            pipeline.progress = 100.0
+        elif total:
+            done = counts.get("COMPLETED", 0) + counts.get("FAILED", 0)
+            progress = (done + 0.5 * counts.get("RUNNING", 0)) / total * 100
+            pipeline.progress = round(progress, 1)
+        last_update_ms = counts.get("last_update_ms", 0)
+        if last_update_ms > pipeline.last_update.ToMilliseconds():
+            pipeline.last_update.FromMilliseconds(last_update_ms)
+        return pipeline
+
+    def get_status_snapshot(
+        self, pipeline_id: str, since_version: Optional[int] = None
+    ) -> Optional[PipelineStatusSnapshot]:
+        """파이프라인 전체 노드 상태를 하나의 packed 메시지로 반환 (StatusService 와 같은 형식)
+
+        Args:
+            pipeline_id: 파이프라인 ID
+            since_version: 이전 스냅샷의 version. 지정 시 그 이후 변경된 노드만 반환(delta).
+                해당 버전이 현재 파이프라인 초기화 이전이면 full 스냅샷을 반환한다.
+
+        Returns:
+            PipelineStatusSnapshot 또는 None (존재하지 않는 경우)
+        """
+        keys = [
+            self._key(pipeline_id, kind)
+            for kind in ("pipeline", "counters", "state", "order", "versions")
+        ]
+        since = "" if since_version is None else str(since_version)
+        result = self._snapshot_script(keys=keys, args=[since])
+        if not result:
+            return None
+        raw, flat_counters, delta, node_ids, statuses, indices = result
+        counters = {_decode(k): v for k, v in zip(flat_counters[::2], flat_counters[1::2])}
+        pipeline = self._with_counters(PipelineStatus.FromString(raw), counters)
+        snapshot = PipelineStatusSnapshot(
+            pipeline_id=pipeline_id,
+            status=pipeline.status,
+            progress=pipeline.progress,
+            version=int(counters.get("version", 0)),
+            delta=bool(delta),
+        )
+        snapshot.statuses = bytes(
+            STATUS_TO_CODE.get(_decode(status), NODE_STATUS_UNKNOWN) for status in statuses
+        )
+        if delta:
+            snapshot.changed_indices.extend(int(float(idx)) for idx in indices)
+        else:
+            snapshot.node_ids.extend(_decode(node_id) for node_id in node_ids)
+        return snapshot
+
+    def get_node_status(self, pipeline_id: str, node_id: str) -> Optional[NodeStatus]:
+        """노드 상태 조회"""
+        raw = self.redis.hget(self._key(pipeline_id, "nodes"), node_id)
+        return NodeStatus.FromString(raw) if raw else None
+
+    def get_all_node_statuses(self, pipeline_id: str) -> Dict[str, NodeStatus]:
+        """파이프라인의 모든 노드 상태 조회"""
+        raw = self.redis.hgetall(self._key(pipeline_id, "nodes"))
+        return {_decode(k): NodeStatus.FromString(v) for k, v in raw.items()}
+
+    def read_changes(
+        self,
+        pipeline_id: str,
+        last_id: str = "0-0",
+        count: int = 100,
+        block: Optional[int] = None,
+    ) -> List[Tuple[str, Dict[str, str]]]:
+        """last_id 이후의 상태 변경 이벤트를 반환한다. (watcher 는 마지막 id 로 이어서 호출)
+
+        Args:
+            pipeline_id: 파이프라인 ID
+            last_id: 마지막으로 처리한 stream entry id ("0-0" 이면 처음부터)
+            count: 최대 반환 개수
+            block: 대기 시간(ms). None 이면 대기하지 않음
+
+        Returns:
+            (entry_id, fields) 리스트
+        """
+        response = self.redis.xread(
+            {self._key(pipeline_id, "changes"): last_id}, count=count, block=block
+        )
+        changes: List[Tuple[str, Dict[str, str]]] = []
+        for _, entries in response or []:
+            for entry_id, fields in entries:
+                changes.append(
+                    (_decode(entry_id), {_decode(k): _decode(v) for k, v in fields.items()})
+                )
+        return changes
+
+    # ------------------------------------------------------------------
+    # Cleanup
+    # ------------------------------------------------------------------
+    def cleanup_pipeline(self, pipeline_id: str) -> None:
+        """파이프라인 상태 정보 삭제 (리소스 정리)"""
+        self.redis.delete(*self._keys(pipeline_id))
+        logger.info(f"Pipeline {pipeline_id} status data cleaned up")
+
+    def cleanup_old_pipelines(self, max_age_hours: int = 24) -> int:
+        """오래된 파이프라인 정리는 키 TTL 만료로 처리되므로 스캔하지 않는다.
+
+        Returns:
+            삭제된 파이프라인 수 (항상 0)
+        """
+        logger.info("Old pipelines expire via Redis TTL; nothing to scan")
+        return 0
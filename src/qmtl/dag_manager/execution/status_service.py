@@ -1,5 +1,9 @@
+import itertools
+import json
 import logging
 import threading
+from array import array
+from collections import Counter
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, MutableMapping, Optional
 from enum import Enum
@@ -7,7 +11,12 @@ from enum import Enum
 from qmtl.common.errors.exceptions import StatusServiceError
 from qmtl.models.datanode import DataNode
 from qmtl.models.generated.qmtl_status_pb2 import NodeStatus, PipelineStatus
-from google.protobuf.json_format import MessageToDict, ParseDict
+from qmtl.models.generated.qmtl_status_snapshot_pb2 import (
+    NODE_STATUS_PENDING,
+    NODE_STATUS_UNKNOWN,
+    PipelineStatusSnapshot,
+)
+from qmtl.models.status import STATUS_TO_CODE
 from google.protobuf.timestamp_pb2 import Timestamp
 
 logger = logging.getLogger(__name__)
@@ -16,6 +25,20 @@ logger = logging.getLogger(__name__)
 _instance = None
 _instance_lock = threading.Lock()
 
+# 파이프라인 단위 락 테이블 크기 (pipeline_id 해시로 shard 선택)
+_LOCK_SHARDS = 64
+
+
+def _now_json() -> str:
+    """현재 시각을 RFC3339 문자열로 반환 (NodeStatus.start_time/end_time 형식)"""
+    ts = Timestamp()
+    ts.GetCurrentTime()
+    return ts.ToJsonString()
+
+
+def _str_map(result: Dict[str, Any]) -> Dict[str, str]:
+    return {str(k): str(v) if v is not None else "" for k, v in result.items()}
+
 
 class StatusService:
     """파이프라인 상태 관리 서비스"""
@@ -27,9 +50,7 @@ class StatusService:
             if _instance is None:
                 _instance = super(StatusService, cls).__new__(cls)
                 # 초기화가 필요한 속성들
-                _instance.pipelines = {}
-                _instance.nodes = {}
-                _instance._lock = threading.RLock()
+                _instance._init_state()
                 logger.info("StatusService singleton instance created")
             return _instance
 
@@ -37,16 +58,32 @@ class StatusService:
         """상태 서비스 초기화"""
         # __new__에서 이미 초기화된 경우 중복 초기화 방지
         if not hasattr(self, "pipelines"):
-            # 타입 힌트를 명확히 함
-            self.pipelines: MutableMapping[str, PipelineStatus] = (
-                {}
-            )  # 파이프라인 상태 저장 (실제 구현에서는 Redis 등 활용)
-            self.nodes: MutableMapping[str, MutableMapping[str, NodeStatus]] = (
-                {}
-            )  # 노드별 상태 저장
-            self._lock = threading.RLock()  # 스레드 안전성을 위한 락
+            self._init_state()
             logger.info("StatusService instance initialized")
 
+    def _init_state(self) -> None:
+        # 파이프라인 상태 저장 (실제 구현에서는 Redis 등 활용)
+        self.pipelines: MutableMapping[str, PipelineStatus] = {}
+        # 노드별 상태 저장 (상태가 한 번이라도 갱신된 노드만 NodeStatus 로 보관)
+        self.nodes: MutableMapping[str, MutableMapping[str, NodeStatus]] = {}
+        # bulk 스냅샷용: 노드 순서/인덱스, 노드별 상태 코드(1 byte), 노드별 마지막 변경 버전
+        self._node_order: MutableMapping[str, List[str]] = {}
+        self._node_index: MutableMapping[str, Dict[str, int]] = {}
+        self._status_codes: MutableMapping[str, bytearray] = {}
+        self._node_versions: MutableMapping[str, array] = {}
+        # 파이프라인별 (초기화 버전, 현재 버전). 버전은 서비스 전역에서 단조 증가
+        self._versions: MutableMapping[str, List[int]] = {}
+        self._version_seq = itertools.count(1)
+        # 파이프라인별 상태 카운터 (status → 노드 수), 진행률 O(1) 계산용
+        self._counters: MutableMapping[str, Counter] = {}
+        # 파이프라인 등록/삭제용 락 (노드 상태 갱신은 파이프라인 shard 락만 사용)
+        self._lock = threading.RLock()
+        self._pipeline_locks = [threading.RLock() for _ in range(_LOCK_SHARDS)]
+
+    def _pipeline_lock(self, pipeline_id: str) -> threading.RLock:
+        """pipeline_id 가 속한 shard 락 반환"""
+        return self._pipeline_locks[hash(pipeline_id) % _LOCK_SHARDS]
+
     def _to_str(self, v):
         if isinstance(v, Enum):
             return v.value
@@ -69,30 +106,33 @@ class StatusService:
             StatusServiceError: 상태 초기화 실패 시
         """
         try:
-            with self._lock:
-                now_dt = datetime.now()
-                now = Timestamp()
-                now.FromDatetime(now_dt)
-                safe_params = dict(params or {}).copy()
-                params_dict = {str(k): self._to_str(v) for k, v in safe_params.items()}
-                params_dict = dict(params_dict)  # dict로 강제 변환
-                print(f"[DEBUG] params_dict for PipelineStatus: {params_dict}")
-                print(f"[DEBUG] param types: {[type(v) for v in params_dict.values()]}")
-                ps = PipelineStatus(
-                    pipeline_id=pipeline_id,
-                    status="PENDING",
-                    progress=0.0,
-                )
-                ps.start_time.CopyFrom(now)
-                ps.last_update.CopyFrom(now)
-                ps.params.update(params_dict)
+            now = Timestamp()
+            now.GetCurrentTime()
+            params_dict = {str(k): self._to_str(v) for k, v in (params or {}).items()}
+            ps = PipelineStatus(
+                pipeline_id=pipeline_id,
+                status="PENDING",
+                progress=0.0,
+            )
+            ps.start_time.CopyFrom(now)
+            ps.last_update.CopyFrom(now)
+            ps.params.update(params_dict)
+            # 노드별 NodeStatus 는 첫 상태 갱신 시 생성 (bulk 초기화는 배열만 할당)
+            node_index: Dict[str, int] = {}
+            for node in nodes:
+                node_index.setdefault(node.node_id, len(node_index))
+            node_order = list(node_index)
+            total = len(node_order)
+            base_version = next(self._version_seq)
+            with self._pipeline_lock(pipeline_id), self._lock:
                 self.pipelines[pipeline_id] = ps
                 self.nodes[pipeline_id] = {}
-                for node in nodes:
-                    self.nodes[pipeline_id][node.node_id] = NodeStatus(
-                        node_id=node.node_id,
-                        status="PENDING",
-                    )
+                self._node_order[pipeline_id] = node_order
+                self._node_index[pipeline_id] = node_index
+                self._status_codes[pipeline_id] = bytearray([NODE_STATUS_PENDING]) * total
+                self._node_versions[pipeline_id] = array("Q", [base_version]) * total
+                self._versions[pipeline_id] = [base_version, base_version]
+                self._counters[pipeline_id] = Counter({"PENDING": total})
                 logger.info(f"Pipeline {pipeline_id} status initialized with {len(nodes)} nodes")
         except Exception as e:
             logger.error(f"Failed to initialize pipeline status: {e}")
@@ -116,30 +156,21 @@ class StatusService:
             StatusServiceError: 상태 업데이트 실패 시
         """
         try:
-            with self._lock:
-                if pipeline_id not in self.pipelines:
+            with self._pipeline_lock(pipeline_id):
+                pipeline = self.pipelines.get(pipeline_id)
+                if pipeline is None:
                     raise ValueError(f"Pipeline {pipeline_id} not found")
-                pipeline = self.pipelines[pipeline_id]
-                update_dict = MessageToDict(pipeline)
-                update_dict["status"] = status
-                now = Timestamp()
-                now.FromDatetime(datetime.now())
-                update_dict["last_update"] = now.ToJsonString()
+                pipeline.status = status
+                pipeline.last_update.GetCurrentTime()
                 if status in ("COMPLETED", "FAILED"):
-                    end_ts = Timestamp()
-                    end_ts.FromDatetime(datetime.now())
-                    update_dict["end_time"] = end_ts.ToJsonString()
+                    pipeline.end_time.CopyFrom(pipeline.last_update)
                     if status == "COMPLETED":
-                        update_dict["progress"] = 100.0
+                        pipeline.progress = 100.0
                 if result is not None:
                     if isinstance(result, dict):
-                        safe_result = dict(result).copy()
-                        update_dict["result"] = {
-                            str(k): str(v) if v is not None else "" for k, v in safe_result.items()
-                        }
+                        pipeline.result.update(_str_map(result))
                     else:
-                        update_dict["result"] = str(result)
-                self.pipelines[pipeline_id] = ParseDict(update_dict, PipelineStatus())
+                        pipeline.result["result"] = str(result)
                 logger.info(f"Pipeline {pipeline_id} status updated to {status}")
         except ValueError as e:
             logger.error(f"Pipeline not found: {e}")
@@ -168,45 +199,44 @@ class StatusService:
             StatusServiceError: 상태 업데이트 실패 시
         """
         try:
-            with self._lock:
-                if pipeline_id not in self.nodes:
+            with self._pipeline_lock(pipeline_id):
+                pipeline_nodes = self.nodes.get(pipeline_id)
+                if pipeline_nodes is None:
                     raise ValueError(f"Pipeline {pipeline_id} not found")
-                pipeline_nodes = self.nodes[pipeline_id]
-                if node_id not in pipeline_nodes:
+                idx = self._node_index[pipeline_id].get(node_id)
+                if idx is None:
                     raise ValueError(f"Node {node_id} not found in pipeline {pipeline_id}")
-                node = pipeline_nodes[node_id]
-                update_dict = MessageToDict(node)
-                update_dict["status"] = status
-                if status == "RUNNING" and not update_dict.get("start_time"):
-                    ts = Timestamp()
-                    ts.FromDatetime(datetime.now())
-                    update_dict["start_time"] = ts.ToJsonString()
-                if status in ("COMPLETED", "FAILED") and not update_dict.get("end_time"):
-                    ts = Timestamp()
-                    ts.FromDatetime(datetime.now())
-                    update_dict["end_time"] = ts.ToJsonString()
-                if hasattr(node, "function_name"):
-                    update_dict["function_name"] = getattr(node, "function_name", "")
-                if hasattr(node, "tags"):
-                    update_dict["tags"] = getattr(node, "tags", [])
+                node = pipeline_nodes.get(node_id)
+                if node is None:
+                    node = pipeline_nodes[node_id] = NodeStatus(node_id=node_id, status="PENDING")
+                previous = node.status
+                node.status = status
+                if status == "RUNNING" and not node.start_time:
+                    node.start_time = _now_json()
+                if status in ("COMPLETED", "FAILED") and not node.end_time:
+                    node.end_time = _now_json()
+                pipeline = self.pipelines.get(pipeline_id)
                 if result is not None:
                     if isinstance(result, dict):
-                        safe_result = dict(result).copy()
-                        update_dict["result"] = {
-                            str(k): str(v) if v is not None else "" for k, v in safe_result.items()
-                        }
+                        node.result.update(_str_map(result))
                     else:
-                        update_dict["result"] = str(result)
-                    if pipeline_id in self.pipelines:
-                        pipeline = self.pipelines[pipeline_id]
-                        pipeline_dict = MessageToDict(pipeline)
-                        if "result" not in pipeline_dict or pipeline_dict["result"] is None:
-                            pipeline_dict["result"] = {}
-                        if not isinstance(pipeline_dict["result"], dict):
-                            pipeline_dict["result"] = {}
-                        pipeline_dict["result"][node_id] = result
-                        self.pipelines[pipeline_id] = ParseDict(pipeline_dict, PipelineStatus())
-                pipeline_nodes[node_id] = ParseDict(update_dict, NodeStatus())
+                        node.result["result"] = str(result)
+                    if pipeline is not None:
+                        pipeline.result[node_id] = (
+                            json.dumps(result, default=str)
+                            if isinstance(result, dict)
+                            else str(result)
+                        )
+                if previous != status:
+                    counters = self._counters[pipeline_id]
+                    counters[previous] -= 1
+                    counters[status] += 1
+                    version = next(self._version_seq)
+                    self._versions[pipeline_id][1] = version
+                    self._node_versions[pipeline_id][idx] = version
+                    self._status_codes[pipeline_id][idx] = STATUS_TO_CODE.get(
+                        status, NODE_STATUS_UNKNOWN
+                    )
                 self._update_pipeline_progress(pipeline_id)
                 logger.info(f"Node {node_id} in pipeline {pipeline_id} status updated to {status}")
                 if status == "COMPLETED" and isinstance(result, dict) and "recovery" in result:
@@ -230,8 +260,14 @@ class StatusService:
         Returns:
             파이프라인 상태 정보 또는 None (존재하지 않는 경우)
         """
-        with self._lock:
-            return self.pipelines.get(pipeline_id)
+        with self._pipeline_lock(pipeline_id):
+            pipeline = self.pipelines.get(pipeline_id)
+            if pipeline is None:
+                return None
+            # 내부 상태는 in-place 로 갱신되므로 호출자에게는 스냅샷 복사본을 반환
+            snapshot = PipelineStatus()
+            snapshot.CopyFrom(pipeline)
+            return snapshot
 
     def get_node_status(self, pipeline_id: str, node_id: str) -> Optional[NodeStatus]:
         """노드 상태 조회
@@ -243,9 +279,15 @@ class StatusService:
         Returns:
             노드 상태 정보 또는 None (존재하지 않는 경우)
         """
-        with self._lock:
-            pipeline_nodes = self.nodes.get(pipeline_id, {})
-            return pipeline_nodes.get(node_id)
+        with self._pipeline_lock(pipeline_id):
+            node = self.nodes.get(pipeline_id, {}).get(node_id)
+            if node is None:
+                if node_id not in self._node_index.get(pipeline_id, {}):
+                    return None
+                return NodeStatus(node_id=node_id, status="PENDING")
+            snapshot = NodeStatus()
+            snapshot.CopyFrom(node)
+            return snapshot
 
     def get_all_node_statuses(self, pipeline_id: str) -> Dict[str, NodeStatus]:
         """파이프라인의 모든 노드 상태 조회
@@ -256,10 +298,55 @@ class StatusService:
         Returns:
             노드 ID를 키로 하는 상태 정보 딕셔너리
         """
-        with self._lock:
-            if pipeline_id not in self.nodes:
+        with self._pipeline_lock(pipeline_id):
+            pipeline_nodes = self.nodes.get(pipeline_id)
+            if pipeline_nodes is None:
                 return {}
-            return {node_id: node for node_id, node in self.nodes[pipeline_id].items()}
+            snapshots: Dict[str, NodeStatus] = {}
+            for node_id in self._node_order[pipeline_id]:
+                snapshot = NodeStatus(node_id=node_id, status="PENDING")
+                node = pipeline_nodes.get(node_id)
+                if node is not None:
+                    snapshot.CopyFrom(node)
+                snapshots[node_id] = snapshot
+            return snapshots
+
+    def get_status_snapshot(
+        self, pipeline_id: str, since_version: Optional[int] = None
+    ) -> Optional[PipelineStatusSnapshot]:
+        """파이프라인 전체 노드 상태를 하나의 packed 메시지로 반환 (대시보드 polling 용)
+
+        Args:
+            pipeline_id: 파이프라인 ID
+            since_version: 이전 스냅샷의 version. 지정 시 그 이후 변경된 노드만 반환(delta).
+                해당 버전이 현재 파이프라인 초기화 이전이면 full 스냅샷을 반환한다.
+
+        Returns:
+            PipelineStatusSnapshot 또는 None (존재하지 않는 경우)
+        """
+        with self._pipeline_lock(pipeline_id):
+            pipeline = self.pipelines.get(pipeline_id)
+            if pipeline is None:
+                return None
+            base_version, version = self._versions[pipeline_id]
+            codes = self._status_codes[pipeline_id]
+            snapshot = PipelineStatusSnapshot(
+                pipeline_id=pipeline_id,
+                status=pipeline.status,
+                progress=pipeline.progress,
+                version=version,
+            )
+            if since_version is None or not base_version <= since_version <= version:
+                snapshot.node_ids.extend(self._node_order[pipeline_id])
+                snapshot.statuses = bytes(codes)
+                return snapshot
+            changed = [
+                i for i, v in enumerate(self._node_versions[pipeline_id]) if v > since_version
+            ]
+            snapshot.delta = True
+            snapshot.changed_indices.extend(changed)
+            snapshot.statuses = bytes(codes[i] for i in changed)
+            return snapshot
 
     def _update_pipeline_progress(self, pipeline_id: str) -> None:
         """파이프라인 진행 상황 업데이트
@@ -267,34 +354,16 @@ class StatusService:
         Args:
             pipeline_id: 파이프라인 ID
         """
-        if pipeline_id not in self.nodes or pipeline_id not in self.pipelines:
+        pipeline = self.pipelines.get(pipeline_id)
+        if pipeline is None or not self._node_order.get(pipeline_id):
             return
 
-        pipeline_nodes = self.nodes[pipeline_id]
-        total_nodes = len(pipeline_nodes)
-
-        if total_nodes == 0:
-            return
-
-        # 완료된 노드 수 계산
-        completed_nodes = sum(
-            1 for node in pipeline_nodes.values() if node.status in ("COMPLETED", "FAILED")
-        )
-
-        # 진행 중인 노드 수 (부분 진행으로 계산)
-        running_nodes = sum(0.5 for node in pipeline_nodes.values() if node.status == "RUNNING")
-
-        # 진행률 계산 및 업데이트
-        progress = (completed_nodes + running_nodes) / total_nodes * 100
-
-        # Pydantic 모델 업데이트
-        pipeline = self.pipelines[pipeline_id]
-        pipeline_dict = MessageToDict(pipeline)
-        now = Timestamp()
-        now.FromDatetime(datetime.now())
-        pipeline_dict["progress"] = round(progress, 1)
-        pipeline_dict["last_update"] = now.ToJsonString()
-        self.pipelines[pipeline_id] = ParseDict(pipeline_dict, PipelineStatus())
+        # 상태 카운터 기반 O(1) 진행률 계산 (RUNNING 은 부분 진행 0.5 로 계산)
+        counters = self._counters[pipeline_id]
+        done = counters["COMPLETED"] + counters["FAILED"]
+        progress = (done + 0.5 * counters["RUNNING"]) / len(self._node_order[pipeline_id]) * 100
+        pipeline.progress = round(progress, 1)
+        pipeline.last_update.GetCurrentTime()
 
     def cleanup_pipeline(self, pipeline_id: str) -> None:
         """파이프라인 상태 정보 삭제 (리소스 정리)
@@ -302,12 +371,15 @@ class StatusService:
         Args:
             pipeline_id: 파이프라인 ID
         """
-        with self._lock:
-            if pipeline_id in self.pipelines:
-                del self.pipelines[pipeline_id]
-
-            if pipeline_id in self.nodes:
-                del self.nodes[pipeline_id]
+        with self._pipeline_lock(pipeline_id), self._lock:
+            self.pipelines.pop(pipeline_id, None)
+            self.nodes.pop(pipeline_id, None)
+            self._counters.pop(pipeline_id, None)
+            self._node_order.pop(pipeline_id, None)
+            self._node_index.pop(pipeline_id, None)
+            self._status_codes.pop(pipeline_id, None)
+            self._node_versions.pop(pipeline_id, None)
+            self._versions.pop(pipeline_id, None)
 
             logger.info(f"Pipeline {pipeline_id} status data cleaned up")
 
@@ -320,19 +392,17 @@ class StatusService:
         Returns:
             삭제된 파이프라인 수
         """
+        cutoff = datetime.utcnow() - timedelta(hours=max_age_hours)
         with self._lock:
-            now = datetime.now()
-            cutoff = now - timedelta(hours=max_age_hours)
-
-            pipelines_to_remove = []
-
-            for pipeline_id, pipeline in self.pipelines.items():
-                # Pydantic 모델의 last_update는 이미 datetime 객체
-                if pipeline.last_update < cutoff:
-                    pipelines_to_remove.append(pipeline_id)
-
-            for pipeline_id in pipelines_to_remove:
-                self.cleanup_pipeline(pipeline_id)
-
-            logger.info(f"Cleaned up {len(pipelines_to_remove)} old pipelines")
-            return len(pipelines_to_remove)
+            pipelines_to_remove = [
+                pipeline_id
+                for pipeline_id, pipeline in self.pipelines.items()
+                if pipeline.last_update.ToDatetime() < cutoff
+            ]
+
+        # 락 획득 순서(파이프라인 락 → 전역 락)를 지키기 위해 전역 락 해제 후 정리
+        for pipeline_id in pipelines_to_remove:
+            self.cleanup_pipeline(pipeline_id)
+
+        logger.info(f"Cleaned up {len(pipelines_to_remove)} old pipelines")
+        return len(pipelines_to_remove)
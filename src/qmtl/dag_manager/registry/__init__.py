@@ -6,6 +6,7 @@ in the QMTL system using Neo4j as the backend store.
 """
 
 # Import key components for easier access
+from .async_registry_client import AsyncRegistryClient
 from .registry_client import RegistryClient
 
-__all__ = ['RegistryClient']
+__all__ = ['AsyncRegistryClient', 'RegistryClient']
@@ -1,18 +1,39 @@
 # ------------------ QMTL Registry API ------------------
 
 # Imports (no duplicates, all at top)
+import hashlib
 import logging
-from typing import Dict, List, Optional, Any
-from fastapi import Depends, FastAPI, HTTPException, Query, status, Body, APIRouter, Request
+from typing import Dict, Iterator, List, Optional, Any, Union
+from fastapi import (
+    Depends,
+    FastAPI,
+    HTTPException,
+    Query,
+    status,
+    Body,
+    APIRouter,
+    Request,
+    Response,
+)
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
 from qmtl.common.config.settings import get_settings
 from qmtl.common.db.connection_pool import get_neo4j_pool
 from qmtl.common.errors.handlers import add_exception_handlers
+from qmtl.common.http.negotiation import (
+    PROTOBUF_MEDIA_TYPE,
+    if_none_match,
+    is_protobuf_body,
+    protobuf_response,
+    read_protobuf,
+    wants_protobuf,
+)
 from qmtl.common.errors.exceptions import (
     RegistryServiceError,
     ValidationError,
 )
-from qmtl.models.datanode import DataNode
+from qmtl.models.datanode import datanode_to_proto
 from qmtl.models.event import NodeStatusEvent, PipelineStatusEvent, AlertEvent
 from qmtl.dag_manager.registry.services.node.management import (
     Neo4jNodeManagementService,
@@ -26,11 +47,13 @@ from qmtl.dag_manager.registry.services.strategy import StrategySnapshotService
 from qmtl.dag_manager.registry.services.event import EventPublisher
 from qmtl.dag_manager.registry.services.metadata_service import MetadataService
 from qmtl.dag_manager.registry import api_callback
+from qmtl.dag_manager.execution.redis_status_service import RedisStatusService
+from qmtl.dag_manager.execution.status_service import StatusService
 import os
 import sys
 from qmtl.dag_manager.registry.services.node.memory_impl import InMemoryNodeService
 from google.protobuf.json_format import MessageToDict, ParseDict
-from qmtl.models.generated import qmtl_datanode_pb2
+from qmtl.models.generated import qmtl_datanode_pb2, qmtl_registry_api_pb2, qmtl_strategy_pb2
 from qmtl.dag_manager.registry.services.node.neo4j_schema import init_neo4j_schema
 
 # FastAPI app declaration (only once, right after imports)
@@ -53,6 +76,72 @@ add_exception_handlers(app)
 # Logger
 logger = logging.getLogger(__name__)
 
+# 목록 API 페이지 크기: JSON 응답은 서버 측 최대 크기로 제한하고 next_cursor(node_id)로 이어 받는다.
+# Accept: application/x-ndjson 요청은 결과를 읽는 즉시 한 줄씩 스트리밍한다 (limit 미지정 시 전체).
+DEFAULT_PAGE_SIZE = 500
+MAX_PAGE_SIZE = 1000
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def _wants_ndjson(request: Request) -> bool:
+    return NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def _ndjson_response(lines: Iterator[str]) -> StreamingResponse:
+    return StreamingResponse((line + "\n" for line in lines), media_type=NDJSON_MEDIA_TYPE)
+
+
+def _page(items: list, limit: int, key: str, cursor_field: str) -> dict:
+    """limit + 1 개로 조회한 결과를 한 페이지로 자르고, 다음 페이지가 있으면 next_cursor 를 채운다."""
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        next_cursor = getattr(items[-1], cursor_field)
+    return {key: items, "next_cursor": next_cursor}
+
+
+# Accept/Content-Type: application/x-protobuf 이면 qmtl_registry_api.proto 메시지로 주고받고,
+# 그 외에는 JSON (기본값). DataNode 는 MessageToDict/ParseDict 없이 필드 단위로 변환한다.
+def _json_node(node):
+    """JSON 응답용 노드 (protobuf 로 저장된 노드는 dict 로 변환, enum 은 label)"""
+    if isinstance(node, qmtl_datanode_pb2.DataNode):
+        return MessageToDict(node, preserving_proto_field_name=True)
+    return node
+
+
+def _node_list_response(request: Request, nodes: list, limit: Optional[int] = None):
+    """노드 목록 응답 (limit 지정 시 limit + 1 개로 조회한 결과를 페이지로 자름)"""
+    page = _page(nodes, limit, "nodes", "node_id") if limit else {"nodes": nodes}
+    if not wants_protobuf(request):
+        page["nodes"] = [_json_node(node) for node in page["nodes"]]
+        return page
+    message = qmtl_registry_api_pb2.NodeList(nodes=[datanode_to_proto(n) for n in page["nodes"]])
+    if page.get("next_cursor") is not None:
+        message.next_cursor = page["next_cursor"]
+    return protobuf_response(message)
+
+
+def _ids_response(request: Request, key: str, ids: List[str], status_code: int = 200):
+    if wants_protobuf(request):
+        return protobuf_response(qmtl_registry_api_pb2.IdList(ids=ids), status_code)
+    return {key: ids}
+
+
+def _ref_counts_response(request: Request, ref_counts: Dict[str, int]):
+    if wants_protobuf(request):
+        return protobuf_response(qmtl_registry_api_pb2.RefCounts(ref_counts=ref_counts))
+    return {"ref_counts": ref_counts}
+
+
+async def _json_body(request: Request) -> dict:
+    try:
+        body = await request.json()
+    except ValueError:
+        raise HTTPException(status_code=422, detail="JSON 본문을 해석할 수 없습니다")
+    if not isinstance(body, dict):
+        raise HTTPException(status_code=422, detail="JSON 본문은 객체여야 합니다")
+    return body
+
 
 # 내부 util: 테스트 환경 판별
 def _is_test_mode() -> bool:
@@ -91,7 +180,7 @@ def get_strategy_service() -> StrategyManagementService:
             def get_version(self, version_id: str):
                 return None
 
-            def list_strategies(self):
+            def list_strategies(self, after=None, limit=None):
                 return []
 
         global _dummy_strategy_service
@@ -119,6 +208,12 @@ def get_snapshot_service() -> StrategySnapshotService:
             def get_snapshots(self, pipeline_id):
                 return []
 
+            def list_snapshots(self, pipeline_id):
+                return []
+
+            def get_latest_snapshot(self, pipeline_id):
+                return None
+
             def rollback_to_snapshot(self, pipeline_id, snapshot_id):
                 return None
 
@@ -131,7 +226,24 @@ def get_snapshot_service() -> StrategySnapshotService:
 
     pool = get_neo4j_pool()
     settings = get_settings()
-    return StrategySnapshotService(pool.get_client(), settings.env.neo4j_database)
+    return StrategySnapshotService(pool, settings.env.neo4j_database)
+
+
+_redis_status_service: Optional[RedisStatusService] = None
+
+
+def get_status_service() -> Union[StatusService, RedisStatusService]:
+    """상태 스냅샷 조회용 서비스.
+
+    운영 환경에서는 replica 들이 상태를 기록하는 Redis(RedisStatusService)를 읽고,
+    테스트 모드에서는 프로세스 내 StatusService 싱글턴을 사용한다.
+    """
+    if _is_test_mode():
+        return StatusService()
+    global _redis_status_service
+    if _redis_status_service is None:
+        _redis_status_service = RedisStatusService(redis_url=get_settings().env.redis_uri)
+    return _redis_status_service
 
 
 def get_metadata_service() -> MetadataService:
@@ -147,7 +259,7 @@ def get_metadata_service() -> MetadataService:
     strategy_service = Neo4jStrategyManagementService(
         pool.get_client(), settings.env.neo4j_database
     )
-    snapshot_service = StrategySnapshotService(pool.get_client(), settings.env.neo4j_database)
+    snapshot_service = StrategySnapshotService(pool, settings.env.neo4j_database)
     return MetadataService(node_service, strategy_service, snapshot_service)
 
 
@@ -173,39 +285,69 @@ internal_router = APIRouter(
 # --- GET 엔드포인트만 public_router에 등록 ---
 @public_router.get("/pipelines/{pipeline_id}/dag")
 async def get_pipeline_dag_public(
-    pipeline_id: str, metadata_service: MetadataService = Depends(get_metadata_service)
+    pipeline_id: str,
+    request: Request,
+    metadata_service: MetadataService = Depends(get_metadata_service),
 ):
-    return await get_pipeline_dag(pipeline_id, metadata_service)
+    return await get_pipeline_dag(pipeline_id, request, metadata_service)
 
 
 @public_router.get("/pipelines/{pipeline_id}/ready-nodes")
 async def get_ready_nodes_public(
-    pipeline_id: str, metadata_service: MetadataService = Depends(get_metadata_service)
+    pipeline_id: str,
+    request: Request,
+    metadata_service: MetadataService = Depends(get_metadata_service),
+):
+    return await get_ready_nodes(pipeline_id, request, metadata_service)
+
+
+@public_router.get("/pipelines/{pipeline_id}/status/snapshot")
+async def get_pipeline_status_snapshot_public(
+    pipeline_id: str,
+    since_version: Optional[int] = Query(None, ge=0),
+    status_service: Union[StatusService, RedisStatusService] = Depends(get_status_service),
 ):
-    return await get_ready_nodes(pipeline_id, metadata_service)
+    return await get_pipeline_status_snapshot(pipeline_id, since_version, status_service)
 
 
 @public_router.get("/nodes/{node_id}")
 async def get_node_public(
-    node_id: str, node_service: NodeManagementService = Depends(get_node_service)
+    node_id: str, request: Request, node_service: NodeManagementService = Depends(get_node_service)
 ):
-    return await get_node(node_id, node_service)
+    return await get_node(node_id, request, node_service)
 
 
 @public_router.get("/nodes/leaf-nodes")
-async def get_leaf_nodes_public(metadata_service: MetadataService = Depends(get_metadata_service)):
-    return await get_leaf_nodes(metadata_service)
+async def get_leaf_nodes_public(
+    request: Request, metadata_service: MetadataService = Depends(get_metadata_service)
+):
+    return await get_leaf_nodes(request, metadata_service)
 
 
 @public_router.get("/nodes/by-tags")
 async def get_nodes_by_tags_public(
+    request: Request,
     tags: List[str] = Query(..., description="필터링할 태그 목록"),
     interval: Optional[str] = Query(None, description="데이터 수집 인터벌 (예: 1h, 1d)"),
     period: Optional[str] = Query(None, description="데이터 보관 기간 (인터벌 단위)"),
     match_mode: str = Query("AND", description="태그 매칭 모드 (AND 또는 OR)"),
+    after: Optional[str] = Query(None, description="이전 페이지의 next_cursor (node_id)"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="페이지 크기"),
     metadata_service: MetadataService = Depends(get_metadata_service),
 ):
-    return await get_nodes_by_tags(tags, interval, period, match_mode, metadata_service)
+    return await get_nodes_by_tags(
+        request, tags, interval, period, match_mode, after, limit, metadata_service
+    )
+
+
+@public_router.get("/nodes")
+async def list_nodes_public(
+    request: Request,
+    after: Optional[str] = Query(None, description="이전 페이지의 next_cursor (node_id)"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="페이지 크기"),
+    node_service: NodeManagementService = Depends(get_node_service),
+):
+    return await list_nodes(request, after, limit, node_service)
 
 
 @public_router.get("/strategies/{version_id}")
@@ -216,8 +358,12 @@ async def get_strategy_public(
 
 
 @public_router.get("/strategies")
-async def list_strategies_public(metadata_service: MetadataService = Depends(get_metadata_service)):
-    return await list_strategies(metadata_service)
+async def list_strategies_public(
+    after: Optional[str] = Query(None, description="이전 페이지의 next_cursor (version_id)"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="페이지 크기"),
+    metadata_service: MetadataService = Depends(get_metadata_service),
+):
+    return await list_strategies(after, limit, metadata_service)
 
 
 @public_router.get("/nodes/{node_id}/ref-count")
@@ -229,16 +375,22 @@ async def get_node_reference_count_public(
 
 @public_router.get("/nodes/{node_id}/ref-strategies")
 async def get_node_reference_strategies_public(
-    node_id: str, metadata_service: MetadataService = Depends(get_metadata_service)
+    node_id: str,
+    request: Request,
+    metadata_service: MetadataService = Depends(get_metadata_service),
 ):
-    return await get_node_reference_strategies(node_id, metadata_service)
+    return await get_node_reference_strategies(node_id, request, metadata_service)
 
 
 @public_router.get("/strategies/{strategy_version_id}/nodes")
 async def get_strategy_nodes_public(
-    strategy_version_id: str, metadata_service: MetadataService = Depends(get_metadata_service)
+    strategy_version_id: str,
+    request: Request,
+    after: Optional[str] = Query(None, description="이전 페이지의 next_cursor (node_id)"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="페이지 크기"),
+    metadata_service: MetadataService = Depends(get_metadata_service),
 ):
-    return await get_strategy_nodes(strategy_version_id, metadata_service)
+    return await get_strategy_nodes(strategy_version_id, request, after, limit, metadata_service)
 
 
 @public_router.get("/nodes/{node_id}/status", response_model=None)
@@ -257,17 +409,26 @@ async def list_strategy_snapshots_public(
 
 @public_router.get("/nodes/{node_id}/dependencies")
 async def get_node_dependencies_public(
-    node_id: str, metadata_service: MetadataService = Depends(get_metadata_service)
+    node_id: str,
+    request: Request,
+    metadata_service: MetadataService = Depends(get_metadata_service),
 ):
-    return await get_node_dependencies(node_id, metadata_service)
+    return await get_node_dependencies(node_id, request, metadata_service)
 
 
 # --- POST/PUT/PATCH/DELETE 엔드포인트는 internal_router에만 등록 ---
 @internal_router.post("/nodes", status_code=status.HTTP_201_CREATED)
 async def create_node_internal(
-    node_data: Dict[str, DataNode], node_service: NodeManagementService = Depends(get_node_service)
+    request: Request, node_service: NodeManagementService = Depends(get_node_service)
+):
+    return await create_node(request, node_service)
+
+
+@internal_router.post("/nodes:batch", status_code=status.HTTP_201_CREATED)
+async def create_nodes_batch_internal(
+    request: Request, node_service: NodeManagementService = Depends(get_node_service)
 ):
-    return await create_node(node_data, node_service)
+    return await create_nodes_batch(request, node_service)
 
 
 @internal_router.delete("/nodes/{node_id}")
@@ -357,9 +518,10 @@ async def create_strategy_snapshot_internal(
 async def rollback_strategy_to_snapshot_internal(
     version_id: str,
     snapshot_id: str,
+    request: Request,
     metadata_service: MetadataService = Depends(get_metadata_service),
 ):
-    return await rollback_strategy_to_snapshot(version_id, snapshot_id, metadata_service)
+    return await rollback_strategy_to_snapshot(version_id, snapshot_id, request, metadata_service)
 
 
 @internal_router.post("/strategies/{strategy_version_id}/nodes/{node_id}")
@@ -380,6 +542,29 @@ async def remove_node_from_strategy_internal(
     return await remove_node_from_strategy(strategy_version_id, node_id, metadata_service)
 
 
+@internal_router.delete("/strategies/{strategy_version_id}/nodes")
+async def remove_all_nodes_from_strategy_internal(
+    strategy_version_id: str,
+    request: Request,
+    metadata_service: MetadataService = Depends(get_metadata_service),
+):
+    return await remove_all_nodes_from_strategy(strategy_version_id, request, metadata_service)
+
+
+@internal_router.post("/nodes:batch-get")
+async def get_nodes_batch_internal(
+    request: Request, node_service: NodeManagementService = Depends(get_node_service)
+):
+    return await get_nodes_batch(request, node_service)
+
+
+@internal_router.post("/nodes:ref-counts")
+async def get_node_reference_counts_internal(
+    request: Request, metadata_service: MetadataService = Depends(get_metadata_service)
+):
+    return await get_node_reference_counts(request, metadata_service)
+
+
 @internal_router.post("/nodes/{node_id}/dependencies/{dependency_id}")
 async def add_node_dependency_internal(
     node_id: str,
@@ -419,6 +604,14 @@ async def health():
     return {"status": "ok", "service": "registry"}
 
 
+@app.get("/metrics/neo4j-pool")
+async def neo4j_pool_metrics():
+    """Neo4j 세션 풀 메트릭 (획득 대기 시간, 활성 세션 수 등)"""
+    if _is_test_mode():
+        return {}
+    return get_neo4j_pool().get_metrics()
+
+
 # ------------------ MULTI-8: 노드/전략 Partial Update(수정) API ------------------
 @app.patch("/v1/registry/nodes/{node_id}")
 async def update_node_partial(
@@ -544,57 +737,103 @@ async def revoke_template_permission(template_id: str, user_id: str):
 @app.get("/v1/registry/pipelines/{pipeline_id}/dag")
 async def get_pipeline_dag(
     pipeline_id: str,
+    request: Request,
     metadata_service: MetadataService = Depends(get_metadata_service),
 ):
     dag = metadata_service.get_dag(pipeline_id)
     if not dag:
         raise HTTPException(status_code=404, detail=f"파이프라인 스냅샷 없음: {pipeline_id}")
+    if wants_protobuf(request):
+        return protobuf_response(dag)
     return {"nodes": dag.nodes, "edges": dag.edges, "metadata": dag.metadata}
 
 
 @app.get("/v1/registry/pipelines/{pipeline_id}/ready-nodes")
 async def get_ready_nodes(
     pipeline_id: str,
+    request: Request,
     metadata_service: MetadataService = Depends(get_metadata_service),
 ):
     dag = metadata_service.get_dag(pipeline_id)
     if not dag:
         raise HTTPException(status_code=404, detail=f"파이프라인 스냅샷 없음: {pipeline_id}")
     # 기존 ready_nodes 로직은 MetadataService에 위임 필요(추후 확장)
+    if wants_protobuf(request):
+        return protobuf_response(
+            qmtl_strategy_pb2.StrategySnapshot(pipeline_id=dag.pipeline_id, nodes=dag.nodes)
+        )
     return {"nodes": dag.nodes}
 
 
+@app.get("/v1/registry/pipelines/{pipeline_id}/status/snapshot")
+async def get_pipeline_status_snapshot(
+    pipeline_id: str,
+    since_version: Optional[int] = Query(None, ge=0),
+    status_service: Union[StatusService, RedisStatusService] = Depends(get_status_service),
+):
+    """
+    파이프라인 전체 노드 상태 bulk 스냅샷 조회 API (application/x-protobuf)
+    - since_version 지정 시 해당 버전 이후 변경된 노드만 delta 로 반환
+    - 404: 파이프라인 상태 없음
+    """
+    snapshot = status_service.get_status_snapshot(pipeline_id, since_version)
+    if snapshot is None:
+        raise HTTPException(status_code=404, detail=f"파이프라인 상태 없음: {pipeline_id}")
+    return Response(content=snapshot.SerializeToString(), media_type="application/x-protobuf")
+
+
+def _camel_to_snake(name: str) -> str:
+    import re
+
+    s1 = re.sub(r"(.)([A-Z][a-z]+)", r"\1_\2", name)
+    return re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", s1).lower()
+
+
+def _parse_node_proto(orig_node: Dict[str, Any]) -> qmtl_datanode_pb2.DataNode:
+    """요청 dict(camelCase/snake_case)를 protobuf DataNode로 변환"""
+    # dict key normalize (camelCase → snake_case)
+    node_dict = {_camel_to_snake(k): v for k, v in orig_node.items()}
+    interval_settings = node_dict.get("interval_settings")
+    if interval_settings:
+        # interval_settings 내부도 key normalize
+        interval_settings = {_camel_to_snake(k): v for k, v in interval_settings.items()}
+        node_dict["interval_settings"] = interval_settings
+        val = interval_settings.get("interval")
+        if val:
+            # Accept both enum label and short string, convert to enum label for protobuf
+            enum_map = {
+                "1m": "MINUTE",
+                "1h": "HOUR",
+                "1d": "DAY",
+                "MINUTE": "MINUTE",
+                "HOUR": "HOUR",
+                "DAY": "DAY",
+            }
+            if val in enum_map:
+                interval_settings["interval"] = enum_map[val]
+    # Parse dict to protobuf DataNode
+    return ParseDict(node_dict, qmtl_datanode_pb2.DataNode())
+
+
 # 노드 관련 API
 @app.post("/v1/registry/nodes", status_code=status.HTTP_201_CREATED)
 async def create_node(
-    node_data: Dict[str, Any], node_service: NodeManagementService = Depends(get_node_service)
+    request: Request, node_service: NodeManagementService = Depends(get_node_service)
 ):
-    """노드 등록 API"""
+    """노드 등록 API
+    - Body: {"node": {...}} 또는 NodeEnvelope (Content-Type: application/x-protobuf)
+    """
     try:
-        import re
-
-        def camel_to_snake(name):
-            s1 = re.sub(r"(.)([A-Z][a-z]+)", r"\1_\2", name)
-            return re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", s1).lower()
-
-        # dict key normalize (camelCase → snake_case)
-        orig_node = node_data.get("node", {})
-        node_dict = {camel_to_snake(k): v for k, v in orig_node.items()}
-        interval_settings = node_dict.get("interval_settings")
-        if interval_settings:
-            # interval_settings 내부도 key normalize
-            interval_settings = {camel_to_snake(k): v for k, v in interval_settings.items()}
-            node_dict["interval_settings"] = interval_settings
-            val = interval_settings.get("interval")
-            if val:
-                # Accept both enum label and short string, convert to enum label for protobuf
-                enum_map = {"1m": "MINUTE", "1h": "HOUR", "1d": "DAY", "MINUTE": "MINUTE", "HOUR": "HOUR", "DAY": "DAY"}
-                if val in enum_map:
-                    interval_settings["interval"] = enum_map[val]
-        # Parse dict to protobuf DataNode
-        node_proto = ParseDict(node_dict, qmtl_datanode_pb2.DataNode())
+        if is_protobuf_body(request):
+            node_proto = (await read_protobuf(request, qmtl_registry_api_pb2.NodeEnvelope)).node
+        else:
+            node_proto = _parse_node_proto((await _json_body(request)).get("node", {}))
         node_service.validate_node(node_proto)
         node_id = node_service.create_node(node_proto)
+        if wants_protobuf(request):
+            return protobuf_response(
+                qmtl_registry_api_pb2.IdList(ids=[node_id]), status.HTTP_201_CREATED
+            )
         return {"node_id": node_id}
     except ValidationError as e:
         logger.error(f"노드 등록 입력값 오류: {str(e)}", exc_info=True)
@@ -611,17 +850,105 @@ async def create_node(
         )
 
 
+@app.post("/v1/registry/nodes:batch", status_code=status.HTTP_201_CREATED)
+async def create_nodes_batch(
+    request: Request, node_service: NodeManagementService = Depends(get_node_service)
+):
+    """
+    노드 일괄 등록 API
+    - Body: {"nodes": [...], "strategy_version_id": (선택) CONTAINS 관계를 생성할 전략 버전}
+      또는 NodeBatchRequest (Content-Type: application/x-protobuf)
+    - 노드/DEPENDS_ON/CONTAINS 를 한 번의 트랜잭션으로 등록, 이미 존재하는 노드는 유지
+    """
+    try:
+        if is_protobuf_body(request):
+            batch = await read_protobuf(request, qmtl_registry_api_pb2.NodeBatchRequest)
+            node_protos = list(batch.nodes)
+            strategy_version_id = batch.strategy_version_id or None
+        else:
+            batch_data = await _json_body(request)
+            node_protos = [_parse_node_proto(n) for n in batch_data.get("nodes", [])]
+            strategy_version_id = batch_data.get("strategy_version_id")
+        for node_proto in node_protos:
+            node_service.validate_node(node_proto)
+        node_ids = node_service.create_nodes_bulk(node_protos, strategy_version_id)
+        return _ids_response(request, "node_ids", node_ids, status.HTTP_201_CREATED)
+    except ValidationError as e:
+        logger.error(f"노드 일괄 등록 입력값 오류: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=422, detail=str(e))
+    except RegistryServiceError as e:
+        logger.error(f"노드 일괄 등록 실패: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+    except HTTPException:
+        raise
+    except Exception:
+        logger.exception("노드 일괄 등록 처리 중 알 수 없는 오류")
+        raise HTTPException(
+            status_code=500, detail="노드 일괄 등록 처리 중 내부 서버 오류가 발생했습니다"
+        )
+
+
+@app.get("/v1/registry/nodes")
+async def list_nodes(
+    request: Request,
+    after: Optional[str] = Query(None, description="이전 페이지의 next_cursor (node_id)"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="페이지 크기"),
+    node_service: NodeManagementService = Depends(get_node_service),
+):
+    """노드 목록 조회 API (node_id keyset 페이지, NDJSON 스트리밍 지원)"""
+    if _wants_ndjson(request):
+        return _ndjson_response(node_service.iter_nodes(after=after, limit=limit, as_json=True))
+    limit = limit or DEFAULT_PAGE_SIZE
+    nodes = node_service.list_nodes(after=after, limit=limit + 1)
+    return _node_list_response(request, nodes, limit)
+
+
+@app.post("/v1/registry/nodes:batch-get")
+async def get_nodes_batch(
+    request: Request, node_service: NodeManagementService = Depends(get_node_service)
+):
+    """노드 일괄 조회 API
+    - Body: {"node_ids": [...]} 또는 IdList (Content-Type: application/x-protobuf)
+    - 존재하는 노드만 반환 (요청 순서 유지, 중복 제거)
+    """
+    if is_protobuf_body(request):
+        node_ids = list((await read_protobuf(request, qmtl_registry_api_pb2.IdList)).ids)
+    else:
+        node_ids = (await _json_body(request)).get("node_ids", [])
+    if len(node_ids) > MAX_PAGE_SIZE:
+        raise HTTPException(
+            status_code=422, detail=f"한 번에 조회할 수 있는 노드는 최대 {MAX_PAGE_SIZE}개입니다"
+        )
+    nodes = node_service.get_nodes(node_ids)
+    return _node_list_response(request, list(nodes.values()))
+
+
 @app.get("/v1/registry/nodes/{node_id}")
 async def get_node(
-    node_id: str, node_service: NodeManagementService = Depends(get_node_service)
+    node_id: str, request: Request, node_service: NodeManagementService = Depends(get_node_service)
 ):
-    """노드 조회 API"""
+    """노드 조회 API
+
+    - ETag: 응답 media type + 노드 protobuf 직렬화의 sha256 (표현별로 다름)
+    - If-None-Match(쉼표 구분 목록 또는 `*`)가 일치하면 304, 본문 없음
+    - Accept 에 따라 표현이 달라지므로 Vary: Accept
+    """
     node = node_service.get_node(node_id)
     if not node:
         raise HTTPException(status_code=404, detail=f"노드를 찾을 수 없습니다: {node_id}")
-    # protobuf → dict 변환 시 enum은 label로 변환
-    node_dict = MessageToDict(node, preserving_proto_field_name=True, use_integers_for_enums=False)
-    return {"node": node_dict}
+    node_proto = datanode_to_proto(node)
+    media_type = PROTOBUF_MEDIA_TYPE if wants_protobuf(request) else "application/json"
+    digest = hashlib.sha256(media_type.encode())
+    digest.update(node_proto.SerializeToString(deterministic=True))
+    etag = '"%s"' % digest.hexdigest()
+    headers = {"ETag": etag, "Vary": "Accept"}
+    if if_none_match(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    if media_type == PROTOBUF_MEDIA_TYPE:
+        return protobuf_response(
+            qmtl_registry_api_pb2.NodeEnvelope(node=node_proto), headers=headers
+        )
+    return JSONResponse({"node": jsonable_encoder(_json_node(node))}, headers=headers)
 
 
 @app.delete("/v1/registry/nodes/{node_id}")
@@ -636,26 +963,41 @@ async def delete_node(
 
 
 @app.get("/v1/registry/nodes/leaf-nodes")
-async def get_leaf_nodes(metadata_service: MetadataService = Depends(get_metadata_service)):
+async def get_leaf_nodes(
+    request: Request, metadata_service: MetadataService = Depends(get_metadata_service)
+):
     """의존성이 없는 노드 목록 조회 API"""
     nodes = metadata_service.node_service.list_zero_deps()
-    return {"nodes": nodes}
+    return _node_list_response(request, nodes)
 
 
 @app.get("/v1/registry/nodes/by-tags")
 async def get_nodes_by_tags(
+    request: Request,
     tags: List[str] = Query(..., description="필터링할 태그 목록"),
     interval: Optional[str] = Query(None, description="데이터 수집 인터벌 (예: 1h, 1d)"),
     period: Optional[str] = Query(None, description="데이터 보관 기간 (인터벌 단위)"),
     match_mode: str = Query("AND", description="태그 매칭 모드 (AND 또는 OR)"),
+    after: Optional[str] = Query(None, description="이전 페이지의 next_cursor (node_id)"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="페이지 크기"),
     metadata_service: MetadataService = Depends(get_metadata_service),
 ):
-    """태그/인터벌/피리어드 기반 노드 목록 조회 API"""
+    """태그/인터벌/피리어드 기반 노드 목록 조회 API (node_id keyset 페이지, NDJSON 스트리밍 지원)"""
     if match_mode not in ("AND", "OR"):
         raise HTTPException(status_code=422, detail="match_mode는 'AND' 또는 'OR'이어야 합니다")
 
-    nodes = metadata_service.node_service.list_by_tags(tags, interval, period, match_mode)
-    return {"nodes": nodes}
+    node_service = metadata_service.node_service
+    if _wants_ndjson(request):
+        return _ndjson_response(
+            node_service.iter_by_tags(
+                tags, interval, period, match_mode, after=after, limit=limit, as_json=True
+            )
+        )
+    limit = limit or DEFAULT_PAGE_SIZE
+    nodes = node_service.list_by_tags(
+        tags, interval, period, match_mode, after=after, limit=limit + 1
+    )
+    return _node_list_response(request, nodes, limit)
 
 
 # 전략 관련 API
@@ -671,10 +1013,15 @@ async def get_strategy(
 
 
 @app.get("/v1/registry/strategies")
-async def list_strategies(metadata_service: MetadataService = Depends(get_metadata_service)):
-    """전략 목록 조회 API"""
-    strategies = metadata_service.strategy_service.list_strategies()
-    return {"strategies": strategies}
+async def list_strategies(
+    after: Optional[str] = Query(None, description="이전 페이지의 next_cursor (version_id)"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="페이지 크기"),
+    metadata_service: MetadataService = Depends(get_metadata_service),
+):
+    """전략 목록 조회 API (version_id keyset 페이지)"""
+    limit = limit or DEFAULT_PAGE_SIZE
+    strategies = metadata_service.strategy_service.list_strategies(after=after, limit=limit + 1)
+    return _page(strategies, limit, "strategies", "version_id")
 
 
 # 노드-전략 관계 관리 API
@@ -713,6 +1060,33 @@ async def remove_node_from_strategy(
     return {"success": True}
 
 
+@app.delete("/v1/registry/strategies/{strategy_version_id}/nodes")
+async def remove_all_nodes_from_strategy(
+    strategy_version_id: str,
+    request: Request,
+    metadata_service: MetadataService = Depends(get_metadata_service),
+):
+    """전략의 모든 노드 제거 API (CONTAINS 관계 일괄 삭제, 노드별 갱신된 참조 카운트 반환)"""
+    ref_counts = metadata_service.node_service.remove_strategy_contains(strategy_version_id)
+    return _ref_counts_response(request, ref_counts)
+
+
+@app.post("/v1/registry/nodes:ref-counts")
+async def get_node_reference_counts(
+    request: Request, metadata_service: MetadataService = Depends(get_metadata_service)
+):
+    """노드 참조 카운트 일괄 조회 API
+    - Body: {"node_ids": [...]} 또는 IdList (Content-Type: application/x-protobuf)
+    - 존재하지 않는 노드는 0
+    """
+    if is_protobuf_body(request):
+        node_ids = list((await read_protobuf(request, qmtl_registry_api_pb2.IdList)).ids)
+    else:
+        node_ids = (await _json_body(request)).get("node_ids", [])
+    ref_counts = metadata_service.node_service.get_ref_counts(node_ids)
+    return _ref_counts_response(request, ref_counts)
+
+
 @app.get("/v1/registry/nodes/{node_id}/ref-count")
 async def get_node_reference_count(
     node_id: str, metadata_service: MetadataService = Depends(get_metadata_service)
@@ -730,7 +1104,9 @@ async def get_node_reference_count(
 
 @app.get("/v1/registry/nodes/{node_id}/ref-strategies")
 async def get_node_reference_strategies(
-    node_id: str, metadata_service: MetadataService = Depends(get_metadata_service)
+    node_id: str,
+    request: Request,
+    metadata_service: MetadataService = Depends(get_metadata_service),
 ):
     """노드를 참조하는 전략 목록 조회 API"""
     # 노드가 존재하는지 확인
@@ -740,15 +1116,18 @@ async def get_node_reference_strategies(
 
     # 참조하는 전략 목록 조회
     ref_strategies = metadata_service.node_service.get_node_ref_strategies(node_id)
-    return {"strategy_version_ids": ref_strategies}
+    return _ids_response(request, "strategy_version_ids", ref_strategies)
 
 
 @app.get("/v1/registry/strategies/{strategy_version_id}/nodes")
 async def get_strategy_nodes(
     strategy_version_id: str,
+    request: Request,
+    after: Optional[str] = Query(None, description="이전 페이지의 next_cursor (node_id)"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="페이지 크기"),
     metadata_service: MetadataService = Depends(get_metadata_service),
 ):
-    """전략에 포함된 노드 목록 조회 API"""
+    """전략에 포함된 노드 목록 조회 API (node_id keyset 페이지, NDJSON 스트리밍 지원)"""
     # 전략이 존재하는지 확인
     strategy = metadata_service.get_strategy(strategy_version_id)
     if not strategy:
@@ -757,8 +1136,16 @@ async def get_strategy_nodes(
         )
 
     # 전략에 포함된 노드 목록 조회
-    nodes = metadata_service.node_service.get_strategy_nodes(strategy_version_id)
-    return {"nodes": nodes}
+    node_service = metadata_service.node_service
+    if _wants_ndjson(request):
+        return _ndjson_response(
+            node_service.iter_strategy_nodes(
+                strategy_version_id, after=after, limit=limit, as_json=True
+            )
+        )
+    limit = limit or DEFAULT_PAGE_SIZE
+    nodes = node_service.get_strategy_nodes(strategy_version_id, after=after, limit=limit + 1)
+    return _node_list_response(request, nodes, limit)
 
 
 # 노드 상태/메타데이터 API
@@ -829,7 +1216,8 @@ async def list_strategy_snapshots(
     metadata_service: MetadataService = Depends(get_metadata_service),
 ):
     try:
-        snapshots = metadata_service.snapshot_service.get_snapshots(version_id)
+        # 메타데이터만 반환 (노드 blob 은 rollback 시 지연 복원)
+        snapshots = metadata_service.snapshot_service.list_snapshots(version_id)
         return {"snapshots": snapshots}
     except HTTPException:
         raise
@@ -842,12 +1230,15 @@ async def list_strategy_snapshots(
 async def rollback_strategy_to_snapshot(
     version_id: str,
     snapshot_id: str,
+    request: Request,
     metadata_service: MetadataService = Depends(get_metadata_service),
 ):
     try:
         snapshot = metadata_service.snapshot_service.rollback_to_snapshot(version_id, snapshot_id)
         if not snapshot:
             raise HTTPException(status_code=404, detail="스냅샷을 찾을 수 없습니다")
+        if wants_protobuf(request):
+            return protobuf_response(snapshot)
         return {"snapshot": snapshot}
     except HTTPException:
         raise
@@ -858,14 +1249,16 @@ async def rollback_strategy_to_snapshot(
 
 @app.get("/v1/registry/nodes/{node_id}/dependencies")
 async def get_node_dependencies(
-    node_id: str, metadata_service: MetadataService = Depends(get_metadata_service)
+    node_id: str,
+    request: Request,
+    metadata_service: MetadataService = Depends(get_metadata_service),
 ):
     """노드가 의존하는 노드 ID 목록 조회 API"""
     node = metadata_service.get_node(node_id)
     if not node:
         raise HTTPException(status_code=404, detail=f"노드를 찾을 수 없습니다: {node_id}")
     deps = metadata_service.node_service.get_node_dependencies(node_id)
-    return {"dependencies": deps}
+    return _ids_response(request, "dependencies", deps)
 
 
 @app.post("/v1/registry/nodes/{node_id}/dependencies/{dependency_id}")
@@ -0,0 +1,320 @@
+"""
+비동기 Registry 클라이언트: 대형 전략 등록/조회를 위한 HTTP/2, 동시성 제한, 요청 병합 클라이언트
+
+- httpx.AsyncClient (h2 설치 시 HTTP/2 멀티플렉싱) + max_concurrency 세마포어로 동시 요청 수 제한
+- MicroBatcher: batch_window 동안 들어온 get_node/get_node_ref_count/register_node 호출을
+  nodes:batch-get / nodes:ref-counts / nodes:batch 한 번으로 병합
+- 같은 key 의 요청이 대기/전송 중이면 새 요청을 보내지 않고 결과를 공유 (single-flight)
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Set
+
+import httpx
+from google.protobuf.json_format import MessageToDict
+from google.protobuf.message import Message
+
+from qmtl.common.errors.exceptions import RegistryClientError, RegistryConnectionError
+from qmtl.dag_manager.registry.registry_client import (
+    ACCEPT_HEADER,
+    NODE_PAGE_SIZE,
+    RegistryClientBase,
+)
+from qmtl.models.datanode import DataNode, datanode_from_proto, datanode_to_proto
+from qmtl.models.generated import qmtl_registry_api_pb2
+
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+class MicroBatcher:
+    """동시 load(key) 호출을 window_sec 동안 모아 fetch_many 한 번으로 처리
+
+    - fetch_many(items) 는 key → 결과 dict 를 반환 (없는 key 는 None)
+    - 같은 key 는 대기 중이든 전송 중이든 하나의 future 를 공유한다 (single-flight)
+    - 대기 중인 key 가 max_batch_size 에 도달하면 window 를 기다리지 않고 즉시 전송
+    """
+
+    def __init__(
+        self,
+        fetch_many: Callable[[List[Any]], Awaitable[Dict[Hashable, Any]]],
+        window_sec: float = 0.002,
+        max_batch_size: int = 500,
+    ):
+        self._fetch_many = fetch_many
+        self.window_sec = window_sec
+        self.max_batch_size = max_batch_size
+        self._futures: Dict[Hashable, asyncio.Future] = {}
+        self._queue: Dict[Hashable, Any] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def load(self, key: Hashable, item: Any = None) -> Any:
+        """key 의 결과를 반환. item 을 주면 fetch_many 에 key 대신 item 을 전달"""
+        future = self._futures.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._futures[key] = future
+            self._queue[key] = key if item is None else item
+            if len(self._queue) >= self.max_batch_size:
+                self.flush()
+            elif self._timer is None:
+                self._timer = loop.call_later(self.window_sec, self.flush)
+        # 한 호출자의 취소가 같은 key 를 기다리는 다른 호출자에게 전파되지 않도록 shield
+        return await asyncio.shield(future)
+
+    def flush(self) -> None:
+        """대기 중인 key 를 즉시 전송"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._queue:
+            return
+        batch, self._queue = self._queue, {}
+        task = asyncio.ensure_future(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: Dict[Hashable, Any]) -> None:
+        try:
+            results = await self._fetch_many(list(batch.values()))
+        except Exception as e:
+            for key in batch:
+                future = self._futures.pop(key)
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for key in batch:
+            future = self._futures.pop(key)
+            if not future.done():
+                future.set_result(results.get(key))
+
+
+class AsyncRegistryClient(RegistryClientBase):
+    """
+    Registry API 비동기 클라이언트
+
+    사용 예:
+        async with AsyncRegistryClient("http://registry:8000") as client:
+            await asyncio.gather(*(client.register_node(n) for n in nodes))
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        timeout: int = 10,
+        use_protobuf: bool = False,
+        http2: bool = True,
+        max_concurrency: int = 32,
+        batch_window_ms: float = 2.0,
+        max_batch_size: int = 500,
+    ):
+        """
+        Args:
+            base_url: Registry API의 기본 URL (예: "http://localhost:8000")
+            timeout: API 요청 타임아웃 (초)
+            use_protobuf: 요청 본문을 application/x-protobuf 로 전송할지 여부
+            http2: HTTP/2 사용 여부 (h2 패키지 미설치 시 HTTP/1.1)
+            max_concurrency: 동시에 전송 중인 요청 수 상한 (커넥션 풀 크기)
+            batch_window_ms: 개별 호출을 모으는 시간 창 (ms)
+            max_batch_size: 한 번의 batch 요청에 담는 최대 key 수 (서버 MAX_PAGE_SIZE 이하)
+        """
+        super().__init__(base_url, timeout, use_protobuf)
+        self.http2 = http2 and HTTP2_AVAILABLE
+        self.client = httpx.AsyncClient(
+            timeout=timeout,
+            verify=False,
+            http2=self.http2,
+            headers={"Accept": ACCEPT_HEADER},
+            limits=httpx.Limits(
+                max_connections=max_concurrency, max_keepalive_connections=max_concurrency
+            ),
+        )
+        self.max_batch_size = max_batch_size
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        window_sec = batch_window_ms / 1000
+        self._node_batcher = MicroBatcher(self._fetch_nodes, window_sec, max_batch_size)
+        self._ref_count_batcher = MicroBatcher(self._fetch_ref_counts, window_sec, max_batch_size)
+        self._register_batcher = MicroBatcher(self._register_many, window_sec, max_batch_size)
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+    async def __aenter__(self) -> "AsyncRegistryClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """대기 중인 batch 를 전송하고 커넥션 풀을 닫는다"""
+        batchers = (self._node_batcher, self._ref_count_batcher, self._register_batcher)
+        for batcher in batchers:
+            batcher.flush()
+        pending = [task for batcher in batchers for task in batcher._tasks]
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        await self.client.aclose()
+
+    async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        async with self._semaphore:
+            try:
+                return await self.client.request(method, url, **kwargs)
+            except httpx.HTTPError as e:
+                raise RegistryConnectionError(f"Registry API 연결 실패: {str(e)}")
+
+    async def _single_flight(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """같은 key 의 요청이 진행 중이면 그 결과를 공유"""
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(factory())
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(future)
+
+    # --- batch 요청 (MicroBatcher fetch_many) ---
+
+    async def _fetch_nodes(self, node_ids: List[str]) -> Dict[str, DataNode]:
+        response = await self._request(
+            "POST", f"{self.nodes_path}:batch-get", **self._ids_body("node_ids", node_ids)
+        )
+        result = self._decode(response, qmtl_registry_api_pb2.NodeList)
+        if isinstance(result, Message):
+            nodes = [datanode_from_proto(node) for node in result.nodes]
+        else:
+            nodes = [DataNode.model_validate(node) for node in result.get("nodes", [])]
+        return {node.node_id: node for node in nodes}
+
+    async def _fetch_ref_counts(self, node_ids: List[str]) -> Dict[str, int]:
+        response = await self._request(
+            "POST", f"{self.nodes_path}:ref-counts", **self._ids_body("node_ids", node_ids)
+        )
+        result = self._decode(response, qmtl_registry_api_pb2.RefCounts)
+        if isinstance(result, Message):
+            return dict(result.ref_counts)
+        return result.get("ref_counts", {})
+
+    async def _register_many(
+        self, nodes: List[DataNode], strategy_version_id: Optional[str] = None
+    ) -> Dict[str, str]:
+        url = f"{self.nodes_path}:batch"
+        if self.use_protobuf:
+            body = qmtl_registry_api_pb2.NodeBatchRequest(
+                nodes=[datanode_to_proto(node) for node in nodes]
+            )
+            if strategy_version_id:
+                body.strategy_version_id = strategy_version_id
+            response = await self._request("POST", url, **self._protobuf_body(body))
+        else:
+            payload = {
+                # 서버는 ParseDict 로 해석하므로 protobuf JSON 표현으로 전송
+                "nodes": [
+                    MessageToDict(datanode_to_proto(node), preserving_proto_field_name=True)
+                    for node in nodes
+                ],
+                "strategy_version_id": strategy_version_id,
+            }
+            response = await self._request("POST", url, json=payload)
+        result = self._decode(response, qmtl_registry_api_pb2.IdList, expected_status_code=201)
+        node_ids = list(result.ids) if isinstance(result, Message) else result.get("node_ids", [])
+        return {node_id: node_id for node_id in node_ids}
+
+    # --- 공개 API ---
+
+    async def health_check(self) -> Dict:
+        """Registry API 헬스 체크"""
+        return self._handle_response(await self._request("GET", self.health_path))
+
+    async def get_node(self, node_id: str) -> Optional[DataNode]:
+        """노드 조회 (동시 호출은 nodes:batch-get 으로 병합, 없으면 None)"""
+        return await self._node_batcher.load(node_id)
+
+    async def get_nodes(self, node_ids: List[str]) -> Dict[str, DataNode]:
+        """여러 노드 조회 (존재하는 노드만 node_id → DataNode)"""
+        node_ids = list(dict.fromkeys(node_ids))
+        nodes = await asyncio.gather(*(self.get_node(node_id) for node_id in node_ids))
+        return {node_id: node for node_id, node in zip(node_ids, nodes) if node is not None}
+
+    async def register_node(self, node: DataNode) -> str:
+        """노드 등록 (동시 호출은 nodes:batch 로 병합, 이미 존재하는 노드는 유지)"""
+        node_id = await self._register_batcher.load(node.node_id, node)
+        if node_id is None:
+            raise RegistryClientError(f"노드 등록 실패: {node.node_id}")
+        return node_id
+
+    async def register_nodes(
+        self, nodes: List[DataNode], strategy_version_id: Optional[str] = None
+    ) -> List[str]:
+        """노드 일괄 등록 (max_batch_size 단위로 나눠 동시에 전송, 선택적으로 CONTAINS 생성)"""
+        chunks = [
+            nodes[i : i + self.max_batch_size] for i in range(0, len(nodes), self.max_batch_size)
+        ]
+        results = await asyncio.gather(
+            *(self._register_many(chunk, strategy_version_id) for chunk in chunks)
+        )
+        return [node_id for result in results for node_id in result]
+
+    async def get_node_ref_count(self, node_id: str) -> int:
+        """노드 참조 카운트 (동시 호출은 nodes:ref-counts 로 병합)"""
+        return await self._ref_count_batcher.load(node_id) or 0
+
+    async def get_ref_counts(self, node_ids: List[str]) -> Dict[str, int]:
+        """여러 노드의 참조 카운트 일괄 조회 (존재하지 않는 노드는 0)"""
+        return await self._fetch_ref_counts(list(node_ids))
+
+    async def get_node_ref_strategies(self, node_id: str) -> List[str]:
+        """노드를 참조하는 전략 버전 ID 목록"""
+
+        async def fetch():
+            response = await self._request("GET", f"{self.nodes_path}/{node_id}/ref-strategies")
+            if response.status_code == 404:
+                return []
+            result = self._decode(response, qmtl_registry_api_pb2.IdList)
+            if isinstance(result, Message):
+                return list(result.ids)
+            return result.get("strategy_version_ids", [])
+
+        return list(await self._single_flight(("ref-strategies", node_id), fetch))
+
+    async def get_strategy_nodes(self, strategy_version_id: str) -> List[DataNode]:
+        """전략에 포함된 노드 목록 (next_cursor 가 없을 때까지 모든 페이지 조회)"""
+
+        async def fetch():
+            url = f"{self.strategies_path}/{strategy_version_id}/nodes"
+            params = {"limit": NODE_PAGE_SIZE}
+            nodes = []
+            while True:
+                response = await self._request("GET", url, params=params)
+                if response.status_code == 404:
+                    return []
+                result = self._decode(response, qmtl_registry_api_pb2.NodeList)
+                if isinstance(result, Message):
+                    nodes.extend(datanode_from_proto(node) for node in result.nodes)
+                else:
+                    nodes.extend(DataNode.model_validate(n) for n in result.get("nodes", []))
+                cursor = self._next_cursor(result)
+                if cursor is None:
+                    return nodes
+                params = {"limit": NODE_PAGE_SIZE, "after": cursor}
+
+        return list(await self._single_flight(("strategy-nodes", strategy_version_id), fetch))
+
+    async def add_contains_relationship(self, strategy_version_id: str, node_id: str) -> bool:
+        """전략과 노드 간 CONTAINS 관계 생성"""
+        response = await self._request(
+            "POST", f"{self.strategies_path}/{strategy_version_id}/nodes/{node_id}"
+        )
+        return response.status_code in (200, 201)
+
+    async def remove_contains_relationship(self, strategy_version_id: str, node_id: str) -> bool:
+        """전략과 노드 간 CONTAINS 관계 삭제"""
+        response = await self._request(
+            "DELETE", f"{self.strategies_path}/{strategy_version_id}/nodes/{node_id}"
+        )
+        return response.status_code != 404
@@ -0,0 +1,147 @@
+"""
+RegistryClient 노드 메타데이터 캐시
+
+- node_id(정의 content hash) → (ETag, DataNode) LRU, max_entries 초과 시 가장 오래 사용하지 않은 항목 제거
+- max_age 지정 시 해당 시간이 지난 항목은 If-None-Match 로 재검증 (304 면 캐시 유지)
+- path 지정 시 JSON 파일로 저장/복원 (프로세스 재시작 후 warm start)
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Tuple
+
+from qmtl.models.datanode import DataNode
+
+logger = logging.getLogger(__name__)
+
+CACHE_FORMAT_VERSION = 1
+
+
+class NodeMetadataCache:
+    """node_id 키 LRU 캐시 (스레드 안전)"""
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        max_age: Optional[float] = None,
+        path: Optional[str] = None,
+    ):
+        """
+        Args:
+            max_entries: 최대 항목 수
+            max_age: 재검증 없이 사용할 수 있는 시간(초). None 이면 재검증하지 않음 (노드 정의 불변)
+            path: 캐시 파일 경로 (None 이면 메모리 전용)
+        """
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self.path = path
+        # node_id -> (etag, node, stored_at)
+        self._entries: "OrderedDict[str, Tuple[Optional[str], DataNode, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        if path:
+            self.load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def lookup(self, node_id: str) -> Tuple[Optional[DataNode], Optional[str], bool]:
+        """(node, etag, fresh) 반환. fresh 가 False 이면 etag 로 재검증 필요"""
+        with self._lock:
+            entry = self._entries.get(node_id)
+            if entry is None:
+                return None, None, False
+            self._entries.move_to_end(node_id)
+            etag, node, stored_at = entry
+            fresh = self.max_age is None or time.time() - stored_at < self.max_age
+            return node, etag, fresh
+
+    def put(self, node_id: str, node: DataNode, etag: Optional[str] = None) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[node_id] = (etag, node, time.time())
+            self._entries.move_to_end(node_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def seed(self, nodes: Iterable[DataNode]) -> None:
+        """목록 조회 결과 적재 (ETag 를 알고 있는 기존 항목은 유지)"""
+        for node in nodes:
+            if node.node_id not in self._entries:
+                self.put(node.node_id, node)
+
+    def touch(self, node_id: str) -> None:
+        """304 재검증 후 저장 시각 갱신"""
+        with self._lock:
+            entry = self._entries.get(node_id)
+            if entry is not None:
+                self._entries[node_id] = (entry[0], entry[1], time.time())
+
+    def invalidate(self, node_id: str) -> None:
+        with self._lock:
+            self._entries.pop(node_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+            "hit_rate": self.hit_rate,
+        }
+
+    def load(self) -> int:
+        """캐시 파일에서 항목 복원. 파일이 없거나 손상된 경우 빈 캐시로 시작"""
+        if not self.path or not os.path.exists(self.path):
+            return 0
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != CACHE_FORMAT_VERSION:
+                return 0
+            entries = data.get("entries", [])
+        except (OSError, ValueError) as e:
+            logger.warning(f"노드 캐시 파일 로드 실패, 빈 캐시로 시작: {self.path}: {e}")
+            return 0
+        loaded = 0
+        for entry in entries[-self.max_entries :] if self.max_entries > 0 else []:
+            try:
+                node = DataNode.model_validate(entry["node"])
+            except Exception:
+                continue
+            with self._lock:
+                self._entries[node.node_id] = (entry.get("etag"), node, entry.get("stored_at", 0.0))
+            loaded += 1
+        return loaded
+
+    def save(self) -> None:
+        """캐시 파일에 저장 (임시 파일에 쓴 뒤 교체, LRU 순서 유지)"""
+        if not self.path:
+            return
+        with self._lock:
+            entries = [
+                {"etag": etag, "stored_at": stored_at, "node": node.model_dump(mode="json")}
+                for etag, node, stored_at in self._entries.values()
+            ]
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": CACHE_FORMAT_VERSION, "entries": entries}, f)
+        os.replace(tmp_path, self.path)
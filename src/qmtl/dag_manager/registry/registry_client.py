@@ -6,13 +6,18 @@ import logging
 from typing import Dict, List, Optional
 
 import httpx
+from google.protobuf.message import Message
 from httpx import Client, Response
 
 from qmtl.common.errors.exceptions import (
     RegistryClientError,
     RegistryConnectionError,
 )
-from qmtl.models.generated.qmtl_datanode_pb2 import DataNode, DAGEdge
+from qmtl.common.http.negotiation import PROTOBUF_MEDIA_TYPE
+from qmtl.dag_manager.registry.node_cache import NodeMetadataCache
+from qmtl.models.datanode import DataNode, datanode_from_proto, datanode_to_proto
+from qmtl.models.generated import qmtl_registry_api_pb2
+from qmtl.models.generated.qmtl_datanode_pb2 import DAGEdge
 from qmtl.models.generated.qmtl_common_pb2 import IntervalSettings
 from qmtl.models.generated.qmtl_strategy_pb2 import (
     StrategySnapshot,
@@ -24,30 +29,37 @@ from qmtl.models.generated.qmtl_strategy_pb2 import (
 logger = logging.getLogger(__name__)
 
 
-class RegistryClient:
+# protobuf 응답을 우선 요청 (서버가 지원하지 않으면 JSON 응답)
+ACCEPT_HEADER = f"{PROTOBUF_MEDIA_TYPE}, application/json;q=0.9"
+
+# 목록 API 페이지 요청 크기 (registry MAX_PAGE_SIZE). next_cursor 가 없을 때까지 이어 받는다.
+NODE_PAGE_SIZE = 1000
+
+
+class RegistryClientBase:
     """
-    Registry API와 통신하는 클라이언트 클래스
+    RegistryClient/AsyncRegistryClient 공용 경로 설정과 응답 해석
+
+    응답은 Accept 헤더로 protobuf 를 우선 요청하고, 서버가 돌려준 Content-Type 에 따라
+    protobuf 또는 JSON 으로 해석한다. 요청 본문은 use_protobuf=True 일 때만 protobuf 로 보낸다
+    (protobuf 본문을 지원하지 않는 registry 와의 호환을 위해 기본값은 JSON).
     """
 
-    def __init__(self, base_url: str, timeout: int = 10):
+    def __init__(self, base_url: str, timeout: int = 10, use_protobuf: bool = False):
         """
         Args:
             base_url: Registry API의 기본 URL (예: "http://localhost:8000")
             timeout: API 요청 타임아웃 (초)
+            use_protobuf: 요청 본문을 application/x-protobuf 로 전송할지 여부
         """
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
-        self.client = Client(timeout=timeout, verify=False)
+        self.use_protobuf = use_protobuf
         # API 경로
         self.nodes_path = f"{self.base_url}/v1/registry/nodes"
         self.strategies_path = f"{self.base_url}/v1/registry/strategies"
         self.health_path = f"{self.base_url}/"
 
-    def __del__(self):
-        """클라이언트 리소스 정리"""
-        if hasattr(self, "client"):
-            self.client.close()
-
     def _handle_response(self, response: Response, expected_status_code: int = 200) -> Dict:
         """응답 처리 공통 로직
 
@@ -76,6 +88,72 @@ class RegistryClient:
         except httpx.HTTPError as e:
             raise RegistryConnectionError(f"Registry API 연결 오류: {str(e)}")
 
+    def _decode(self, response: Response, message_class, expected_status_code: int = 200):
+        """응답이 protobuf 면 message_class 메시지로, 아니면 JSON dict 로 반환"""
+        content_type = str(response.headers.get("content-type", ""))
+        if response.status_code == expected_status_code and PROTOBUF_MEDIA_TYPE in content_type:
+            message = message_class()
+            message.ParseFromString(response.content)
+            return message
+        return self._handle_response(response, expected_status_code)
+
+    @staticmethod
+    def _next_cursor(result) -> Optional[str]:
+        """NodeList 메시지/JSON 페이지의 next_cursor (마지막 페이지면 None)"""
+        if isinstance(result, Message):
+            return result.next_cursor if result.HasField("next_cursor") else None
+        return result.get("next_cursor")
+
+    def _protobuf_body(self, message: Message) -> Dict:
+        return {
+            "content": message.SerializeToString(),
+            "headers": {"Content-Type": PROTOBUF_MEDIA_TYPE},
+        }
+
+    def _ids_body(self, key: str, ids: List[str]) -> Dict:
+        """ID 목록 요청 본문 (use_protobuf 이면 IdList, 아니면 {key: [...]})"""
+        if self.use_protobuf:
+            return self._protobuf_body(qmtl_registry_api_pb2.IdList(ids=list(ids)))
+        return {"json": {key: list(ids)}}
+
+
+class RegistryClient(RegistryClientBase):
+    """
+    Registry API와 통신하는 클라이언트 클래스 (동기, 요청 단위 호출)
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        timeout: int = 10,
+        use_protobuf: bool = False,
+        cache_size: int = 10000,
+        cache_max_age: Optional[float] = None,
+        cache_path: Optional[str] = None,
+    ):
+        """
+        Args:
+            cache_size: 노드 메타데이터 캐시 최대 항목 수 (0 이면 캐시 사용 안 함)
+            cache_max_age: 캐시 항목을 ETag 재검증 없이 사용할 시간(초), None 이면 재검증 안 함
+            cache_path: 캐시 파일 경로 (지정 시 생성 시 복원, close() 시 저장)
+        """
+        super().__init__(base_url, timeout, use_protobuf)
+        self.client = Client(timeout=timeout, verify=False, headers={"Accept": ACCEPT_HEADER})
+        self.node_cache = NodeMetadataCache(cache_size, cache_max_age, cache_path)
+
+    def close(self) -> None:
+        """캐시 파일 저장 후 커넥션 정리"""
+        try:
+            self.node_cache.save()
+        except OSError as e:
+            logger.warning(f"노드 캐시 저장 실패: {str(e)}")
+        self.client.close()
+
+    def __del__(self):
+        """클라이언트 리소스 정리 (캐시 파일 저장은 close() 에서만 수행)"""
+        if hasattr(self, "client"):
+            self.client.close()
+
     def health_check(self) -> Dict:
         """Registry API 헬스 체크
 
@@ -104,18 +182,28 @@ class RegistryClient:
             RegistryClientError: 노드 등록 실패 시
         """
         try:
-            payload = {"node": node.model_dump()}
-            response = self.client.post(self.nodes_path, json=payload)
-            result = self._handle_response(response, expected_status_code=201)
+            if self.use_protobuf:
+                envelope = qmtl_registry_api_pb2.NodeEnvelope(node=datanode_to_proto(node))
+                response = self.client.post(self.nodes_path, **self._protobuf_body(envelope))
+            else:
+                payload = {"node": node.model_dump()}
+                response = self.client.post(self.nodes_path, json=payload)
+            result = self._decode(response, qmtl_registry_api_pb2.IdList, expected_status_code=201)
+            if isinstance(result, Message):
+                return result.ids[0] if result.ids else None
             return result.get("node_id")
         except httpx.HTTPError as e:
             raise RegistryClientError(f"노드 등록 실패: {str(e)}")
 
-    def get_node(self, node_id: str) -> Optional[DataNode]:
+    def get_node(self, node_id: str, revalidate: bool = False) -> Optional[DataNode]:
         """노드 ID로 노드 조회
 
+        node_id 는 노드 정의의 content hash 이므로 캐시에 있으면 네트워크 요청 없이 반환한다.
+        cache_max_age 가 지났거나 revalidate=True 이면 If-None-Match 로 재검증한다 (304 면 캐시 사용)
+
         Args:
             node_id: 조회할 노드 ID
+            revalidate: 캐시 항목을 ETag 로 재검증할지 여부
 
         Returns:
             DataNode 객체 또는 None (존재하지 않는 경우)
@@ -123,18 +211,39 @@ class RegistryClient:
         Raises:
             RegistryClientError: API 오류 시
         """
+        cached, etag, fresh = self.node_cache.lookup(node_id)
+        if cached is not None and fresh and not revalidate:
+            self.node_cache.hits += 1
+            return cached
         try:
             url = f"{self.nodes_path}/{node_id}"
-            response = self.client.get(url)
+            if cached is not None and etag:
+                response = self.client.get(url, headers={"If-None-Match": etag})
+            else:
+                response = self.client.get(url)
 
-            if response.status_code == 404:
-                return None
+            if cached is not None and response.status_code == 304:
+                self.node_cache.hits += 1
+                self.node_cache.revalidations += 1
+                self.node_cache.touch(node_id)
+                return cached
+            self.node_cache.misses += 1
 
-            result = self._handle_response(response)
-            if not result or "node" not in result:
+            if response.status_code == 404:
+                self.node_cache.invalidate(node_id)
                 return None
 
-            return DataNode.model_validate(result["node"])
+            result = self._decode(response, qmtl_registry_api_pb2.NodeEnvelope)
+            if isinstance(result, Message):
+                node = datanode_from_proto(result.node) if result.HasField("node") else None
+            elif not result or "node" not in result:
+                node = None
+            else:
+                node = DataNode.model_validate(result["node"])
+            if node is not None:
+                etag = response.headers.get("etag")
+                self.node_cache.put(node_id, node, etag if isinstance(etag, str) else None)
+            return node
         except httpx.HTTPError as e:
             raise RegistryClientError(f"노드 조회 실패: {str(e)}")
         except Exception as e:
@@ -156,6 +265,7 @@ class RegistryClient:
         try:
             url = f"{self.nodes_path}/{node_id}"
             response = self.client.delete(url)
+            self.node_cache.invalidate(node_id)
 
             if response.status_code == 404:
                 return False
@@ -295,6 +405,49 @@ class RegistryClient:
         except httpx.HTTPError as e:
             raise RegistryClientError(f"노드 참조 카운트 조회 실패: {str(e)}")
 
+    def get_ref_counts(self, node_ids: List[str]) -> Dict[str, int]:
+        """여러 노드의 참조 카운트 일괄 조회
+
+        Args:
+            node_ids: 노드 ID 목록
+
+        Returns:
+            node_id → 노드를 참조하는 전략 수 (존재하지 않는 노드는 0)
+
+        Raises:
+            RegistryClientError: API 오류 시
+        """
+        try:
+            url = f"{self.nodes_path}:ref-counts"
+            response = self.client.post(url, **self._ids_body("node_ids", node_ids))
+            result = self._decode(response, qmtl_registry_api_pb2.RefCounts)
+            if isinstance(result, Message):
+                return dict(result.ref_counts)
+            return result.get("ref_counts", {})
+        except httpx.HTTPError as e:
+            raise RegistryClientError(f"노드 참조 카운트 일괄 조회 실패: {str(e)}")
+
+    def remove_strategy_nodes(self, strategy_version_id: str) -> Dict[str, int]:
+        """전략의 모든 CONTAINS 관계를 한 번에 삭제 (전략 비활성화 시 사용)
+
+        Args:
+            strategy_version_id: 전략 버전 ID
+
+        Returns:
+            해제된 node_id → 갱신된 참조 카운트
+
+        Raises:
+            RegistryClientError: API 오류 시
+        """
+        try:
+            response = self.client.delete(f"{self.strategies_path}/{strategy_version_id}/nodes")
+            result = self._decode(response, qmtl_registry_api_pb2.RefCounts)
+            if isinstance(result, Message):
+                return dict(result.ref_counts)
+            return result.get("ref_counts", {})
+        except httpx.HTTPError as e:
+            raise RegistryClientError(f"전략 CONTAINS 관계 일괄 삭제 실패: {str(e)}")
+
     def get_node_ref_strategies(self, node_id: str) -> List[str]:
         """노드를 참조하는 전략 ID 목록 조회
 
@@ -314,13 +467,15 @@ class RegistryClient:
             if response.status_code == 404:
                 return []
 
-            result = self._handle_response(response)
+            result = self._decode(response, qmtl_registry_api_pb2.IdList)
+            if isinstance(result, Message):
+                return list(result.ids)
             return result.get("strategy_version_ids", [])
         except httpx.HTTPError as e:
             raise RegistryClientError(f"노드 참조 전략 목록 조회 실패: {str(e)}")
 
     def get_strategy_nodes(self, strategy_version_id: str) -> List[DataNode]:
-        """전략에 포함된 노드 목록 조회
+        """전략에 포함된 노드 목록 조회 (next_cursor 가 없을 때까지 모든 페이지 조회)
 
         Args:
             strategy_version_id: 전략 버전 ID
@@ -333,20 +488,32 @@ class RegistryClient:
         """
         try:
             url = f"{self.strategies_path}/{strategy_version_id}/nodes"
-            response = self.client.get(url)
-
-            if response.status_code == 404:
-                return []
-
-            result = self._handle_response(response)
+            params = {"limit": NODE_PAGE_SIZE}
             nodes = []
-
-            for node_data in result.get("nodes", []):
-                try:
-                    nodes.append(DataNode.model_validate(node_data))
-                except Exception as e:
-                    logger.error(f"노드 데이터 파싱 실패: {str(e)}")
-
+            while True:
+                response = self.client.get(url, params=params)
+
+                if response.status_code == 404:
+                    return []
+
+                result = self._decode(response, qmtl_registry_api_pb2.NodeList)
+                if isinstance(result, Message):
+                    nodes.extend(datanode_from_proto(node) for node in result.nodes)
+                else:
+                    for node_data in result.get("nodes", []):
+                        try:
+                            nodes.append(DataNode.model_validate(node_data))
+                        except Exception as e:
+                            logger.error(f"노드 데이터 파싱 실패: {str(e)}")
+
+                # 서버는 페이지 단위로 응답하므로 마지막 페이지까지 이어 받음
+                cursor = self._next_cursor(result)
+                if cursor is None:
+                    break
+                params = {"limit": NODE_PAGE_SIZE, "after": cursor}
+
+            # 이후 get_node 가 네트워크 없이 응답하도록 캐시에 적재
+            self.node_cache.seed(nodes)
             return nodes
         except httpx.HTTPError as e:
             raise RegistryClientError(f"전략 노드 목록 조회 실패: {str(e)}")
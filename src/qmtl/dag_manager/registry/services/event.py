@@ -3,38 +3,483 @@
 Registry 상태 변화 이벤트 발행/구독 서비스 (MULTI-7)
 - Redis Pub/Sub 기반 (확장 가능)
 - NodeStatusEvent, PipelineStatusEvent, AlertEvent 발행/구독
+- BatchingEventPublisher/AsyncBatchingEventPublisher: flush_interval 동안 모은 이벤트를
+  pipeline 한 번으로 PUBLISH, 같은 노드의 상태 이벤트는 최신 것만 발행 (coalesce)
+- StreamEventPublisher/StreamEventSubscriber: Redis Streams 이벤트 로그 (consumer group, ack, 재생)
 """
-from typing import Any, Dict, Optional
+import asyncio
+import itertools
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Tuple
 import json
 import redis
+import redis.asyncio as aioredis
 from datetime import datetime
 from qmtl.models.generated import qmtl_events_pb2
 
+logger = logging.getLogger(__name__)
+
+
+def node_status_channels(event: qmtl_events_pb2.NodeStatusEvent) -> List[str]:
+    return [f"event:node:{event.node_id}", "event:node_status"]
+
+
+def pipeline_status_channels(event: qmtl_events_pb2.PipelineStatusEvent) -> List[str]:
+    return [f"event:pipeline:{event.pipeline_id}", "event:pipeline_status"]
+
+
+def alert_channels(event: qmtl_events_pb2.AlertEvent) -> List[str]:
+    return [f"event:alert:{event.target_id}", "event:alert"]
+
+
 class EventPublisher:
     def __init__(self, redis_url: str = "redis://localhost:6379/0"):
         self.redis = redis.from_url(redis_url)
 
     def publish_node_status(self, event: qmtl_events_pb2.NodeStatusEvent):
-        self.redis.publish(f"event:node:{event.node_id}", event.SerializeToString())
-        self.redis.publish("event:node_status", event.SerializeToString())
+        for channel in node_status_channels(event):
+            self.redis.publish(channel, event.SerializeToString())
 
     def publish_pipeline_status(self, event: qmtl_events_pb2.PipelineStatusEvent):
-        self.redis.publish(f"event:pipeline:{event.pipeline_id}", event.SerializeToString())
-        self.redis.publish("event:pipeline_status", event.SerializeToString())
+        for channel in pipeline_status_channels(event):
+            self.redis.publish(channel, event.SerializeToString())
 
     def publish_alert(self, event: qmtl_events_pb2.AlertEvent):
-        self.redis.publish(f"event:alert:{event.target_id}", event.SerializeToString())
-        self.redis.publish("event:alert", event.SerializeToString())
+        for channel in alert_channels(event):
+            self.redis.publish(channel, event.SerializeToString())
+
+
+class _EventBuffer:
+    """발행 대기 이벤트 버퍼 (coalesce key → (채널 목록, payload), 삽입 순서 유지)"""
+
+    def __init__(self, coalesce: bool):
+        self.coalesce = coalesce
+        self._pending: "OrderedDict[Hashable, Tuple[List[str], bytes]]" = OrderedDict()
+        self._seq = itertools.count()
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def add(self, channels: List[str], payload: bytes, key: Optional[Hashable] = None) -> None:
+        if key is None or not self.coalesce:
+            key = next(self._seq)
+        elif key in self._pending:
+            # 같은 노드의 이전 상태는 버리고 최신 상태를 마지막 순서로 발행
+            del self._pending[key]
+            self.coalesced += 1
+        self._pending[key] = (channels, payload)
+
+    def drain(self) -> List[Tuple[List[str], bytes]]:
+        pending, self._pending = self._pending, OrderedDict()
+        return list(pending.values())
+
+
+class BatchingEventPublisher:
+    """
+    이벤트를 버퍼에 모아 flush_interval 마다 (또는 max_batch 도달 시) pipeline 으로 일괄 PUBLISH
+    - coalesce=True 이면 flush 전 같은 node_id 의 NodeStatusEvent 는 최신 것만 발행
+    - close() 시 남은 이벤트를 발행하고 백그라운드 스레드 종료
+    """
+
+    def __init__(
+        self,
+        redis_url: str = "redis://localhost:6379/0",
+        flush_interval: float = 0.01,
+        max_batch: int = 1000,
+        coalesce: bool = True,
+        start: bool = True,
+    ):
+        self.redis = redis.from_url(redis_url)
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self._buffer = _EventBuffer(coalesce)
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.published = 0
+        if start:
+            self.start()
+
+    def __enter__(self) -> "BatchingEventPublisher":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="event-publisher-flush", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except redis.RedisError:
+                logger.exception("이벤트 일괄 발행 실패")
+
+    def _add(self, channels: List[str], payload: bytes, key: Optional[Hashable] = None) -> None:
+        with self._lock:
+            self._buffer.add(channels, payload, key)
+            full = len(self._buffer) >= self.max_batch
+        if full:
+            self.flush()
+
+    def publish_node_status(self, event: qmtl_events_pb2.NodeStatusEvent):
+        self._add(node_status_channels(event), event.SerializeToString(), ("node", event.node_id))
+
+    def publish_pipeline_status(self, event: qmtl_events_pb2.PipelineStatusEvent):
+        self._add(pipeline_status_channels(event), event.SerializeToString())
+
+    def publish_alert(self, event: qmtl_events_pb2.AlertEvent):
+        self._add(alert_channels(event), event.SerializeToString())
+
+    def flush(self) -> int:
+        """버퍼의 이벤트를 pipeline 한 번으로 발행, 발행한 이벤트 수 반환"""
+        with self._flush_lock:
+            with self._lock:
+                batch = self._buffer.drain()
+            if not batch:
+                return 0
+            pipe = self.redis.pipeline(transaction=False)
+            for channels, payload in batch:
+                for channel in channels:
+                    pipe.publish(channel, payload)
+            pipe.execute()
+            self.published += len(batch)
+            return len(batch)
+
+    def close(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+
+class AsyncBatchingEventPublisher:
+    """
+    BatchingEventPublisher 의 asyncio 버전 (redis.asyncio)
+    - publish_* 는 버퍼에 추가만 하고 즉시 반환 (max_batch 도달 시 flush 를 기다림)
+    - start() 로 주기적 flush task 시작, aclose() 로 남은 이벤트 발행 후 종료
+    """
+
+    def __init__(
+        self,
+        redis_url: str = "redis://localhost:6379/0",
+        flush_interval: float = 0.01,
+        max_batch: int = 1000,
+        coalesce: bool = True,
+    ):
+        self.redis = aioredis.from_url(redis_url)
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self._buffer = _EventBuffer(coalesce)
+        self._flush_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self.published = 0
+
+    async def __aenter__(self) -> "AsyncBatchingEventPublisher":
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except redis.RedisError:
+                logger.exception("이벤트 일괄 발행 실패")
+
+    async def _add(self, channels: List[str], payload: bytes, key: Optional[Hashable] = None):
+        self._buffer.add(channels, payload, key)
+        if len(self._buffer) >= self.max_batch:
+            await self.flush()
+
+    async def publish_node_status(self, event: qmtl_events_pb2.NodeStatusEvent):
+        await self._add(
+            node_status_channels(event), event.SerializeToString(), ("node", event.node_id)
+        )
+
+    async def publish_pipeline_status(self, event: qmtl_events_pb2.PipelineStatusEvent):
+        await self._add(pipeline_status_channels(event), event.SerializeToString())
+
+    async def publish_alert(self, event: qmtl_events_pb2.AlertEvent):
+        await self._add(alert_channels(event), event.SerializeToString())
+
+    async def flush(self) -> int:
+        """버퍼의 이벤트를 pipeline 한 번으로 발행, 발행한 이벤트 수 반환"""
+        async with self._flush_lock:
+            batch = self._buffer.drain()
+            if not batch:
+                return 0
+            pipe = self.redis.pipeline(transaction=False)
+            for channels, payload in batch:
+                for channel in channels:
+                    pipe.publish(channel, payload)
+            await pipe.execute()
+            self.published += len(batch)
+            return len(batch)
+
+    async def aclose(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+        await self.redis.aclose()
 
 class EventSubscriber:
     def __init__(self, redis_url: str = "redis://localhost:6379/0"):
         self.redis = redis.from_url(redis_url)
         self.pubsub = self.redis.pubsub()
+        self._thread = None
 
     def subscribe(self, channels, callback):
         if isinstance(channels, str):
             channels = [channels]
         self.pubsub.subscribe(**{ch: callback for ch in channels})
-        self.pubsub.run_in_thread(sleep_time=0.1)
+        # 구독 수와 무관하게 연결/수신 스레드는 하나만 사용
+        if self._thread is None:
+            self._thread = self.pubsub.run_in_thread(sleep_time=1.0, daemon=True)
+
+
+# --- Redis Streams 기반 내구성 이벤트 로그 ---
+# Pub/Sub 은 구독자가 느리거나 재시작하면 이벤트를 잃는다. 같은 이벤트를 stream 에도 XADD 하여
+# consumer group 으로 재시작 후 이어 읽기(미 ack 항목 재전달)와 last ID 이후 재생을 지원한다.
+
+NODE_STATUS_STREAM = "stream:event:node_status"
+PIPELINE_STATUS_STREAM = "stream:event:pipeline_status"
+ALERT_STREAM = "stream:event:alert"
+
+STREAM_EVENT_TYPES = {
+    NODE_STATUS_STREAM: qmtl_events_pb2.NodeStatusEvent,
+    PIPELINE_STATUS_STREAM: qmtl_events_pb2.PipelineStatusEvent,
+    ALERT_STREAM: qmtl_events_pb2.AlertEvent,
+}
+
+
+class StreamEvent:
+    """stream 에서 읽은 이벤트 (stream key, entry ID, 원래 Pub/Sub 채널, protobuf 이벤트)"""
+
+    __slots__ = ("stream", "id", "channel", "event")
+
+    def __init__(self, stream: str, entry_id: str, channel: str, event):
+        self.stream = stream
+        self.id = entry_id
+        self.channel = channel
+        self.event = event
+
+    def __repr__(self) -> str:
+        return f"StreamEvent({self.stream!r}, {self.id!r}, {self.channel!r})"
+
+
+def _decode_stream_entries(stream, entries) -> List[StreamEvent]:
+    stream = stream.decode() if isinstance(stream, bytes) else stream
+    event_type = STREAM_EVENT_TYPES[stream]
+    events = []
+    for entry_id, fields in entries:
+        if not fields:
+            # 이미 trim 된 pending 항목
+            continue
+        entry_id = entry_id.decode() if isinstance(entry_id, bytes) else entry_id
+        events.append(
+            StreamEvent(
+                stream,
+                entry_id,
+                fields[b"channel"].decode(),
+                event_type.FromString(fields[b"data"]),
+            )
+        )
+    return events
+
+
+class StreamEventPublisher:
+    """
+    이벤트를 Redis Stream 에 XADD (MAXLEN ~ maxlen 으로 근사 trim)
+    - mirror_pubsub=True 이면 기존 Pub/Sub 채널에도 같은 pipeline 으로 PUBLISH (기존 구독자 호환)
+    """
+
+    def __init__(
+        self,
+        redis_url: str = "redis://localhost:6379/0",
+        maxlen: int = 100000,
+        mirror_pubsub: bool = True,
+    ):
+        self.redis = redis.from_url(redis_url)
+        self.maxlen = maxlen
+        self.mirror_pubsub = mirror_pubsub
+
+    def _publish(self, stream: str, channels: List[str], payload: bytes) -> str:
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.xadd(
+            stream,
+            {"channel": channels[0], "data": payload},
+            maxlen=self.maxlen,
+            approximate=True,
+        )
+        if self.mirror_pubsub:
+            for channel in channels:
+                pipe.publish(channel, payload)
+        entry_id = pipe.execute()[0]
+        return entry_id.decode() if isinstance(entry_id, bytes) else entry_id
+
+    def publish_node_status(self, event: qmtl_events_pb2.NodeStatusEvent) -> str:
+        return self._publish(
+            NODE_STATUS_STREAM, node_status_channels(event), event.SerializeToString()
+        )
+
+    def publish_pipeline_status(self, event: qmtl_events_pb2.PipelineStatusEvent) -> str:
+        return self._publish(
+            PIPELINE_STATUS_STREAM, pipeline_status_channels(event), event.SerializeToString()
+        )
+
+    def publish_alert(self, event: qmtl_events_pb2.AlertEvent) -> str:
+        return self._publish(ALERT_STREAM, alert_channels(event), event.SerializeToString())
+
+
+class StreamEventSubscriber:
+    """
+    consumer group 기반 stream 구독자
+    - read(): 먼저 이 consumer 의 미 ack 항목(재시작 전 처리 중이던 이벤트)을, 이후 새 항목을
+      XREADGROUP 으로 count 개씩 읽는다
+    - ack(): 처리 완료 항목 XACK
+    - replay(): group 없이 last_id 이후 항목을 XRANGE 로 재생 (대시보드 등 catch-up 용)
+    """
+
+    def __init__(
+        self,
+        group: str,
+        consumer: str,
+        streams: Optional[List[str]] = None,
+        redis_url: str = "redis://localhost:6379/0",
+        start_id: str = "$",
+        count: int = 500,
+        block_ms: int = 1000,
+    ):
+        """
+        Args:
+            group: consumer group 이름
+            consumer: group 내 consumer 이름 (재시작 후 같은 이름이면 미 ack 항목을 이어 받음)
+            streams: 구독할 stream key 목록 (기본: 전체 이벤트 stream)
+            start_id: group 이 없을 때 생성 기준 ID ("$": 이후 이벤트만, "0": 보존된 전체)
+            count: XREADGROUP 한 번에 읽을 최대 항목 수
+            block_ms: 새 항목 대기 시간 (ms)
+        """
+        self.redis = redis.from_url(redis_url)
+        self.group = group
+        self.consumer = consumer
+        self.streams = list(streams or STREAM_EVENT_TYPES)
+        self.count = count
+        self.block_ms = block_ms
+        self._pending_cursor: Dict[str, str] = {}
+        self.recover()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.ensure_groups(start_id)
+
+    def ensure_groups(self, start_id: str = "$") -> None:
+        for stream in self.streams:
+            try:
+                self.redis.xgroup_create(stream, self.group, id=start_id, mkstream=True)
+            except redis.ResponseError as e:
+                if "BUSYGROUP" not in str(e):
+                    raise
+
+    def read(self) -> List[StreamEvent]:
+        """다음 이벤트 묶음 (없으면 block_ms 동안 대기 후 빈 목록)"""
+        if self._pending_cursor:
+            # 재시작 전 이 consumer 에 전달됐지만 ack 되지 않은 항목부터 순서대로
+            response = self.redis.xreadgroup(
+                self.group, self.consumer, dict(self._pending_cursor), count=self.count
+            )
+            events = self._decode(response)
+            for stream, entries in response:
+                stream = stream.decode() if isinstance(stream, bytes) else stream
+                if entries:
+                    last_id = entries[-1][0]
+                    self._pending_cursor[stream] = (
+                        last_id.decode() if isinstance(last_id, bytes) else last_id
+                    )
+                else:
+                    self._pending_cursor.pop(stream, None)
+            if events:
+                return events
+            self._pending_cursor = {}
+        response = self.redis.xreadgroup(
+            self.group,
+            self.consumer,
+            {s: ">" for s in self.streams},
+            count=self.count,
+            block=self.block_ms,
+        )
+        return self._decode(response or [])
+
+    @staticmethod
+    def _decode(response) -> List[StreamEvent]:
+        return [e for stream, entries in response for e in _decode_stream_entries(stream, entries)]
+
+    def recover(self) -> None:
+        """다음 read() 가 미 ack 항목부터 다시 읽도록 설정"""
+        self._pending_cursor = {s: "0" for s in self.streams}
+
+    def ack(self, events: List[StreamEvent]) -> int:
+        """처리한 이벤트를 stream 별로 묶어 XACK (pipeline 한 번)"""
+        by_stream: Dict[str, List[str]] = {}
+        for event in events:
+            by_stream.setdefault(event.stream, []).append(event.id)
+        if not by_stream:
+            return 0
+        pipe = self.redis.pipeline(transaction=False)
+        for stream, ids in by_stream.items():
+            pipe.xack(stream, self.group, *ids)
+        return sum(pipe.execute())
+
+    def replay(self, stream: str, last_id: str = "0", count: int = 1000) -> List[StreamEvent]:
+        """last_id 이후(제외) 항목을 최대 count 개 반환"""
+        start = f"({last_id}" if last_id != "0" else "-"
+        entries = self.redis.xrange(stream, min=start, count=count)
+        return _decode_stream_entries(stream, entries)
+
+    def run(self, callback) -> None:
+        """백그라운드 스레드에서 read → callback(events) → ack 반복 (callback 예외 시 ack 하지 않음)"""
+
+        def _loop():
+            while not self._stop.is_set():
+                try:
+                    events = self.read()
+                    if events:
+                        callback(events)
+                        self.ack(events)
+                except Exception:
+                    logger.exception("stream 이벤트 처리 실패")
+                    # 미 ack 항목부터 다시 처리
+                    self.recover()
+                    self._stop.wait(1.0)
+
+        self._thread = threading.Thread(target=_loop, name=f"stream-{self.group}", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
 
 # 사용 예시: EventPublisher().publish_node_status(NodeStatusEvent(...))
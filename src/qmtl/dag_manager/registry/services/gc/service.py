@@ -1,12 +1,15 @@
+import logging
 import threading
 import time
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any
+from typing import Any, Dict, Optional
 
-from qmtl.common.db.connection_pool import Neo4jConnectionPool
+from qmtl.common.db.connection_pool import get_neo4j_pool
 from qmtl.common.errors.exceptions import DatabaseError
 
+logger = logging.getLogger(__name__)
+
 
 class GCService(ABC):
     @abstractmethod
@@ -17,50 +20,160 @@ class GCService(ABC):
     def get_status(self) -> dict:
         pass
 
+    def get_metrics(self) -> dict:
+        """GC 진행/누적 메트릭 (기본 구현은 빈 dict)"""
+        return {}
+
 
 class Neo4jGCService(GCService):
-    def __init__(self, database: str = None, interval_sec: int = 600):
-        self.pool = Neo4jConnectionPool()
+    """배치 단위 증분 GC
+
+    - 대상 선정은 인덱스 속성으로 수행: TTL 은 n.expires_at 범위 탐색, zero-deps 는 n.dependent_count = 0
+    - 한 배치(최대 batch_size 노드)를 하나의 쓰기 트랜잭션으로 삭제하고, 삭제 노드가 의존하던
+      노드의 dependent_count 를 같은 트랜잭션에서 감소시킨다
+    - 선택 결과가 빌 때까지 배치를 반복하므로(배치가 가득 찼는지와 무관), 삭제로 dependent_count 가
+      0 이 된 노드까지 연쇄 수거가 한 실행에서 끝난다. 결과는 배치 크기에 의존하지 않는다
+      (max_batches_per_run 으로 상한을 둔 경우만 예외)
+    - 배치 소요 시간이 max_batch_ms 를 넘으면 배치 크기를 절반으로 줄이고(min_batch_size 까지),
+      여유가 있으면 다시 늘린다. 배치 사이에는 pause_sec 만큼 쉬어 registry 쓰기 지연을 제한한다
+    """
+
+    _TTL_SELECT_QUERY = """
+    MATCH (n:DataNode) WHERE n.expires_at < $now
+    RETURN n.node_id AS node_id LIMIT $limit
+    """
+    # 삭제로 새로 dependent_count 가 0 이 된 노드도 같은 실행에서 이어서 수거된다
+    _ZERO_DEPS_SELECT_QUERY = """
+    MATCH (n:DataNode) WHERE n.dependent_count = 0
+    RETURN n.node_id AS node_id LIMIT $limit
+    """
+    # 같은 배치에서 함께 삭제되는 노드는 감소 대상에서 제외 (삭제된 노드에 SET 불가)
+    _RELEASE_DEPENDENCIES_QUERY = """
+    UNWIND $ids AS id
+    MATCH (:DataNode {node_id: id})-[:DEPENDS_ON]->(dep:DataNode)
+    WHERE NOT dep.node_id IN $ids
+    WITH dep, count(*) AS released
+    SET dep.dependent_count = dep.dependent_count - released
+    """
+    _DELETE_QUERY = """
+    UNWIND $ids AS id
+    MATCH (n:DataNode {node_id: id})
+    DETACH DELETE n
+    """
+
+    def __init__(
+        self,
+        database: str = None,
+        interval_sec: int = 600,
+        batch_size: int = 1000,
+        min_batch_size: int = 50,
+        max_batch_ms: float = 200.0,
+        pause_sec: float = 0.05,
+        max_batches_per_run: Optional[int] = None,
+    ):
+        self.pool = get_neo4j_pool()
         self.database = database
         self.interval_sec = interval_sec
+        self.batch_size = batch_size
+        self.min_batch_size = min(min_batch_size, batch_size)
+        self.max_batch_ms = max_batch_ms
+        self.pause_sec = pause_sec
+        self.max_batches_per_run = max_batches_per_run
+        self._current_batch_size = batch_size
         self._last_status = {}
         self._daemon_thread = None
         self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, Any] = {
+            "runs": 0,
+            "batches": 0,
+            "throttled_batches": 0,
+            "failed_batches": 0,
+            "ttl_deleted_total": 0,
+            "zero_dep_deleted_total": 0,
+            "last_batch_ms": 0.0,
+            "last_run_sec": 0.0,
+        }
+        self._progress: Dict[str, Any] = {"running": False, "phase": None, "deleted": 0}
 
     def collect_ttl_expired(self) -> int:
-        now = int(time.time())
-        cypher = """
-        MATCH (n:DataNode)
-        WHERE n.ttl IS NOT NULL AND n.ttl > 0 AND n.created_at IS NOT NULL AND (n.created_at + n.ttl) < $now
-        WITH n
-        DETACH DELETE n
-        RETURN count(n) AS deleted_count
-        """
-        with self.pool.client() as client:
-            try:
-                result = client.execute_query(cypher, {"now": now}, self.database)
-                return result[0]["deleted_count"] if result else 0
-            except DatabaseError:
-                return 0
+        return self._collect("ttl", self._TTL_SELECT_QUERY, {"now": int(time.time())})
 
     def collect_zero_deps(self) -> int:
-        cypher = """
-        MATCH (n:DataNode)
-        WHERE NOT (n)<-[:DEPENDS_ON]-(:DataNode)
-        WITH n
-        DETACH DELETE n
-        RETURN count(n) AS deleted_count
+        return self._collect("zero_dep", self._ZERO_DEPS_SELECT_QUERY, {})
+
+    def _collect(self, phase: str, select_query: str, params: dict) -> int:
+        """select_query 결과가 빌 때까지 배치 단위로 삭제하고 삭제한 노드 수를 반환한다.
+
+        배치 트랜잭션이 DatabaseError 로 실패하면 로그와 failed_batches 메트릭을 남기고 이번 실행의
+        해당 phase 를 중단한다 (다음 실행에서 재시도).
         """
-        with self.pool.client() as client:
+        with self._lock:
+            self._progress.update(phase=phase, deleted=0)
+        deleted = 0
+        batches = 0
+        while not self._stop_event.is_set():
+            if self.max_batches_per_run is not None and batches >= self.max_batches_per_run:
+                break
+            limit = self._current_batch_size
+            batch_params = dict(params, limit=limit)
+            started = time.perf_counter()
             try:
-                result = client.execute_query(cypher, {}, self.database)
-                return result[0]["deleted_count"] if result else 0
+                with self.pool.client() as client:
+                    result = client.execute_transaction(
+                        lambda tx: self._delete_batch(tx, select_query, batch_params),
+                        self.database,
+                    )
             except DatabaseError:
-                return 0
+                logger.exception("GC %s 배치 삭제 실패 (batch_size=%d)", phase, limit)
+                with self._lock:
+                    self._metrics["failed_batches"] += 1
+                break
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            count = result[0]["deleted_count"] if result else 0
+            if count == 0:
+                break
+            batches += 1
+            deleted += count
+            with self._lock:
+                self._metrics["batches"] += 1
+                self._metrics["last_batch_ms"] = elapsed_ms
+                self._metrics[f"{phase}_deleted_total"] += count
+                self._progress["deleted"] = deleted
+            self._throttle(elapsed_ms)
+        return deleted
+
+    def _delete_batch(self, tx, select_query: str, params: dict) -> list:
+        ids = [record["node_id"] for record in tx.run(select_query, params)]
+        if ids:
+            tx.run(self._RELEASE_DEPENDENCIES_QUERY, {"ids": ids}).consume()
+            tx.run(self._DELETE_QUERY, {"ids": ids}).consume()
+        return [{"deleted_count": len(ids)}]
+
+    def _throttle(self, elapsed_ms: float) -> None:
+        """배치 소요 시간에 따라 다음 배치 크기를 조정하고 pause_sec 만큼 대기한다."""
+        if elapsed_ms > self.max_batch_ms:
+            self._current_batch_size = max(self.min_batch_size, self._current_batch_size // 2)
+            with self._lock:
+                self._metrics["throttled_batches"] += 1
+        elif elapsed_ms < self.max_batch_ms / 2:
+            self._current_batch_size = min(self.batch_size, self._current_batch_size * 2)
+        if self.pause_sec:
+            # stop_daemon 호출 시 즉시 깨어나도록 stop_event 로 대기
+            self._stop_event.wait(self.pause_sec)
 
     def run_gc(self) -> dict:
-        ttl_deleted = self.collect_ttl_expired()
-        zero_dep_deleted = self.collect_zero_deps()
+        started = time.perf_counter()
+        with self._lock:
+            self._progress["running"] = True
+        try:
+            ttl_deleted = self.collect_ttl_expired()
+            zero_dep_deleted = self.collect_zero_deps()
+        finally:
+            with self._lock:
+                self._progress.update(running=False, phase=None)
+                self._metrics["runs"] += 1
+                self._metrics["last_run_sec"] = time.perf_counter() - started
         status = {
             "timestamp": datetime.utcnow().isoformat(),
             "ttl_deleted": ttl_deleted,
@@ -72,6 +185,14 @@ class Neo4jGCService(GCService):
     def get_status(self) -> dict:
         return self._last_status
 
+    def get_metrics(self) -> dict:
+        """누적 삭제 수/배치 수/스로틀·실패 횟수, 현재 배치 크기와 진행 중인 실행 상태"""
+        with self._lock:
+            metrics = dict(self._metrics)
+            metrics["batch_size"] = self._current_batch_size
+            metrics["progress"] = dict(self._progress)
+        return metrics
+
     def start_daemon(self):
         if self._daemon_thread and self._daemon_thread.is_alive():
             return
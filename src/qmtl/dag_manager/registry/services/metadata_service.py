@@ -71,8 +71,7 @@ class MetadataService:
 
     def get_dag(self, pipeline_id: str) -> Optional[StrategySnapshot]:
         """Pipeline ID로 DAG 조회"""
-        snaps = self.snapshot_service.get_snapshots(pipeline_id)
-        return snaps[0] if snaps else None
+        return self.snapshot_service.get_latest_snapshot(pipeline_id)
 
     def update_dag(self, dag: StrategySnapshot) -> None:
         """DAG 정보 갱신"""
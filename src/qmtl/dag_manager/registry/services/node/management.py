@@ -1,11 +1,15 @@
 # NodeManagementService의 메서드가 아닌, 클래스 내부에 정의되어야 하므로 아래로 이동
+import json
+import time
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from bisect import bisect_right
+from typing import Dict, Iterator, List, Optional, Union
 
 from qmtl.common.db.neo4j_client import Neo4jClient
 from qmtl.common.errors.exceptions import DatabaseError
 from qmtl.models.datanode import DataNode
 from qmtl.models.generated.qmtl_status_pb2 import NodeStatus
+from qmtl.sdk.models import IntervalEnum
 
 from .validation import validate_node_model
 from qmtl.dag_manager.core.graph_builder import GraphBuilder
@@ -27,8 +31,10 @@ class NodeManagementService(ABC):
         """node_id로 DataNode를 삭제한다."""
 
     @abstractmethod
-    def list_nodes(self) -> List[DataNode]:
-        """모든 DataNode 목록을 반환한다."""
+    def list_nodes(
+        self, after: Optional[str] = None, limit: Optional[int] = None
+    ) -> List[DataNode]:
+        """DataNode 목록을 node_id 오름차순으로 반환한다 (after 이후 최대 limit 개)."""
 
     @abstractmethod
     def list_zero_deps(self) -> List[DataNode]:
@@ -36,9 +42,15 @@ class NodeManagementService(ABC):
 
     @abstractmethod
     def list_by_tags(
-        self, tags: list[str], interval: str = None, period: str = None, match_mode: str = "AND"
+        self,
+        tags: list[str],
+        interval: str = None,
+        period: str = None,
+        match_mode: str = "AND",
+        after: Optional[str] = None,
+        limit: Optional[int] = None,
     ) -> List[DataNode]:
-        """태그/인터벌/피리어드 기반 노드 목록 반환 (AND/OR 지원)"""
+        """태그/인터벌/피리어드 기반 노드 목록 반환 (AND/OR 지원, node_id keyset 페이지)"""
 
     @abstractmethod
     def add_contains_relationship(self, strategy_version_id: str, node_id: str) -> None:
@@ -56,9 +68,51 @@ class NodeManagementService(ABC):
     def get_node_ref_strategies(self, node_id: str) -> list[str]:
         """해당 DataNode를 참조하는 모든 StrategyVersion(version_id) 목록을 반환한다."""
 
+    def get_nodes(self, node_ids: List[str]) -> Dict[str, DataNode]:
+        """여러 DataNode를 한 번에 조회해 node_id → DataNode 로 반환한다 (존재하지 않는 노드는 제외).
+
+        기본 구현은 노드 단위 호출이며, 백엔드별로 일괄 조회 구현을 제공한다.
+        """
+        nodes = {}
+        for node_id in dict.fromkeys(node_ids):
+            node = self.get_node(node_id)
+            if node is not None:
+                nodes[node_id] = node
+        return nodes
+
+    def get_ref_counts(self, node_ids: List[str]) -> Dict[str, int]:
+        """여러 DataNode의 참조 카운트를 한 번에 반환한다 (존재하지 않는 노드는 0).
+
+        기본 구현은 노드 단위 호출이며, 백엔드별로 일괄 조회 구현을 제공한다.
+        """
+        return {node_id: self.get_node_ref_count(node_id) for node_id in node_ids}
+
+    def get_strategy_graph(self, strategy_version_id: str) -> List[DataNode]:
+        """전략 버전의 노드 목록을 DEPENDS_ON 관계 기준 dependencies 와 함께 반환한다.
+
+        반환 노드는 GraphBuilder/ReadyNodeSelector/CriticalPathPriority 에 바로 전달할 수 있다.
+        기본 구현은 노드마다 get_node_dependencies 를 호출(N+1)하며, 백엔드별로 단일 조회 구현을 제공한다.
+        """
+        return [
+            _with_dependencies(node, self.get_node_dependencies(node.node_id))
+            for node in self.get_strategy_nodes(strategy_version_id)
+        ]
+
+    def remove_strategy_contains(self, strategy_version_id: str) -> Dict[str, int]:
+        """전략 버전의 모든 CONTAINS 관계를 삭제하고, 해제된 노드별 갱신된 참조 카운트를 반환한다.
+
+        기본 구현은 노드 단위 호출이며, 백엔드별로 일괄 처리 구현을 제공한다.
+        """
+        node_ids = [node.node_id for node in self.get_strategy_nodes(strategy_version_id)]
+        for node_id in node_ids:
+            self.remove_contains_relationship(strategy_version_id, node_id)
+        return self.get_ref_counts(node_ids)
+
     @abstractmethod
-    def get_strategy_nodes(self, strategy_version_id: str) -> List[DataNode]:
-        """특정 전략 버전에 포함된 모든 노드 목록을 반환한다."""
+    def get_strategy_nodes(
+        self, strategy_version_id: str, after: Optional[str] = None, limit: Optional[int] = None
+    ) -> List[DataNode]:
+        """특정 전략 버전에 포함된 노드 목록을 반환한다 (node_id keyset 페이지)."""
 
     @abstractmethod
     def get_node_status(self, node_id: str) -> Optional[NodeStatus]:
@@ -84,8 +138,177 @@ class NodeManagementService(ABC):
     def validate_node(self, node: DataNode) -> None:
         """DataNode 유효성 검증. 실패 시 ValidationError 발생."""
 
+    def create_nodes_bulk(
+        self, nodes: List[DataNode], strategy_version_id: Optional[str] = None
+    ) -> List[str]:
+        """여러 DataNode를 등록(이미 존재하면 유지)하고 DEPENDS_ON/CONTAINS 관계를 생성한다.
+
+        기본 구현은 노드 단위 호출이며, 백엔드별로 일괄 처리 구현을 제공한다.
+        """
+        existing = {node.node_id for node in nodes if self.get_node(node.node_id) is not None}
+        node_ids: List[str] = []
+        for node in nodes:
+            if node.node_id not in existing:
+                self.create_node(node)
+                existing.add(node.node_id)
+            node_ids.append(node.node_id)
+        for node in nodes:
+            for dependency_id in node.dependencies:
+                self.add_dependency(node.node_id, dependency_id)
+        if strategy_version_id:
+            for node_id in node_ids:
+                self.add_contains_relationship(strategy_version_id, node_id)
+        return node_ids
+
+    # 목록 조회 iterator: as_json=True 이면 DataNode 대신 JSON 문자열(NDJSON 한 줄)을 반환한다.
+    # 기본 구현은 list_* 결과를 순회하며, 백엔드별로 결과를 읽는 도중 내보내는 스트리밍 구현을 제공한다.
+
+    def iter_nodes(
+        self, after: Optional[str] = None, limit: Optional[int] = None, as_json: bool = False
+    ) -> Iterator[Union[DataNode, str]]:
+        """DataNode를 node_id 오름차순으로 순회한다."""
+        return _as_output(self.list_nodes(after=after, limit=limit), as_json)
+
+    def iter_by_tags(
+        self,
+        tags: list[str],
+        interval: str = None,
+        period: str = None,
+        match_mode: str = "AND",
+        after: Optional[str] = None,
+        limit: Optional[int] = None,
+        as_json: bool = False,
+    ) -> Iterator[Union[DataNode, str]]:
+        """태그/인터벌/피리어드 조건에 맞는 DataNode를 node_id 오름차순으로 순회한다."""
+        return _as_output(
+            self.list_by_tags(tags, interval, period, match_mode, after=after, limit=limit),
+            as_json,
+        )
+
+    def iter_strategy_nodes(
+        self,
+        strategy_version_id: str,
+        after: Optional[str] = None,
+        limit: Optional[int] = None,
+        as_json: bool = False,
+    ) -> Iterator[Union[DataNode, str]]:
+        """전략 버전에 포함된 DataNode를 node_id 오름차순으로 순회한다."""
+        return _as_output(
+            self.get_strategy_nodes(strategy_version_id, after=after, limit=limit), as_json
+        )
+
+
+def keyset_page(nodes, after: Optional[str] = None, limit: Optional[int] = None) -> list:
+    """node_id 오름차순 정렬 후 after 보다 큰 node_id 부터 최대 limit 개 반환 (메모리 백엔드용)"""
+    nodes = sorted(nodes, key=lambda node: node.node_id)
+    if after is not None:
+        nodes = nodes[bisect_right(nodes, after, key=lambda node: node.node_id) :]
+    return nodes if limit is None else nodes[:limit]
+
+
+def _node_json(node) -> str:
+    """DataNode(Pydantic 또는 protobuf)를 한 줄 JSON 문자열로 직렬화"""
+    if hasattr(node, "model_dump_json"):
+        return node.model_dump_json()
+    from google.protobuf.json_format import MessageToJson
+
+    return MessageToJson(node, preserving_proto_field_name=True, indent=None)
+
+
+def _with_dependencies(node: DataNode, dependencies: List[str]) -> DataNode:
+    """dependencies 를 DEPENDS_ON 관계 기준 목록으로 교체한 DataNode 반환"""
+    if list(node.dependencies) == dependencies:
+        return node
+    return node.model_copy(update={"dependencies": dependencies})
+
+
+def _as_output(nodes, as_json: bool) -> Iterator:
+    for node in nodes:
+        yield _node_json(node) if as_json else node
+
+
+# 태그 검색/GC 용 top-level 인덱스 속성 (DataNode 모델 필드가 아니므로 조회 시 제외)
+# - expires_at: 생성 시각 + ttl (epoch 초), TTL GC 의 범위 인덱스 탐색용
+# - dependent_count: 이 노드에 DEPENDS_ON 으로 의존하는 노드 수, zero-deps GC 의 인덱스 탐색용
+# - ref_count: 이 노드를 CONTAINS 하는 StrategyVersion 수 (관계 생성/삭제와 같은 쿼리에서 증감)
+_INDEXED_PROPERTIES = ("interval", "period", "expires_at", "dependent_count", "ref_count")
+# Neo4j 에 JSON 문자열로 저장되는 DataNode 필드
+_JSON_FIELDS = ("data_format", "params", "tags", "interval_settings", "stream_settings")
+
+
+def _tag_names(node: DataNode) -> List[str]:
+    """HAS_TAG 관계로 저장할 태그 이름 목록 (predefined + custom, 중복 제거)"""
+    if not node.tags:
+        return []
+    names = [getattr(tag, "value", tag) for tag in node.tags.predefined or []]
+    names.extend(node.tags.custom or [])
+    return list(dict.fromkeys(names))
+
+
+def _interval_period(node: DataNode) -> tuple:
+    """인덱스용 (interval, period). interval_settings 우선, 없으면 stream_settings 첫 interval"""
+    settings = node.interval_settings
+    if settings is None and node.stream_settings and node.stream_settings.intervals:
+        settings = next(iter(node.stream_settings.intervals.values()))
+    if settings is None:
+        return None, None
+    return getattr(settings.interval, "value", settings.interval), settings.period
+
+
+def _decode_node(node_data: dict) -> DataNode:
+    """Neo4j 노드 속성을 DataNode로 복원 (JSON 문자열 필드 파싱, 인덱스 속성 제외)"""
+    node_data = {k: v for k, v in node_data.items() if k not in _INDEXED_PROPERTIES}
+    for field in _JSON_FIELDS:
+        if isinstance(node_data.get(field), str):
+            node_data[field] = json.loads(node_data[field])
+    return DataNode.model_validate(node_data)
+
+
+def _encode_node(node_data: dict) -> str:
+    """Neo4j 노드 속성을 DataNode JSON 문자열로 직접 직렬화
+
+    JSON 문자열로 저장된 필드는 decode/재직렬화 없이 그대로 이어 붙인다 (NDJSON 스트리밍용).
+    """
+    parts = []
+    for key, value in node_data.items():
+        if key in _INDEXED_PROPERTIES:
+            continue
+        raw = value if key in _JSON_FIELDS and isinstance(value, str) else json.dumps(value)
+        parts.append(f"{json.dumps(key)}:{raw}")
+    return "{" + ",".join(parts) + "}"
+
+
+def _node_properties(node: DataNode) -> dict:
+    """DataNode를 Neo4j 노드 속성 dict로 변환 (복잡한 객체는 JSON 문자열로 직렬화)"""
+    interval, period = _interval_period(node)
+    return {
+        "node_id": node.node_id,
+        "type": node.type.value if node.type else None,
+        "data_format": json.dumps(node.data_format) if node.data_format else None,
+        "params": json.dumps(node.params) if node.params else None,
+        "dependencies": node.dependencies,
+        "ttl": node.ttl,
+        "tags": json.dumps(node.tags.model_dump() if node.tags else {}),
+        "interval_settings": json.dumps(
+            node.interval_settings.model_dump() if node.interval_settings else None
+        ),
+        "stream_settings": json.dumps(
+            node.stream_settings.model_dump() if node.stream_settings else None
+        ),
+        "interval": interval,
+        "period": period,
+        "expires_at": int(time.time()) + node.ttl if node.ttl and node.ttl > 0 else None,
+        "dependent_count": 0,
+        "ref_count": 0,
+    }
+
 
 class Neo4jNodeManagementService(NodeManagementService):
+    # create_nodes_bulk 에서 한 번의 UNWIND 로 전달하는 최대 row 수 (파라미터 크기 제한)
+    BULK_BATCH_SIZE = 5000
+    # 목록 스트리밍 시 서버에서 한 번에 가져오는 레코드 수
+    STREAM_FETCH_SIZE = 1000
+
     def __init__(self, neo4j_client: Neo4jClient, database: str = None):
         self.neo4j_client = neo4j_client
         self.database = database
@@ -112,136 +335,229 @@ class Neo4jNodeManagementService(NodeManagementService):
             ttl: $ttl,
             tags: $tags,
             interval_settings: $interval_settings,
-            stream_settings: $stream_settings
+            stream_settings: $stream_settings,
+            interval: $interval,
+            period: $period,
+            expires_at: $expires_at,
+            dependent_count: $dependent_count,
+            ref_count: $ref_count
         })
+        WITH n
+        FOREACH (tag IN $tag_names |
+            MERGE (t:Tag {name: tag})
+            MERGE (n)-[:HAS_TAG]->(t)
+        )
         RETURN n.node_id AS node_id
         """
-        # 복잡한 객체를 JSON 문자열로 직렬화
-        import json
-
-        tags_dict = json.dumps(node.tags.model_dump() if node.tags else {})
-        interval_settings_dict = json.dumps(
-            node.interval_settings.model_dump() if node.interval_settings else None
-        )
-        stream_settings_dict = json.dumps(
-            node.stream_settings.model_dump() if node.stream_settings else None
-        )
-        params = {
-            "node_id": node.node_id,
-            "type": node.type.value if node.type else None,
-            "data_format": json.dumps(node.data_format) if node.data_format else None,
-            "params": json.dumps(node.params) if node.params else None,
-            "dependencies": node.dependencies,
-            "ttl": node.ttl,
-            "tags": tags_dict,
-            "interval_settings": interval_settings_dict,
-            "stream_settings": stream_settings_dict,
-        }
+        params = _node_properties(node)
+        params["tag_names"] = _tag_names(node)
         result = self.neo4j_client.execute_query(create_query, params, self.database)
         if not result:
             raise DatabaseError("Failed to create DataNode")
         return result[0]["node_id"]
 
+    def create_nodes_bulk(
+        self, nodes: List[DataNode], strategy_version_id: Optional[str] = None
+    ) -> List[str]:
+        """여러 DataNode와 DEPENDS_ON/CONTAINS 관계를 단일 트랜잭션에서 일괄 등록한다.
+
+        - UNWIND $rows + MERGE 로 노드 생성 (존재 여부는 node_id 유니크 제약조건이 보장, 사전 조회 없음)
+        - 이미 존재하는 노드는 속성을 변경하지 않음 (node_id 는 내용 기반 해시)
+        - strategy_version_id 가 주어지면 해당 StrategyVersion 과 CONTAINS 관계를 생성
+        """
+        rows = {}
+        for node in nodes:
+            if node.node_id not in rows:
+                rows[node.node_id] = {
+                    "node_id": node.node_id,
+                    "props": _node_properties(node),
+                    "tag_names": _tag_names(node),
+                }
+        node_ids = list(rows)
+        edges = [
+            {"node_id": node_id, "dependency_id": dependency_id}
+            for node_id, row in rows.items()
+            for dependency_id in row["props"]["dependencies"] or []
+        ]
+        node_query = """
+        UNWIND $rows AS row
+        MERGE (n:DataNode {node_id: row.node_id})
+        ON CREATE SET n += row.props
+        WITH n, row
+        FOREACH (tag IN row.tag_names |
+            MERGE (t:Tag {name: tag})
+            MERGE (n)-[:HAS_TAG]->(t)
+        )
+        """
+        edge_query = """
+        UNWIND $edges AS edge
+        MATCH (n:DataNode {node_id: edge.node_id})
+        MATCH (dep:DataNode {node_id: edge.dependency_id})
+        MERGE (n)-[r:DEPENDS_ON]->(dep)
+        ON CREATE SET dep.dependent_count = coalesce(dep.dependent_count, 0) + 1
+        """
+        contains_query = """
+        MATCH (s:StrategyVersion {version_id: $strategy_version_id})
+        UNWIND $node_ids AS node_id
+        MATCH (n:DataNode {node_id: node_id})
+        MERGE (s)-[:CONTAINS]->(n)
+        ON CREATE SET n.ref_count = coalesce(n.ref_count, 0) + 1
+        """
+        size = self.BULK_BATCH_SIZE
+
+        def work(tx):
+            rows_list = list(rows.values())
+            for i in range(0, len(rows_list), size):
+                tx.run(node_query, {"rows": rows_list[i : i + size]}).consume()
+            for i in range(0, len(edges), size):
+                tx.run(edge_query, {"edges": edges[i : i + size]}).consume()
+            if strategy_version_id:
+                for i in range(0, len(node_ids), size):
+                    tx.run(
+                        contains_query,
+                        {
+                            "strategy_version_id": strategy_version_id,
+                            "node_ids": node_ids[i : i + size],
+                        },
+                    ).consume()
+            return []
+
+        if node_ids:
+            self.neo4j_client.execute_transaction(work, self.database)
+        return node_ids
+
     def get_node(self, node_id: str) -> Optional[DataNode]:
         """node_id로 DataNode를 조회한다."""
         query = """
         MATCH (n:DataNode {node_id: $node_id}) RETURN n LIMIT 1
         """
-        result = self.neo4j_client.execute_query(query, {"node_id": node_id}, self.database)
+        result = self.neo4j_client.execute_read(query, {"node_id": node_id}, self.database)
         if not result:
             return None
-        node_data = result[0]["n"]
-
-        # JSON 문자열로 저장된 필드들을 다시 파싱
-        import json
+        try:
+            return _decode_node(result[0]["n"])
+        except Exception as e:
+            raise DatabaseError(f"Invalid DataNode format: {e}")
 
+    def get_nodes(self, node_ids: List[str]) -> Dict[str, DataNode]:
+        """여러 DataNode를 한 번의 쿼리로 조회한다 (존재하지 않는 노드는 제외)."""
+        node_ids = list(dict.fromkeys(node_ids))
+        if not node_ids:
+            return {}
+        query = """
+        UNWIND $node_ids AS node_id
+        MATCH (n:DataNode {node_id: node_id})
+        RETURN n
+        """
+        result = self.neo4j_client.execute_read(query, {"node_ids": node_ids}, self.database)
         try:
-            # 데이터 포맷, 파라미터, 태그, 인터벌 설정을 JSON에서 파싱
-            if isinstance(node_data.get("data_format"), str):
-                node_data["data_format"] = json.loads(node_data["data_format"])
-            if isinstance(node_data.get("params"), str):
-                node_data["params"] = json.loads(node_data["params"])
-            if isinstance(node_data.get("tags"), str):
-                node_data["tags"] = json.loads(node_data["tags"])
-            if isinstance(node_data.get("interval_settings"), str):
-                node_data["interval_settings"] = json.loads(node_data["interval_settings"])
-            if isinstance(node_data.get("stream_settings"), str):
-                node_data["stream_settings"] = json.loads(node_data["stream_settings"])
-
-            return DataNode.model_validate(node_data)
+            nodes = [_decode_node(row["n"]) for row in result or []]
         except Exception as e:
             raise DatabaseError(f"Invalid DataNode format: {e}")
+        return {node.node_id: node for node in nodes}
 
     def delete_node(self, node_id: str) -> bool:
         """node_id로 DataNode를 삭제한다."""
+        # 의존 대상 노드의 dependent_count 를 같은 쿼리에서 감소
         query = """
-        MATCH (n:DataNode {node_id: $node_id}) DETACH DELETE n RETURN COUNT(n) AS deleted
+        MATCH (n:DataNode {node_id: $node_id})
+        OPTIONAL MATCH (n)-[:DEPENDS_ON]->(dep:DataNode)
+        WHERE dep <> n
+        SET dep.dependent_count = dep.dependent_count - 1
+        WITH DISTINCT n
+        DETACH DELETE n RETURN COUNT(n) AS deleted
         """
         result = self.neo4j_client.execute_query(query, {"node_id": node_id}, self.database)
         return result and result[0].get("deleted", 0) > 0
 
-    def list_nodes(self) -> List[DataNode]:
-        """모든 DataNode 목록을 반환한다."""
-        query = """
-        MATCH (n:DataNode) RETURN n
+    def _stream_nodes(
+        self,
+        match: str,
+        params: dict,
+        conds: List[str],
+        after: Optional[str],
+        limit: Optional[int],
+        as_json: bool,
+    ) -> Iterator[Union[DataNode, str]]:
+        """match 절 뒤에 node_id keyset 조건/정렬/LIMIT 을 붙여 결과를 읽는 즉시 내보낸다.
+
+        node_id 유니크 제약의 인덱스로 정렬·범위 탐색하므로 페이지 크기와 무관하게 메모리가 일정하다.
         """
-        result = self.neo4j_client.execute_query(query, {}, self.database)
-        nodes = []
-        import json
-
-        for row in result:
+        conds = list(conds)
+        params = dict(params)
+        if after is not None:
+            params["after"] = after
+            conds.append("n.node_id > $after")
+        where_clause = f"WHERE {' AND '.join(conds)}" if conds else ""
+        limit_clause = ""
+        fetch_size = self.STREAM_FETCH_SIZE
+        if limit is not None:
+            params["limit"] = limit
+            limit_clause = "LIMIT $limit"
+            fetch_size = min(limit, fetch_size)
+        query = f"""
+        {match}
+        {where_clause}
+        RETURN n ORDER BY n.node_id {limit_clause}
+        """
+        encode = _encode_node if as_json else _decode_node
+        for row in self.neo4j_client.stream_read(
+            query, params, self.database, fetch_size=fetch_size
+        ):
             try:
-                node_data = row["n"]
-                # JSON 문자열로 저장된 필드들을 다시 파싱
-                if isinstance(node_data.get("data_format"), str):
-                    node_data["data_format"] = json.loads(node_data["data_format"])
-                if isinstance(node_data.get("params"), str):
-                    node_data["params"] = json.loads(node_data["params"])
-                if isinstance(node_data.get("tags"), str):
-                    node_data["tags"] = json.loads(node_data["tags"])
-                if isinstance(node_data.get("interval_settings"), str):
-                    node_data["interval_settings"] = json.loads(node_data["interval_settings"])
-                if isinstance(node_data.get("stream_settings"), str):
-                    node_data["stream_settings"] = json.loads(node_data["stream_settings"])
-
-                nodes.append(DataNode.model_validate(node_data))
+                yield encode(row["n"])
             except Exception:
                 continue
-        return nodes
+
+    def iter_nodes(
+        self, after: Optional[str] = None, limit: Optional[int] = None, as_json: bool = False
+    ) -> Iterator[Union[DataNode, str]]:
+        """DataNode를 node_id 오름차순으로 스트리밍한다."""
+        return self._stream_nodes("MATCH (n:DataNode)", {}, [], after, limit, as_json)
+
+    def list_nodes(
+        self, after: Optional[str] = None, limit: Optional[int] = None
+    ) -> List[DataNode]:
+        """DataNode 목록을 node_id 오름차순으로 반환한다 (after 이후 최대 limit 개)."""
+        return list(self.iter_nodes(after, limit))
 
     def list_zero_deps(self) -> List[DataNode]:
         """의존성이 없는(leaf) DataNode 목록을 반환한다."""
         query = """
         MATCH (n:DataNode) WHERE size(n.dependencies) = 0 RETURN n
         """
-        result = self.neo4j_client.execute_query(query, {}, self.database)
+        result = self.neo4j_client.stream_read(query, {}, self.database)
         nodes = []
-        import json
-
         for row in result:
             try:
-                node_data = row["n"]
-                # JSON 문자열로 저장된 필드들을 다시 파싱
-                if isinstance(node_data.get("data_format"), str):
-                    node_data["data_format"] = json.loads(node_data["data_format"])
-                if isinstance(node_data.get("params"), str):
-                    node_data["params"] = json.loads(node_data["params"])
-                if isinstance(node_data.get("tags"), str):
-                    node_data["tags"] = json.loads(node_data["tags"])
-                if isinstance(node_data.get("interval_settings"), str):
-                    node_data["interval_settings"] = json.loads(node_data["interval_settings"])
-                if isinstance(node_data.get("stream_settings"), str):
-                    node_data["stream_settings"] = json.loads(node_data["stream_settings"])
-
-                nodes.append(DataNode.model_validate(node_data))
+                nodes.append(_decode_node(row["n"]))
             except Exception:
                 continue
         return nodes
 
     def list_by_tags(
-        self, tags: list[str], interval: str = None, period: str = None, match_mode: str = "AND"
+        self,
+        tags: list[str],
+        interval: str = None,
+        period: str = None,
+        match_mode: str = "AND",
+        after: Optional[str] = None,
+        limit: Optional[int] = None,
     ) -> List[DataNode]:
-        """태그/인터벌/피리어드 기반 노드 목록 반환 (AND/OR 지원)"""
+        """태그/인터벌/피리어드 기반 노드 목록 반환 (AND/OR 지원, node_id keyset 페이지)"""
+        return list(self.iter_by_tags(tags, interval, period, match_mode, after, limit))
+
+    def iter_by_tags(
+        self,
+        tags: list[str],
+        interval: str = None,
+        period: str = None,
+        match_mode: str = "AND",
+        after: Optional[str] = None,
+        limit: Optional[int] = None,
+        as_json: bool = False,
+    ) -> Iterator[Union[DataNode, str]]:
+        """태그/인터벌/피리어드 조건에 맞는 DataNode를 node_id 오름차순으로 스트리밍한다."""
         # 로컬에서 TagFilterParams를 정의하여 import 오류 방지
         from pydantic import BaseModel, Field
         from typing import List, Optional, Literal
@@ -261,76 +577,34 @@ class Neo4jNodeManagementService(NodeManagementService):
             match_mode=match_mode,
         )
 
-        # 태그 필터 Cypher
-        tag_cond = ""
-        if filter_params.tags:
-            if filter_params.match_mode == "AND":
-                tag_cond = " AND ".join(
-                    [
-                        f"$tag{i} IN n.tags.predefined OR $tag{i} IN n.tags.custom"
-                        for i in range(len(filter_params.tags))
-                    ]
-                )
-            else:
-                tag_cond = " OR ".join(
-                    [
-                        f"$tag{i} IN n.tags.predefined OR $tag{i} IN n.tags.custom"
-                        for i in range(len(filter_params.tags))
-                    ]
-                )
-
-        interval_cond = ""
-        if filter_params.interval:
-            interval_cond = "n.interval_settings.interval = $interval"
-
-        period_cond = ""
-        if filter_params.period:
-            period_cond = "n.interval_settings.period = $period"
-
-        conds = [c for c in [tag_cond, interval_cond, period_cond] if c]
-        where_clause = f"WHERE {' AND '.join(conds)}" if conds else ""
-
-        query = f"""
-        MATCH (n:DataNode)
-        {where_clause}
-        RETURN n
-        """
-
-        params = {f"tag{i}": t for i, t in enumerate(filter_params.tags)}
+        # interval/period 는 top-level 인덱스 속성, 태그는 (:Tag {name}) 유니크 인덱스 + HAS_TAG 탐색
+        params: dict = {}
+        conds = []
         if filter_params.interval:
-            params["interval"] = filter_params.interval
+            interval = filter_params.interval
+            if interval in IntervalEnum.__members__:
+                interval = IntervalEnum[interval].value
+            params["interval"] = interval
+            conds.append("n.interval = $interval")
         if filter_params.period:
-            params["period"] = filter_params.period
-
-        result = self.neo4j_client.execute_query(
-            query,
-            params,
-            self.database,
-        )
-
-        nodes = []
-        import json
-
-        for row in result:
-            try:
-                node_data = row["n"]
-                # JSON 문자열로 저장된 필드들을 다시 파싱
-                if isinstance(node_data.get("data_format"), str):
-                    node_data["data_format"] = json.loads(node_data["data_format"])
-                if isinstance(node_data.get("params"), str):
-                    node_data["params"] = json.loads(node_data["params"])
-                if isinstance(node_data.get("tags"), str):
-                    node_data["tags"] = json.loads(node_data["tags"])
-                if isinstance(node_data.get("interval_settings"), str):
-                    node_data["interval_settings"] = json.loads(node_data["interval_settings"])
-                if isinstance(node_data.get("stream_settings"), str):
-                    node_data["stream_settings"] = json.loads(node_data["stream_settings"])
-
-                nodes.append(DataNode.model_validate(node_data))
-            except Exception:
-                continue
-
-        return nodes
+            period = filter_params.period
+            params["period"] = int(period) if period.lstrip("-").isdigit() else period
+            conds.append("n.period = $period")
+
+        tags = list(dict.fromkeys(filter_params.tags))
+        if tags:
+            params["tags"] = tags
+            # AND: 모든 태그와 연결된 노드, OR: 하나 이상의 태그와 연결된 노드
+            tag_match = "WHERE matched = size($tags)" if filter_params.match_mode == "AND" else ""
+            match = f"""MATCH (t:Tag) WHERE t.name IN $tags
+        MATCH (n:DataNode)-[:HAS_TAG]->(t)
+        WITH n, count(DISTINCT t) AS matched
+        {tag_match}
+        WITH n"""
+        else:
+            match = "MATCH (n:DataNode)"
+
+        return self._stream_nodes(match, params, conds, after, limit, as_json)
 
     def validate_node(self, node: DataNode) -> None:
         """DataNode 유효성 검증. 실패 시 ValidationError 발생."""
@@ -339,12 +613,13 @@ class Neo4jNodeManagementService(NodeManagementService):
     def add_contains_relationship(self, strategy_version_id: str, node_id: str) -> None:
         """
         StrategyVersion과 DataNode 간 CONTAINS 관계를 생성한다.
-        (파이프라인 등록/활성화 시 호출)
+        (파이프라인 등록/활성화 시 호출, 새 관계일 때만 같은 쿼리에서 n.ref_count 증가)
         """
         query = (
             "MATCH (s:StrategyVersion {version_id: $strategy_version_id}), "
             "(n:DataNode {node_id: $node_id}) "
-            "MERGE (s)-[:CONTAINS]->(n)"
+            "MERGE (s)-[:CONTAINS]->(n) "
+            "ON CREATE SET n.ref_count = coalesce(n.ref_count, 0) + 1"
         )
         self.neo4j_client.execute_query(
             query,
@@ -355,12 +630,13 @@ class Neo4jNodeManagementService(NodeManagementService):
     def remove_contains_relationship(self, strategy_version_id: str, node_id: str) -> None:
         """
         StrategyVersion과 DataNode 간 CONTAINS 관계를 삭제한다.
-        (파이프라인 비활성화/삭제 시 호출)
+        (파이프라인 비활성화/삭제 시 호출, 같은 쿼리에서 n.ref_count 감소)
         """
         query = (
             "MATCH (s:StrategyVersion {version_id: $strategy_version_id})-"
             "[r:CONTAINS]->(n:DataNode {node_id: $node_id}) "
-            "DELETE r"
+            "DELETE r "
+            "SET n.ref_count = n.ref_count - 1"
         )
         self.neo4j_client.execute_query(
             query,
@@ -371,15 +647,37 @@ class Neo4jNodeManagementService(NodeManagementService):
     def get_node_ref_count(self, node_id: str) -> int:
         """
         해당 DataNode를 참조하는 StrategyVersion(CONTAINS 관계) 개수를 반환한다.
+        (관계 집계 대신 유지되는 n.ref_count 속성 조회)
         """
+        return self.get_ref_counts([node_id])[node_id]
+
+    def get_ref_counts(self, node_ids: List[str]) -> Dict[str, int]:
+        """여러 DataNode의 참조 카운트를 한 번의 쿼리로 반환한다 (존재하지 않는 노드는 0)."""
+        counts = dict.fromkeys(node_ids, 0)
+        if not counts:
+            return counts
         query = """
-        MATCH (s:StrategyVersion)-[:CONTAINS]->(n:DataNode {node_id: $node_id})
-        RETURN COUNT(s) AS ref_count
+        UNWIND $node_ids AS node_id
+        MATCH (n:DataNode {node_id: node_id})
+        RETURN n.node_id AS node_id, coalesce(n.ref_count, 0) AS ref_count
         """
-        result = self.neo4j_client.execute_query(query, {"node_id": node_id}, self.database)
-        if not result:
-            return 0
-        return result[0].get("ref_count", 0)
+        result = self.neo4j_client.execute_read(query, {"node_ids": list(counts)}, self.database)
+        for row in result or []:
+            counts[row["node_id"]] = row["ref_count"]
+        return counts
+
+    def remove_strategy_contains(self, strategy_version_id: str) -> Dict[str, int]:
+        """전략 버전의 모든 CONTAINS 관계를 한 번의 쿼리로 삭제하고, 노드별 갱신된 참조 카운트를 반환한다."""
+        query = """
+        MATCH (:StrategyVersion {version_id: $strategy_version_id})-[r:CONTAINS]->(n:DataNode)
+        DELETE r
+        SET n.ref_count = n.ref_count - 1
+        RETURN n.node_id AS node_id, coalesce(n.ref_count, 0) AS ref_count
+        """
+        result = self.neo4j_client.execute_query(
+            query, {"strategy_version_id": strategy_version_id}, self.database
+        )
+        return {row["node_id"]: row["ref_count"] for row in result or []}
 
     def get_node_ref_strategies(self, node_id: str) -> list[str]:
         """
@@ -389,42 +687,34 @@ class Neo4jNodeManagementService(NodeManagementService):
         MATCH (s:StrategyVersion)-[:CONTAINS]->(n:DataNode {node_id: $node_id})
         RETURN s.version_id AS version_id
         """
-        result = self.neo4j_client.execute_query(query, {"node_id": node_id}, self.database)
+        result = self.neo4j_client.execute_read(query, {"node_id": node_id}, self.database)
         return [row["version_id"] for row in result] if result else []
 
-    def get_strategy_nodes(self, strategy_version_id: str) -> List[DataNode]:
-        """
-        특정 전략 버전에 포함된 모든 노드 목록을 반환한다.
+    def get_strategy_nodes(
+        self, strategy_version_id: str, after: Optional[str] = None, limit: Optional[int] = None
+    ) -> List[DataNode]:
         """
-        query = """
-        MATCH (s:StrategyVersion {version_id: $strategy_version_id})-[:CONTAINS]->(n:DataNode)
-        RETURN n
+        특정 전략 버전에 포함된 노드 목록을 반환한다 (node_id keyset 페이지).
         """
-        result = self.neo4j_client.execute_query(
-            query, {"strategy_version_id": strategy_version_id}, self.database
+        return list(self.iter_strategy_nodes(strategy_version_id, after, limit))
+
+    def iter_strategy_nodes(
+        self,
+        strategy_version_id: str,
+        after: Optional[str] = None,
+        limit: Optional[int] = None,
+        as_json: bool = False,
+    ) -> Iterator[Union[DataNode, str]]:
+        """전략 버전에 포함된 DataNode를 node_id 오름차순으로 스트리밍한다."""
+        return self._stream_nodes(
+            "MATCH (s:StrategyVersion {version_id: $strategy_version_id})"
+            "-[:CONTAINS]->(n:DataNode)",
+            {"strategy_version_id": strategy_version_id},
+            [],
+            after,
+            limit,
+            as_json,
         )
-        nodes = []
-        import json
-
-        for row in result:
-            try:
-                node_data = row["n"]
-                # JSON 문자열로 저장된 필드들을 다시 파싱
-                if isinstance(node_data.get("data_format"), str):
-                    node_data["data_format"] = json.loads(node_data["data_format"])
-                if isinstance(node_data.get("params"), str):
-                    node_data["params"] = json.loads(node_data["params"])
-                if isinstance(node_data.get("tags"), str):
-                    node_data["tags"] = json.loads(node_data["tags"])
-                if isinstance(node_data.get("interval_settings"), str):
-                    node_data["interval_settings"] = json.loads(node_data["interval_settings"])
-                if isinstance(node_data.get("stream_settings"), str):
-                    node_data["stream_settings"] = json.loads(node_data["stream_settings"])
-
-                nodes.append(DataNode.model_validate(node_data))
-            except Exception:
-                continue
-        return nodes
 
     def get_node_status(self, node_id: str) -> Optional[NodeStatus]:
         """해당 DataNode의 상태/메타데이터를 조회한다."""
@@ -432,7 +722,7 @@ class Neo4jNodeManagementService(NodeManagementService):
         MATCH (s:NodeStatus {node_id: $node_id}) RETURN s LIMIT 1
         """
         try:
-            result = self.neo4j_client.execute_query(query, {"node_id": node_id}, self.database)
+            result = self.neo4j_client.execute_read(query, {"node_id": node_id}, self.database)
             if not result:
                 return None
             status_data = result[0]["s"]
@@ -475,7 +765,7 @@ class Neo4jNodeManagementService(NodeManagementService):
         MATCH (n:DataNode {node_id: $node_id})-[:DEPENDS_ON]->(dep:DataNode)
         RETURN dep.node_id AS dependency_id
         """
-        result = self.neo4j_client.execute_query(query, {"node_id": node_id}, self.database)
+        result = self.neo4j_client.execute_read(query, {"node_id": node_id}, self.database)
         return [row["dependency_id"] for row in result] if result else []
 
     def add_dependency(self, node_id: str, dependency_id: str) -> None:
@@ -484,7 +774,8 @@ class Neo4jNodeManagementService(NodeManagementService):
         """
         query = (
             "MATCH (n:DataNode {node_id: $node_id}), (dep:DataNode {node_id: $dependency_id}) "
-            "MERGE (n)-[:DEPENDS_ON]->(dep)"
+            "MERGE (n)-[:DEPENDS_ON]->(dep) "
+            "ON CREATE SET dep.dependent_count = coalesce(dep.dependent_count, 0) + 1"
         )
         self.neo4j_client.execute_query(
             query, {"node_id": node_id, "dependency_id": dependency_id}, self.database
@@ -496,15 +787,40 @@ class Neo4jNodeManagementService(NodeManagementService):
         """
         query = (
             "MATCH (n:DataNode {node_id: $node_id})-[r:DEPENDS_ON]->(dep:DataNode {node_id: $dependency_id}) "
-            "DELETE r"
+            "DELETE r "
+            "SET dep.dependent_count = dep.dependent_count - 1"
         )
         self.neo4j_client.execute_query(
             query, {"node_id": node_id, "dependency_id": dependency_id}, self.database
         )
 
+    def get_strategy_graph(self, strategy_version_id: str) -> List[DataNode]:
+        """전략 버전의 노드와 DEPENDS_ON 관계를 한 번의 쿼리로 조회한다.
+
+        노드별 의존 노드 ID 는 pattern comprehension(collect 투영)으로 같은 행에 담아
+        노드당 get_node_dependencies 를 호출하는 N+1 조회를 피한다.
+        """
+        query = """
+        MATCH (:StrategyVersion {version_id: $strategy_version_id})-[:CONTAINS]->(n:DataNode)
+        RETURN n, [(n)-[:DEPENDS_ON]->(dep:DataNode) | dep.node_id] AS dependencies
+        """
+        nodes = []
+        for row in self.neo4j_client.stream_read(
+            query,
+            {"strategy_version_id": strategy_version_id},
+            self.database,
+            fetch_size=self.STREAM_FETCH_SIZE,
+        ):
+            try:
+                node_data = dict(row["n"], dependencies=row["dependencies"])
+                nodes.append(_decode_node(node_data))
+            except Exception:
+                continue
+        return nodes
+
     def get_strategy_dag(self, strategy_version_id: str):
         """특정 전략 버전의 노드 리스트로 DAG 빌드/검증 결과 반환"""
-        nodes = self.get_strategy_nodes(strategy_version_id)
+        nodes = self.get_strategy_graph(strategy_version_id)
         builder = GraphBuilder(nodes)
         node_map, topo_result = builder.build_dag()
         return node_map, topo_result
@@ -513,15 +829,33 @@ class Neo4jNodeManagementService(NodeManagementService):
         self, strategy_version_id: str, node_status_map: dict[str, str]
     ) -> list[DataNode]:
         """core ReadyNodeSelector를 활용해 ready 노드 반환"""
-        nodes = self.get_strategy_nodes(strategy_version_id)
+        nodes = self.get_strategy_graph(strategy_version_id)
         selector = ReadyNodeSelector(nodes, node_status_map)
         return selector.get_ready_nodes()
 
-    def enqueue_ready_nodes(self, ready_nodes: list[DataNode], queue_repo, status_service):
-        """core QueueWorker를 활용해 ready 노드 큐 등록 및 상태 갱신"""
-        worker = QueueWorker(
-            push_fn=queue_repo.push,
-            update_status_fn=status_service.update_node_status,
-            complete_fn=queue_repo.complete,
-        )
+    def enqueue_ready_nodes(
+        self,
+        ready_nodes: list[DataNode],
+        queue_repo,
+        status_service,
+        priorities: Optional[dict[str, float]] = None,
+    ):
+        """core QueueWorker를 활용해 ready 노드 큐 등록 및 상태 갱신
+
+        priorities(node_id → priority, 예: CriticalPathPriority.compute())가 주어지면
+        우선순위 큐(push_priority)에 등록한다.
+        """
+        if priorities is None:
+            worker = QueueWorker(
+                push_fn=queue_repo.push,
+                update_status_fn=status_service.update_node_status,
+                complete_fn=queue_repo.complete,
+            )
+        else:
+            worker = QueueWorker(
+                push_fn=queue_repo.push_priority,
+                update_status_fn=status_service.update_node_status,
+                complete_fn=queue_repo.complete,
+                priority_fn=lambda node_id: priorities.get(node_id, 0.0),
+            )
         return worker.enqueue_ready_nodes(ready_nodes)
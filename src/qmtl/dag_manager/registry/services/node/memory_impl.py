@@ -1,9 +1,10 @@
 from threading import Lock
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 
 from qmtl.models.generated import qmtl_datanode_pb2
+from qmtl.sdk.tag_index import TagIndex
 
-from .management import NodeManagementService
+from .management import NodeManagementService, keyset_page
 from .validation import validate_proto_node
 
 
@@ -11,11 +12,30 @@ class InMemoryNodeService(NodeManagementService):
     def __init__(self):
         self._nodes: Dict[str, qmtl_datanode_pb2.DataNode] = {}
         self._lock = Lock()
-        # 노드-전략 참조 관계 저장용 Dictionary
-        self._node_strategy_map: Dict[str, List[str]] = {}  # node_id -> [strategy_version_id]
-        self._strategy_node_map: Dict[str, List[str]] = {}  # strategy_version_id -> [node_id]
+        # 노드-전략 참조 관계 저장용 Dictionary (set 으로 O(1) 추가/삭제/포함 검사)
+        self._node_strategy_map: Dict[str, Set[str]] = {}  # node_id -> {strategy_version_id}
+        self._strategy_node_map: Dict[str, Set[str]] = {}  # strategy_version_id -> {node_id}
         # 노드 상태 저장용 Dictionary (str 또는 protobuf status 사용)
         self._node_statuses: Dict[str, str] = {}
+        # tag/interval/period → node_id 비트맵 역색인 (list_by_tags 용)
+        self._tag_index = TagIndex()
+
+    @staticmethod
+    def _index_values(node: qmtl_datanode_pb2.DataNode):
+        """역색인에 넣을 (tags, intervals, periods) 추출"""
+        predefined_tags = getattr(node.tags, "predefined", []) or []
+        custom_tags = getattr(node.tags, "custom", []) or []
+        # Convert predefined tags from enum to string if needed
+        tags = [t.value if hasattr(t, "value") else t for t in predefined_tags]
+        tags.extend(custom_tags)
+        interval_settings = node.interval_settings
+        if not interval_settings:
+            return tags, (), ()
+        return (
+            tags,
+            [getattr(interval_settings, "interval", None)],
+            [getattr(interval_settings, "period", None)],
+        )
 
     def create_node(self, node: qmtl_datanode_pb2.DataNode) -> str:
         """
@@ -27,31 +47,35 @@ class InMemoryNodeService(NodeManagementService):
             if node.tags is None:
                 node.tags = NodeTags()
             self._nodes[node.node_id] = node
+            tags, intervals, periods = self._index_values(node)
+            self._tag_index.add(node.node_id, tags, intervals, periods)
             return node.node_id
 
     def get_node(self, node_id: str) -> Optional[qmtl_datanode_pb2.DataNode]:
         """Get a node by ID."""
         return self._nodes.get(node_id)
 
+    def get_nodes(self, node_ids: List[str]) -> Dict[str, qmtl_datanode_pb2.DataNode]:
+        """Get nodes by ID (missing IDs are omitted)."""
+        return {node_id: self._nodes[node_id] for node_id in node_ids if node_id in self._nodes}
+
     def delete_node(self, node_id: str) -> bool:
         """Delete a node by ID."""
         with self._lock:
             if node_id in self._nodes:
                 del self._nodes[node_id]
-                # 노드-전략 매핑에서도 삭제
-                if node_id in self._node_strategy_map:
-                    # 이 노드를 참조하는 전략들의 맵에서도 삭제
-                    for strategy_id in self._node_strategy_map[node_id]:
-                        if strategy_id in self._strategy_node_map:
-                            if node_id in self._strategy_node_map[strategy_id]:
-                                self._strategy_node_map[strategy_id].remove(node_id)
-                    del self._node_strategy_map[node_id]
+                self._tag_index.remove(node_id)
+                # 노드-전략 매핑에서도 삭제 (이 노드를 참조하는 전략들의 맵 포함)
+                for strategy_id in self._node_strategy_map.pop(node_id, ()):
+                    self._strategy_node_map.get(strategy_id, set()).discard(node_id)
                 return True
             return False
 
-    def list_nodes(self) -> List[qmtl_datanode_pb2.DataNode]:
-        """List all nodes."""
-        return list(self._nodes.values())
+    def list_nodes(
+        self, after: Optional[str] = None, limit: Optional[int] = None
+    ) -> List[qmtl_datanode_pb2.DataNode]:
+        """List nodes ordered by node_id (keyset page after `after`, up to `limit`)."""
+        return keyset_page(list(self._nodes.values()), after, limit)
 
     def list_zero_deps(self) -> List[qmtl_datanode_pb2.DataNode]:
         """List nodes with no dependencies (leaf nodes)."""
@@ -63,51 +87,17 @@ class InMemoryNodeService(NodeManagementService):
         interval: Optional[str] = None,
         period: Optional[str] = None,
         match_mode: str = "AND",
+        after: Optional[str] = None,
+        limit: Optional[int] = None,
     ) -> List[qmtl_datanode_pb2.DataNode]:
         """
         List nodes filtered by tags, interval and period.
         Ensures proper handling of Pydantic v2 models and null values.
         """
-        nodes = list(self._nodes.values())
-        if tags:
-            filtered_nodes = []
-            for n in nodes:
-                # Handle potential None values in tags properly
-                predefined_tags = getattr(n.tags, "predefined", []) or []
-                custom_tags = getattr(n.tags, "custom", []) or []
-
-                # Convert predefined tags from enum to string if needed
-                predefined_tag_values = [
-                    t.value if hasattr(t, "value") else t for t in predefined_tags
-                ]
-
-                # Check if node matches the tags based on match_mode
-                if match_mode == "AND":
-                    if all(t in predefined_tag_values or t in custom_tags for t in tags):
-                        filtered_nodes.append(n)
-                else:  # OR mode
-                    if any(t in predefined_tag_values or t in custom_tags for t in tags):
-                        filtered_nodes.append(n)
-            nodes = filtered_nodes
-
-        # Filter by interval if specified
-        if interval and nodes:
-            nodes = [
-                n
-                for n in nodes
-                if n.interval_settings
-                and getattr(n.interval_settings, "interval", None) == interval
-            ]
-
-        # Filter by period if specified
-        if period and nodes:
-            nodes = [
-                n
-                for n in nodes
-                if n.interval_settings and getattr(n.interval_settings, "period", None) == period
-            ]
-
-        return nodes
+        with self._lock:
+            node_ids = self._tag_index.query(tags or [], interval, period, match_mode)
+            nodes = [self._nodes[node_id] for node_id in node_ids]
+        return keyset_page(nodes, after, limit)
 
     def validate_node(self, node: qmtl_datanode_pb2.DataNode) -> None:
         """Validate DataNode (protobuf). Will raise ValidationError on failure."""
@@ -123,17 +113,8 @@ class InMemoryNodeService(NodeManagementService):
             if node_id not in self._nodes:
                 return
 
-            # 노드->전략 매핑 업데이트
-            if node_id not in self._node_strategy_map:
-                self._node_strategy_map[node_id] = []
-            if strategy_version_id not in self._node_strategy_map[node_id]:
-                self._node_strategy_map[node_id].append(strategy_version_id)
-
-            # 전략->노드 매핑 업데이트
-            if strategy_version_id not in self._strategy_node_map:
-                self._strategy_node_map[strategy_version_id] = []
-            if node_id not in self._strategy_node_map[strategy_version_id]:
-                self._strategy_node_map[strategy_version_id].append(node_id)
+            self._node_strategy_map.setdefault(node_id, set()).add(strategy_version_id)
+            self._strategy_node_map.setdefault(strategy_version_id, set()).add(node_id)
 
     def remove_contains_relationship(self, strategy_version_id: str, node_id: str) -> None:
         """
@@ -141,52 +122,64 @@ class InMemoryNodeService(NodeManagementService):
         (파이프라인 비활성화/삭제 시 호출)
         """
         with self._lock:
-            # 노드->전략 매핑에서 삭제
-            if node_id in self._node_strategy_map:
-                if strategy_version_id in self._node_strategy_map[node_id]:
-                    self._node_strategy_map[node_id].remove(strategy_version_id)
-                    # 빈 리스트가 되면 키 자체를 삭제
-                    if not self._node_strategy_map[node_id]:
-                        del self._node_strategy_map[node_id]
-
-            # 전략->노드 매핑에서 삭제
-            if strategy_version_id in self._strategy_node_map:
-                if node_id in self._strategy_node_map[strategy_version_id]:
-                    self._strategy_node_map[strategy_version_id].remove(node_id)
-                    # 빈 리스트가 되면 키 자체를 삭제
-                    if not self._strategy_node_map[strategy_version_id]:
-                        del self._strategy_node_map[strategy_version_id]
+            self._discard(self._node_strategy_map, node_id, strategy_version_id)
+            self._discard(self._strategy_node_map, strategy_version_id, node_id)
+
+    @staticmethod
+    def _discard(mapping: Dict[str, Set[str]], key: str, value: str) -> None:
+        """mapping[key] 에서 value 제거, 빈 set 이 되면 키 자체를 삭제"""
+        values = mapping.get(key)
+        if values is not None:
+            values.discard(value)
+            if not values:
+                del mapping[key]
 
     def get_node_ref_count(self, node_id: str) -> int:
         """
         해당 DataNode를 참조하는 StrategyVersion(CONTAINS 관계) 개수를 반환한다.
         """
         with self._lock:
-            if node_id not in self._node_strategy_map:
-                return 0
-            return len(self._node_strategy_map[node_id])
+            return len(self._node_strategy_map.get(node_id, ()))
+
+    def get_ref_counts(self, node_ids: List[str]) -> Dict[str, int]:
+        """여러 DataNode의 참조 카운트를 한 번에 반환한다 (존재하지 않는 노드는 0)."""
+        with self._lock:
+            return {node_id: len(self._node_strategy_map.get(node_id, ())) for node_id in node_ids}
+
+    def remove_strategy_contains(self, strategy_version_id: str) -> Dict[str, int]:
+        """전략 버전의 모든 CONTAINS 관계를 삭제하고, 노드별 갱신된 참조 카운트를 반환한다."""
+        with self._lock:
+            node_ids = self._strategy_node_map.pop(strategy_version_id, set())
+            for node_id in node_ids:
+                self._discard(self._node_strategy_map, node_id, strategy_version_id)
+            return {node_id: len(self._node_strategy_map.get(node_id, ())) for node_id in node_ids}
 
     def get_node_ref_strategies(self, node_id: str) -> list[str]:
         """
         해당 DataNode를 참조하는 모든 StrategyVersion(version_id) 목록을 반환한다.
         """
         with self._lock:
-            if node_id not in self._node_strategy_map:
-                return []
-            return self._node_strategy_map[node_id].copy()
+            return sorted(self._node_strategy_map.get(node_id, ()))
 
-    def get_strategy_nodes(self, strategy_version_id: str) -> List[qmtl_datanode_pb2.DataNode]:
+    def get_strategy_nodes(
+        self, strategy_version_id: str, after: Optional[str] = None, limit: Optional[int] = None
+    ) -> List[qmtl_datanode_pb2.DataNode]:
         """
-        특정 전략 버전에 포함된 모든 노드 목록을 반환한다.
+        특정 전략 버전에 포함된 노드 목록을 반환한다 (node_id keyset 페이지).
         """
         with self._lock:
             if strategy_version_id not in self._strategy_node_map:
                 return []
-            return [
+            nodes = [
                 self._nodes[node_id]
                 for node_id in self._strategy_node_map[strategy_version_id]
                 if node_id in self._nodes
             ]
+        return keyset_page(nodes, after, limit)
+
+    def get_strategy_graph(self, strategy_version_id: str) -> List[qmtl_datanode_pb2.DataNode]:
+        """전략 버전의 노드 목록 반환 (메모리 백엔드는 add_dependency 가 dependencies 를 직접 갱신)"""
+        return self.get_strategy_nodes(strategy_version_id)
 
     def get_node_status(self, node_id: str):
         """해당 DataNode의 상태/메타데이터를 조회한다."""
@@ -2,8 +2,13 @@
 Neo4j 데이터 스키마 및 마이그레이션 스크립트
 - DataNode, StrategyVersion, ActivationHistory 노드 및 관계 정의
 - 인덱스 및 제약조건 생성
+- 태그/인터벌 저장 구조 마이그레이션 (JSON 문자열 → Tag 노드 + top-level 인덱스 속성)
+- GC/참조 카운트 속성(expires_at, dependent_count, ref_count) 백필
 """
 
+import json
+import time
+
 from qmtl.common.db.neo4j_client import Neo4jClient
 
 
@@ -36,18 +41,36 @@ def get_schema_cypher():
         """
         CREATE INDEX IF NOT EXISTS FOR ()-[r:ACTIVATED_BY]-() ON (r);
         """,
-        # 태그/인터벌/피리어드 인덱스 (태그 기반 쿼리 최적화)
+        # 태그 노드 (DataNode)-[:HAS_TAG]->(:Tag {name}) — 태그 기반 쿼리의 시작점
+        """
+        CREATE CONSTRAINT IF NOT EXISTS FOR (t:Tag)
+        REQUIRE t.name IS UNIQUE;
+        """,
+        # 인터벌/피리어드 top-level 인덱스 (JSON 문자열 내부 경로는 인덱싱 불가)
+        """
+        CREATE INDEX IF NOT EXISTS FOR (n:DataNode) ON (n.interval);
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS FOR (n:DataNode) ON (n.interval, n.period);
+        """,
+        # GC 대상 선정용 인덱스 (TTL 만료 시각 범위 탐색, 의존 노드 수 0 탐색)
         """
-        CREATE INDEX IF NOT EXISTS FOR (n:DataNode) ON (n.tags.predefined);
+        CREATE INDEX IF NOT EXISTS FOR (n:DataNode) ON (n.expires_at);
         """,
         """
-        CREATE INDEX IF NOT EXISTS FOR (n:DataNode) ON (n.tags.custom);
+        CREATE INDEX IF NOT EXISTS FOR (n:DataNode) ON (n.dependent_count);
         """,
+        # 스냅샷: content-addressed 노드 blob (hash 로 MERGE), 스냅샷 id/파이프라인별 최신 조회
         """
-        CREATE INDEX IF NOT EXISTS FOR (n:DataNode) ON (n.interval_settings.interval);
+        CREATE CONSTRAINT IF NOT EXISTS FOR (n:SnapshotNode)
+        REQUIRE n.hash IS UNIQUE;
         """,
         """
-        CREATE INDEX IF NOT EXISTS FOR (n:DataNode) ON (n.interval_settings.period);
+        CREATE CONSTRAINT IF NOT EXISTS FOR (s:StrategySnapshot)
+        REQUIRE s.snapshot_id IS UNIQUE;
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS FOR (s:StrategySnapshot) ON (s.pipeline_id, s.created_at);
         """,
     ]
 
@@ -58,3 +81,96 @@ def init_neo4j_schema(client: Neo4jClient):
     """
     for cypher in get_schema_cypher():
         client.execute_query(cypher)
+
+
+def migrate_tag_storage(client: Neo4jClient, database: str = None, batch_size: int = 10000) -> int:
+    """
+    기존 DataNode의 JSON 문자열 태그/인터벌을 인덱스 가능한 구조로 마이그레이션
+    - tags → (:Tag {name}) 노드 + HAS_TAG 관계
+    - interval_settings(없으면 stream_settings 첫 interval) → n.interval / n.period
+    - node_id 기준 keyset 페이지 단위 처리, 재실행해도 안전(MERGE/SET)
+
+    Returns:
+        처리한 DataNode 수
+    """
+    read_query = """
+    MATCH (n:DataNode) WHERE n.node_id > $after
+    RETURN n.node_id AS node_id, n.tags AS tags,
+           n.interval_settings AS interval_settings, n.stream_settings AS stream_settings
+    ORDER BY n.node_id LIMIT $limit
+    """
+    write_query = """
+    UNWIND $rows AS row
+    MATCH (n:DataNode {node_id: row.node_id})
+    SET n.interval = row.interval, n.period = row.period
+    WITH n, row
+    FOREACH (tag IN row.tag_names |
+        MERGE (t:Tag {name: tag})
+        MERGE (n)-[:HAS_TAG]->(t)
+    )
+    """
+    after = ""
+    migrated = 0
+    while True:
+        records = client.execute_query(read_query, {"after": after, "limit": batch_size}, database)
+        if not records:
+            return migrated
+        rows = [_migration_row(record) for record in records]
+        client.execute_query(write_query, {"rows": rows}, database)
+        migrated += len(rows)
+        after = records[-1]["node_id"]
+
+
+def backfill_gc_properties(
+    client: Neo4jClient, database: str = None, batch_size: int = 10000
+) -> int:
+    """
+    GC/참조 카운트 속성이 없는 기존 DataNode 에 expires_at / dependent_count / ref_count 를 채운다
+    - dependent_count: 현재 들어오는 DEPENDS_ON 관계 수
+    - ref_count: 현재 들어오는 CONTAINS 관계 수
+    - expires_at: (기존 값이 없을 때) created_at(없으면 백필 시각) + ttl, ttl 이 없으면 null
+    - CALL { ... } IN TRANSACTIONS 로 batch_size 행마다 커밋 (auto-commit 쿼리), 재실행해도 안전
+
+    Returns:
+        처리한 DataNode 수
+    """
+    query = """
+    MATCH (n:DataNode) WHERE n.dependent_count IS NULL OR n.ref_count IS NULL
+    CALL {
+        WITH n
+        SET n.dependent_count = COUNT { (n)<-[:DEPENDS_ON]-(:DataNode) },
+            n.ref_count = COUNT { (n)<-[:CONTAINS]-(:StrategyVersion) },
+            n.expires_at = coalesce(n.expires_at, CASE WHEN n.ttl IS NOT NULL AND n.ttl > 0
+                THEN coalesce(n.created_at, $now) + n.ttl ELSE null END)
+    } IN TRANSACTIONS OF $batch_size ROWS
+    RETURN count(n) AS updated
+    """
+    result = client.execute_query(
+        query, {"now": int(time.time()), "batch_size": batch_size}, database
+    )
+    return result[0]["updated"] if result else 0
+
+
+def _load_json(value):
+    if isinstance(value, str):
+        try:
+            return json.loads(value)
+        except ValueError:
+            return None
+    return value
+
+
+def _migration_row(record: dict) -> dict:
+    tags = _load_json(record.get("tags")) or {}
+    names = list(tags.get("predefined") or []) + list(tags.get("custom") or [])
+    settings = _load_json(record.get("interval_settings"))
+    if not settings:
+        intervals = (_load_json(record.get("stream_settings")) or {}).get("intervals") or {}
+        settings = next(iter(intervals.values()), None)
+    settings = settings or {}
+    return {
+        "node_id": record["node_id"],
+        "tag_names": list(dict.fromkeys(names)),
+        "interval": settings.get("interval"),
+        "period": settings.get("period"),
+    }
@@ -14,8 +14,10 @@ class StrategyManagementService(ABC):
         pass
 
     @abstractmethod
-    def list_strategies(self) -> List[StrategyVersion]:
-        pass
+    def list_strategies(
+        self, after: Optional[str] = None, limit: Optional[int] = None
+    ) -> List[StrategyVersion]:
+        """StrategyVersion 목록을 version_id 오름차순으로 반환한다 (after 이후 최대 limit 개)."""
 
 
 # MULTI-4: Neo4j 구현체 (스텁)
@@ -29,7 +31,10 @@ class Neo4jStrategyManagementService(StrategyManagementService):
         # 여기서는 None 반환 (스텁)
         return None
 
-    def list_strategies(self) -> List[StrategyVersion]:
-        # 실제 구현에서는 Cypher 쿼리로 전체 조회
+    def list_strategies(
+        self, after: Optional[str] = None, limit: Optional[int] = None
+    ) -> List[StrategyVersion]:
+        # 실제 구현에서는 version_id keyset Cypher 쿼리로 조회
+        # (WHERE s.version_id > $after ORDER BY s.version_id LIMIT $limit)
         # 여기서는 빈 리스트 반환 (스텁)
         return []
@@ -1,77 +1,290 @@
-from typing import List, Optional
-from qmtl.models.generated.qmtl_strategy_pb2 import StrategySnapshot
+"""
+전략 DAG 스냅샷 저장소 (content-addressed + delta 인코딩)
+
+- 노드: NodeSnapshot 직렬화 바이트의 sha256 을 키로 (:SnapshotNode {hash}) 에 한 번만 저장 (스냅샷 간 중복 제거)
+- 스냅샷: 직전 스냅샷 대비 StrategySnapshotDelta(추가/제거 노드 hash, 엣지) 만 압축 저장하고
+  (s)-[:DELTA_OF]->(base) 로 연결. KEYFRAME_INTERVAL 마다 또는 순서 변경 등 delta 로 표현할 수 없으면
+  full(keyframe) 스냅샷을 저장한다
+- 압축: zstandard 설치 시 zstd, 미설치 시 zlib (행마다 codec 기록)
+- 목록 조회는 메타데이터만 반환하고, 롤백/조회 시 keyframe 부터 delta 를 적용해 지연 복원한다
+"""
+
+import hashlib
+import zlib
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from qmtl.models.generated.qmtl_datanode_pb2 import DAGEdge
+from qmtl.models.generated.qmtl_snapshot_delta_pb2 import StrategySnapshotDelta
+from qmtl.models.generated.qmtl_strategy_pb2 import NodeSnapshot, StrategySnapshot
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# keyframe 사이 최대 delta 수 (복원 시 읽는 행 수 상한)
+KEYFRAME_INTERVAL = 20
+
+
+def compress(data: bytes) -> Tuple[bytes, str]:
+    """(압축 바이트, codec) 반환"""
+    if ZSTD_AVAILABLE:
+        return zstandard.ZstdCompressor(level=3).compress(data), "zstd"
+    return zlib.compress(data, 6), "zlib"
+
+
+def decompress(data: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        if not ZSTD_AVAILABLE:
+            raise RuntimeError("zstd 로 압축된 스냅샷을 읽으려면 zstandard 패키지가 필요합니다")
+        return zstandard.ZstdDecompressor().decompress(data)
+    if codec == "zlib":
+        return zlib.decompress(data)
+    return data
+
+
+def node_hash(data: bytes) -> str:
+    """NodeSnapshot 직렬화 바이트(deterministic)의 content hash"""
+    return hashlib.sha256(data).hexdigest()
+
+
+def diff_sequence(base: Sequence, new: Sequence) -> Optional[Tuple[list, list]]:
+    """base → new 를 (removed, added) 로 표현. base 에서 removed 를 빼고 added 를 덧붙여
+    new 가 복원되지 않으면(순서 변경/중복) None"""
+    base_set, new_set = set(base), set(new)
+    if len(base_set) != len(base) or len(new_set) != len(new):
+        return None
+    removed = [item for item in base if item not in new_set]
+    added = [item for item in new if item not in base_set]
+    kept = [item for item in base if item in new_set]
+    if kept + added != list(new):
+        return None
+    return removed, added
+
+
+def apply_deltas(
+    deltas: Iterable[StrategySnapshotDelta],
+) -> Tuple[list, list, StrategySnapshotDelta]:
+    """keyframe 부터 순서대로 delta 를 적용해 (노드 hash 목록, 엣지 목록, 마지막 delta) 반환"""
+    hashes: List[str] = []
+    edges: List[Tuple[str, str]] = []
+    last = None
+    for delta in deltas:
+        removed = set(delta.removed_nodes)
+        hashes = [h for h in hashes if h not in removed] + list(delta.added_nodes)
+        removed_edges = {(e.source, e.target) for e in delta.removed_edges}
+        edges = [e for e in edges if e not in removed_edges] + [
+            (e.source, e.target) for e in delta.added_edges
+        ]
+        last = delta
+    return hashes, edges, last
 
 
 class StrategySnapshotService:
     """전략별 DAG 스냅샷/버전 관리/롤백 서비스 (Neo4j 연동)"""
 
+    _LATEST_QUERY = """
+    MATCH (s:StrategySnapshot {pipeline_id: $pipeline_id})
+    RETURN s.snapshot_id AS snapshot_id, coalesce(s.chain_depth, 0) AS chain_depth
+    ORDER BY s.created_at DESC LIMIT 1
+    """
+    # 가장 가까운 keyframe 까지의 경로를 keyframe → 대상 순서로 반환
+    _CHAIN_QUERY = f"""
+    MATCH (s:StrategySnapshot {{snapshot_id: $snapshot_id, pipeline_id: $pipeline_id}})
+    MATCH p = (s)-[:DELTA_OF*0..{KEYFRAME_INTERVAL}]->(k:StrategySnapshot {{is_full: true}})
+    WITH p ORDER BY length(p) LIMIT 1
+    UNWIND reverse(nodes(p)) AS x
+    RETURN x.delta_bin AS delta_bin, x.codec AS codec
+    """
+    # delta 인코딩 이전에 저장된 스냅샷(snapshot_bin 전체 저장) 호환 조회
+    _LEGACY_QUERY = """
+    MATCH (s:StrategySnapshot {snapshot_id: $snapshot_id, pipeline_id: $pipeline_id})
+    WHERE s.snapshot_bin IS NOT NULL
+    RETURN s.snapshot_bin AS snapshot_bin LIMIT 1
+    """
+    _NODES_QUERY = """
+    UNWIND $hashes AS h
+    MATCH (n:SnapshotNode {hash: h})
+    RETURN n.hash AS hash, n.data AS data, n.codec AS codec
+    """
+    _LIST_QUERY = """
+    MATCH (s:StrategySnapshot {pipeline_id: $pipeline_id})
+    RETURN s.snapshot_id AS snapshot_id, s.pipeline_id AS pipeline_id,
+           s.created_at AS created_at, s.node_count AS node_count,
+           s.edge_count AS edge_count, coalesce(s.is_full, true) AS is_full,
+           s.base_snapshot_id AS base_snapshot_id
+    ORDER BY s.created_at DESC
+    """
+    _MERGE_NODES_QUERY = """
+    UNWIND $nodes AS node
+    MERGE (n:SnapshotNode {hash: node.hash})
+    ON CREATE SET n.data = node.data, n.codec = node.codec
+    """
+    _CREATE_QUERY = """
+    CREATE (s:StrategySnapshot {
+        snapshot_id: $snapshot_id,
+        pipeline_id: $pipeline_id,
+        created_at: $created_at,
+        node_count: $node_count,
+        edge_count: $edge_count,
+        is_full: $is_full,
+        chain_depth: $chain_depth,
+        base_snapshot_id: $base_snapshot_id,
+        codec: $codec,
+        delta_bin: $delta_bin
+    })
+    WITH s
+    OPTIONAL MATCH (b:StrategySnapshot {snapshot_id: $base_snapshot_id})
+    FOREACH (_ IN CASE WHEN b IS NULL THEN [] ELSE [1] END | CREATE (s)-[:DELTA_OF]->(b))
+    RETURN s.snapshot_id AS snapshot_id
+    """
+
     def __init__(self, neo4j_pool, database: str):
         self.neo4j_pool = neo4j_pool
         self.database = database
 
     def create_snapshot(self, snapshot: StrategySnapshot) -> str:
-        """스냅샷 저장 (Neo4j에 영구 저장)"""
+        """스냅샷 저장 (Neo4j에 영구 저장)
+
+        새 노드 blob 만 SnapshotNode 로 MERGE 하고, 스냅샷 행에는 직전 스냅샷 대비 delta 를 기록한다.
+        """
         # snapshot_id는 pipeline_id+created_at 조합(고유)
         snapshot_id = f"{snapshot.pipeline_id}_{snapshot.created_at}"
+        blobs: Dict[str, bytes] = {}
+        hashes = []
+        for node in snapshot.nodes:
+            data = node.SerializeToString(deterministic=True)
+            h = node_hash(data)
+            hashes.append(h)
+            blobs.setdefault(h, data)
+        edges = [(e.source, e.target) for e in snapshot.edges]
+
         with self.neo4j_pool.client() as client:
-            cypher = """
-            CREATE (s:StrategySnapshot {
-                snapshot_id: $snapshot_id,
-                pipeline_id: $pipeline_id,
-                created_at: $created_at,
-                snapshot_bin: $snapshot_bin
-            })
-            WITH s
-            RETURN s.snapshot_id AS snapshot_id
-            """
+            base = client.execute_query(
+                self._LATEST_QUERY, {"pipeline_id": snapshot.pipeline_id}, self.database
+            )
+            node_diff = edge_diff = None
+            if base and base[0]["chain_depth"] + 1 < KEYFRAME_INTERVAL:
+                manifest = self._load_manifest(client, snapshot.pipeline_id, base[0]["snapshot_id"])
+                if manifest is not None:
+                    node_diff = diff_sequence(manifest[0], hashes)
+                    edge_diff = diff_sequence(manifest[1], edges)
+            is_full = node_diff is None or edge_diff is None
+            if is_full:
+                node_diff, edge_diff = ([], hashes), ([], edges)
+
+            delta = StrategySnapshotDelta(
+                pipeline_id=snapshot.pipeline_id,
+                created_at=snapshot.created_at,
+                removed_nodes=node_diff[0],
+                added_nodes=node_diff[1],
+                removed_edges=[DAGEdge(source=s, target=t) for s, t in edge_diff[0]],
+                added_edges=[DAGEdge(source=s, target=t) for s, t in edge_diff[1]],
+                metadata=dict(snapshot.metadata),
+            )
+            delta_bin, codec = compress(delta.SerializeToString(deterministic=True))
+            new_nodes = []
+            for h in dict.fromkeys(node_diff[1]):
+                data, node_codec = compress(blobs[h])
+                new_nodes.append({"hash": h, "data": data, "codec": node_codec})
             params = {
                 "snapshot_id": snapshot_id,
                 "pipeline_id": snapshot.pipeline_id,
                 "created_at": snapshot.created_at,
-                "snapshot_bin": snapshot.SerializeToString(),
+                "node_count": len(hashes),
+                "edge_count": len(edges),
+                "is_full": is_full,
+                "chain_depth": 0 if is_full else base[0]["chain_depth"] + 1,
+                "base_snapshot_id": None if is_full else base[0]["snapshot_id"],
+                "codec": codec,
+                "delta_bin": delta_bin,
             }
-            result = client.execute_query(cypher, params, self.database)
+
+            def work(tx):
+                if new_nodes:
+                    tx.run(self._MERGE_NODES_QUERY, {"nodes": new_nodes}).consume()
+                return [dict(record) for record in tx.run(self._CREATE_QUERY, params)]
+
+            result = client.execute_transaction(work, self.database)
             if not result:
                 raise Exception("스냅샷 저장 실패")
             return snapshot_id
 
-    def get_snapshots(self, pipeline_id: str) -> List[StrategySnapshot]:
-        """특정 파이프라인의 모든 스냅샷 조회"""
+    def _load_manifest(self, client, pipeline_id: str, snapshot_id: str):
+        """keyframe 부터 delta 를 적용해 (노드 hash 목록, 엣지 목록, 마지막 delta) 복원 (노드 blob 미조회)"""
+        rows = client.execute_query(
+            self._CHAIN_QUERY,
+            {"snapshot_id": snapshot_id, "pipeline_id": pipeline_id},
+            self.database,
+        )
+        if not rows:
+            return None
+        deltas = []
+        for row in rows:
+            delta = StrategySnapshotDelta()
+            delta.ParseFromString(decompress(row["delta_bin"], row["codec"]))
+            deltas.append(delta)
+        return apply_deltas(deltas)
+
+    def list_snapshots(self, pipeline_id: str) -> List[dict]:
+        """스냅샷 메타데이터 목록 (최신순, blob 미포함)"""
+        with self.neo4j_pool.client() as client:
+            rows = client.execute_query(
+                self._LIST_QUERY, {"pipeline_id": pipeline_id}, self.database
+            )
+            return [dict(row) for row in rows]
+
+    def get_snapshot(self, pipeline_id: str, snapshot_id: str) -> Optional[StrategySnapshot]:
+        """snapshot_id 의 전체 스냅샷을 keyframe + delta 체인과 노드 blob 으로 복원"""
         with self.neo4j_pool.client() as client:
-            cypher = """
-            MATCH (s:StrategySnapshot {pipeline_id: $pipeline_id})
-            RETURN s ORDER BY s.created_at DESC
-            """
-            result = client.execute_query(cypher, {"pipeline_id": pipeline_id}, self.database)
-            snapshots = []
-            for row in result:
-                s = row["s"]
+            params = {"snapshot_id": snapshot_id, "pipeline_id": pipeline_id}
+            manifest = self._load_manifest(client, pipeline_id, snapshot_id)
+            if manifest is None:
+                rows = client.execute_query(self._LEGACY_QUERY, params, self.database)
+                if not rows:
+                    return None
                 try:
                     snapshot = StrategySnapshot()
-                    snapshot.ParseFromString(s["snapshot_bin"])
-                    snapshots.append(snapshot)
+                    snapshot.ParseFromString(rows[0]["snapshot_bin"])
+                    return snapshot
                 except Exception:
-                    continue
-            return snapshots
+                    return None
+            hashes, edges, last = manifest
+            rows = client.execute_query(
+                self._NODES_QUERY, {"hashes": list(dict.fromkeys(hashes))}, self.database
+            )
+            blobs = {row["hash"]: decompress(row["data"], row["codec"]) for row in rows}
+            missing = [h for h in hashes if h not in blobs]
+            if missing:
+                raise Exception(f"스냅샷 노드 blob 누락: {missing[:5]}")
+            return StrategySnapshot(
+                pipeline_id=last.pipeline_id,
+                created_at=last.created_at,
+                nodes=[NodeSnapshot.FromString(blobs[h]) for h in hashes],
+                edges=[DAGEdge(source=s, target=t) for s, t in edges],
+                metadata=dict(last.metadata),
+            )
+
+    def get_latest_snapshot(self, pipeline_id: str) -> Optional[StrategySnapshot]:
+        """가장 최근 스냅샷 하나만 복원"""
+        metas = self.list_snapshots(pipeline_id)
+        if not metas:
+            return None
+        return self.get_snapshot(pipeline_id, metas[0]["snapshot_id"])
+
+    def get_snapshots(self, pipeline_id: str) -> List[StrategySnapshot]:
+        """특정 파이프라인의 모든 스냅샷 조회 (최신순, 전체 복원 — 목록은 list_snapshots 사용)"""
+        snapshots = []
+        for meta in self.list_snapshots(pipeline_id):
+            snapshot = self.get_snapshot(pipeline_id, meta["snapshot_id"])
+            if snapshot is not None:
+                snapshots.append(snapshot)
+        return snapshots
 
     def rollback_to_snapshot(
         self, pipeline_id: str, snapshot_id: str
     ) -> Optional[StrategySnapshot]:
-        """특정 스냅샷으로 롤백 (스냅샷 구조 반환)"""
-        with self.neo4j_pool.client() as client:
-            cypher = """
-            MATCH (s:StrategySnapshot {snapshot_id: $snapshot_id, pipeline_id: $pipeline_id})
-            RETURN s LIMIT 1
-            """
-            result = client.execute_query(
-                cypher, {"snapshot_id": snapshot_id, "pipeline_id": pipeline_id}, self.database
-            )
-            if not result:
-                return None
-            s = result[0]["s"]
-            try:
-                snapshot = StrategySnapshot()
-                snapshot.ParseFromString(s["snapshot_bin"])
-                return snapshot
-            except Exception:
-                return None
+        """특정 스냅샷으로 롤백 (스냅샷 구조를 지연 복원하여 반환)"""
+        return self.get_snapshot(pipeline_id, snapshot_id)
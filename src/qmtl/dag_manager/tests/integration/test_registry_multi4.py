@@ -83,6 +83,18 @@ class MockStrategySnapshotService:
         )
         return [snap]
 
+    def list_snapshots(self, pipeline_id):
+        return [
+            {
+                "snapshot_id": f"{pipeline_id}_1111",
+                "pipeline_id": pipeline_id,
+                "created_at": 1111,
+            }
+        ]
+
+    def get_latest_snapshot(self, pipeline_id):
+        return self.get_snapshots(pipeline_id)[0]
+
 # FastAPI DI override
 client = TestClient(app)
 
@@ -1,62 +1,105 @@
 import pytest
-from qmtl.models.generated import qmtl_strategy_pb2
-from qmtl.dag_manager.registry.services.strategy.snapshot import StrategySnapshotService
+from qmtl.models.generated import qmtl_datanode_pb2, qmtl_strategy_pb2
+from qmtl.dag_manager.registry.services.strategy import snapshot as snapshot_module
+from qmtl.dag_manager.registry.services.strategy.snapshot import (
+    StrategySnapshotService,
+    diff_sequence,
+)
+
+
+class DummyStore:
+    """StrategySnapshot / SnapshotNode 를 dict 로 흉내내는 저장소"""
+
+    def __init__(self):
+        self.snapshots = {}
+        self.nodes = {}
+        self.merged_batches = []
+
+
+class DummyTx:
+    def __init__(self, store):
+        self.store = store
+
+    def run(self, cypher, params):
+        class _Result(list):
+            def consume(self):
+                pass
+
+        if "MERGE (n:SnapshotNode" in cypher:
+            self.store.merged_batches.append([n["hash"] for n in params["nodes"]])
+            for node in params["nodes"]:
+                self.store.nodes.setdefault(node["hash"], node)
+            return _Result()
+        if "CREATE (s:StrategySnapshot" in cypher:
+            self.store.snapshots[params["snapshot_id"]] = dict(params)
+            return _Result([{"snapshot_id": params["snapshot_id"]}])
+        return _Result()
+
+
+class DummyClient:
+    def __init__(self, store):
+        self.store = store
+        self.queries = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    def _pipeline_rows(self, pipeline_id):
+        rows = [s for s in self.store.snapshots.values() if s["pipeline_id"] == pipeline_id]
+        return sorted(rows, key=lambda s: s["created_at"], reverse=True)
+
+    def execute_query(self, cypher, params, database):
+        self.queries.append(cypher)
+        if "ORDER BY s.created_at DESC LIMIT 1" in cypher:
+            rows = self._pipeline_rows(params["pipeline_id"])
+            return [
+                {"snapshot_id": r["snapshot_id"], "chain_depth": r["chain_depth"]} for r in rows[:1]
+            ]
+        if "DELTA_OF" in cypher:
+            chain = []
+            current = self.store.snapshots.get(params["snapshot_id"])
+            while current is not None:
+                chain.append(current)
+                if current["is_full"]:
+                    break
+                current = self.store.snapshots.get(current["base_snapshot_id"])
+            if not chain or not chain[-1]["is_full"]:
+                return []
+            return [{"delta_bin": s["delta_bin"], "codec": s["codec"]} for s in reversed(chain)]
+        if "snapshot_bin" in cypher:
+            return []
+        if "MATCH (n:SnapshotNode" in cypher:
+            return [dict(self.store.nodes[h]) for h in params["hashes"] if h in self.store.nodes]
+        if "MATCH (s:StrategySnapshot {pipeline_id: $pipeline_id})" in cypher:
+            return [
+                {
+                    k: r[k]
+                    for k in (
+                        "snapshot_id",
+                        "pipeline_id",
+                        "created_at",
+                        "node_count",
+                        "edge_count",
+                        "is_full",
+                        "base_snapshot_id",
+                    )
+                }
+                for r in self._pipeline_rows(params["pipeline_id"])
+            ]
+        return []
+
+    def execute_transaction(self, work, database=None):
+        return work(DummyTx(self.store))
 
 
 @pytest.fixture
 def mock_neo4j_pool():
-    class DummyClient:
-        def __enter__(self):
-            return self
-
-        def __exit__(self, exc_type, exc_val, exc_tb):
-            pass
-
-        def execute_query(self, cypher, params, database):
-            if hasattr(self, "_force_return"):
-                return self._force_return
-            # pipeline_id 정책에 맞춘 mock 동작
-            if "CREATE (s:StrategySnapshot" in cypher:
-                return [{"snapshot_id": params["snapshot_id"]}]
-            if "MATCH (s:StrategySnapshot {pipeline_id: $pipeline_id})" in cypher:
-                # 조회 mock: 2개 스냅샷 반환 (protobuf 바이너리)
-                snap1 = qmtl_strategy_pb2.StrategySnapshot(
-                    pipeline_id=params["pipeline_id"],
-                    created_at=1111,
-                    nodes=[],
-                    edges=[],
-                    metadata={},
-                )
-                snap2 = qmtl_strategy_pb2.StrategySnapshot(
-                    pipeline_id=params["pipeline_id"],
-                    created_at=2222,
-                    nodes=[],
-                    edges=[],
-                    metadata={},
-                )
-                return [
-                    {"s": {"snapshot_bin": snap1.SerializeToString()}},
-                    {"s": {"snapshot_bin": snap2.SerializeToString()}},
-                ]
-            if (
-                "MATCH (s:StrategySnapshot {snapshot_id: $snapshot_id, pipeline_id: $pipeline_id})"
-                in cypher
-            ):
-                snap = qmtl_strategy_pb2.StrategySnapshot(
-                    pipeline_id=params["pipeline_id"],
-                    created_at=3333,
-                    nodes=[],
-                    edges=[],
-                    metadata={},
-                )
-                return [
-                    {"s": {"snapshot_bin": snap.SerializeToString()}},
-                ]
-            return []
-
     class DummyPool:
         def __init__(self):
-            self.client_instance = DummyClient()
+            self.client_instance = DummyClient(DummyStore())
 
         def client(self):
             return self.client_instance
@@ -69,6 +112,20 @@ def service(mock_neo4j_pool):
     return StrategySnapshotService(mock_neo4j_pool, database="testdb")
 
 
+def _node(node_id, tag="t"):
+    return qmtl_strategy_pb2.NodeSnapshot(node_id=node_id, data={"tag": tag, "type": "FEATURE"})
+
+
+def _snapshot(created_at, node_ids, edges=(), **metadata):
+    return qmtl_strategy_pb2.StrategySnapshot(
+        pipeline_id="v1",
+        created_at=created_at,
+        nodes=[_node(n) for n in node_ids],
+        edges=[qmtl_datanode_pb2.DAGEdge(source=s, target=t) for s, t in edges],
+        metadata=metadata,
+    )
+
+
 def test_create_snapshot(service):
     snap = qmtl_strategy_pb2.StrategySnapshot(
         pipeline_id="v1",
@@ -79,9 +136,60 @@ def test_create_snapshot(service):
     )
     snapshot_id = service.create_snapshot(snap)
     assert snapshot_id == "v1_1234"
+    assert service.rollback_to_snapshot("v1", snapshot_id) == snap
+
+
+def test_delta_snapshots_dedupe_nodes(service):
+    store = service.neo4j_pool.client().store
+    first = _snapshot(1, ["a", "b", "c"], [("a", "b"), ("b", "c")], foo="1")
+    second = _snapshot(2, ["a", "c", "d"], [("a", "c"), ("c", "d")], foo="2")
+    service.create_snapshot(first)
+    service.create_snapshot(second)
+
+    # 두 번째 스냅샷은 delta 로 저장되고 새 노드(d)의 blob 만 추가된다
+    assert store.snapshots["v1_1"]["is_full"] is True
+    assert store.snapshots["v1_2"]["is_full"] is False
+    assert store.snapshots["v1_2"]["base_snapshot_id"] == "v1_1"
+    assert [len(batch) for batch in store.merged_batches] == [3, 1]
+    assert len(store.nodes) == 4
+
+    assert service.rollback_to_snapshot("v1", "v1_2") == second
+    assert service.rollback_to_snapshot("v1", "v1_1") == first
+
+
+def test_reordered_nodes_write_keyframe(service):
+    store = service.neo4j_pool.client().store
+    service.create_snapshot(_snapshot(1, ["a", "b"]))
+    reordered = _snapshot(2, ["b", "a"])
+    service.create_snapshot(reordered)
+    assert store.snapshots["v1_2"]["is_full"] is True
+    # 노드 blob 은 content hash 로 재사용
+    assert len(store.nodes) == 2
+    assert service.rollback_to_snapshot("v1", "v1_2") == reordered
+
+
+def test_keyframe_interval(service, monkeypatch):
+    monkeypatch.setattr(snapshot_module, "KEYFRAME_INTERVAL", 3)
+    store = service.neo4j_pool.client().store
+    for i in range(5):
+        service.create_snapshot(_snapshot(i, [f"n{j}" for j in range(i + 1)]))
+    assert [store.snapshots[f"v1_{i}"]["chain_depth"] for i in range(5)] == [0, 1, 2, 0, 1]
+    assert len(service.rollback_to_snapshot("v1", "v1_4").nodes) == 5
+
+
+def test_list_snapshots_metadata_only(service):
+    service.create_snapshot(_snapshot(1, ["a"]))
+    service.create_snapshot(_snapshot(2, ["a", "b"], [("a", "b")]))
+    metas = service.list_snapshots("v1")
+    assert [m["snapshot_id"] for m in metas] == ["v1_2", "v1_1"]
+    assert metas[0]["node_count"] == 2 and metas[0]["edge_count"] == 1
+    assert all("delta_bin" not in m for m in metas)
+    assert service.get_latest_snapshot("v1").created_at == 2
 
 
 def test_get_snapshots(service):
+    service.create_snapshot(_snapshot(1111, []))
+    service.create_snapshot(_snapshot(2222, ["a"]))
     snaps = service.get_snapshots("v1")
     assert len(snaps) == 2
     assert all(isinstance(s, qmtl_strategy_pb2.StrategySnapshot) for s in snaps)
@@ -92,23 +200,20 @@ def test_get_snapshots(service):
         assert s == s2
 
 
-def test_rollback_to_snapshot(service):
-    snap = service.rollback_to_snapshot("v1", "v1_3333")
-    assert isinstance(snap, qmtl_strategy_pb2.StrategySnapshot)
-    assert snap.created_at == 3333
+def test_diff_sequence():
+    assert diff_sequence(["a", "b", "c"], ["a", "c", "d"]) == (["b"], ["d"])
+    assert diff_sequence(["a", "b"], ["b", "a"]) is None
+    assert diff_sequence(["a"], ["a", "a"]) is None
 
 
-def test_get_snapshots_empty(service, monkeypatch):
+def test_get_snapshots_empty(service):
     # 조회 결과가 없을 때
-    dummy_client = service.neo4j_pool.client()
-    dummy_client._force_return = []
-    snaps = service.get_snapshots("notfound")
-    assert snaps == []
+    assert service.get_snapshots("notfound") == []
+    assert service.list_snapshots("notfound") == []
+    assert service.get_latest_snapshot("notfound") is None
 
 
-def test_rollback_to_snapshot_none(service, monkeypatch):
+def test_rollback_to_snapshot_none(service):
     # 롤백 결과가 없을 때
-    dummy_client = service.neo4j_pool.client()
-    dummy_client._force_return = []
     snap = service.rollback_to_snapshot("v1", "notfound")
     assert snap is None
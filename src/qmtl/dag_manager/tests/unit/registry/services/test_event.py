@@ -15,7 +15,7 @@ def test_publish_and_subscribe(monkeypatch):
             class DummyPubSub:
                 def subscribe(self, **kwargs):
                     self.subscribed = kwargs
-                def run_in_thread(self, sleep_time=0.1):
+                def run_in_thread(self, sleep_time=0.1, daemon=False):
                     pass
             return DummyPubSub()
     monkeypatch.setattr("redis.from_url", lambda url: DummyRedis())
@@ -35,3 +35,140 @@ def test_publish_and_subscribe(monkeypatch):
     sub = EventSubscriber()
     sub.subscribe(["event:node:n1", "event:alert"], lambda msg: None)
     assert hasattr(sub.pubsub, "subscribed")
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    import fakeredis
+
+    server = fakeredis.FakeServer()
+    monkeypatch.setattr("redis.from_url", lambda url: fakeredis.FakeRedis(server=server))
+    monkeypatch.setattr(
+        "redis.asyncio.from_url", lambda url: fakeredis.aioredis.FakeRedis(server=server)
+    )
+    return fakeredis.FakeRedis(server=server)
+
+
+def _drain(pubsub):
+    messages = []
+    while True:
+        msg = pubsub.get_message(timeout=0.05)
+        if msg is None:
+            return messages
+        if msg["type"] == "pmessage":
+            messages.append((msg["channel"].decode(), NodeStatusEvent.FromString(msg["data"])))
+
+
+def test_batching_publisher_coalesces_node_status(fake_redis):
+    from qmtl.dag_manager.registry.services.event import BatchingEventPublisher
+
+    pubsub = fake_redis.pubsub()
+    pubsub.psubscribe("event:node*")
+    pubsub.get_message(timeout=0.05)
+    pub = BatchingEventPublisher(start=False)
+    for status in ("PENDING", "RUNNING", "COMPLETED"):
+        pub.publish_node_status(NodeStatusEvent(node_id="n1", status=status))
+    pub.publish_node_status(NodeStatusEvent(node_id="n2", status="RUNNING"))
+    assert pub.flush() == 2
+    messages = _drain(pubsub)
+    assert [(ch, e.status) for ch, e in messages] == [
+        ("event:node:n1", "COMPLETED"),
+        ("event:node_status", "COMPLETED"),
+        ("event:node:n2", "RUNNING"),
+        ("event:node_status", "RUNNING"),
+    ]
+    # coalesce=False 이면 모든 이벤트 발행
+    pub = BatchingEventPublisher(coalesce=False, max_batch=2, start=False)
+    pub.publish_node_status(NodeStatusEvent(node_id="n1", status="PENDING"))
+    pub.publish_node_status(NodeStatusEvent(node_id="n1", status="RUNNING"))
+    assert len(_drain(pubsub)) == 4  # max_batch 도달 시 즉시 flush
+    pub.close()
+
+
+def test_batching_publisher_background_flush(fake_redis):
+    from qmtl.dag_manager.registry.services.event import BatchingEventPublisher
+
+    pubsub = fake_redis.pubsub()
+    pubsub.subscribe("event:alert")
+    pubsub.get_message(timeout=0.05)
+    with BatchingEventPublisher(flush_interval=0.01) as pub:
+        pub.publish_alert(AlertEvent(target_id="n1", message="Alert!"))
+        time.sleep(0.1)
+        assert pub.published == 1
+    msg = pubsub.get_message(timeout=0.05)
+    assert AlertEvent.FromString(msg["data"]).message == "Alert!"
+
+
+def test_async_batching_publisher(fake_redis):
+    import asyncio
+    from qmtl.dag_manager.registry.services.event import AsyncBatchingEventPublisher
+
+    pubsub = fake_redis.pubsub()
+    pubsub.psubscribe("event:node*")
+    pubsub.get_message(timeout=0.05)
+
+    async def scenario():
+        async with AsyncBatchingEventPublisher(flush_interval=0.01) as pub:
+            for i in range(100):
+                await pub.publish_node_status(NodeStatusEvent(node_id="n1", status=str(i)))
+        return pub.published
+
+    assert asyncio.run(scenario()) == 1
+    assert [e.status for _, e in _drain(pubsub)] == ["99", "99"]
+
+
+def test_stream_publisher_consumer_group_resume(fake_redis):
+    from qmtl.dag_manager.registry.services.event import (
+        NODE_STATUS_STREAM,
+        StreamEventPublisher,
+        StreamEventSubscriber,
+    )
+
+    pubsub = fake_redis.pubsub()
+    pubsub.psubscribe("event:node*")
+    pubsub.get_message(timeout=0.05)
+    pub = StreamEventPublisher(maxlen=1000)
+    sub = StreamEventSubscriber("dashboard", "c1", [NODE_STATUS_STREAM], count=2, block_ms=10)
+    ids = [
+        pub.publish_node_status(NodeStatusEvent(node_id=f"n{i}", status="RUNNING"))
+        for i in range(3)
+    ]
+    # Pub/Sub 구독자 호환
+    assert len(_drain(pubsub)) == 6
+
+    first = sub.read()
+    assert [e.id for e in first] == ids[:2]
+    assert first[0].channel == "event:node:n0" and first[0].event.node_id == "n0"
+    sub.ack(first[:1])
+
+    # 재시작: 같은 consumer 이름이면 ack 되지 않은 n1 부터 다시 받는다
+    restarted = StreamEventSubscriber(
+        "dashboard", "c1", [NODE_STATUS_STREAM], count=2, block_ms=10
+    )
+    assert [e.event.node_id for e in restarted.read()] == ["n1"]
+    assert [e.event.node_id for e in restarted.read()] == ["n2"]
+    assert restarted.read() == []
+
+    # group 없이 last ID 이후 재생
+    assert [e.id for e in sub.replay(NODE_STATUS_STREAM, ids[0])] == ids[1:]
+    assert len(sub.replay(NODE_STATUS_STREAM)) == 3
+
+
+def test_stream_subscriber_run_acks(fake_redis):
+    from qmtl.dag_manager.registry.services.event import (
+        ALERT_STREAM,
+        StreamEventPublisher,
+        StreamEventSubscriber,
+    )
+
+    pub = StreamEventPublisher(mirror_pubsub=False)
+    sub = StreamEventSubscriber("alerts", "c1", [ALERT_STREAM], block_ms=10)
+    received = []
+    sub.run(received.extend)
+    pub.publish_alert(AlertEvent(target_id="n1", message="Alert!"))
+    deadline = time.time() + 2
+    while not received and time.time() < deadline:
+        time.sleep(0.01)
+    sub.stop()
+    assert received[0].event.message == "Alert!"
+    assert fake_redis.xpending(ALERT_STREAM, "alerts")["pending"] == 0
@@ -56,6 +56,6 @@ class TestMetadataService:
         self.service.create_dag(dag)
         self.snapshot_service.create_snapshot.assert_called_once_with(dag)
         self.service.get_dag("p1")
-        self.snapshot_service.get_snapshots.assert_called_once_with("p1")
+        self.snapshot_service.get_latest_snapshot.assert_called_once_with("p1")
 
     # Dependency, History 관련 테스트는 주석 처리 또는 제거
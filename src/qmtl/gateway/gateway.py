@@ -1,5 +1,7 @@
-from fastapi import FastAPI, Request, status
-from fastapi.responses import JSONResponse, Response
+from typing import List, Optional
+
+from fastapi import FastAPI, Query, Request, status
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 import logging
 import os
@@ -9,6 +11,9 @@ from qmtl.gateway.middlewares.acl import ACLMiddleware, ACLConfig, default_acl_r
 from qmtl.gateway.middlewares.logging import LoggingMiddleware
 from qmtl.gateway.middlewares.error import ErrorHandlingMiddleware
 from qmtl.gateway.services.policy import PolicyService, ResourceType, ActionType
+from qmtl.gateway.services.status_stream import StatusStreamHub, sse_events
+from qmtl.common.http.negotiation import protobuf_response, wants_protobuf
+from qmtl.models.generated import qmtl_registry_api_pb2
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -20,6 +25,12 @@ app = FastAPI(title="QMTL Gateway", description="API Gateway for QMTL System")
 # 정책 서비스 인스턴스 생성
 policy_service = PolicyService()
 
+# 상태 이벤트 스트림 (프로세스당 upstream Redis 구독 1개)
+status_hub = StatusStreamHub(
+    redis_url=os.environ.get("REDIS_URL", "redis://localhost:6379/0"),
+    buffer_size=int(os.environ.get("STATUS_STREAM_BUFFER_SIZE", "256")),
+)
+
 # CORS 미들웨어 설정
 app.add_middleware(
     CORSMiddleware,
@@ -137,7 +148,9 @@ def list_nodes(request: Request):
         return Response(status_code=status.HTTP_403_FORBIDDEN)
 
     # 실제 구현에서는 노드 목록 조회
-    # 현재는 스텁 응답
+    # 현재는 스텁 응답 (Accept: application/x-protobuf 이면 registry 와 같은 NodeList)
+    if wants_protobuf(request):
+        return protobuf_response(qmtl_registry_api_pb2.NodeList())
     return JSONResponse(content={"nodes": []})
 
 
@@ -157,6 +170,42 @@ def list_events(request: Request):
     return JSONResponse(content={"events": []})
 
 
+# 상태 이벤트 스트림 (SSE)
+@app.get("/v1/gateway/events/stream")
+async def stream_events(
+    request: Request,
+    strategy_id: Optional[List[str]] = Query(None, description="수신할 전략 ID (반복 지정 가능)"),
+):
+    """노드/파이프라인 상태 이벤트를 text/event-stream 으로 전송하는 엔드포인트.
+
+    폴링 대신 연결을 유지하며 이벤트를 받는다. strategy_id 를 지정하면 해당 전략 이벤트만 전송.
+    클라이언트가 느리면 버퍼(STATUS_STREAM_BUFFER_SIZE)를 넘는 오래된 이벤트부터 버린다.
+    """
+    user = request.state.user
+    user_roles = user.get("roles", [])
+
+    if not policy_service.evaluate_access(user_roles, ResourceType.EVENT, ActionType.READ):
+        return Response(status_code=status.HTTP_403_FORBIDDEN)
+    for sid in strategy_id or []:
+        if not policy_service.evaluate_access(
+            user_roles, ResourceType.STRATEGY, ActionType.READ, sid
+        ):
+            return Response(status_code=status.HTTP_403_FORBIDDEN)
+
+    client = await status_hub.connect(strategy_id)
+    return StreamingResponse(
+        sse_events(status_hub, client),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.on_event("shutdown")
+async def close_status_stream():
+    """upstream Redis 구독과 열린 스트림 정리."""
+    await status_hub.aclose()
+
+
 # read-only 보장: GET 외의 메서드는 405
 @app.post("/v1/gateway/strategies/{strategy_id}/status")
 @app.put("/v1/gateway/strategies/{strategy_id}/status")
@@ -4,6 +4,7 @@
 """
 
 from fastapi import Request, HTTPException, status
+from functools import lru_cache
 from typing import List, Callable, Optional
 from pydantic import BaseModel, field_validator
 import re
@@ -39,15 +40,21 @@ class ACLConfig(BaseModel):
 class ACLMiddleware:
     """ACL(Access Control List) 미들웨어."""
 
-    def __init__(self, config: ACLConfig):
+    def __init__(self, config: ACLConfig, path_cache_size: int = 4096):
         """미들웨어 초기화.
 
         Args:
             config: ACL 설정
+            path_cache_size: 경로별 매칭 결과 캐시 크기
         """
         self.config = config
+        self.exclude_paths = frozenset(config.exclude_paths)
         # 경로 패턴 컴파일
         self.compiled_rules = [(re.compile(rule.path_pattern), rule) for rule in config.rules]
+        # 전체 규칙을 하나의 정규식으로 합침 (alternation 은 앞선 규칙부터 시도하므로 선형 검색과 같은 결과)
+        self.combined_pattern = _combine_patterns([rule.path_pattern for rule in config.rules])
+        # 경로 → 규칙 인덱스 캐시
+        self._match_index = lru_cache(maxsize=path_cache_size)(self._scan)
 
     async def __call__(self, request: Request, call_next: Callable):
         """미들웨어 콜 함수.
@@ -60,7 +67,7 @@ class ACLMiddleware:
             FastAPI 응답 객체
         """
         # 인증 면제 경로 확인
-        if request.url.path in self.config.exclude_paths:
+        if request.url.path in self.exclude_paths:
             return await call_next(request)
 
         # 요청 경로에 대한 ACL 규칙 검색
@@ -114,9 +121,33 @@ class ACLMiddleware:
         Returns:
             매칭된 ACL 규칙 또는 None
         """
-        for pattern, rule in self.compiled_rules:
+        index = self._match_index(path)
+        return None if index is None else self.config.rules[index]
+
+    def _scan(self, path: str) -> Optional[int]:
+        """path 에 처음 매칭되는 규칙의 인덱스 (캐시 miss 시 호출)."""
+        if self.combined_pattern is not None:
+            match = self.combined_pattern.match(path)
+            return None if match is None else int(match.lastgroup[1:])
+        for index, (pattern, _) in enumerate(self.compiled_rules):
             if pattern.match(path):
-                return rule
+                return index
+        return None
+
+
+def _combine_patterns(patterns: List[str]) -> Optional["re.Pattern"]:
+    """규칙 패턴을 (?P<r0>...)|(?P<r1>...) 형태의 단일 정규식으로 컴파일.
+
+    그룹 번호가 바뀌면 의미가 달라지는 패턴(그룹 참조, 인라인 플래그 등)이 있으면 None (선형 검색 사용).
+    """
+    if not patterns:
+        return None
+    for pattern in patterns:
+        if re.search(r"\\\d|\(\?P[=<]|\(\?[aiLmsux]", pattern):
+            return None
+    try:
+        return re.compile("|".join(f"(?P<r{i}>{p})" for i, p in enumerate(patterns)))
+    except re.error:
         return None
 
 
@@ -147,4 +178,9 @@ default_acl_rules = [
         allowed_roles=["user", "admin", "service"],
         allowed_methods=["GET"],
     ),
+    ACLRule(
+        path_pattern=r"^/v1/gateway/events/stream$",
+        allowed_roles=["user", "admin", "service"],
+        allowed_methods=["GET"],
+    ),
 ]
@@ -2,12 +2,19 @@
 
 이 모듈은 Gateway API 요청에 대한 인증을 처리하는 미들웨어를 제공합니다.
 JWT 토큰 기반 인증과 API 키 기반 인증을 지원합니다.
+
+검증에 성공한 토큰은 sha256(토큰) 키의 LRU 캐시에 claims 와 함께 exp 까지 보관하므로
+같은 토큰을 재사용하는 요청은 서명 검증을 다시 하지 않습니다. 폐기(revoke)된 토큰/jti 는
+캐시 조회 경로에서도 거부됩니다.
 """
 
+from collections import OrderedDict
 from fastapi import Request, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import jwt, JWTError
-from typing import Optional, Dict, List, Any, Callable
+from typing import Optional, Dict, List, Any, Callable, Tuple
+import hashlib
+import threading
 import time
 from pydantic import BaseModel
 
@@ -19,6 +26,10 @@ class JWTConfig(BaseModel):
     algorithm: str = "HS256"
     # 특정 엔드포인트에 대한 인증 면제 경로 (예: 상태 확인, 문서)
     exclude_paths: List[str] = ["/health", "/", "/docs", "/openapi.json"]
+    # 검증된 토큰 캐시 최대 항목 수 (0 이면 캐시 사용 안 함)
+    token_cache_size: int = 10000
+    # exp 가 없는 토큰의 캐시 보관 시간(초)
+    token_cache_ttl: float = 300.0
 
 
 class JWTAuthMiddleware:
@@ -32,6 +43,14 @@ class JWTAuthMiddleware:
         """
         self.config = config
         self.security = HTTPBearer(auto_error=False)
+        # sha256(토큰) → (claims, 캐시 만료 시각)
+        self._token_cache: "OrderedDict[bytes, Tuple[Dict[str, Any], float]]" = OrderedDict()
+        # 폐기 목록: sha256(토큰) / jti → 폐기 항목 만료 시각 (토큰 exp 이후에는 보관할 필요 없음)
+        self._revoked_tokens: Dict[bytes, float] = {}
+        self._revoked_jtis: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
 
     async def __call__(self, request: Request, call_next: Callable):
         """미들웨어 콜 함수.
@@ -65,9 +84,7 @@ class JWTAuthMiddleware:
 
         # JWT 토큰 검증
         try:
-            payload = jwt.decode(
-                credentials.credentials, self.config.secret_key, algorithms=[self.config.algorithm]
-            )
+            payload = self._verify_token(credentials.credentials)
 
             # 토큰 만료 확인
             if "exp" in payload and payload["exp"] < time.time():
@@ -89,6 +106,96 @@ class JWTAuthMiddleware:
 
         return await call_next(request)
 
+    def _verify_token(self, token: str) -> Dict[str, Any]:
+        """토큰을 검증하고 claims 를 반환합니다 (캐시 hit 시 서명 검증 생략).
+
+        Args:
+            token: JWT 토큰 문자열
+
+        Returns:
+            토큰 claims (요청마다 새 dict)
+
+        Raises:
+            JWTError: 서명/형식 오류, 만료 또는 폐기된 토큰
+        """
+        key = _token_key(token)
+        now = time.time()
+        with self._lock:
+            if key in self._revoked_tokens:
+                raise JWTError("Token revoked")
+            entry = self._token_cache.get(key)
+            if entry is not None:
+                claims, expires_at = entry
+                if expires_at > now:
+                    if claims.get("jti") in self._revoked_jtis:
+                        del self._token_cache[key]
+                        raise JWTError("Token revoked")
+                    self._token_cache.move_to_end(key)
+                    self.cache_hits += 1
+                    return dict(claims)
+                del self._token_cache[key]
+            self.cache_misses += 1
+
+        payload = jwt.decode(token, self.config.secret_key, algorithms=[self.config.algorithm])
+        expires_at = payload.get("exp", now + self.config.token_cache_ttl)
+        with self._lock:
+            # jti 폐기 확인 (캐시 비활성 포함) 및 검증 중에 폐기된 경우
+            if key in self._revoked_tokens or payload.get("jti") in self._revoked_jtis:
+                raise JWTError("Token revoked")
+            if self.config.token_cache_size <= 0:
+                return payload
+            self._token_cache[key] = (payload, expires_at)
+            self._token_cache.move_to_end(key)
+            while len(self._token_cache) > self.config.token_cache_size:
+                self._token_cache.popitem(last=False)
+        return dict(payload)
+
+    def revoke_token(self, token: str, expires_at: Optional[float] = None) -> None:
+        """토큰을 폐기합니다 (캐시에서 제거하고 이후 요청을 거부).
+
+        Args:
+            token: 폐기할 JWT 토큰 문자열
+            expires_at: 폐기 목록 보관 기한 (기본: 토큰의 exp, 없으면 무기한)
+        """
+        if expires_at is None:
+            try:
+                expires_at = jwt.get_unverified_claims(token).get("exp")
+            except JWTError:
+                expires_at = None
+        key = _token_key(token)
+        with self._lock:
+            self._prune_revoked()
+            self._revoked_tokens[key] = float("inf") if expires_at is None else expires_at
+            self._token_cache.pop(key, None)
+
+    def revoke_jti(self, jti: str, expires_at: Optional[float] = None) -> None:
+        """jti(토큰 ID) 를 폐기합니다.
+
+        Args:
+            jti: 폐기할 토큰 ID
+            expires_at: 폐기 목록 보관 기한 (해당 토큰의 exp 권장, 없으면 무기한)
+        """
+        with self._lock:
+            self._prune_revoked()
+            self._revoked_jtis[jti] = float("inf") if expires_at is None else expires_at
+
+    def clear_token_cache(self) -> None:
+        """검증된 토큰 캐시를 비웁니다 (폐기 목록은 유지)."""
+        with self._lock:
+            self._token_cache.clear()
+
+    def _prune_revoked(self) -> None:
+        """만료 시각이 지난 폐기 항목 제거 (만료된 토큰은 어차피 검증에 실패)."""
+        now = time.time()
+        for revoked in (self._revoked_tokens, self._revoked_jtis):
+            for key in [key for key, expires_at in revoked.items() if expires_at <= now]:
+                del revoked[key]
+
+
+def _token_key(token: str) -> bytes:
+    """캐시/폐기 목록 키 (토큰 원문 대신 sha256 digest 보관)."""
+    return hashlib.sha256(token.encode()).digest()
+
 
 def create_access_token(
     data: Dict[str, Any],
@@ -6,4 +6,5 @@
 - DagSyncService: DAG Manager와 SDK 간 동기화 처리
 - StateTrackingService: 전략 및 노드 상태 추적/제공
 - QueryNodeResolver: TAG 기반 QueryNode 메타데이터 해석/제공
+- StatusStreamHub: Redis 상태 이벤트를 SSE 클라이언트로 fan-out
 """
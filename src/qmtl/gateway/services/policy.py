@@ -4,7 +4,8 @@
 """
 
 from enum import Enum
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, List, Optional
 from pydantic import BaseModel, Field
 
 
@@ -48,16 +49,78 @@ class Policy(BaseModel):
     rules: List[PolicyRule]
 
 
+class _PolicyStore(dict):
+    """변경 시 on_change 를 호출하는 정책 dict (결정 캐시 무효화용)."""
+
+    def __init__(self, policies: Dict[str, Policy], on_change: Callable[[], None]):
+        super().__init__(policies)
+        self._on_change = on_change
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._on_change()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._on_change()
+
+    def pop(self, *args):
+        result = super().pop(*args)
+        self._on_change()
+        return result
+
+    def popitem(self):
+        result = super().popitem()
+        self._on_change()
+        return result
+
+    def setdefault(self, key, default=None):
+        result = super().setdefault(key, default)
+        self._on_change()
+        return result
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._on_change()
+
+    def clear(self):
+        super().clear()
+        self._on_change()
+
+
 class PolicyService:
-    """Gateway 정책 관리 및 적용 서비스."""
+    """Gateway 정책 관리 및 적용 서비스.
+
+    evaluate_access 결과는 (역할 집합, 리소스 유형, 작업, 리소스 ID) 키로 LRU 캐시하며,
+    policies 가 변경되면 캐시를 비웁니다. 정책 객체 내부(rules 등)를 직접 수정한 경우에는
+    invalidate_cache() 를 호출해야 합니다.
+    """
 
-    def __init__(self):
-        """서비스 초기화."""
+    def __init__(self, decision_cache_size: int = 10000):
+        """서비스 초기화.
+
+        Args:
+            decision_cache_size: 접근 결정 캐시 최대 항목 수
+        """
+        self._decide = lru_cache(maxsize=decision_cache_size)(self._evaluate)
         # 정책 저장소 (실제로는 DB나 외부 스토리지에서 로드)
         self.policies: Dict[str, Policy] = {}
         # 기본 정책 로드
         self._load_default_policies()
 
+    @property
+    def policies(self) -> Dict[str, Policy]:
+        return self._policies
+
+    @policies.setter
+    def policies(self, policies: Dict[str, Policy]) -> None:
+        self._policies = _PolicyStore(policies, self.invalidate_cache)
+        self.invalidate_cache()
+
+    def invalidate_cache(self) -> None:
+        """접근 결정 캐시를 비웁니다."""
+        self._decide.cache_clear()
+
     def _load_default_policies(self):
         """기본 정책을 로드합니다."""
         # 읽기 전용 정책
@@ -195,6 +258,16 @@ class PolicyService:
         Returns:
             접근 허용 여부
         """
+        return self._decide(frozenset(user_roles), resource_type, action, resource_id)
+
+    def _evaluate(
+        self,
+        user_roles: FrozenSet[str],
+        resource_type: ResourceType,
+        action: ActionType,
+        resource_id: Optional[str],
+    ) -> bool:
+        """정책을 순회하여 접근 허용 여부를 계산합니다 (evaluate_access 캐시 miss 시 호출)."""
         # 기본적으로 접근 거부
         allowed = False
 
@@ -0,0 +1,149 @@
+"""Gateway 상태 이벤트 스트리밍 서비스.
+
+Registry 가 Redis 로 발행하는 노드/파이프라인 상태 이벤트를 프로세스당 하나의 upstream 구독으로 받아
+연결된 클라이언트(SSE)에 분배합니다.
+
+- upstream: AsyncEventDispatcher 로 event:node_status / event:pipeline_status firehose 채널 구독
+- 클라이언트별 bounded 버퍼: 가득 차면 가장 오래된 이벤트를 버림 (drop-oldest, dropped 카운트)
+- 클라이언트별 전략 필터: PipelineStatusEvent 는 pipeline_id, NodeStatusEvent 는
+  meta["strategy_id"] 또는 meta["pipeline_id"] 로 매칭
+"""
+
+import asyncio
+import json
+import logging
+from collections import deque
+from typing import AsyncIterator, Iterable, Optional, Set, Tuple
+
+from google.protobuf.json_format import MessageToDict
+
+from qmtl.dag_manager.event_client import AsyncEventDispatcher
+from qmtl.models.generated import qmtl_events_pb2
+
+logger = logging.getLogger(__name__)
+
+NODE_STATUS = "node_status"
+PIPELINE_STATUS = "pipeline_status"
+
+UPSTREAM_CHANNELS = {
+    "event:node_status": NODE_STATUS,
+    "event:pipeline_status": PIPELINE_STATUS,
+}
+
+
+def event_strategy_ids(event) -> Set[str]:
+    """이벤트가 속한 전략(파이프라인) ID 집합."""
+    if isinstance(event, qmtl_events_pb2.PipelineStatusEvent):
+        return {event.pipeline_id}
+    return {event.meta[key] for key in ("strategy_id", "pipeline_id") if key in event.meta}
+
+
+class ClientStream:
+    """클라이언트 한 명의 bounded 이벤트 버퍼."""
+
+    def __init__(self, strategy_ids: Optional[Iterable[str]] = None, buffer_size: int = 256):
+        """
+        Args:
+            strategy_ids: 수신할 전략 ID (None 이면 전체)
+            buffer_size: 최대 대기 이벤트 수 (초과 시 가장 오래된 이벤트 버림)
+        """
+        self.strategy_ids = set(strategy_ids) if strategy_ids else None
+        self._buffer: "deque[Tuple[str, object]]" = deque(maxlen=buffer_size)
+        self._ready = asyncio.Event()
+        self.dropped = 0
+        self.closed = False
+
+    def accepts(self, event) -> bool:
+        return self.strategy_ids is None or not self.strategy_ids.isdisjoint(
+            event_strategy_ids(event)
+        )
+
+    def push(self, kind: str, event) -> None:
+        if len(self._buffer) == self._buffer.maxlen:
+            self.dropped += 1
+        self._buffer.append((kind, event))
+        self._ready.set()
+
+    def close(self) -> None:
+        self.closed = True
+        self._ready.set()
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[Tuple[str, object]]:
+        """다음 이벤트 (timeout 동안 없으면 None)."""
+        if not self._buffer and not self.closed:
+            self._ready.clear()
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout)
+            except asyncio.TimeoutError:
+                return None
+        if not self._buffer:
+            return None
+        return self._buffer.popleft()
+
+
+class StatusStreamHub:
+    """프로세스당 하나의 upstream 구독을 여러 클라이언트로 fan-out."""
+
+    def __init__(self, redis_url: str = "redis://localhost:6379/0", buffer_size: int = 256):
+        self.redis_url = redis_url
+        self.buffer_size = buffer_size
+        self.clients: Set[ClientStream] = set()
+        self._dispatcher: Optional[AsyncEventDispatcher] = None
+        self._start_lock: Optional[asyncio.Lock] = None
+
+    async def start(self) -> None:
+        """upstream 구독 시작 (이미 시작했으면 무시)."""
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+        async with self._start_lock:
+            if self._dispatcher is not None:
+                return
+            dispatcher = AsyncEventDispatcher(self.redis_url)
+            for channel, kind in UPSTREAM_CHANNELS.items():
+                await dispatcher.subscribe(
+                    channel, lambda event, kind=kind: self.broadcast(kind, event)
+                )
+            self._dispatcher = dispatcher
+
+    def broadcast(self, kind: str, event) -> None:
+        for client in list(self.clients):
+            if client.accepts(event):
+                client.push(kind, event)
+
+    async def connect(self, strategy_ids: Optional[Iterable[str]] = None) -> ClientStream:
+        await self.start()
+        client = ClientStream(strategy_ids, self.buffer_size)
+        self.clients.add(client)
+        return client
+
+    def disconnect(self, client: ClientStream) -> None:
+        client.close()
+        self.clients.discard(client)
+
+    async def aclose(self) -> None:
+        for client in list(self.clients):
+            self.disconnect(client)
+        if self._dispatcher is not None:
+            await self._dispatcher.aclose()
+            self._dispatcher = None
+
+
+async def sse_events(
+    hub: StatusStreamHub, client: ClientStream, heartbeat: float = 15.0
+) -> AsyncIterator[str]:
+    """ClientStream 을 text/event-stream 형식으로 변환 (heartbeat 주기마다 주석 라인 전송)."""
+    seq = 0
+    try:
+        while not client.closed:
+            item = await client.get(timeout=heartbeat)
+            if item is None:
+                if client.closed:
+                    break
+                yield ": keep-alive\n\n"
+                continue
+            kind, event = item
+            seq += 1
+            data = json.dumps(MessageToDict(event, preserving_proto_field_name=True))
+            yield f"id: {seq}\nevent: {kind}\ndata: {data}\n\n"
+    finally:
+        hub.disconnect(client)
@@ -236,3 +236,88 @@ class DAGEdge(BaseModel):
     source: str = Field(..., description="소스 노드 ID")
     target: str = Field(..., description="타겟 노드 ID")
     model_config = {"extra": "forbid"}
+
+
+# --- DataNode <-> protobuf DataNode 변환 (HTTP application/x-protobuf 본문용) ---
+# MessageToDict/ParseDict 와 키 변환 없이 필드를 직접 복사한다.
+# data_format/params 는 protobuf 에서 map<string, string> 이므로 문자열이 아닌 값은 JSON 문자열로 저장된다.
+
+
+def _interval_to_proto(settings, target) -> None:
+    from qmtl.models.generated import qmtl_common_pb2
+
+    interval = settings.interval
+    name = interval.name if isinstance(interval, IntervalEnum) else IntervalEnum(interval).name
+    target.interval = qmtl_common_pb2.IntervalEnum.Value(name)
+    target.period = settings.period
+    if settings.max_history is not None:
+        target.max_history = settings.max_history
+
+
+def _interval_from_proto(settings) -> dict:
+    from qmtl.models.generated import qmtl_common_pb2
+
+    return {
+        "interval": IntervalEnum[qmtl_common_pb2.IntervalEnum.Name(settings.interval)],
+        "period": settings.period,
+        "max_history": settings.max_history if settings.HasField("max_history") else None,
+    }
+
+
+def _str_map(values: Optional[Dict[str, Any]]) -> Dict[str, str]:
+    import json
+
+    return {k: v if isinstance(v, str) else json.dumps(v) for k, v in (values or {}).items()}
+
+
+def datanode_to_proto(node):
+    """DataNode(Pydantic)를 protobuf DataNode 로 변환 (이미 protobuf 면 그대로 반환)"""
+    from qmtl.models.generated import qmtl_datanode_pb2
+
+    if isinstance(node, qmtl_datanode_pb2.DataNode):
+        return node
+    message = qmtl_datanode_pb2.DataNode(
+        node_id=node.node_id,
+        type=node.type.value if node.type else "",
+        data_format=_str_map(node.data_format),
+        params=_str_map(node.params),
+        dependencies=node.dependencies,
+    )
+    if node.ttl is not None:
+        message.ttl = node.ttl
+    if node.tags:
+        message.tags.predefined.extend(
+            getattr(tag, "value", tag) for tag in node.tags.predefined or []
+        )
+        message.tags.custom.extend(node.tags.custom or [])
+    if node.interval_settings:
+        _interval_to_proto(node.interval_settings, message.interval_settings)
+    if node.stream_settings:
+        for key, settings in node.stream_settings.intervals.items():
+            _interval_to_proto(
+                settings, message.stream_settings.intervals[getattr(key, "value", key)]
+            )
+    return message
+
+
+def datanode_from_proto(message) -> DataNode:
+    """protobuf DataNode 를 DataNode(Pydantic)로 변환"""
+    data: Dict[str, Any] = {
+        "node_id": message.node_id,
+        "type": message.type or None,
+        "data_format": dict(message.data_format),
+        "params": dict(message.params) or None,
+        "dependencies": list(message.dependencies),
+        "ttl": message.ttl if message.HasField("ttl") else None,
+        "tags": {"predefined": list(message.tags.predefined), "custom": list(message.tags.custom)},
+    }
+    if message.HasField("interval_settings"):
+        data["interval_settings"] = _interval_from_proto(message.interval_settings)
+    if message.stream_settings.intervals:
+        data["stream_settings"] = {
+            "intervals": {
+                key: _interval_from_proto(value)
+                for key, value in message.stream_settings.intervals.items()
+            }
+        }
+    return DataNode.model_validate(data)
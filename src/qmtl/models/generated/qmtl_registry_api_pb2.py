@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: qmtl_registry_api.proto
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+import qmtl_datanode_pb2 as qmtl__datanode__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x17qmtl_registry_api.proto\x12\x04qmtl\x1a\x13qmtl_datanode.proto\",\n\x0cNodeEnvelope\x12\x1c\n\x04node\x18\x01 \x01(\x0b\x32\x0e.qmtl.DataNode\"k\n\x10NodeBatchRequest\x12\x1d\n\x05nodes\x18\x01 \x03(\x0b\x32\x0e.qmtl.DataNode\x12 \n\x13strategy_version_id\x18\x02 \x01(\tH\x00\x88\x01\x01\x42\x16\n\x14_strategy_version_id\"S\n\x08NodeList\x12\x1d\n\x05nodes\x18\x01 \x03(\x0b\x32\x0e.qmtl.DataNode\x12\x18\n\x0bnext_cursor\x18\x02 \x01(\tH\x00\x88\x01\x01\x42\x0e\n\x0c_next_cursor\"\x15\n\x06IdList\x12\x0b\n\x03ids\x18\x01 \x03(\t\"q\n\tRefCounts\x12\x32\n\nref_counts\x18\x01 \x03(\x0b\x32\x1e.qmtl.RefCounts.RefCountsEntry\x1a\x30\n\x0eRefCountsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'qmtl_registry_api_pb2', _globals)
+if _descriptor._USE_C_DESCRIPTORS == False:
+  DESCRIPTOR._options = None
+  _globals['_REFCOUNTS_REFCOUNTSENTRY']._options = None
+  _globals['_REFCOUNTS_REFCOUNTSENTRY']._serialized_options = b'8\001'
+  _globals['_NODEENVELOPE']._serialized_start=54
+  _globals['_NODEENVELOPE']._serialized_end=98
+  _globals['_NODEBATCHREQUEST']._serialized_start=100
+  _globals['_NODEBATCHREQUEST']._serialized_end=207
+  _globals['_NODELIST']._serialized_start=209
+  _globals['_NODELIST']._serialized_end=292
+  _globals['_IDLIST']._serialized_start=294
+  _globals['_IDLIST']._serialized_end=315
+  _globals['_REFCOUNTS']._serialized_start=317
+  _globals['_REFCOUNTS']._serialized_end=430
+  _globals['_REFCOUNTS_REFCOUNTSENTRY']._serialized_start=382
+  _globals['_REFCOUNTS_REFCOUNTSENTRY']._serialized_end=430
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: qmtl_snapshot_delta.proto
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+import qmtl_datanode_pb2 as qmtl__datanode__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x19qmtl_snapshot_delta.proto\x12\x04qmtl\x1a\x13qmtl_datanode.proto\"\xa4\x02\n\x15StrategySnapshotDelta\x12\x13\n\x0bpipeline_id\x18\x01 \x01(\t\x12\x12\n\ncreated_at\x18\x02 \x01(\x03\x12\x15\n\rremoved_nodes\x18\x03 \x03(\t\x12\x13\n\x0b\x61\x64\x64\x65\x64_nodes\x18\x04 \x03(\t\x12$\n\rremoved_edges\x18\x05 \x03(\x0b\x32\r.qmtl.DAGEdge\x12\"\n\x0b\x61\x64\x64\x65\x64_edges\x18\x06 \x03(\x0b\x32\r.qmtl.DAGEdge\x12;\n\x08metadata\x18\x07 \x03(\x0b\x32).qmtl.StrategySnapshotDelta.MetadataEntry\x1a/\n\rMetadataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'qmtl_snapshot_delta_pb2', _globals)
+if _descriptor._USE_C_DESCRIPTORS == False:
+  DESCRIPTOR._options = None
+  _globals['_STRATEGYSNAPSHOTDELTA_METADATAENTRY']._options = None
+  _globals['_STRATEGYSNAPSHOTDELTA_METADATAENTRY']._serialized_options = b'8\001'
+  _globals['_STRATEGYSNAPSHOTDELTA']._serialized_start=57
+  _globals['_STRATEGYSNAPSHOTDELTA']._serialized_end=349
+  _globals['_STRATEGYSNAPSHOTDELTA_METADATAENTRY']._serialized_start=302
+  _globals['_STRATEGYSNAPSHOTDELTA_METADATAENTRY']._serialized_end=349
+# @@protoc_insertion_point(module_scope)
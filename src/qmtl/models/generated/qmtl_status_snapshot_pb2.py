@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: qmtl_status_snapshot.proto
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1aqmtl_status_snapshot.proto\x12\x04qmtl\"\xac\x01\n\x16PipelineStatusSnapshot\x12\x13\n\x0bpipeline_id\x18\x01 \x01(\t\x12\x0e\n\x06status\x18\x02 \x01(\t\x12\x10\n\x08progress\x18\x03 \x01(\x02\x12\x0f\n\x07version\x18\x04 \x01(\x04\x12\r\n\x05\x64\x65lta\x18\x05 \x01(\x08\x12\x10\n\x08node_ids\x18\x06 \x03(\t\x12\x10\n\x08statuses\x18\x07 \x01(\x0c\x12\x17\n\x0f\x63hanged_indices\x18\x08 \x03(\r*\xa5\x01\n\x0eNodeStatusCode\x12\x17\n\x13NODE_STATUS_UNKNOWN\x10\x00\x12\x17\n\x13NODE_STATUS_PENDING\x10\x01\x12\x15\n\x11NODE_STATUS_READY\x10\x02\x12\x17\n\x13NODE_STATUS_RUNNING\x10\x03\x12\x19\n\x15NODE_STATUS_COMPLETED\x10\x04\x12\x16\n\x12NODE_STATUS_FAILED\x10\x05\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'qmtl_status_snapshot_pb2', _globals)
+if _descriptor._USE_C_DESCRIPTORS == False:
+  DESCRIPTOR._options = None
+  _globals['_NODESTATUSCODE']._serialized_start=212
+  _globals['_NODESTATUSCODE']._serialized_end=377
+  _globals['_PIPELINESTATUSSNAPSHOT']._serialized_start=37
+  _globals['_PIPELINESTATUSSNAPSHOT']._serialized_end=209
+# @@protoc_insertion_point(module_scope)
@@ -1,6 +1,8 @@
 
 # Protobuf 기반 모델로 마이그레이션됨
-from qmtl.models.generated import qmtl_events_pb2
+from typing import Dict, List, Optional
+
+from qmtl.models.generated import qmtl_events_pb2, qmtl_status_snapshot_pb2
 
 # 예시: NodeStatusEvent, PipelineStatusEvent 등 protobuf 메시지 사용
 # 기존 Pydantic 모델은 모두 protobuf 메시지로 대체됨
@@ -28,4 +30,36 @@ def pipeline_status_to_proto(pipeline_id: str, status: str, timestamp: int, meta
             event.meta[k] = str(v)
     return event
 
-# 기타 필요한 변환 함수 및 protobuf 메시지 import를 여기에 추가
\ No newline at end of file
+# 기타 필요한 변환 함수 및 protobuf 메시지 import를 여기에 추가
+
+
+# 상태 문자열 <-> PipelineStatusSnapshot.statuses 바이트 코드 변환
+
+STATUS_TO_CODE = {
+    "PENDING": qmtl_status_snapshot_pb2.NODE_STATUS_PENDING,
+    "READY": qmtl_status_snapshot_pb2.NODE_STATUS_READY,
+    "RUNNING": qmtl_status_snapshot_pb2.NODE_STATUS_RUNNING,
+    "COMPLETED": qmtl_status_snapshot_pb2.NODE_STATUS_COMPLETED,
+    "FAILED": qmtl_status_snapshot_pb2.NODE_STATUS_FAILED,
+}
+CODE_TO_STATUS = {code: status for status, code in STATUS_TO_CODE.items()}
+
+
+def apply_status_snapshot(
+    snapshot: qmtl_status_snapshot_pb2.PipelineStatusSnapshot,
+    node_ids: Optional[List[str]] = None,
+    statuses: Optional[Dict[str, str]] = None,
+) -> Dict[str, str]:
+    """PipelineStatusSnapshot 을 node_id → status 문자열 dict 로 풀어낸다.
+
+    delta 스냅샷은 이전 full 스냅샷의 node_ids 와 statuses(dict)에 변경분을 반영한다.
+    """
+    if not snapshot.delta:
+        return {
+            node_id: CODE_TO_STATUS.get(code, "UNKNOWN")
+            for node_id, code in zip(snapshot.node_ids, snapshot.statuses)
+        }
+    merged = dict(statuses or {})
+    for idx, code in zip(snapshot.changed_indices, snapshot.statuses):
+        merged[node_ids[idx]] = CODE_TO_STATUS.get(code, "UNKNOWN")
+    return merged
@@ -41,15 +41,13 @@ class Analyzer(Pipeline):
         analyzer_results: List[AnalyzerResult] = []
         if self.query_nodes and local:
             for qn in self.query_nodes.values():
-                matched_nodes = self.find_nodes_by_query(qn)
                 # selectors 인자가 있으면 우선 적용, 없으면 쿼리노드의 result_selectors 적용
                 selectors_to_apply = None
                 if selectors and qn.name in selectors:
                     selectors_to_apply = selectors[qn.name]
                 elif hasattr(qn, "result_selectors") and qn.result_selectors:
                     selectors_to_apply = qn.result_selectors
-                if selectors_to_apply:
-                    matched_nodes = self.apply_selectors(matched_nodes, selectors_to_apply)
+                matched_nodes = self.resolve_query_node(qn, selectors_to_apply)
                 node_results = {}
                 for node in matched_nodes:
                     try:
@@ -11,6 +11,7 @@ from qmtl.sdk.models import QueryNodeResultSelector
 from qmtl.sdk.node import ProcessingNode, QueryNode
 from qmtl.sdk.visualization import visualize_pipeline
 from qmtl.sdk.models import IntervalSettings, IntervalEnum
+from qmtl.sdk.tag_index import TagIndex
 
 
 class Pipeline:
@@ -42,6 +43,10 @@ class Pipeline:
         self.execution_order = []  # 실행 순서 (위상 정렬 결과)
         self.results_cache = {}  # 실행 결과 캐시
         self.default_intervals = default_intervals or {}
+        self._tag_index = TagIndex()  # QueryNode 해석용 tag/interval/period 역색인
+        self._structure_version = 0  # add_node/add_query_node 시 증가 (쿼리 캐시 무효화 기준)
+        self._query_cache: Dict[Any, List[ProcessingNode]] = {}  # QueryNode 해석 결과 캐시
+        self._query_cache_token = None
 
     def _apply_default_intervals(self, node):
         """
@@ -121,9 +126,11 @@ class Pipeline:
 
         # 노드 등록
         self.nodes[node.name] = node
+        self._index_node(node)
 
-        # 실행 순서 무효화 (다시 계산 필요)
+        # 실행 순서/쿼리 캐시 무효화 (다시 계산 필요)
         self.execution_order = []
+        self._structure_version += 1
 
         return node
 
@@ -149,8 +156,9 @@ class Pipeline:
         # 쿼리 노드 등록
         self.query_nodes[node.name] = node
 
-        # 실행 순서 무효화 (다시 계산 필요)
+        # 실행 순서/쿼리 캐시 무효화 (다시 계산 필요)
         self.execution_order = []
+        self._structure_version += 1
 
         return node.name
 
@@ -310,16 +318,13 @@ class Pipeline:
         query_results = {}
         if self.query_nodes:
             for qname, qnode in self.query_nodes.items():
-                matched_nodes = self.find_nodes_by_query(qnode)
-                node_list = matched_nodes
                 # selectors 인자가 있으면 우선 적용, 없으면 쿼리노드의 result_selectors 적용
                 selectors_to_apply = None
                 if selectors and qname in selectors:
                     selectors_to_apply = selectors[qname]
                 elif hasattr(qnode, "result_selectors") and qnode.result_selectors:
                     selectors_to_apply = qnode.result_selectors
-                if selectors_to_apply:
-                    node_list = self.apply_selectors(node_list, selectors_to_apply)
+                node_list = self.resolve_query_node(qnode, selectors_to_apply)
                 node_results = {}
                 for node in node_list:
                     if hasattr(self, "results_cache") and node.name in self.results_cache:
@@ -556,84 +561,106 @@ class Pipeline:
         query_node_count = len(self.query_nodes)
         return f"Pipeline(name='{self.name}', nodes={node_count}, query_nodes={query_node_count})"
 
+    @staticmethod
+    def _node_query_values(node, field: str) -> Set[Any]:
+        """노드의 stream_settings(없으면 interval_settings)에서 interval/period 값 집합 추출"""
+        values = set()
+        if getattr(node, "stream_settings", None):
+            intervals = getattr(node.stream_settings, "intervals", {})
+            for interval_setting in intervals.values():
+                if hasattr(interval_setting, field):
+                    values.add(getattr(interval_setting, field))
+        # 하위 호환성을 위한 interval_settings 체크
+        elif isinstance(getattr(node, "interval_settings", None), dict):
+            interval_settings = node.interval_settings
+            if field in interval_settings:
+                values.add(interval_settings[field])
+            # 중첩된 딕셔너리 처리
+            else:
+                for setting in interval_settings.values():
+                    if isinstance(setting, dict) and field in setting:
+                        values.add(setting[field])
+        return values
+
+    def _index_node(self, node: ProcessingNode) -> None:
+        self._tag_index.add(
+            node.name,
+            tags=node.tags or [],
+            intervals=self._node_query_values(node, "interval"),
+            periods=self._node_query_values(node, "period"),
+        )
+
     def find_nodes_by_query(self, query_node: "QueryNode") -> List["ProcessingNode"]:
         """
         QueryNode의 조건(tags, interval, period)에 맞는 실제 노드 리스트 반환
-        AND 조건 기반 필터링
+        AND 조건 기반 필터링 (tag/interval/period 역색인 비트맵 교집합)
+        """
+        if len(self._tag_index) != len(self.nodes):
+            # add_node 를 거치지 않고 nodes 가 변경된 경우 색인 재구성
+            self._tag_index = TagIndex()
+            for node in self.nodes.values():
+                self._index_node(node)
+        names = self._tag_index.query(
+            tags=query_node.query_tags or [],
+            interval=query_node.interval,
+            period=query_node.period,
+        )
+        return [self.nodes[name] for name in names]
+
+    @staticmethod
+    def _freeze(value: Any) -> Any:
+        """캐시 key 용 hashable 변환 (dict/list 재귀)"""
+        if isinstance(value, dict):
+            return tuple(sorted((k, Pipeline._freeze(v)) for k, v in value.items()))
+        if isinstance(value, (list, tuple, set)):
+            return tuple(Pipeline._freeze(v) for v in value)
+        return value
+
+    def resolve_query_node(
+        self,
+        query_node: "QueryNode",
+        selectors: Optional[List["QueryNodeResultSelector"]] = None,
+    ) -> List["ProcessingNode"]:
         """
-        result = []
-        for node in self.nodes.values():
-            # 태그 필터 (AND)
-            if query_node.query_tags:
-                if not all(tag in (node.tags or []) for tag in query_node.query_tags):
-                    continue
-
-            # interval 필터
-            if query_node.interval:
-                node_interval = None
-                if hasattr(node, "stream_settings") and node.stream_settings:
-                    # 모든 interval을 순회하면서 일치하는 것이 있는지 확인
-                    intervals = getattr(node.stream_settings, "intervals", {})
-                    for interval_key, interval_setting in intervals.items():
-                        if (
-                            hasattr(interval_setting, "interval")
-                            and interval_setting.interval == query_node.interval
-                        ):
-                            node_interval = query_node.interval
-                            break
-                # 하위 호환성을 위한 interval_settings 체크
-                elif hasattr(node, "interval_settings") and node.interval_settings:
-                    interval_settings = node.interval_settings
-                    if isinstance(interval_settings, dict):
-                        if "interval" in interval_settings:
-                            node_interval = interval_settings["interval"]
-                        # 중첩된 딕셔너리 처리
-                        else:
-                            for key, setting in interval_settings.items():
-                                if (
-                                    isinstance(setting, dict)
-                                    and setting.get("interval") == query_node.interval
-                                ):
-                                    node_interval = query_node.interval
-                                    break
-
-                if node_interval != query_node.interval:
-                    continue
-
-            # period 필터
-            if query_node.period:
-                node_period = None
-                if hasattr(node, "stream_settings") and node.stream_settings:
-                    # 모든 interval을 순회하면서 일치하는 것이 있는지 확인
-                    intervals = getattr(node.stream_settings, "intervals", {})
-                    for interval_key, interval_setting in intervals.items():
-                        if (
-                            hasattr(interval_setting, "period")
-                            and interval_setting.period == query_node.period
-                        ):
-                            node_period = query_node.period
-                            break
-                # 하위 호환성을 위한 interval_settings 체크
-                elif hasattr(node, "interval_settings") and node.interval_settings:
-                    interval_settings = node.interval_settings
-                    if isinstance(interval_settings, dict):
-                        if "period" in interval_settings:
-                            node_period = interval_settings["period"]
-                        # 중첩된 딕셔너리 처리
-                        else:
-                            for key, setting in interval_settings.items():
-                                if (
-                                    isinstance(setting, dict)
-                                    and setting.get("period") == query_node.period
-                                ):
-                                    node_period = query_node.period
-                                    break
-
-                if node_period != query_node.period:
-                    continue
+        QueryNode 해석(find_nodes_by_query + selector 적용) 결과를 캐시하여 반환합니다.
 
-            result.append(node)
-        return result
+        캐시 key 는 (query tags, interval, period, selectors) 이며, 파이프라인 구조 버전
+        (add_node/add_query_node 시 증가)이 바뀌면 전체 캐시를 비웁니다.
+        random selector 가 포함된 경우 최종 결과는 캐시하지 않고 매번 새로 샘플링합니다.
+        """
+        token = (self._structure_version, len(self.nodes))
+        if self._query_cache_token != token:
+            self._query_cache.clear()
+            self._query_cache_token = token
+
+        base_key = (
+            tuple(query_node.query_tags or []),
+            query_node.interval,
+            query_node.period,
+        )
+        try:
+            matched = self._query_cache.get(base_key)
+        except TypeError:  # hash 불가능한 조건 값은 캐시하지 않음
+            base_key, matched = None, None
+        if matched is None:
+            matched = self.find_nodes_by_query(query_node)
+            if base_key is not None:
+                self._query_cache[base_key] = matched
+        if not selectors:
+            return list(matched)
+
+        if base_key is None or any(s.mode == "random" for s in selectors):
+            return self.apply_selectors(list(matched), selectors)
+        key = base_key + tuple(
+            (s.mode, s.batch_size, s.sample_size, self._freeze(s.filter_meta)) for s in selectors
+        )
+        try:
+            selected = self._query_cache.get(key)
+        except TypeError:
+            return self.apply_selectors(list(matched), selectors)
+        if selected is None:
+            selected = self._query_cache[key] = self.apply_selectors(list(matched), selectors)
+        return list(selected)
 
     def apply_selectors(
         self, nodes: List["ProcessingNode"], selectors: List["QueryNodeResultSelector"]
@@ -0,0 +1,118 @@
+"""
+태그 역색인 (tag/interval/period → 노드 비트맵)
+
+- 노드마다 정수 slot 을 할당하고, 태그/인터벌/피리어드별로 해당 slot 비트가 켜진 비트맵(int)을 유지
+- AND/OR 조건은 비트맵 교집합(&)/합집합(|)으로 평가하여 노드 전체 순회 없이 결과 산출
+- Pipeline.find_nodes_by_query, registry InMemoryNodeService.list_by_tags 에서 공용 사용
+"""
+
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+
+class TagIndex:
+    """tag/interval/period 별 노드 비트맵 역색인"""
+
+    def __init__(self):
+        self._slots: Dict[Hashable, int] = {}  # key -> bit 위치
+        self._keys: List[Optional[Hashable]] = []  # bit 위치 -> key
+        self._free: List[int] = []  # 삭제로 비워진 bit 위치 (재사용)
+        self._all = 0
+        self._tags: Dict[Any, int] = {}
+        self._intervals: Dict[Any, int] = {}
+        self._periods: Dict[Any, int] = {}
+        # key -> (tags, intervals, periods), 삭제 시 비트맵 갱신용
+        self._entries: Dict[Hashable, Tuple[frozenset, frozenset, frozenset]] = {}
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._slots
+
+    def add(
+        self,
+        key: Hashable,
+        tags: Iterable[Any] = (),
+        intervals: Iterable[Any] = (),
+        periods: Iterable[Any] = (),
+    ) -> None:
+        """노드를 색인에 추가 (이미 존재하면 기존 색인을 교체)"""
+        if key in self._slots:
+            self.remove(key)
+        if self._free:
+            slot = self._free.pop()
+            self._keys[slot] = key
+        else:
+            slot = len(self._keys)
+            self._keys.append(key)
+        self._slots[key] = slot
+        bit = 1 << slot
+        self._all |= bit
+        entry = (frozenset(tags), frozenset(intervals), frozenset(periods))
+        self._entries[key] = entry
+        for index, values in zip((self._tags, self._intervals, self._periods), entry):
+            for value in values:
+                index[value] = index.get(value, 0) | bit
+
+    def remove(self, key: Hashable) -> bool:
+        """노드를 색인에서 제거. 존재하지 않으면 False"""
+        slot = self._slots.pop(key, None)
+        if slot is None:
+            return False
+        mask = ~(1 << slot)
+        self._all &= mask
+        entry = self._entries.pop(key)
+        for index, values in zip((self._tags, self._intervals, self._periods), entry):
+            for value in values:
+                bits = index[value] & mask
+                if bits:
+                    index[value] = bits
+                else:
+                    del index[value]
+        self._keys[slot] = None
+        self._free.append(slot)
+        return True
+
+    def query(
+        self,
+        tags: Iterable[Any] = (),
+        interval: Any = None,
+        period: Any = None,
+        match_mode: str = "AND",
+    ) -> List[Hashable]:
+        """조건에 맞는 key 목록 반환 (slot 순서)
+
+        Args:
+            tags: 태그 목록 (비어 있으면 태그 조건 없음)
+            interval: 인터벌 값 (None/빈 값이면 조건 없음)
+            period: 피리어드 값 (None/빈 값이면 조건 없음)
+            match_mode: 태그 매칭 모드 ("AND" 또는 "OR")
+        """
+        bits = self._all
+        tags = list(tags)
+        if tags:
+            if match_mode == "AND":
+                for tag in tags:
+                    bits &= self._tags.get(tag, 0)
+                    if not bits:
+                        return []
+            else:
+                matched = 0
+                for tag in tags:
+                    matched |= self._tags.get(tag, 0)
+                bits &= matched
+        if interval:
+            bits &= self._intervals.get(interval, 0)
+        if period:
+            bits &= self._periods.get(period, 0)
+        return self._decode(bits)
+
+    def _decode(self, bits: int) -> List[Hashable]:
+        # 비트 단위 shift 반복은 O(n^2) 이므로 이진 문자열에서 '1' 위치를 찾는다
+        keys = []
+        digits = bin(bits)[:1:-1]
+        pos = digits.find("1")
+        while pos != -1:
+            keys.append(self._keys[pos])
+            pos = digits.find("1", pos + 1)
+        return keys
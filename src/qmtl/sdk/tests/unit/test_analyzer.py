@@ -99,3 +99,39 @@ def test_analyzer_execute_local():
     results = analyzer.execute(local=True)
     assert "qA" in results
     assert results["qA"]["n1"] == 10
+
+
+def test_analyzer_query_resolution_cache():
+    from unittest.mock import patch
+
+    from qmtl.sdk.models import QueryNodeResultSelector
+
+    def make(name, tags):
+        return ProcessingNode(
+            name=name,
+            fn=lambda: name,
+            tags=tags,
+            upstreams=["input"],
+            stream_settings=NodeStreamSettings(
+                intervals={"1d": IntervalSettings(interval="1d", period=1)}
+            ),
+        )
+
+    analyzer = Analyzer(name="cache-analyzer")
+    analyzer.add_node(make("n1", ["A"]))
+    analyzer.add_node(make("n2", ["A", "B"]))
+    qn = QueryNode(name="q1", tags=["A"])
+    batch = [QueryNodeResultSelector(mode="batch", batch_size=1)]
+    with patch.object(analyzer, "find_nodes_by_query", wraps=analyzer.find_nodes_by_query) as spy:
+        first = analyzer.resolve_query_node(qn, batch)
+        assert [n.name for n in analyzer.resolve_query_node(qn, batch)] == ["n1", "n2"]
+        assert analyzer.resolve_query_node(qn) == first
+        assert spy.call_count == 1
+        # random selector 는 결과를 캐시하지 않지만 기본 해석 결과는 재사용
+        rand = [QueryNodeResultSelector(mode="random", sample_size=1)]
+        assert len(analyzer.resolve_query_node(qn, rand)) == 1
+        assert spy.call_count == 1
+        # 구조 변경 시 캐시 무효화
+        analyzer.add_node(make("n3", ["A"]))
+        assert [n.name for n in analyzer.resolve_query_node(qn)] == ["n1", "n2", "n3"]
+        assert spy.call_count == 2
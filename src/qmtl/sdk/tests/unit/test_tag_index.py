@@ -0,0 +1,58 @@
+"""
+TagIndex(태그 역색인) 및 Pipeline QueryNode 해석 단위 테스트 (SDK)
+"""
+
+from qmtl.sdk.node import ProcessingNode, QueryNode
+from qmtl.sdk.models import NodeStreamSettings, IntervalSettings
+from qmtl.sdk.pipeline import Pipeline
+from qmtl.sdk.tag_index import TagIndex
+
+
+def test_tag_index_and_or_and_secondary_filters():
+    index = TagIndex()
+    index.add("n1", tags=["A", "B"], intervals=["1d"], periods=[1])
+    index.add("n2", tags=["A", "C"], intervals=["1h"], periods=[1])
+    index.add("n3", tags=["B", "C"], intervals=["1d"], periods=[7])
+    assert index.query(["A", "B"]) == ["n1"]
+    assert index.query(["A", "B"], match_mode="OR") == ["n1", "n2", "n3"]
+    assert index.query(["C"], interval="1d") == ["n3"]
+    assert index.query(period=1) == ["n1", "n2"]
+    assert index.query(["missing", "A"]) == []
+    assert index.query() == ["n1", "n2", "n3"]
+
+
+def test_tag_index_remove_and_replace():
+    index = TagIndex()
+    index.add("n1", tags=["A"])
+    index.add("n2", tags=["A", "B"])
+    assert index.remove("n1") is True
+    assert index.remove("n1") is False
+    assert index.query(["A"]) == ["n2"]
+    # 재색인 시 기존 태그는 제거됨
+    index.add("n2", tags=["C"])
+    assert index.query(["A"]) == [] and index.query(["C"]) == ["n2"]
+    # 비워진 slot 재사용
+    index.add("n3", tags=["C"])
+    assert len(index) == 2 and set(index.query(["C"])) == {"n2", "n3"}
+
+
+def test_pipeline_find_nodes_by_query_uses_index():
+    pipeline = Pipeline(name="p")
+    for i, (tags, interval, period) in enumerate(
+        [(["A", "B"], "1d", 1), (["A"], "1h", 1), (["A", "B"], "1h", 3)]
+    ):
+        pipeline.add_node(
+            ProcessingNode(
+                name=f"n{i}",
+                fn=lambda: i,
+                tags=tags,
+                upstreams=["input"],
+                stream_settings=NodeStreamSettings(
+                    intervals={interval: IntervalSettings(interval=interval, period=period)}
+                ),
+            )
+        )
+    qn = QueryNode(name="q", tags=["A", "B"], interval="1h")
+    assert [n.name for n in pipeline.find_nodes_by_query(qn)] == ["n2"]
+    qn = QueryNode(name="q", tags=["A"], period=1)
+    assert [n.name for n in pipeline.find_nodes_by_query(qn)] == ["n0", "n1"]
@@ -0,0 +1,96 @@
+import pytest
+
+from qmtl.dag_manager.execution.redis_status_service import RedisStatusService
+
+
+class DummyNode:
+    def __init__(self, node_id):
+        self.node_id = node_id
+
+
+@pytest.fixture
+def status_store(redis_session, redis_clean):
+    return RedisStatusService(redis_client=redis_session, ttl=60)
+
+
+def test_redis_status_shared_between_replicas(status_store, redis_session):
+    replica = RedisStatusService(redis_client=redis_session, ttl=60)
+    status_store.initialize_pipeline("p1", [DummyNode(f"n{i}") for i in range(4)], {"a": 1})
+
+    status_store.update_node_status("p1", "n0", "RUNNING")
+    replica.update_node_status("p1", "n0", "COMPLETED", {"v": 1})
+    replica.update_node_status("p1", "n1", "FAILED")
+    status_store.update_node_status("p1", "n2", "RUNNING")
+
+    pipeline = replica.get_pipeline_status("p1")
+    assert pipeline.params["a"] == "1"
+    assert pipeline.progress == pytest.approx(62.5)
+    node = status_store.get_node_status("p1", "n0")
+    assert node.status == "COMPLETED"
+    assert node.start_time and node.end_time
+    assert dict(node.result) == {"v": "1"}
+    assert len(replica.get_all_node_statuses("p1")) == 4
+
+    # 키 TTL 이 설정되어 스캔 없이 만료됨
+    assert 0 < redis_session.ttl(status_store._key("p1", "nodes")) <= 60
+
+
+def test_redis_status_change_stream(status_store):
+    status_store.initialize_pipeline("p2", [DummyNode("n0")])
+    status_store.update_node_status("p2", "n0", "RUNNING")
+    status_store.update_pipeline_status("p2", "COMPLETED")
+
+    changes = status_store.read_changes("p2")
+    assert [c[1]["type"] for c in changes] == ["pipeline", "node", "pipeline"]
+    assert changes[1][1]["node_id"] == "n0"
+    # 마지막 id 이후로 이어 읽기
+    assert status_store.read_changes("p2", last_id=changes[-1][0]) == []
+
+
+def test_redis_status_invalid_ids(status_store):
+    status_store.initialize_pipeline("p3", [DummyNode("n0")])
+    with pytest.raises(ValueError):
+        status_store.update_node_status("p3", "missing", "RUNNING")
+    with pytest.raises(ValueError):
+        status_store.update_node_status("missing", "n0", "RUNNING")
+    with pytest.raises(ValueError):
+        status_store.update_pipeline_status("missing", "RUNNING")
+    status_store.cleanup_pipeline("p3")
+    assert status_store.get_pipeline_status("p3") is None
+
+
+def _interleave(store, method, other_update):
+    """store 가 blob 을 읽은 직후 다른 replica 의 갱신이 끼어들도록 한다."""
+    original = getattr(store.redis, method)
+    pending = [other_update]
+
+    def read(*args):
+        value = original(*args)
+        if pending:
+            pending.pop()()
+        return value
+
+    setattr(store.redis, method, read)
+
+
+def test_redis_status_concurrent_updates_are_merged(status_store, redis_session):
+    replica = RedisStatusService(redis_client=redis_session, ttl=60)
+    status_store.initialize_pipeline("p4", [DummyNode("n0"), DummyNode("n1")])
+
+    _interleave(
+        status_store, "hget", lambda: replica.update_node_status("p4", "n0", "RUNNING", {"a": 1})
+    )
+    status_store.update_node_status("p4", "n0", "COMPLETED", {"b": 2})
+    node = replica.get_node_status("p4", "n0")
+    assert node.status == "COMPLETED"
+    assert node.start_time and node.end_time
+    assert dict(node.result) == {"a": "1", "b": "2"}
+    assert replica.get_pipeline_status("p4").progress == pytest.approx(50.0)
+
+    _interleave(
+        status_store, "get", lambda: replica.update_pipeline_status("p4", "RUNNING", {"c": 3})
+    )
+    status_store.update_pipeline_status("p4", "COMPLETED", {"d": 4})
+    pipeline = replica.get_pipeline_status("p4")
+    assert pipeline.status == "COMPLETED"
+    assert dict(pipeline.result) == {"c": "3", "d": "4"}
@@ -0,0 +1,91 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from qmtl.dag_manager.registry import api
+from qmtl.dag_manager.registry.services.node.memory_impl import InMemoryNodeService
+from qmtl.models.datanode import DataNode, IntervalSettings
+from qmtl.sdk.models import IntervalEnum
+
+
+class DummyRedis:
+    """큐 테스트용 in-memory Redis (list/hash 연산만, blocking 없음)"""
+
+    def __init__(self):
+        self._data = {}
+        self._hash = {}
+
+    # list operations ---------------------------------------------------
+    def lpush(self, key, value):
+        self._data.setdefault(key, []).insert(0, value)
+
+    def rpoplpush(self, src, dest):
+        lst = self._data.get(src, [])
+        if not lst:
+            return None
+        value = lst.pop()  # FIFO pop (right)
+        self._data.setdefault(dest, []).insert(0, value)
+        return value
+
+    def brpoplpush(self, src, dest, timeout=0):  # noqa: D401 unused timeout
+        return self.rpoplpush(src, dest)
+
+    def lrem(self, key, num, value):
+        if key not in self._data:
+            return 0
+        lst = self._data[key]
+        removed = 0
+        new_lst = []
+        for v in lst:
+            if v == value and (num == 0 or removed < abs(num)):
+                removed += 1
+            else:
+                new_lst.append(v)
+        self._data[key] = new_lst
+        return removed
+
+    # hash operations ---------------------------------------------------
+    def hset(self, key, field, value):
+        self._hash.setdefault(key, {})[field] = value
+
+    def hget(self, key, field):
+        return self._hash.get(key, {}).get(field)
+
+    def expire(self, key, ttl):
+        # expiration not simulated
+        pass
+
+    # util for tests ----------------------------------------------------
+    def list_contents(self, key):
+        return list(self._data.get(key, []))
+
+
+@pytest.fixture
+def dummy_redis():
+    return DummyRedis()
+
+
+def _node(i):
+    return DataNode(
+        node_id=f"{i:032x}",
+        type="RAW",
+        data_format={"fields": "close"},
+        interval_settings=IntervalSettings(interval=IntervalEnum.MINUTE, period=1),
+    )
+
+
+@pytest.fixture
+def make_node():
+    """i 번째 테스트용 RAW DataNode 를 만드는 factory (node_id 는 i 의 32자리 hex)"""
+    return _node
+
+
+@pytest.fixture
+def registry():
+    """registry API 의 노드/메타데이터 서비스를 InMemoryNodeService 로 교체"""
+    service = InMemoryNodeService()
+    metadata_service = api.MetadataService(service, MagicMock(), MagicMock())
+    api.app.dependency_overrides[api.get_node_service] = lambda: service
+    api.app.dependency_overrides[api.get_metadata_service] = lambda: metadata_service
+    yield service
+    api.app.dependency_overrides.clear()
@@ -0,0 +1,122 @@
+import asyncio
+
+import httpx
+import pytest
+
+from qmtl.dag_manager.registry import api
+from qmtl.dag_manager.registry.async_registry_client import AsyncRegistryClient, MicroBatcher
+from qmtl.sdk.models import IntervalEnum
+
+
+def _client(requests, **kwargs):
+    """ASGI 앱으로 요청을 보내며 요청 경로를 requests 에 기록하는 클라이언트"""
+    client = AsyncRegistryClient("http://testserver", **kwargs)
+
+    async def record(request):
+        requests.append(request.url.path)
+
+    client.client = httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=api.app),
+        headers=dict(client.client.headers),
+        event_hooks={"request": [record]},
+    )
+    return client
+
+
+@pytest.mark.parametrize("use_protobuf", [False, True])
+def test_concurrent_calls_are_coalesced(registry, use_protobuf, make_node):
+    nodes = [make_node(i) for i in range(20)]
+
+    async def scenario():
+        requests = []
+        async with _client(requests, use_protobuf=use_protobuf) as client:
+            ids = await asyncio.gather(*(client.register_node(n) for n in nodes))
+            assert ids == [n.node_id for n in nodes]
+            assert requests == ["/v1/registry/nodes:batch"]
+
+            requests.clear()
+            node_ids = [n.node_id for n in nodes] + ["missing"]
+            # 같은 노드를 중복 요청해도 한 번만 전송
+            fetched = await asyncio.gather(*(client.get_node(i) for i in node_ids + node_ids))
+            assert requests == ["/v1/registry/nodes:batch-get"]
+            assert [n.node_id for n in fetched[:20]] == [n.node_id for n in nodes]
+            assert fetched[20] is None
+            assert fetched[0].interval_settings.interval == IntervalEnum.MINUTE
+
+            registry.add_contains_relationship("s1", nodes[0].node_id)
+            requests.clear()
+            counts = await asyncio.gather(
+                client.get_node_ref_count(nodes[0].node_id),
+                client.get_node_ref_count(nodes[1].node_id),
+            )
+            assert counts == [1, 0]
+            assert requests == ["/v1/registry/nodes:ref-counts"]
+
+    asyncio.run(scenario())
+
+
+def test_max_batch_size_splits_requests(registry, make_node):
+    nodes = [make_node(i) for i in range(5)]
+
+    async def scenario():
+        requests = []
+        async with _client(requests, max_batch_size=2) as client:
+            assert await client.register_nodes(nodes) == [n.node_id for n in nodes]
+            assert len(requests) == 3
+            requests.clear()
+            assert len(await client.get_nodes([n.node_id for n in nodes])) == 5
+            assert requests == ["/v1/registry/nodes:batch-get"] * 3
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.parametrize("accept", ["application/json", "application/x-protobuf"])
+def test_get_strategy_nodes_follows_next_cursor(registry, accept, make_node):
+    # 서버 페이지 크기보다 많은 노드 → next_cursor 로 이어 받아 전체 반환
+    nodes = [make_node(i) for i in range(1200)]
+    for node in nodes:
+        registry.create_node(node)
+        registry.add_contains_relationship("s1", node.node_id)
+
+    async def scenario():
+        requests = []
+        async with _client(requests) as client:
+            client.client.headers["Accept"] = accept
+            result = await client.get_strategy_nodes("s1")
+            assert [n.node_id for n in result] == [n.node_id for n in nodes]
+            assert requests == ["/v1/registry/strategies/s1/nodes"] * 2
+
+    asyncio.run(scenario())
+
+
+def test_batch_get_rejects_oversized_request(registry):
+    from fastapi.testclient import TestClient
+
+    http = TestClient(api.app)
+    response = http.post(
+        "/v1/registry/nodes:batch-get",
+        json={"node_ids": [str(i) for i in range(api.MAX_PAGE_SIZE + 1)]},
+    )
+    assert response.status_code == 422
+
+
+def test_micro_batcher_propagates_errors():
+    calls = []
+
+    async def fetch_many(keys):
+        calls.append(keys)
+        raise RuntimeError("boom")
+
+    async def scenario():
+        batcher = MicroBatcher(fetch_many, window_sec=0.001)
+        results = await asyncio.gather(
+            batcher.load("a"), batcher.load("a"), batcher.load("b"), return_exceptions=True
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert calls == [["a", "b"]]
+        # 실패한 key 는 다시 요청할 수 있다
+        with pytest.raises(RuntimeError):
+            await batcher.load("a")
+        assert calls[-1] == ["a"]
+
+    asyncio.run(scenario())
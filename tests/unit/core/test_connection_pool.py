@@ -0,0 +1,139 @@
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from qmtl.common.db import connection_pool
+from qmtl.common.db.connection_pool import Neo4jConnectionPool
+from qmtl.common.errors.exceptions import DatabaseError
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    driver_factory = MagicMock()
+    monkeypatch.setattr(connection_pool.GraphDatabase, "driver", driver_factory)
+    monkeypatch.setattr(Neo4jConnectionPool, "_instance", None)
+    pool = Neo4jConnectionPool(
+        uri="bolt://neo4j:7687", username="u", password="p", max_size=2, acquire_timeout=0.05
+    )
+    pool.driver_factory = driver_factory
+    yield pool
+    pool.close_all()
+
+
+def test_pool_shares_single_driver_and_client(pool):
+    client = pool.get_client()
+    assert pool.get_client() is client
+    with pool.client() as leased:
+        assert leased is client
+    pool.get_driver()
+    assert pool.driver_factory.call_count == 1
+    _, kwargs = pool.driver_factory.call_args
+    assert kwargs["max_connection_pool_size"] == 100
+    assert kwargs["liveness_check_timeout"] == 30.0
+    # 공유 드라이버는 클라이언트 close 로 닫히지 않음
+    client.close()
+    pool.get_driver().close.assert_not_called()
+
+
+def test_pool_leases_sessions_and_records_metrics(pool):
+    driver = pool.get_driver()
+    session = driver.session.return_value.__enter__.return_value
+    session.run.return_value = [MagicMock(data=lambda: {"x": 1})]
+    assert pool.get_client().execute_query("RETURN 1 AS x", database="neo4j") == [{"x": 1}]
+    driver.session.assert_called_with(database="neo4j")
+
+    release = threading.Event()
+    entered = threading.Barrier(3)
+
+    def hold():
+        with pool.session():
+            entered.wait()
+            release.wait()
+
+    threads = [threading.Thread(target=hold) for _ in range(2)]
+    for t in threads:
+        t.start()
+    entered.wait()
+    assert pool.get_metrics()["active_sessions"] == 2
+    # max_size 초과 시 acquire_timeout 후 실패
+    with pytest.raises(DatabaseError):
+        with pool.session():
+            pass
+    release.set()
+    for t in threads:
+        t.join()
+
+    metrics = pool.get_metrics()
+    assert metrics["active_sessions"] == 0
+    assert metrics["peak_active_sessions"] == 2
+    assert metrics["acquired_total"] == 3
+    assert metrics["acquire_timeouts"] == 1
+
+
+def test_client_read_write_use_managed_transactions_and_routing(pool):
+    from neo4j import READ_ACCESS, WRITE_ACCESS
+
+    driver = pool.get_driver()
+    session = driver.session.return_value.__enter__.return_value
+    session.execute_read.side_effect = lambda work: work(tx)
+    session.execute_write.side_effect = lambda work: work(tx)
+    tx = MagicMock()
+    tx.run.return_value = [MagicMock(data=lambda: {"n": 1})]
+    client = pool.get_client()
+
+    assert client.execute_read("MATCH (n) RETURN n", database="neo4j") == [{"n": 1}]
+    assert driver.session.call_args.kwargs["default_access_mode"] == READ_ACCESS
+    assert client.execute_write("CREATE (n)") == [{"n": 1}]
+    assert driver.session.call_args.kwargs["default_access_mode"] == WRITE_ACCESS
+    session.run.assert_not_called()
+
+
+def test_client_stream_read_is_lazy(pool):
+    driver = pool.get_driver()
+    session = driver.session.return_value.__enter__.return_value
+    tx = session.begin_transaction.return_value.__enter__.return_value
+    tx.run.return_value = (MagicMock(data=lambda i=i: {"i": i}) for i in range(3))
+
+    stream = pool.get_client().stream_read("MATCH (n) RETURN n", fetch_size=2)
+    driver.session.assert_not_called()
+    assert next(stream) == {"i": 0}
+    assert driver.session.call_args.kwargs["fetch_size"] == 2
+    assert pool.get_metrics()["active_sessions"] == 1
+    assert pool.get_metrics()["active_stream_sessions"] == 1
+    assert list(stream) == [{"i": 1}, {"i": 2}]
+    assert pool.get_metrics()["active_sessions"] == 0
+
+
+def test_stream_sessions_have_separate_bound(monkeypatch):
+    monkeypatch.setattr(connection_pool.GraphDatabase, "driver", MagicMock())
+    monkeypatch.setattr(Neo4jConnectionPool, "_instance", None)
+    pool = Neo4jConnectionPool(uri="bolt://neo4j:7687", username="u", password="p")
+    # 세션 한도는 기본적으로 드라이버 커넥션 풀 크기와 같음
+    assert pool.get_metrics()["max_sessions"] == 100
+    pool = Neo4jConnectionPool(
+        uri="bolt://neo4j:7687", username="u", password="p", max_size=3, acquire_timeout=0.05
+    )
+    assert pool.get_metrics()["max_stream_sessions"] == 1
+
+    with pool.session(stream=True):
+        assert pool.get_metrics()["active_stream_sessions"] == 1
+        # 스트리밍 한도 초과는 실패하지만 일반 쿼리 세션은 계속 임대 가능
+        with pytest.raises(DatabaseError):
+            with pool.session(stream=True):
+                pass
+        with pool.session(), pool.session():
+            assert pool.get_metrics()["active_sessions"] == 3
+    assert pool.get_metrics()["active_stream_sessions"] == 0
+    pool.close_all()
+
+
+def test_reinitialize_closes_previous_drivers(pool):
+    driver = pool.get_driver()
+    Neo4jConnectionPool(uri="bolt://other:7687", username="u", password="p")
+    driver.close.assert_called_once()
+    assert pool.get_metrics()["drivers"] == 0
+    # 인자 없는 재생성은 기존 설정 유지
+    pool.get_driver()
+    Neo4jConnectionPool()
+    assert pool.get_metrics()["drivers"] == 1
@@ -1,64 +1,94 @@
 # tests/unit/core/test_event_client.py
+import asyncio
+import threading
+import time
+
+import fakeredis
 import pytest
-from unittest.mock import MagicMock, patch
-from qmtl.dag_manager.event_client import EventClient
+from unittest.mock import MagicMock
+
+from qmtl.dag_manager.event_client import AsyncEventDispatcher, EventClient, EventDispatcher
+from qmtl.models.generated.qmtl_events_pb2 import AlertEvent, NodeStatusEvent, PipelineStatusEvent
 
-@pytest.fixture
-def mock_redis_pubsub():
-    class DummyPubSub:
-        def subscribe(self, **kwargs):
-            self.subscribed = True
-        def run_in_thread(self, sleep_time=0.1):
-            self.running = True
-    return DummyPubSub()
 
 @pytest.fixture
-def mock_redis(monkeypatch, mock_redis_pubsub):
-    class DummyRedis:
-        def pubsub(self):
-            return mock_redis_pubsub
-    monkeypatch.setattr("redis.from_url", lambda *a, **k: DummyRedis())
-    return DummyRedis()
-
-def test_event_client_subscribe_node_status(mock_redis):
-    client = EventClient()
-    callback = MagicMock()
-    client.subscribe_node_status("n1", callback)
-    # smoke: no exception, pubsub.subscribe called
-    assert hasattr(client.pubsub, "subscribed")
-
-@patch("qmtl.dag_manager.event_client.redis")
-@patch("qmtl.dag_manager.event_client.qmtl_events_pb2")
-def test_event_client_subscribe_node_status(mock_pb2, mock_redis):
-    # Redis와 protobuf 메시지 mocking
-    pubsub = MagicMock()
-    mock_redis.from_url.return_value.pubsub.return_value = pubsub
-    client = EventClient("redis://test")
-    callback = MagicMock()
-    # 구독 메서드 호출
-    client.subscribe_node_status("node1", callback)
-    # pubsub.subscribe가 올바르게 호출되었는지 확인
-    assert pubsub.subscribe.called
-    # 콜백 함수가 정상적으로 등록되는지 확인
-    args, kwargs = pubsub.subscribe.call_args
-    assert "event:node:node1" in kwargs
-    # 메시지 수신 시 protobuf 파싱 및 콜백 호출 확인
-    proto_cb = kwargs["event:node:node1"]
-    msg = {"type": "message", "data": b"dummy"}
-    event_obj = MagicMock()
-    mock_pb2.NodeStatusEvent.return_value = event_obj
-    proto_cb(msg)
-    event_obj.ParseFromString.assert_called_once_with(b"dummy")
-    callback.assert_called_once_with(event_obj)
-
-def test_event_client_subscribe_pipeline_status(mock_redis):
+def fake_redis(monkeypatch):
+    server = fakeredis.FakeServer()
+    monkeypatch.setattr("redis.from_url", lambda *a, **k: fakeredis.FakeRedis(server=server))
+    monkeypatch.setattr(
+        "redis.asyncio.from_url", lambda *a, **k: fakeredis.aioredis.FakeRedis(server=server)
+    )
+    yield fakeredis.FakeRedis(server=server)
+    for dispatcher in EventDispatcher._instances.values():
+        dispatcher.close()
+    EventDispatcher._instances.clear()
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.time() + timeout
+    while not predicate() and time.time() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+def test_event_client_single_dispatcher_thread(fake_redis):
+    threads_before = threading.active_count()
     client = EventClient()
-    callback = MagicMock()
-    client.subscribe_pipeline_status("p1", callback)
-    assert hasattr(client.pubsub, "subscribed")
+    received = {}
+    for i in range(100):
+        client.subscribe_node_status(f"n{i}", lambda e, i=i: received.setdefault(i, e))
+    client.subscribe_pipeline_status("p1", lambda e: received.setdefault("p1", e))
+    # 같은 redis_url 의 EventClient 는 dispatcher 를 공유
+    assert EventClient().dispatcher is client.dispatcher
+    assert threading.active_count() - threads_before == 1
+
+    node_event = NodeStatusEvent(node_id="n7", status="RUNNING")
+    fake_redis.publish("event:node:n7", node_event.SerializeToString())
+    pipeline_event = PipelineStatusEvent(pipeline_id="p1")
+    fake_redis.publish("event:pipeline:p1", pipeline_event.SerializeToString())
+    assert _wait_for(lambda: 7 in received and "p1" in received)
+    assert received[7].status == "RUNNING"
+    assert isinstance(received["p1"], PipelineStatusEvent)
 
-def test_event_client_subscribe_alerts(mock_redis):
+
+def test_event_client_decodes_once_and_unsubscribes(fake_redis):
     client = EventClient()
-    callback = MagicMock()
-    client.subscribe_alerts("target1", callback)
-    assert hasattr(client.pubsub, "subscribed")
+    first, second = MagicMock(), MagicMock()
+    handle = client.subscribe_alerts("t1", first)
+    client.subscribe_alerts("t1", second)
+    alert = AlertEvent(target_id="t1", message="hi")
+    fake_redis.publish("event:alert:t1", alert.SerializeToString())
+    assert _wait_for(lambda: second.called)
+    # 두 callback 이 같은 이벤트 객체를 받는다 (디코딩 1회)
+    assert first.call_args[0][0] is second.call_args[0][0]
+
+    assert client.unsubscribe(handle)
+    assert not client.unsubscribe(handle)
+    fake_redis.publish("event:alert:t1", AlertEvent(target_id="t1").SerializeToString())
+    assert _wait_for(lambda: second.call_count == 2)
+    assert first.call_count == 1
+
+
+def test_event_client_rejects_unknown_channel(fake_redis):
+    with pytest.raises(ValueError):
+        EventClient().dispatcher.subscribe("other:channel", print)
+
+
+def test_async_event_dispatcher(fake_redis):
+    async def scenario():
+        received = []
+
+        async def on_event(event):
+            received.append(event.node_id)
+
+        async with AsyncEventDispatcher() as dispatcher:
+            await dispatcher.subscribe("event:node:n1", on_event)
+            await dispatcher.subscribe("event:node:n1", lambda e: received.append("sync"))
+            fake_redis.publish("event:node:n1", NodeStatusEvent(node_id="n1").SerializeToString())
+            for _ in range(100):
+                if len(received) == 2:
+                    break
+                await asyncio.sleep(0.01)
+        return received
+
+    assert asyncio.run(scenario()) == ["n1", "sync"]
@@ -0,0 +1,113 @@
+from contextlib import contextmanager
+from unittest.mock import MagicMock
+
+import pytest
+
+from qmtl.common.errors.exceptions import DatabaseError
+from qmtl.dag_manager.registry.services.gc import service as gc_service
+from qmtl.dag_manager.registry.services.gc.service import Neo4jGCService
+
+
+class FakeTx:
+    def __init__(self, graph):
+        self.graph = graph
+
+    def run(self, query, params):
+        result = MagicMock()
+        if "RETURN n.node_id AS node_id" in query:
+            kind = "ttl" if "expires_at" in query else "zero_dep"
+            ids = self.graph[kind][: params["limit"]]
+            self.graph["selected"].append(len(ids))
+            return [{"node_id": node_id} for node_id in ids]
+        if "dependent_count - released" in query:
+            # 삭제되는 노드에만 의존되던 노드가 dependent_count = 0 이 됨
+            for node_id in params["ids"]:
+                self.graph["zero_dep"].extend(self.graph["freed_by"].pop(node_id, []))
+        if "DETACH DELETE" in query:
+            for kind in ("ttl", "zero_dep"):
+                self.graph[kind] = [i for i in self.graph[kind] if i not in params["ids"]]
+        self.graph["queries"].append(query)
+        return result
+
+
+class FakeClient:
+    def __init__(self, graph):
+        self.graph = graph
+
+    def execute_transaction(self, work, database=None):
+        return work(FakeTx(self.graph))
+
+
+@pytest.fixture
+def graph(monkeypatch):
+    graph = {
+        "ttl": [f"t{i}" for i in range(25)],
+        "zero_dep": ["z0"],
+        "freed_by": {},
+        "selected": [],
+        "queries": [],
+    }
+    pool = MagicMock()
+
+    @contextmanager
+    def client():
+        yield FakeClient(graph)
+
+    pool.client = client
+    monkeypatch.setattr(gc_service, "get_neo4j_pool", lambda: pool)
+    return graph
+
+
+def test_gc_deletes_in_bounded_batches(graph):
+    gc = Neo4jGCService(batch_size=10, pause_sec=0)
+    status = gc.run_gc()
+    assert status["ttl_deleted"] == 25 and status["zero_dep_deleted"] == 1
+    # 25 TTL 노드 → 10/10/5 배치, zero-deps 1 배치 (각 phase 는 빈 선택으로 종료)
+    assert graph["selected"] == [10, 10, 5, 0, 1, 0]
+    assert any("dependent_count - released" in q for q in graph["queries"])
+    metrics = gc.get_metrics()
+    assert metrics["batches"] == 4
+    assert metrics["ttl_deleted_total"] == 25
+    assert metrics["progress"]["running"] is False
+
+
+def test_gc_throttles_slow_batches(graph):
+    gc = Neo4jGCService(batch_size=8, min_batch_size=2, max_batch_ms=-1, pause_sec=0)
+    gc.collect_ttl_expired()
+    # 매 배치가 예산을 초과하므로 8 → 4 → 2 로 줄어든 뒤 최소 크기 유지
+    assert graph["selected"][:4] == [8, 4, 2, 2]
+    assert gc.get_metrics()["throttled_batches"] >= 3
+
+
+def test_gc_max_batches_per_run(graph):
+    gc = Neo4jGCService(batch_size=10, pause_sec=0, max_batches_per_run=1)
+    assert gc.collect_ttl_expired() == 10
+    assert len(graph["ttl"]) == 15
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 10])
+def test_gc_zero_deps_cascade_is_independent_of_batch_size(graph, batch_size):
+    # z0 → z1 → z2 → z3 체인과 독립 노드 y0: 한 실행에서 전부 수거
+    graph["ttl"] = []
+    graph["zero_dep"] = ["z0", "y0"]
+    graph["freed_by"] = {"z0": ["z1"], "z1": ["z2"], "z2": ["z3"]}
+    gc = Neo4jGCService(batch_size=batch_size, pause_sec=0)
+    assert gc.run_gc()["zero_dep_deleted"] == 5
+    assert graph["zero_dep"] == []
+
+
+def test_gc_batch_failure_is_logged_and_counted(graph, caplog):
+    pool = gc_service.get_neo4j_pool()
+
+    @contextmanager
+    def failing_client():
+        client = MagicMock()
+        client.execute_transaction.side_effect = DatabaseError("deadlock")
+        yield client
+
+    pool.client = failing_client
+    gc = Neo4jGCService(batch_size=10, pause_sec=0)
+    with caplog.at_level("ERROR", logger=gc_service.__name__):
+        assert gc.run_gc()["ttl_deleted"] == 0
+    assert gc.get_metrics()["failed_batches"] == 2
+    assert "GC ttl 배치 삭제 실패" in caplog.text
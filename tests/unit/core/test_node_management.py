@@ -52,7 +52,7 @@ def test_get_node_success():
             "stream_settings": stream_settings,
         }
     }
-    mock_client.execute_query.return_value = [node_data]
+    mock_client.execute_read.return_value = [node_data]
     service = Neo4jNodeManagementService(neo4j_client=mock_client)
     with patch.object(DataNode, "model_validate", wraps=DataNode.model_validate) as mock_validate:
         service.get_node("a" * 32)
@@ -61,7 +61,7 @@ def test_get_node_success():
 
 def test_get_node_not_found():
     mock_client = MagicMock()
-    mock_client.execute_query.return_value = []
+    mock_client.execute_read.return_value = []
     service = Neo4jNodeManagementService(neo4j_client=mock_client)
     assert service.get_node("n1") is None
 
@@ -80,14 +80,14 @@ def test_delete_node_not_found():
     assert service.delete_node("n1") is False
 
 
-def test_list_nodes_success():
+def test_list_nodes_success(monkeypatch):
     mock_client = MagicMock()
-    mock_client.execute_query.return_value = [{"n": {}}]
+    mock_client.stream_read.return_value = iter([{"n": {}}])
     service = Neo4jNodeManagementService(neo4j_client=mock_client)
     # DataNode.model_validate를 모킹
     import qmtl.models.datanode
 
-    qmtl.models.datanode.DataNode = MagicMock()
+    monkeypatch.setattr(qmtl.models.datanode, "DataNode", MagicMock())
     assert isinstance(service.list_nodes(), list)
 
 
@@ -97,7 +97,7 @@ def test_get_strategy_dag(monkeypatch):
         MagicMock(node_id="n1", dependencies=[]),
         MagicMock(node_id="n2", dependencies=["n1"]),
     ]
-    monkeypatch.setattr(service, "get_strategy_nodes", lambda x: dummy_nodes)
+    monkeypatch.setattr(service, "get_strategy_graph", lambda x: dummy_nodes)
     node_map, topo_result = service.get_strategy_dag("dummy_strategy")
     assert set(node_map.keys()) == {"n1", "n2"}
     assert "n1" in topo_result.order and "n2" in topo_result.order
@@ -109,7 +109,7 @@ def test_get_ready_nodes(monkeypatch):
         MagicMock(node_id="n1", dependencies=[]),
         MagicMock(node_id="n2", dependencies=["n1"]),
     ]
-    monkeypatch.setattr(service, "get_strategy_nodes", lambda x: dummy_nodes)
+    monkeypatch.setattr(service, "get_strategy_graph", lambda x: dummy_nodes)
     node_status_map = {"n1": "READY", "n2": "PENDING"}
     ready_nodes = service.get_ready_nodes("dummy_strategy", node_status_map)
     assert any(n.node_id == "n1" for n in ready_nodes)
@@ -124,3 +124,331 @@ def test_enqueue_ready_nodes():
     queue_repo.push.assert_called_with("n1")
     status_service.update_node_status.assert_called_with("n1", "READY")
     assert result == ready_nodes
+
+
+def test_create_nodes_bulk_single_transaction():
+    mock_client = MagicMock()
+    service = Neo4jNodeManagementService(neo4j_client=mock_client)
+    service.BULK_BATCH_SIZE = 2
+    interval = IntervalSettings(interval=IntervalEnum.MINUTE, period=1)
+
+    def make(node_id, deps=()):
+        return DataNode(
+            node_id=node_id,
+            type="RAW",
+            data_format={},
+            dependencies=list(deps),
+            interval_settings=interval,
+        )
+
+    nodes = [
+        make("a" * 32),
+        make("b" * 32, ["a" * 32]),
+        make("c" * 32, ["a" * 32, "b" * 32]),
+        make("a" * 32),
+    ]
+    node_ids = service.create_nodes_bulk(nodes, strategy_version_id="v1")
+    assert node_ids == ["a" * 32, "b" * 32, "c" * 32]
+    # 사전 존재 조회 없이 트랜잭션 1회로 처리
+    mock_client.execute_query.assert_not_called()
+    assert mock_client.execute_transaction.call_count == 1
+
+    tx = MagicMock()
+    work = mock_client.execute_transaction.call_args[0][0]
+    work(tx)
+    queries = [(call.args[0], call.args[1]) for call in tx.run.call_args_list]
+    # rows 2+1, edges 2+1, contains 2+1 (batch size 2)
+    assert len(queries) == 6
+    assert all("UNWIND" in q for q, _ in queries)
+    assert "MERGE (n:DataNode" in queries[0][0]
+    assert [r["node_id"] for r in queries[0][1]["rows"]] == ["a" * 32, "b" * 32]
+    edges = queries[2][1]["edges"] + queries[3][1]["edges"]
+    assert {"node_id": "c" * 32, "dependency_id": "b" * 32} in edges and len(edges) == 3
+    assert queries[4][1]["strategy_version_id"] == "v1"
+
+
+def test_create_nodes_bulk_empty():
+    mock_client = MagicMock()
+    service = Neo4jNodeManagementService(neo4j_client=mock_client)
+    assert service.create_nodes_bulk([]) == []
+    mock_client.execute_transaction.assert_not_called()
+
+
+def test_create_node_stores_tag_nodes_and_indexed_interval():
+    from qmtl.models.datanode import NodeTags
+
+    mock_client = MagicMock()
+    mock_client.execute_query.side_effect = [[], [{"node_id": "a" * 32}]]
+    service = Neo4jNodeManagementService(neo4j_client=mock_client)
+    node = DataNode(
+        node_id="a" * 32,
+        type="RAW",
+        data_format={},
+        tags=NodeTags(predefined=["RAW"], custom=["btc", "RAW"]),
+        interval_settings=IntervalSettings(interval=IntervalEnum.HOUR, period=7),
+    )
+    service.create_node(node)
+    query, params = mock_client.execute_query.call_args_list[1].args[:2]
+    assert "MERGE (n)-[:HAS_TAG]->(t)" in query
+    assert params["tag_names"] == ["RAW", "btc"]
+    assert (params["interval"], params["period"]) == ("1h", 7)
+
+
+def test_list_by_tags_uses_tag_nodes_and_top_level_properties():
+    mock_client = MagicMock()
+    stored = {
+        "node_id": "a" * 32,
+        "type": "RAW",
+        "data_format": "{}",
+        "tags": '{"predefined": ["RAW"], "custom": []}',
+        "interval_settings": '{"interval": "1h", "period": 7}',
+        "stream_settings": "null",
+        "interval": "1h",
+        "period": 7,
+    }
+    mock_client.stream_read.return_value = [{"n": stored}]
+    service = Neo4jNodeManagementService(neo4j_client=mock_client)
+    nodes = service.list_by_tags(["RAW", "btc"], interval="HOUR", period="7", match_mode="AND")
+    # 인덱스 속성(interval/period)은 DataNode 로 복원 시 제외
+    assert [n.node_id for n in nodes] == ["a" * 32]
+    query, params = mock_client.stream_read.call_args.args[:2]
+    assert "MATCH (t:Tag) WHERE t.name IN $tags" in query
+    assert "matched = size($tags)" in query
+    assert "n.interval = $interval" in query and "n.tags.predefined" not in query
+    assert params == {"tags": ["RAW", "btc"], "interval": "1h", "period": 7}
+
+    service.list_by_tags(["RAW"], match_mode="OR")
+    query = mock_client.stream_read.call_args.args[0]
+    assert "matched = size($tags)" not in query
+
+
+def test_migrate_tag_storage_batches():
+    from qmtl.dag_manager.registry.services.node.neo4j_schema import migrate_tag_storage
+
+    client = MagicMock()
+    page = [
+        {
+            "node_id": "a" * 32,
+            "tags": '{"predefined": ["RAW"], "custom": ["x"]}',
+            "interval_settings": "null",
+            "stream_settings": '{"intervals": {"1d": {"interval": "1d", "period": 3}}}',
+        }
+    ]
+    client.execute_query.side_effect = [page, None, []]
+    assert migrate_tag_storage(client, batch_size=1) == 1
+    rows = client.execute_query.call_args_list[1].args[1]["rows"]
+    assert rows == [{"node_id": "a" * 32, "tag_names": ["RAW", "x"], "interval": "1d", "period": 3}]
+    assert client.execute_query.call_args_list[2].args[1]["after"] == "a" * 32
+
+
+def test_list_by_tags_keyset_pagination_and_json_stream():
+    import json
+
+    mock_client = MagicMock()
+    stored = {
+        "node_id": "b" * 32,
+        "type": "RAW",
+        "data_format": "{}",
+        "tags": '{"predefined": ["RAW"], "custom": []}',
+        "interval_settings": '{"interval": "1h", "period": 7}',
+        "stream_settings": "null",
+        "interval": "1h",
+        "period": 7,
+    }
+    mock_client.stream_read.return_value = iter([{"n": stored}])
+    service = Neo4jNodeManagementService(neo4j_client=mock_client)
+    lines = list(
+        service.iter_by_tags(["RAW"], interval="HOUR", after="a" * 32, limit=10, as_json=True)
+    )
+    query, params = mock_client.stream_read.call_args.args[:2]
+    assert "n.node_id > $after" in query
+    assert "ORDER BY n.node_id LIMIT $limit" in query
+    assert params["after"] == "a" * 32 and params["limit"] == 10
+    assert mock_client.stream_read.call_args.kwargs["fetch_size"] == 10
+    # JSON 문자열 필드는 decode 없이 그대로 이어 붙이고, 인덱스 속성은 제외
+    decoded = json.loads(lines[0])
+    assert decoded["interval_settings"] == {"interval": "1h", "period": 7}
+    assert "interval" not in decoded and "period" not in decoded
+    assert DataNode.model_validate(decoded).node_id == "b" * 32
+
+
+def test_in_memory_list_endpoints_paginate_and_stream_ndjson():
+    import json
+    from fastapi.testclient import TestClient
+    from qmtl.dag_manager.registry import api
+    from qmtl.dag_manager.registry.services.node.memory_impl import InMemoryNodeService
+
+    service = InMemoryNodeService()
+    for i in (3, 1, 2):
+        service.create_node(
+            DataNode(
+                node_id=f"{i:032x}",
+                type="RAW",
+                data_format={},
+                interval_settings=IntervalSettings(interval=IntervalEnum.MINUTE, period=1),
+            )
+        )
+    api.app.dependency_overrides[api.get_node_service] = lambda: service
+    try:
+        client = TestClient(api.app)
+        first = client.get("/v1/registry/nodes", params={"limit": 2}).json()
+        assert [n["node_id"] for n in first["nodes"]] == [f"{i:032x}" for i in (1, 2)]
+        assert first["next_cursor"] == f"{2:032x}"
+        second = client.get(
+            "/v1/registry/nodes", params={"limit": 2, "after": first["next_cursor"]}
+        ).json()
+        assert [n["node_id"] for n in second["nodes"]] == [f"{3:032x}"]
+        assert second["next_cursor"] is None
+        assert client.get("/v1/registry/nodes", params={"limit": 100000}).status_code == 422
+
+        response = client.get("/v1/registry/nodes", headers={"Accept": "application/x-ndjson"})
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert [row["node_id"] for row in rows] == [f"{i:032x}" for i in (1, 2, 3)]
+    finally:
+        api.app.dependency_overrides.pop(api.get_node_service, None)
+
+
+def test_ref_count_maintained_with_contains_relationship():
+    mock_client = MagicMock()
+    service = Neo4jNodeManagementService(neo4j_client=mock_client)
+    service.add_contains_relationship("s1", "n1")
+    assert "ON CREATE SET n.ref_count = coalesce(n.ref_count, 0) + 1" in (
+        mock_client.execute_query.call_args.args[0]
+    )
+    service.remove_contains_relationship("s1", "n1")
+    assert "SET n.ref_count = n.ref_count - 1" in mock_client.execute_query.call_args.args[0]
+
+    # 여러 노드의 참조 카운트는 집계 없이 속성 조회 한 번
+    mock_client.execute_read.return_value = [{"node_id": "n1", "ref_count": 2}]
+    assert service.get_ref_counts(["n1", "n2"]) == {"n1": 2, "n2": 0}
+    query, params = mock_client.execute_read.call_args.args[:2]
+    assert "COUNT(" not in query and params == {"node_ids": ["n1", "n2"]}
+    assert mock_client.execute_read.call_count == 1
+
+    mock_client.execute_query.return_value = [{"node_id": "n1", "ref_count": 0}]
+    assert service.remove_strategy_contains("s1") == {"n1": 0}
+
+
+def test_in_memory_ref_counts_bulk():
+    from qmtl.dag_manager.registry.services.node.memory_impl import InMemoryNodeService
+
+    service = InMemoryNodeService()
+    for i in range(3):
+        service.create_node(
+            DataNode(
+                node_id=f"{i:032x}",
+                type="RAW",
+                data_format={},
+                interval_settings=IntervalSettings(interval=IntervalEnum.MINUTE, period=1),
+            )
+        )
+    ids = [f"{i:032x}" for i in range(3)]
+    for node_id in ids:
+        service.add_contains_relationship("s1", node_id)
+        service.add_contains_relationship("s1", node_id)
+    service.add_contains_relationship("s2", ids[0])
+    assert service.get_ref_counts(ids + ["missing"]) == {
+        ids[0]: 2,
+        ids[1]: 1,
+        ids[2]: 1,
+        "missing": 0,
+    }
+    assert service.get_node_ref_strategies(ids[0]) == ["s1", "s2"]
+
+    assert service.remove_strategy_contains("s1") == {ids[0]: 1, ids[1]: 0, ids[2]: 0}
+    assert service.get_strategy_nodes("s1") == []
+    assert service.get_node_ref_count(ids[1]) == 0
+
+
+def test_get_strategy_graph_single_query():
+    mock_client = MagicMock()
+    stored = {
+        "node_id": "b" * 32,
+        "type": "RAW",
+        "data_format": "{}",
+        "dependencies": [],
+        "interval_settings": '{"interval": "1m", "period": 1}',
+        "stream_settings": "null",
+    }
+    mock_client.stream_read.return_value = iter(
+        [
+            {"n": dict(stored, node_id="a" * 32), "dependencies": []},
+            {"n": stored, "dependencies": ["a" * 32]},
+        ]
+    )
+    service = Neo4jNodeManagementService(neo4j_client=mock_client)
+    node_map, topo = service.get_strategy_dag("s1")
+    # 노드와 DEPENDS_ON 관계를 한 번의 쿼리로 조회, dependencies 는 관계 기준으로 채움
+    assert mock_client.stream_read.call_count == 1
+    query = mock_client.stream_read.call_args.args[0]
+    assert "[(n)-[:DEPENDS_ON]->(dep:DataNode) | dep.node_id]" in query
+    mock_client.execute_read.assert_not_called()
+    assert node_map["b" * 32].dependencies == ["a" * 32]
+    assert topo.order == ["a" * 32, "b" * 32]
+
+
+def test_registry_protobuf_content_negotiation():
+    from fastapi.testclient import TestClient
+    from qmtl.common.http.negotiation import PROTOBUF_MEDIA_TYPE
+    from qmtl.dag_manager.registry import api
+    from qmtl.dag_manager.registry.registry_client import RegistryClient
+    from qmtl.dag_manager.registry.services.node.memory_impl import InMemoryNodeService
+    from qmtl.models.datanode import datanode_to_proto
+    from qmtl.models.generated import qmtl_registry_api_pb2
+
+    service = InMemoryNodeService()
+    metadata_service = api.MetadataService(service, MagicMock(), MagicMock())
+    api.app.dependency_overrides[api.get_node_service] = lambda: service
+    api.app.dependency_overrides[api.get_metadata_service] = lambda: metadata_service
+    nodes = [
+        DataNode(
+            node_id=f"{i:032x}",
+            type="RAW",
+            data_format={"fields": "close"},
+            interval_settings=IntervalSettings(interval=IntervalEnum.MINUTE, period=1),
+        )
+        for i in range(3)
+    ]
+    try:
+        http = TestClient(api.app)
+        batch = qmtl_registry_api_pb2.NodeBatchRequest(nodes=[datanode_to_proto(n) for n in nodes])
+        response = http.post(
+            "/v1/registry/nodes:batch",
+            content=batch.SerializeToString(),
+            headers={"Content-Type": PROTOBUF_MEDIA_TYPE, "Accept": PROTOBUF_MEDIA_TYPE},
+        )
+        assert response.status_code == 201
+        assert response.headers["content-type"] == PROTOBUF_MEDIA_TYPE
+        ids = qmtl_registry_api_pb2.IdList.FromString(response.content).ids
+        assert list(ids) == [n.node_id for n in nodes]
+
+        response = http.get(
+            "/v1/registry/nodes", params={"limit": 2}, headers={"Accept": PROTOBUF_MEDIA_TYPE}
+        )
+        page = qmtl_registry_api_pb2.NodeList.FromString(response.content)
+        assert [n.node_id for n in page.nodes] == [nodes[0].node_id, nodes[1].node_id]
+        assert page.next_cursor == nodes[1].node_id
+        # Accept 미지정 시 JSON 유지
+        assert http.get("/v1/registry/nodes").json()["next_cursor"] is None
+        # 잘못된 protobuf 본문은 400
+        response = http.post(
+            "/v1/registry/nodes",
+            content=b"\xff\xff",
+            headers={"Content-Type": PROTOBUF_MEDIA_TYPE},
+        )
+        assert response.status_code == 400
+
+        client = RegistryClient("http://testserver", use_protobuf=True)
+        client.client = TestClient(api.app, headers=dict(client.client.headers))
+        node = client.get_node(nodes[2].node_id)
+        assert node.node_id == nodes[2].node_id
+        assert node.interval_settings.interval == IntervalEnum.MINUTE
+        service.add_contains_relationship("s1", nodes[0].node_id)
+        assert client.get_ref_counts([nodes[0].node_id, "missing"]) == {
+            nodes[0].node_id: 1,
+            "missing": 0,
+        }
+    finally:
+        api.app.dependency_overrides.pop(api.get_node_service, None)
+        api.app.dependency_overrides.pop(api.get_metadata_service, None)
@@ -0,0 +1,45 @@
+from qmtl.dag_manager.core.priority import CriticalPathPriority, exec_times_from_statuses
+from qmtl.models.datanode import DataNode, NodeStreamSettings, IntervalSettings
+from qmtl.models.generated.qmtl_status_pb2 import NodeStatus
+from qmtl.sdk.models import IntervalEnum
+
+
+def _stream():
+    interval_settings = IntervalSettings(interval=IntervalEnum.MINUTE, period=1)
+    return NodeStreamSettings(intervals={IntervalEnum.MINUTE: interval_settings})
+
+
+def _node(ch, deps=None):
+    return DataNode(
+        node_id=ch * 32,
+        data_format={"type": "csv"},
+        dependencies=[d * 32 for d in (deps or [])],
+        stream_settings=_stream(),
+    )
+
+
+def test_critical_path_priority():
+    # a -> b -> c (긴 체인), a -> d (leaf)
+    nodes = [_node("a"), _node("b", ["a"]), _node("c", ["b"]), _node("d", ["a"])]
+    exec_times = {"c" * 32: 5.0}
+    prio = CriticalPathPriority(nodes, exec_times=exec_times, strategy_weight=2.0)
+    scores = prio.compute()
+    assert scores["c" * 32] == 10.0
+    assert scores["b" * 32] == 12.0
+    assert scores["d" * 32] == 2.0
+    assert scores["a" * 32] == 14.0
+    # 긴 체인의 노드가 leaf 보다 우선
+    assert prio.priority_of("b" * 32) > prio.priority_of("d" * 32)
+    assert prio.priority_of("f" * 32) == 0.0
+
+
+def test_exec_times_from_statuses():
+    done = NodeStatus(
+        node_id="a" * 32,
+        status="COMPLETED",
+        start_time="2025-01-01T00:00:00Z",
+        end_time="2025-01-01T00:00:03.500Z",
+    )
+    pending = NodeStatus(node_id="b" * 32, status="PENDING")
+    exec_times = exec_times_from_statuses({"a" * 32: done, "b" * 32: pending})
+    assert exec_times == {"a" * 32: 3.5}
@@ -1,56 +1,12 @@
-from qmtl.dag_manager.core.queue_repository import RedisQueueRepository
-
-
-class DummyRedis:
-    def __init__(self):
-        # simple in-memory structures
-        self._data = {}
-        self._hash = {}
-
-    # list operations ---------------------------------------------------
-    def lpush(self, key, value):
-        self._data.setdefault(key, []).insert(0, value)
-
-    def brpoplpush(self, src, dest, timeout=0):  # noqa: D401 unused timeout
-        lst = self._data.get(src, [])
-        if not lst:
-            return None
-        value = lst.pop()  # FIFO pop (right)
-        self._data.setdefault(dest, []).insert(0, value)
-        return value
-
-    def lrem(self, key, num, value):
-        if key not in self._data:
-            return 0
-        lst = self._data[key]
-        removed = 0
-        new_lst = []
-        for v in lst:
-            if v == value and (num == 0 or removed < abs(num)):
-                removed += 1
-            else:
-                new_lst.append(v)
-        self._data[key] = new_lst
-        return removed
+import threading
 
-    # hash operations ---------------------------------------------------
-    def hset(self, key, field, value):
-        self._hash.setdefault(key, {})[field] = value
+import fakeredis
 
-    def hget(self, key, field):
-        return self._hash.get(key, {}).get(field)
-
-    def expire(self, key, ttl):
-        # expiration not simulated
-        pass
-
-    # util for tests ----------------------------------------------------
-    def list_contents(self, key):
-        return list(self._data.get(key, []))
+from qmtl.dag_manager.core.queue_repository import RedisQueueRepository
 
 
-def test_queue_push_pop_complete():
-    r = DummyRedis()
+def test_queue_push_pop_complete(dummy_redis):
+    r = dummy_redis
     repo = RedisQueueRepository(redis_client=r)
 
     # enqueue items
@@ -71,3 +27,34 @@ def test_queue_push_pop_complete():
     # 결과 확인
     res = repo.get_result(popped)
     assert res is not None and res["result"] == {"ok": True}
+
+
+def test_priority_queue_pops_highest_first():
+    r = fakeredis.FakeRedis(decode_responses=True)
+    repo = RedisQueueRepository(redis_client=r, poll_interval=0.01)
+
+    repo.push_priority("leaf", 1.0)
+    repo.push_priority("critical", 10.0)
+    repo.push_priority("mid", 5.0)
+
+    assert repo.pop_priority() == "critical"
+    assert repo.pop_priority() == "mid"
+    assert "critical" in r.lrange(repo.processing_key, 0, -1)
+    assert repo.complete("critical", result="ok") is True
+    assert repo.pop_priority() == "leaf"
+    assert repo.pop_priority(timeout=0.05) is None
+    assert repo.pop_priority_nowait() is None
+
+
+def test_priority_pop_waits_for_late_item():
+    r = fakeredis.FakeRedis(decode_responses=True)
+    repo = RedisQueueRepository(redis_client=r, poll_interval=0.01)
+    timer = threading.Timer(0.05, repo.push_priority, args=("late", 1.0))
+    timer.start()
+    try:
+        # pop 과 processing 기록이 한 스크립트에서 처리됨
+        assert repo.pop_priority() == "late"
+        assert r.lrange(repo.processing_key, 0, -1) == ["late"]
+        assert r.zcard(repo.priority_queue_key) == 0
+    finally:
+        timer.cancel()
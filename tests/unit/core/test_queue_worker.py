@@ -109,3 +109,23 @@ class DummyStatusService:
 
     def update_node_status(self, pipeline_id, node_id, status, result=None):  # noqa: D401
         self.map[(pipeline_id, node_id)] = status
+
+
+def test_queue_worker_priority_order():
+    n1 = DataNode(
+        node_id="1" * 32, data_format={"type": "csv"}, dependencies=[], stream_settings=_stream()
+    )
+    n2 = DataNode(
+        node_id="2" * 32, data_format={"type": "csv"}, dependencies=[], stream_settings=_stream()
+    )
+    priorities = {n1.node_id: 1.0, n2.node_id: 3.0}
+    push_fn = MagicMock()
+    worker = QueueWorker(
+        push_fn=push_fn,
+        update_status_fn=MagicMock(),
+        complete_fn=MagicMock(return_value=True),
+        priority_fn=priorities.get,
+    )
+    result = worker.enqueue_ready_nodes([n1, n2])
+    assert [n.node_id for n in result] == [n2.node_id, n1.node_id]
+    assert [c.args for c in push_fn.call_args_list] == [(n2.node_id, 3.0), (n1.node_id, 1.0)]
@@ -0,0 +1,125 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from qmtl.dag_manager.registry import api
+from qmtl.dag_manager.registry.node_cache import NodeMetadataCache
+from qmtl.dag_manager.registry.registry_client import RegistryClient
+from qmtl.sdk.models import IntervalEnum
+
+
+@pytest.fixture
+def service(registry, make_node):
+    for i in range(3):
+        registry.create_node(make_node(i))
+    return registry
+
+
+def _client(requests, **kwargs):
+    client = RegistryClient("http://testserver", **kwargs)
+    client.client = TestClient(api.app, headers=dict(client.client.headers))
+    client.client.event_hooks = {"request": [requests.append]}
+    return client
+
+
+def test_get_node_etag(service, make_node):
+    http = TestClient(api.app)
+    node_id = make_node(0).node_id
+    response = http.get(f"/v1/registry/nodes/{node_id}")
+    etag = response.headers["etag"]
+    assert response.json()["node"]["node_id"] == node_id
+    response = http.get(f"/v1/registry/nodes/{node_id}", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert "Accept" in response.headers["vary"]
+    # If-None-Match 는 entity-tag 목록(약한 태그 포함) 또는 * 로 해석
+    for header in (f'"x", W/{etag}', "*"):
+        response = http.get(f"/v1/registry/nodes/{node_id}", headers={"If-None-Match": header})
+        assert response.status_code == 304
+    # 부분 문자열은 일치로 보지 않음
+    response = http.get(f"/v1/registry/nodes/{node_id}", headers={"If-None-Match": etag[:-2] + '"'})
+    assert response.status_code == 200
+    # protobuf 표현은 JSON 과 다른 ETag → JSON ETag 로 재검증해도 protobuf 본문 반환
+    response = http.get(
+        f"/v1/registry/nodes/{node_id}",
+        headers={"Accept": "application/x-protobuf", "If-None-Match": etag},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-protobuf"
+    assert response.headers["etag"] != etag
+    assert (
+        http.get(f"/v1/registry/nodes/{node_id}", headers={"If-None-Match": '"x"'}).status_code
+        == 200
+    )
+
+
+def test_get_node_cache_hit_and_revalidate(service, make_node):
+    requests = []
+    client = _client(requests)
+    node_id = make_node(1).node_id
+    for _ in range(10):
+        assert client.get_node(node_id).node_id == node_id
+    assert len(requests) == 1
+    assert client.node_cache.stats()["hits"] == 9
+
+    node = client.get_node(node_id, revalidate=True)
+    assert node.interval_settings.interval == IntervalEnum.MINUTE
+    assert requests[-1].headers["if-none-match"] == client.node_cache.lookup(node_id)[1]
+    assert client.node_cache.revalidations == 1
+
+    service.delete_node(node_id)
+    assert client.get_node(node_id, revalidate=True) is None
+    assert len(client.node_cache) == 0
+
+
+def test_cache_lru_eviction_and_disabled(make_node):
+    cache = NodeMetadataCache(max_entries=2)
+    for i in range(3):
+        cache.put(make_node(i).node_id, make_node(i))
+    assert cache.lookup(make_node(0).node_id)[0] is None
+    assert cache.lookup(make_node(2).node_id)[0] is not None
+
+    disabled = NodeMetadataCache(max_entries=0)
+    disabled.put(make_node(0).node_id, make_node(0))
+    assert len(disabled) == 0
+
+
+def test_cache_persistence_warm_start(service, tmp_path, make_node):
+    path = str(tmp_path / "nodes.json")
+    requests = []
+    client = _client(requests, cache_path=path)
+    for i in range(3):
+        client.get_node(make_node(i).node_id)
+    client.close()
+
+    requests = []
+    warm = _client(requests, cache_path=path)
+    assert len(warm.node_cache) == 3
+    assert all(warm.get_node(make_node(i).node_id) for i in range(3))
+    assert requests == []
+    assert warm.node_cache.hit_rate == 1.0
+
+    (tmp_path / "broken.json").write_text("{not json")
+    assert len(NodeMetadataCache(path=str(tmp_path / "broken.json"))) == 0
+
+
+@pytest.mark.parametrize("use_protobuf", [False, True])
+def test_get_strategy_nodes_follows_next_cursor(service, use_protobuf, make_node):
+    # 서버 페이지 크기(DEFAULT_PAGE_SIZE/MAX_PAGE_SIZE)보다 많은 노드
+    nodes = [make_node(i) for i in range(3, 1203)]
+    for node in nodes:
+        service.create_node(node)
+        service.add_contains_relationship("s1", node.node_id)
+
+    requests = []
+    client = _client(requests, use_protobuf=use_protobuf)
+    client.client.headers["Accept"] = (
+        "application/x-protobuf" if use_protobuf else "application/json"
+    )
+    result = client.get_strategy_nodes("s1")
+    assert [n.node_id for n in result] == sorted(n.node_id for n in nodes)
+    assert len(requests) == 2
+    assert "after" in requests[1].url.params
+    # 전체 목록이 캐시에 적재됨
+    requests.clear()
+    assert client.get_node(nodes[-1].node_id).node_id == nodes[-1].node_id
+    assert requests == []
@@ -0,0 +1,83 @@
+import threading
+import time
+
+import fakeredis
+
+from qmtl.dag_manager.core.sharded_queue import ConsistentHashRing, ShardedRedisQueueRepository
+
+
+def test_consistent_hash_ring_is_stable():
+    ring4 = ConsistentHashRing(range(4))
+    ring5 = ConsistentHashRing(range(5))
+    keys = [f"{i:032x}" for i in range(1000)]
+    assert all(ring4.get_shard(k) == ring4.get_shard(k) for k in keys)
+    assert {ring4.get_shard(k) for k in keys} == {0, 1, 2, 3}
+    # shard 추가 시 대부분의 key 는 기존 shard 유지
+    moved = sum(1 for k in keys if ring4.get_shard(k) != ring5.get_shard(k))
+    assert moved < len(keys) / 2
+
+
+def test_sharded_queue_uses_hash_tags_and_steals_work(dummy_redis):
+    r = dummy_redis
+    repo = ShardedRedisQueueRepository(num_shards=4, redis_client=r)
+    assert repo.shards[2].queue_key == "qmtl:dag:{shard-2}:work_queue"
+
+    item = "a" * 32
+    owner = repo.shard_for(item)
+    repo.push(item)
+    assert r.list_contents(owner.queue_key) == [item]
+
+    # 다른 shard 를 home 으로 가진 worker 가 steal
+    home = (repo.shards.index(owner) + 1) % 4
+    popped = repo.pop(home_shard=home)
+    assert popped == item
+    # 원래 shard 의 processing 리스트로 이동
+    assert r.list_contents(owner.processing_key) == [item]
+
+    assert repo.complete(item, result={"ok": True}) is True
+    assert repo.get_result(item)["result"] == {"ok": True}
+    assert repo.pop(home_shard=home, timeout=0.01) is None
+
+
+def test_sharded_queue_shard_key_groups_pipeline(dummy_redis):
+    r = dummy_redis
+    repo = ShardedRedisQueueRepository(num_shards=8, redis_client=r)
+    for i in range(10):
+        repo.push(f"{i:032x}", shard_key="pipeline-1")
+    owner = repo.shard_for("pipeline-1")
+    assert len(r.list_contents(owner.queue_key)) == 10
+
+
+def _pop_in_thread(fn, **kwargs):
+    result = {}
+    thread = threading.Thread(target=lambda: result.setdefault("item", fn(**kwargs)))
+    thread.start()
+    return thread, result
+
+
+def test_sharded_pop_steals_while_blocked_on_empty_home():
+    r = fakeredis.FakeRedis(decode_responses=True)
+    repo = ShardedRedisQueueRepository(
+        num_shards=4, redis_client=r, steal_interval=0.05, poll_interval=0.01
+    )
+    item = next(
+        f"{i:032x}" for i in range(100) if repo.shard_for(f"{i:032x}") is not repo.shards[0]
+    )
+    owner = repo.shard_for(item)
+
+    # home shard(0) 가 계속 비어 있어도 timeout=0 worker 가 다른 shard 의 작업을 가져감
+    thread, result = _pop_in_thread(repo.pop, home_shard=0)
+    time.sleep(0.1)
+    repo.push(item)
+    thread.join(timeout=2)
+    assert result.get("item") == item
+    assert r.lrange(owner.processing_key, 0, -1) == [item]
+
+    thread, result = _pop_in_thread(repo.pop_priority, home_shard=0)
+    time.sleep(0.05)
+    repo.push_priority(item, 1.0)
+    thread.join(timeout=2)
+    assert result.get("item") == item
+    assert r.lrange(owner.processing_key, 0, -1) == [item, item]
+    assert repo.pop(home_shard=0, timeout=0.05) is None
+    assert repo.pop_priority(home_shard=0, timeout=0.05) is None
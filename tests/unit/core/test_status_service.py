@@ -46,3 +46,120 @@ def test_timestamp_type_debug():
     print("[DEBUG] ps type:", type(ps))
     print("[DEBUG] ps.start_time type:", type(ps.start_time))
     print("[DEBUG] ps.start_time:", ps.start_time)
+
+
+def test_progress_counters_and_snapshots():
+    service = StatusService()
+    nodes = [DummyNode(f"n{i}") for i in range(4)]
+    service.initialize_pipeline("p-progress", nodes)
+    service.update_node_status("p-progress", "n0", status="RUNNING")
+    service.update_node_status("p-progress", "n0", status="COMPLETED", result={"v": 1})
+    service.update_node_status("p-progress", "n1", status="FAILED")
+    service.update_node_status("p-progress", "n2", status="RUNNING")
+    snapshot = service.get_pipeline_status("p-progress")
+    # (완료 1 + 실패 1 + 실행중 0.5) / 4
+    assert snapshot.progress == pytest.approx(62.5)
+    node = service.get_node_status("p-progress", "n0")
+    assert node.start_time and node.end_time
+    assert dict(node.result) == {"v": "1"}
+    # 반환값은 스냅샷이므로 이후 갱신의 영향을 받지 않음
+    service.update_node_status("p-progress", "n2", status="COMPLETED")
+    assert snapshot.progress == pytest.approx(62.5)
+    assert service.get_pipeline_status("p-progress").progress == pytest.approx(75.0)
+    service.cleanup_pipeline("p-progress")
+
+
+def test_concurrent_node_updates():
+    import threading
+
+    service = StatusService()
+    nodes = [DummyNode(f"n{i}") for i in range(200)]
+    service.initialize_pipeline("p-concurrent", nodes)
+
+    def worker(offset):
+        for i in range(offset, 200, 4):
+            service.update_node_status("p-concurrent", f"n{i}", status="RUNNING")
+            service.update_node_status("p-concurrent", f"n{i}", status="COMPLETED")
+
+    threads = [threading.Thread(target=worker, args=(k,)) for k in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert service.get_pipeline_status("p-concurrent").progress == pytest.approx(100.0)
+    service.cleanup_pipeline("p-concurrent")
+
+
+def test_bulk_status_snapshot_full_and_delta():
+    from qmtl.models.generated.qmtl_status_snapshot_pb2 import PipelineStatusSnapshot
+    from qmtl.models.status import apply_status_snapshot
+
+    service = StatusService()
+    node_ids = [f"n{i}" for i in range(1000)]
+    service.initialize_pipeline("p-snapshot", [DummyNode(n) for n in node_ids])
+    # 갱신되지 않은 노드도 PENDING 으로 조회됨
+    assert service.get_node_status("p-snapshot", "n999").status == "PENDING"
+    assert service.get_node_status("p-snapshot", "missing") is None
+
+    full = service.get_status_snapshot("p-snapshot")
+    assert not full.delta and len(full.statuses) == 1000
+    statuses = apply_status_snapshot(full)
+    assert set(statuses.values()) == {"PENDING"}
+
+    service.update_node_status("p-snapshot", "n3", status="RUNNING")
+    service.update_node_status("p-snapshot", "n7", status="FAILED")
+    delta = service.get_status_snapshot("p-snapshot", since_version=full.version)
+    assert delta.delta and list(delta.changed_indices) == [3, 7]
+    assert delta.version > full.version
+    # wire 직렬화 후 복원
+    decoded = PipelineStatusSnapshot.FromString(delta.SerializeToString())
+    statuses = apply_status_snapshot(decoded, list(full.node_ids), statuses)
+    assert statuses["n3"] == "RUNNING" and statuses["n7"] == "FAILED"
+    assert statuses == {
+        n: s.status for n, s in service.get_all_node_statuses("p-snapshot").items()
+    }
+
+    # 변경 없음 → 빈 delta, 알 수 없는 버전 → full
+    unchanged = service.get_status_snapshot("p-snapshot", since_version=delta.version)
+    assert not unchanged.changed_indices
+    assert not service.get_status_snapshot("p-snapshot", since_version=0).delta
+    service.cleanup_pipeline("p-snapshot")
+    assert service.get_status_snapshot("p-snapshot") is None
+
+
+def test_status_snapshot_endpoint_reads_redis_status_service(monkeypatch):
+    import fakeredis
+    from fastapi.testclient import TestClient
+
+    from qmtl.dag_manager.execution.redis_status_service import RedisStatusService
+    from qmtl.dag_manager.registry import api
+    from qmtl.models.generated.qmtl_status_snapshot_pb2 import PipelineStatusSnapshot
+    from qmtl.models.status import apply_status_snapshot
+
+    server = fakeredis.FakeServer()
+    monkeypatch.setattr("redis.from_url", lambda *a, **k: fakeredis.FakeRedis(server=server))
+    monkeypatch.setattr(api, "_is_test_mode", lambda: False)
+    monkeypatch.setattr(api, "_redis_status_service", None)
+    assert isinstance(api.get_status_service(), RedisStatusService)
+
+    # 다른 replica(DAG Manager)가 Redis 에 기록한 상태를 registry 가 조회
+    writer = RedisStatusService(redis_client=fakeredis.FakeRedis(server=server))
+    writer.initialize_pipeline("p-redis", [DummyNode(f"n{i}") for i in range(4)])
+    http = TestClient(api.app)
+    url = "/v1/registry/pipelines/p-redis/status/snapshot"
+
+    response = http.get(url)
+    assert response.headers["content-type"] == "application/x-protobuf"
+    full = PipelineStatusSnapshot.FromString(response.content)
+    assert list(full.node_ids) == ["n0", "n1", "n2", "n3"]
+    statuses = apply_status_snapshot(full)
+
+    writer.update_node_status("p-redis", "n2", "RUNNING")
+    delta = PipelineStatusSnapshot.FromString(
+        http.get(url, params={"since_version": full.version}).content
+    )
+    assert delta.delta and list(delta.changed_indices) == [2]
+    assert apply_status_snapshot(delta, list(full.node_ids), statuses)["n2"] == "RUNNING"
+    public = http.get("/v1/registry/public/pipelines/p-redis/status/snapshot")
+    assert PipelineStatusSnapshot.FromString(public.content).version == delta.version
+    assert http.get("/v1/registry/pipelines/missing/status/snapshot").status_code == 404
@@ -219,3 +219,33 @@ class TestACLMiddleware:
             # 다음 미들웨어가 호출되었는지 확인
             mock_call_next.assert_called_once_with(mock_request)
             assert response == "response"
+
+    def test_combined_pattern_matches_linear_scan(self, acl_config):
+        """단일 정규식 매칭 결과가 규칙 순서대로의 선형 검색과 같은지 테스트"""
+        rules = [
+            ACLRule(path_pattern=r"^/v1/gateway/strategies/[^/]+/status$", allowed_roles=["user"]),
+            ACLRule(path_pattern=r"^/v1/gateway/strategies/(a|b)/status$", allowed_roles=["admin"]),
+            ACLRule(path_pattern=r"^/v1/gateway/strategies$", allowed_roles=["user"]),
+        ]
+        middleware = ACLMiddleware(ACLConfig(rules=rules))
+        assert middleware.combined_pattern is not None
+        paths = ["/v1/gateway/strategies/a/status", "/v1/gateway/strategies", "/v1/other"]
+        for path in paths:
+            expected = next((r for p, r in middleware.compiled_rules if p.match(path)), None)
+            assert middleware._find_matching_rule(path) is expected
+        # 두 번째 조회는 캐시 사용
+        assert middleware._match_index.cache_info().hits == 0
+        middleware._find_matching_rule(paths[0])
+        assert middleware._match_index.cache_info().hits == 1
+
+    def test_combined_pattern_fallback(self):
+        """그룹 참조가 있는 패턴은 선형 검색으로 처리"""
+        rules = [
+            ACLRule(path_pattern=r"^/v1/(x)/\1$", allowed_roles=["user"]),
+            ACLRule(path_pattern=r"^/v1/(?P<name>y)$", allowed_roles=["admin"]),
+        ]
+        middleware = ACLMiddleware(ACLConfig(rules=rules))
+        assert middleware.combined_pattern is None
+        assert middleware._find_matching_rule("/v1/x/x") is rules[0]
+        assert middleware._find_matching_rule("/v1/y") is rules[1]
+        assert middleware._find_matching_rule("/v1/x/y") is None
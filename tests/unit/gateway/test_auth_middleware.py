@@ -8,8 +8,14 @@ import pytest
 import time
 from unittest.mock import MagicMock, patch, AsyncMock
 from fastapi import HTTPException
+from jose.jwt import decode as jwt_decode
 
-from qmtl.gateway.middlewares.auth import JWTConfig, JWTAuthMiddleware, create_access_token
+from qmtl.gateway.middlewares.auth import (
+    JWTConfig,
+    JWTAuthMiddleware,
+    _token_key,
+    create_access_token,
+)
 
 
 class TestAuthMiddleware:
@@ -197,3 +203,73 @@ class TestAuthMiddleware:
         assert payload["sub"] == "test_user"
         assert "user" in payload["roles"]
         assert "exp" in payload
+
+    def test_token_cache_skips_decode(self, auth_middleware, jwt_config):
+        """같은 토큰 재사용 시 캐시된 claims 반환 (서명 검증 1회)"""
+        token = create_access_token({"sub": "test_user"}, jwt_config.secret_key, expires_delta=3600)
+
+        with patch("qmtl.gateway.middlewares.auth.jwt.decode", wraps=jwt_decode) as decode:
+            first = auth_middleware._verify_token(token)
+            first["sub"] = "mutated"
+            second = auth_middleware._verify_token(token)
+
+        assert decode.call_count == 1
+        assert second["sub"] == "test_user"
+        assert (auth_middleware.cache_hits, auth_middleware.cache_misses) == (1, 1)
+
+    def test_token_cache_honors_exp_and_lru_cap(self, jwt_config):
+        """exp 이후에는 캐시를 쓰지 않고, 최대 크기를 넘으면 가장 오래된 항목 제거"""
+        middleware = JWTAuthMiddleware(jwt_config.model_copy(update={"token_cache_size": 2}))
+        tokens = [
+            create_access_token({"sub": f"u{i}"}, jwt_config.secret_key, expires_delta=3600)
+            for i in range(3)
+        ]
+        for token in tokens:
+            middleware._verify_token(token)
+        assert len(middleware._token_cache) == 2
+        assert _token_key(tokens[0]) not in middleware._token_cache
+
+        # exp 가 지난 캐시 항목은 버리고 다시 서명 검증
+        with patch("qmtl.gateway.middlewares.auth.jwt.decode", wraps=jwt_decode) as decode:
+            middleware._verify_token(tokens[2])
+            assert decode.call_count == 0
+            with patch("qmtl.gateway.middlewares.auth.time.time", return_value=time.time() + 7200):
+                middleware._verify_token(tokens[2])
+            assert decode.call_count == 1
+
+    def test_revoked_token_rejected_from_cache(self, auth_middleware, jwt_config):
+        """폐기된 토큰/jti 는 캐시에 있어도 거부"""
+        from jose import JWTError
+
+        token = create_access_token({"sub": "u1"}, jwt_config.secret_key, expires_delta=3600)
+        jti_token = create_access_token(
+            {"sub": "u2", "jti": "t-2"}, jwt_config.secret_key, expires_delta=3600
+        )
+        auth_middleware._verify_token(token)
+        auth_middleware._verify_token(jti_token)
+
+        auth_middleware.revoke_token(token)
+        auth_middleware.revoke_jti("t-2", expires_at=time.time() + 3600)
+        for revoked in (token, jti_token):
+            with pytest.raises(JWTError):
+                auth_middleware._verify_token(revoked)
+        assert not auth_middleware._token_cache
+
+    def test_revoked_jti_rejected_with_cache_disabled(self, jwt_config):
+        """token_cache_size=0 이어도 폐기된 토큰/jti 는 거부"""
+        from jose import JWTError
+
+        middleware = JWTAuthMiddleware(jwt_config.model_copy(update={"token_cache_size": 0}))
+        token = create_access_token(
+            {"sub": "u1", "jti": "t-1"}, jwt_config.secret_key, expires_delta=3600
+        )
+        assert middleware._verify_token(token)["sub"] == "u1"
+        assert not middleware._token_cache
+
+        middleware.revoke_jti("t-1", expires_at=time.time() + 3600)
+        with pytest.raises(JWTError):
+            middleware._verify_token(token)
+        other = create_access_token({"sub": "u2"}, jwt_config.secret_key, expires_delta=3600)
+        middleware.revoke_token(other)
+        with pytest.raises(JWTError):
+            middleware._verify_token(other)
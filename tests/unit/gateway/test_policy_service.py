@@ -181,3 +181,32 @@ class TestPolicyService:
             action=ActionType.READ,
             resource_id="restricted-strategy",
         )
+
+    def test_decision_cache_invalidated_on_policy_change(self, policy_service):
+        """정책 변경 시 접근 결정 캐시 무효화 테스트"""
+        args = (["tester"], ResourceType.NODE, ActionType.READ)
+        assert not policy_service.evaluate_access(*args)
+        assert not policy_service.evaluate_access(*args)
+        assert policy_service._decide.cache_info().hits == 1
+
+        policy_service.policies["tester"] = Policy(
+            policy_id="tester",
+            name="Tester",
+            roles=["tester"],
+            rules=[PolicyRule(resource_type=ResourceType.NODE, actions=[ActionType.READ])],
+        )
+        assert policy_service.evaluate_access(*args)
+
+        # 역할 순서와 무관하게 같은 캐시 키 사용
+        hits = policy_service._decide.cache_info().hits
+        assert policy_service.evaluate_access(["user", "tester"], *args[1:])
+        assert policy_service.evaluate_access(["tester", "user"], *args[1:])
+        assert policy_service._decide.cache_info().hits == hits + 1
+
+        del policy_service.policies["tester"]
+        assert not policy_service.evaluate_access(*args)
+
+        # 정책 내부를 직접 수정한 경우 invalidate_cache 필요
+        policy_service.policies["read-only"].roles.append("tester")
+        policy_service.invalidate_cache()
+        assert policy_service.evaluate_access(*args)
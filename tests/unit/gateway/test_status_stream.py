@@ -0,0 +1,104 @@
+"""
+Gateway 상태 이벤트 스트리밍 테스트
+
+이 모듈은 Gateway 서비스의 상태 스트림(status_stream.py)과 SSE 엔드포인트에 대한
+단위 테스트를 포함합니다.
+"""
+
+import asyncio
+
+import fakeredis
+import pytest
+
+from qmtl.gateway.services.status_stream import ClientStream, StatusStreamHub, sse_events
+from qmtl.models.generated.qmtl_events_pb2 import NodeStatusEvent, PipelineStatusEvent
+
+
+class TestStatusStream:
+    """상태 스트림 테스트 클래스"""
+
+    @pytest.fixture
+    def fake_redis(self, monkeypatch):
+        """redis.asyncio 를 fakeredis 로 대체하는 픽스처"""
+        server = fakeredis.FakeServer()
+        monkeypatch.setattr(
+            "redis.asyncio.from_url", lambda *a, **k: fakeredis.aioredis.FakeRedis(server=server)
+        )
+        return fakeredis.FakeRedis(server=server)
+
+    def test_hub_fans_out_with_strategy_filter(self, fake_redis):
+        """upstream 구독 1개로 여러 클라이언트에 전략별로 분배"""
+
+        async def scenario():
+            hub = StatusStreamHub()
+            all_events = await hub.connect()
+            s1_only = await hub.connect(["s1"])
+            s2_only = await hub.connect(["s2"])
+            dispatcher = hub._dispatcher
+            await hub.connect()
+            assert hub._dispatcher is dispatcher
+
+            node_event = NodeStatusEvent(
+                node_id="n1", status="RUNNING", meta={"strategy_id": "s1"}
+            )
+            fake_redis.publish("event:node_status", node_event.SerializeToString())
+            pipeline_event = PipelineStatusEvent(pipeline_id="s2", status="COMPLETED")
+            fake_redis.publish("event:pipeline_status", pipeline_event.SerializeToString())
+
+            first = await all_events.get(timeout=2)
+            second = await all_events.get(timeout=2)
+            assert [first[0], second[0]] == ["node_status", "pipeline_status"]
+            assert (await s1_only.get(timeout=2))[1].node_id == "n1"
+            assert (await s2_only.get(timeout=2))[1].pipeline_id == "s2"
+            assert await s1_only.get(timeout=0.05) is None
+            await hub.aclose()
+            assert not hub.clients
+
+        asyncio.run(scenario())
+
+    def test_client_buffer_drops_oldest(self):
+        """버퍼가 가득 차면 가장 오래된 이벤트부터 버림"""
+
+        async def scenario():
+            client = ClientStream(buffer_size=3)
+            for i in range(5):
+                client.push("node_status", NodeStatusEvent(node_id=f"n{i}"))
+            assert client.dropped == 2
+            return [(await client.get())[1].node_id for _ in range(3)]
+
+        assert asyncio.run(scenario()) == ["n2", "n3", "n4"]
+
+    def test_sse_format_and_disconnect(self):
+        """text/event-stream 포맷, heartbeat, 종료 시 hub 에서 제거"""
+
+        async def scenario():
+            hub = StatusStreamHub()
+            client = ClientStream()
+            hub.clients.add(client)
+            client.push("node_status", NodeStatusEvent(node_id="n1", status="RUNNING"))
+            stream = sse_events(hub, client, heartbeat=0.01)
+            chunk = await stream.__anext__()
+            assert chunk.startswith("id: 1\nevent: node_status\ndata: ")
+            assert '"node_id": "n1"' in chunk
+            assert await stream.__anext__() == ": keep-alive\n\n"
+            await stream.aclose()
+            return hub.clients
+
+        assert asyncio.run(scenario()) == set()
+
+    def test_stream_endpoint_requires_strategy_access(self, monkeypatch):
+        """접근 권한이 없는 전략 필터는 403"""
+        from unittest.mock import MagicMock
+
+        from qmtl.gateway import gateway
+
+        monkeypatch.setattr(
+            gateway.policy_service,
+            "evaluate_access",
+            lambda roles, rtype, action, rid=None: rid != "secret",
+        )
+        request = MagicMock()
+        request.state.user = {"sub": "u1", "roles": ["user"]}
+        response = asyncio.run(gateway.stream_events(request, strategy_id=["secret"]))
+        assert response.status_code == 403
+        assert not gateway.status_hub.clients